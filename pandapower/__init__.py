@@ -16,5 +16,7 @@ from pandapower.powerflow import *
 from pandapower.opf import *
 from pandapower.optimal_powerflow import OPFNotConverged
 from pandapower.pf.runpp_3ph import runpp_3ph
+from pandapower.pf.run_continuation_pf import runcpf, runcpf_screening
+from pandapower.array_store import use_array_store, get_result_arrays
 import pandas as pd
 pd.options.mode.chained_assignment = None  # default='warn'
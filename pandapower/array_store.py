@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+import numpy as np
+import pandas as pd
+
+
+class ArrayTable(object):
+    """
+    Float table which is stored as struct of arrays, i.e. as one contiguous numpy array per column.
+    The DataFrame df is a view of the arrays: writing into a column array changes the DataFrame
+    without any pandas overhead (index alignment, dtype checks, block management).
+    """
+
+    def __init__(self, index, columns):
+        self.columns = list(columns)
+        self.position = {column: i for i, column in enumerate(self.columns)}
+        self.data = np.full((len(self.columns), len(index)), np.nan)
+        self.df = pd.DataFrame(self.data.T, index=index, columns=self.columns, copy=False)
+
+    def __getitem__(self, column):
+        return self.data[self.position[column]]
+
+    def __setitem__(self, column, values):
+        self.data[self.position[column]] = values
+
+    def __contains__(self, column):
+        return column in self.position
+
+    def is_valid(self, df, index, columns):
+        """
+        Checks if df is still the view of the arrays and if index and columns did not change.
+        """
+        return df is self.df and self.df.index.equals(index) and \
+            list(self.df.columns) == self.columns == list(columns) and \
+            np.shares_memory(self.df.values, self.data)
+
+
+def use_array_store(net, enabled=True):
+    """
+    Switches the storage of the result tables (res_bus, res_line etc.) of the power flow to numpy
+    arrays. The result tables are stored as struct of arrays and the DataFrames net.res_* are views
+    of these arrays. The result tables are only created again if the index of an element table
+    changes, otherwise the power flow results are written into the existing arrays. This lowers the
+    overhead of each power flow, which mostly matters for small nets and time series calculations.
+
+    Since the result tables are overwritten in place, DataFrames of the results of a former power
+    flow change as well (e.g. res = net.res_bus.vm_pu; pp.runpp(net) changes res). Copy the
+    results if they are needed after the next power flow.
+
+    INPUT:
+        **net** (pandapowerNet) - the net
+
+    OPTIONAL:
+        **enabled** (bool, True) - switches the array store on or off
+
+    EXAMPLE:
+        >>> pp.use_array_store(net)
+        >>> pp.runpp(net)
+        >>> vm_pu = pp.get_result_arrays(net, "res_bus")["vm_pu"]
+    """
+    if enabled:
+        if net.get("_array_store", None) is None:
+            net["_array_store"] = dict()
+    elif "_array_store" in net:
+        del net["_array_store"]
+
+
+def get_result_arrays(net, table):
+    """
+    Returns the ArrayTable of a result table, which gives direct access to the column arrays
+    (e.g. get_result_arrays(net, "res_bus")["vm_pu"]), or None if the result table is not stored in
+    the array store (see use_array_store).
+    """
+    store = net.get("_array_store", None)
+    if store is None or table not in store or store[table].df is not net.get(table, None):
+        return None
+    return store[table]
+
+
+def _init_array_table(net, table, index, columns):
+    """
+    Initializes the result table in the array store with nan. The arrays of the last power flow are
+    reused if the index and the columns did not change.
+    """
+    store = net["_array_store"]
+    array_table = store.get(table, None)
+    if array_table is not None and array_table.is_valid(net.get(table, None), index, columns):
+        array_table.data.fill(np.nan)
+    else:
+        array_table = ArrayTable(index, columns)
+        store[table] = array_table
+        net[table] = array_table.df
+
+
+def _set_result_column(net, table, column, values):
+    """
+    Writes the values to the column of a result table, directly into the column array if the table
+    is stored in the array store.
+    """
+    array_table = get_result_arrays(net, table)
+    if array_table is not None and column in array_table:
+        array_table[column] = values
+    else:
+        net[table][column] = values
@@ -27,12 +27,16 @@
 # (https://github.com/bcj/AttrDict/blob/master/LICENSE.txt)
 
 import copy
+import functools
+import inspect
 from collections.abc import MutableMapping
 
 import numpy as np
 import numpy.core.numeric as ncn
 import pandas as pd
 import scipy as sp
+import scipy.sparse.csgraph
+import scipy.sparse.linalg
 import six
 from packaging import version
 
@@ -40,11 +44,7 @@ from pandapower.pypower.idx_brch import F_BUS, T_BUS, BR_STATUS
 from pandapower.pypower.idx_bus import BUS_I, BUS_TYPE, NONE, PD, QD, VM, VA, REF, VMIN, VMAX, PV
 from pandapower.pypower.idx_gen import PMIN, PMAX, QMIN, QMAX
 
-try:
-    from numba import jit
-    from numba._version import version_version as numba_version
-except ImportError:
-    from .pf.no_numba import jit
+from pandapower.pf.numba_cache import jit
 
 try:
     from lightsim2grid.newtonpf import newtonpf as newtonpf_ls
@@ -59,6 +59,10 @@ lightsim2grid_available = True if newtonpf_ls is not None else False
 logger = logging.getLogger(__name__)
 
 
+# columns of DataFrames which contain mutable objects, their elements are copied one by one
+DEEP_COPY_COLUMNS = {'object', 'coords', 'geometry'}
+
+
 class ADict(dict, MutableMapping):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -183,16 +187,15 @@ class ADict(dict, MutableMapping):
         This fix was introduced in pandapower 2.2.1
 
         """
-        deep_columns = {'object', 'coords', 'geometry'}
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.items():
-            if isinstance(v, pd.DataFrame) and not set(v.columns).isdisjoint(deep_columns):
+            if isinstance(v, pd.DataFrame) and not set(v.columns).isdisjoint(DEEP_COPY_COLUMNS):
                 if k not in result:
                     result[k] = v.__class__(index=v.index, columns=v.columns)
                 for col in v.columns:
-                    if col in deep_columns:
+                    if col in DEEP_COPY_COLUMNS:
                         result[k][col] = v[col].apply(lambda x: copy.deepcopy(x, memo))
                     else:
                         result[k][col] = copy.deepcopy(v[col], memo)
@@ -231,6 +234,54 @@ class pandapowerNet(ADict):
     def deepcopy(self):
         return copy.deepcopy(self)
 
+    def clone(self, structure_only=False):
+        """
+        Returns a copy of the net which is much faster to create than a deepcopy and needs less
+        memory. The numerical columns of the tables are not copied but shared with the tables of
+        this net until one of them is changed (copy-on-write on table level): the first change of
+        a shared table, e.g. by net.load.p_mw *= 2, net.load.loc[0, "p_mw"] = 1. or
+        net.load.drop(0, inplace=True), copies the data of this table in the net which is
+        changed. Reading a table (e.g. in a power flow) doesn't copy it. This also holds for
+        tables which are accessed by items() or values() and for references to tables or columns
+        which have been taken before cloning the net. Tables with mutable objects (e.g.
+        controllers or geodata) and all other elements of the net are copied.
+
+        The shared data is read-only on the numpy level, so that writing directly into the arrays
+        (e.g. net.load.p_mw.values[0] = 1.) raises an error instead of changing both nets.
+
+        OPTIONAL:
+            **structure_only** (bool, False) - If True, geodata, controllers and results are
+                not taken over (the tables are empty) and the internal variables of previous
+                calculations (e.g. net._ppc) are dropped
+
+        OUTPUT:
+            **net** (pandapowerNet) - the cloned net
+
+        EXAMPLE:
+            >>> for factor in [0.8, 0.9, 1.1]:
+            >>>     scenario = net.clone()
+            >>>     scenario.load.p_mw *= factor  # only the load table is copied
+        """
+        result = self.__class__.__new__(self.__class__)
+        result._setattr('_allow_invalid_attributes', self._allow_invalid_attributes)
+        # references of copied objects (e.g. controllers) to this net point to the clone
+        memo = {id(self): result}
+        for key, value in dict.items(self):
+            if structure_only and key.startswith("_") and not key.startswith("_empty_res"):
+                continue
+            if isinstance(value, pd.DataFrame):
+                if structure_only and (key.startswith("res_") or key in (
+                        "bus_geodata", "line_geodata", "controller")):
+                    value = value.iloc[:0].copy()
+                elif not set(value.columns).isdisjoint(DEEP_COPY_COLUMNS):
+                    value = _deepcopy_table(value, memo)
+                else:
+                    value = _share_table(value)
+            elif not isinstance(value, (str, bool, int, float, type(None))):
+                value = copy.deepcopy(value, memo)
+            dict.__setitem__(result, key, value)
+        return result
+
     def __repr__(self):  # pragma: no cover
         r = "This pandapower network includes the following parameter tables:"
         par = []
@@ -252,6 +303,207 @@ class pandapowerNet(ADict):
         return r
 
 
+def _deepcopy_table(value, memo):
+    copied = value.copy(deep=True)
+    for col in DEEP_COPY_COLUMNS.intersection(value.columns):
+        if value[col].dtype == object:
+            elements = np.empty(len(value), dtype=object)
+            for i, element in enumerate(value[col].values):
+                elements[i] = copy.deepcopy(element, memo)
+            copied[col] = elements
+        else:
+            copied[col] = value[col].apply(lambda x: copy.deepcopy(x, memo))
+    return copied
+
+
+def _share_table(table):
+    """
+    Returns a copy of the DataFrame table which shares the numerical data with table. The shared
+    data is set to read-only and both tables are turned into _CopyOnWriteTables, which copy their
+    data before it is changed.
+    """
+    if (type(table) is not pd.DataFrame and type(table) is not _CopyOnWriteTable) or \
+            not hasattr(table, "_mgr") or \
+            any(not isinstance(blk.values, np.ndarray) for blk in table._mgr.blocks):
+        # subclasses like GeoDataFrames and extension arrays are copied
+        return copy.deepcopy(table)
+    if type(table) is pd.DataFrame:
+        # views of the data (e.g. columns) which have been taken before and are not known to the
+        # table must not change the shared data, so the table gets new arrays
+        _copy_data(table)
+    for blk in table._mgr.blocks:
+        if blk.values.dtype != object:
+            blk.values.flags.writeable = False
+    # columns which have been taken from the table before are views of its data
+    for column in table._item_cache.values():
+        if column.dtype != object and isinstance(column._values, np.ndarray):
+            column._values.flags.writeable = False
+            object.__setattr__(column, '__class__', _CopyOnWriteColumn)
+    object.__setattr__(table, '__class__', _CopyOnWriteTable)
+    shared = pd.DataFrame.copy(table, deep=False)
+    for blk in shared._mgr.blocks:
+        if blk.values.dtype == object:
+            # pandas can't compare read-only object arrays, they are copied instead
+            blk.values = blk.values.copy()
+    object.__setattr__(shared, '__class__', _CopyOnWriteTable)
+    return shared
+
+
+def _copy_data(table):
+    table._mgr = table._mgr.copy(deep=True)
+    # the cached columns are turned into views of the copied data
+    cache = table._item_cache
+    for name, column in list(cache.items()):
+        loc = table.columns.get_loc(name)
+        if isinstance(loc, int):
+            column._mgr = table._mgr.iget(loc)
+        else:
+            del cache[name]
+
+
+def _unshare(obj):
+    if type(obj) is _CopyOnWriteTable or type(obj) is _CopyOnWriteColumn:
+        obj._unshare()
+
+
+def _unshare_before(method):
+    @functools.wraps(method)
+    def unshare_and_call(self, *args, **kwargs):
+        _unshare(self)
+        return method(self, *args, **kwargs)
+    return unshare_and_call
+
+
+def _unshare_before_inplace(method):
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def unshare_and_call(self, *args, **kwargs):
+        if kwargs.get("inplace", False) or (args and signature.bind(
+                self, *args, **kwargs).arguments.get("inplace", False)):
+            _unshare(self)
+        return method(self, *args, **kwargs)
+    return unshare_and_call
+
+
+class _CopyOnWriteIndexer(object):
+    """
+    Wraps the loc, iloc, at and iat indexers of shared tables and columns, so that the data is
+    copied before it is changed by the indexer.
+    """
+
+    def __init__(self, owner, indexer):
+        self._owner = owner
+        self._indexer = indexer
+
+    def __getitem__(self, key):
+        result = self._indexer[key]
+        if type(result) is pd.Series and type(self._owner) is _CopyOnWriteTable and \
+                getattr(result, '_cacher', None) is not None:
+            # column of the table, e.g. net.load.iloc[:, 0]
+            object.__setattr__(result, '__class__', _CopyOnWriteColumn)
+        return result
+
+    def __setitem__(self, key, value):
+        _unshare(self._owner)
+        self._indexer[key] = value
+
+    def __call__(self, *args, **kwargs):
+        return _CopyOnWriteIndexer(self._owner, self._indexer(*args, **kwargs))
+
+    def __getattr__(self, name):
+        if name.startswith("_setitem"):
+            _unshare(self._owner)
+        return getattr(self._indexer, name)
+
+
+class _CopyOnWriteType(type):
+    """
+    Plain DataFrames and Series are instances of the copy-on-write classes as well, so that
+    isinstance checks against the type of a shared table (e.g. in pandas.testing) don't
+    distinguish between shared and plain tables.
+    """
+
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, cls.__base__)
+
+    def add_copy_on_write(cls, methods):
+        """
+        Overrides all methods of the base class which change the data, so that the data is copied
+        first.
+        """
+        base = cls.__base__
+        for name in ("loc", "iloc", "at", "iat"):
+            indexer = getattr(base, name)
+            setattr(cls, name, property(
+                lambda self, indexer=indexer: _CopyOnWriteIndexer(self, indexer.fget(self))))
+        for name in methods + ("__setitem__", "__delitem__", "update", "__iadd__", "__isub__",
+                               "__imul__", "__itruediv__", "__ifloordiv__", "__imod__",
+                               "__ipow__", "__iand__", "__ior__", "__ixor__"):
+            if hasattr(base, name):
+                setattr(cls, name, _unshare_before(getattr(base, name)))
+        for name in dir(base):
+            method = getattr(base, name, None)
+            if not name.startswith("_") and inspect.isfunction(method) and \
+                    "inplace" in inspect.signature(method).parameters:
+                setattr(cls, name, _unshare_before_inplace(method))
+
+
+class _CopyOnWriteTable(pd.DataFrame, metaclass=_CopyOnWriteType):
+    """
+    DataFrame which shares its (read-only) data with other tables after pandapowerNet.clone().
+    The data is copied before the table is changed, and the table is turned back into a plain
+    DataFrame. Results of operations on the table (e.g. copies or slices) are plain DataFrames.
+    """
+
+    def _unshare(self):
+        _copy_data(self)
+        object.__setattr__(self, '__class__', pd.DataFrame)
+        for column in self._item_cache.values():
+            if type(column) is _CopyOnWriteColumn:
+                object.__setattr__(column, '__class__', pd.Series)
+
+    def _get_item_cache(self, item):
+        # columns taken from the table by net.load.p_mw, net.load["p_mw"] or items() copy the
+        # data of the table before they are changed, e.g. by net.load.p_mw *= 2
+        column = super()._get_item_cache(item)
+        if type(column) is pd.Series:
+            object.__setattr__(column, '__class__', _CopyOnWriteColumn)
+        return column
+
+    def __reduce_ex__(self, protocol):
+        # shared tables are pickled as plain DataFrames
+        return pd.DataFrame, (), self.__getstate__()
+
+
+class _CopyOnWriteColumn(pd.Series, metaclass=_CopyOnWriteType):
+    """
+    Column of a _CopyOnWriteTable. Changing the column copies the data of the table first.
+    """
+
+    def _unshare(self):
+        cacher = getattr(self, '_cacher', None)
+        table = cacher[1]() if cacher is not None else None
+        # turns the column into a view of the copied data if it is cached by the table
+        _unshare(table)
+        if type(self) is not _CopyOnWriteColumn:
+            return
+        loc = table.columns.get_loc(self.name) if table is not None and \
+            self.name in table.columns and len(table) == len(self) else None
+        if isinstance(loc, int):
+            self._mgr = table._mgr.iget(loc)
+        else:
+            self._mgr = self._mgr.copy(deep=True)
+        object.__setattr__(self, '__class__', pd.Series)
+
+    def __reduce_ex__(self, protocol):
+        return pd.Series, (None, None, object), self.__getstate__()
+
+
+_CopyOnWriteTable.add_copy_on_write(("insert", "isetitem", "_maybe_cache_changed"))
+_CopyOnWriteColumn.add_copy_on_write(())
+
+
 def _preserve_dtypes(df, dtypes):
     for item, dtype in list(dtypes.iteritems()):
         if df.dtypes.at[item] != dtype:
@@ -401,35 +653,58 @@ def _check_connectivity_opf(ppc):
     return isolated_nodes, pus, qus
 
 
-def _check_connectivity(ppc):
+def _check_connectivity(ppc, cache=None):
     """
-    Checks if the ppc contains isolated buses. If yes this isolated buses are set out of service
+    Checks if the ppc contains isolated buses. If yes this isolated buses are set out of service.
+    The island label of each bus (see _find_islands) is stored in ppc["bus_island"].
     :param ppc: pypower case file
+    :param cache: dict in which the result is stored and reused as long as the topology of the
+        ppc does not change (see _find_islands)
     :return:
     """
+    bus_island = _find_islands(ppc, cache)
+    ppc["bus_island"] = bus_island
+    isolated_nodes, pus, qus, ppc = _set_isolated_nodes_out_of_service(ppc, bus_island < 0)
+    return isolated_nodes, pus, qus
+
+
+def _find_islands(ppc, cache=None):
+    """
+    Determines the islands of the ppc, i.e. the groups of buses which are connected by in service
+    branches. Islands which contain at least one slack bus are labeled consecutively starting from
+    0, buses in islands without slack bus are labeled with -1.
+
+    If a cache dict is given, the branch connections and slack buses of the last call are stored
+    in it. If they did not change, the labels of the last call are returned without a new
+    search.
+    :param ppc: pypower case file
+    :param cache: dict to store the result of the last call in or None
+    :return: bus_island - array with the island label of each ppc bus
+    """
     br_status = ppc['branch'][:, BR_STATUS] == True
-    nobranch = ppc['branch'][br_status, :].shape[0]
     nobus = ppc['bus'].shape[0]
     bus_from = ppc['branch'][br_status, F_BUS].real.astype(int)
     bus_to = ppc['branch'][br_status, T_BUS].real.astype(int)
-    slacks = ppc['bus'][ppc['bus'][:, BUS_TYPE] == 3, BUS_I]
+    slacks = ppc['bus'][ppc['bus'][:, BUS_TYPE] == REF, BUS_I].astype(int)
 
-    # we create a "virtual" bus thats connected to all slack nodes and start the connectivity
-    # search at this bus
-    bus_from = np.hstack([bus_from, slacks])
-    bus_to = np.hstack([bus_to, np.ones(len(slacks)) * nobus])
+    if cache is not None and cache.get("nobus", None) == nobus and \
+            np.array_equal(cache["bus_from"], bus_from) and \
+            np.array_equal(cache["bus_to"], bus_to) and np.array_equal(cache["slacks"], slacks):
+        return cache["bus_island"]
 
-    adj_matrix = sp.sparse.coo_matrix((np.ones(nobranch + len(slacks)),
-                                       (bus_from, bus_to)),
-                                      shape=(nobus + 1, nobus + 1))
+    adj_matrix = sp.sparse.coo_matrix((np.ones(len(bus_from)), (bus_from, bus_to)),
+                                      shape=(nobus, nobus))
+    n_components, labels = sp.sparse.csgraph.connected_components(adj_matrix, directed=False)
+    supplied = np.zeros(n_components, dtype=bool)
+    supplied[labels[slacks]] = True
+    island_labels = -np.ones(n_components, dtype=int)
+    island_labels[supplied] = np.arange(np.sum(supplied))
+    bus_island = island_labels[labels]
 
-    reachable = sp.sparse.csgraph.breadth_first_order(adj_matrix, nobus, False, False)
-    # TODO: the former impl. excluded ppc buses that are already oos, but is this necessary ?
-    # if so: bus_not_reachable = np.hstack([ppc['bus'][:, BUS_TYPE] != 4, np.array([False])])
-    bus_not_reachable = np.ones(ppc["bus"].shape[0] + 1, dtype=bool)
-    bus_not_reachable[reachable] = False
-    isolated_nodes, pus, qus, ppc = _set_isolated_nodes_out_of_service(ppc, bus_not_reachable)
-    return isolated_nodes, pus, qus
+    if cache is not None:
+        cache.update({"nobus": nobus, "bus_from": bus_from, "bus_to": bus_to, "slacks": slacks,
+                      "bus_island": bus_island})
+    return bus_island
 
 
 def _python_set_elements_oos(ti, tis, bis, lis):  # pragma: no cover
@@ -444,14 +719,9 @@ def _python_set_isolated_buses_oos(bus_in_service, ppc_bus_isolated, bus_lookup)
             bus_in_service[k] = False
 
 
-try:
-    get_values = jit(nopython=True, cache=True)(_get_values)
-    set_elements_oos = jit(nopython=True, cache=True)(_python_set_elements_oos)
-    set_isolated_buses_oos = jit(nopython=True, cache=True)(_python_set_isolated_buses_oos)
-except RuntimeError:
-    get_values = jit(nopython=True, cache=False)(_get_values)
-    set_elements_oos = jit(nopython=True, cache=False)(_python_set_elements_oos)
-    set_isolated_buses_oos = jit(nopython=True, cache=False)(_python_set_isolated_buses_oos)
+get_values = jit(nopython=True)(_get_values)
+set_elements_oos = jit(nopython=True)(_python_set_elements_oos)
+set_isolated_buses_oos = jit(nopython=True)(_python_set_isolated_buses_oos)
 
 
 def _select_is_elements_numba(net, isolated_nodes=None, sequence=None):
@@ -668,6 +938,7 @@ def _check_if_numba_is_installed(numba):
 
     try:
         # get numba Version (in order to use it it must be > 0.25)
+        from numba import __version__ as numba_version
         if version.parse(numba_version) < version.parse("0.2.5"):
             logger.warning('Warning: numba version too old -> Upgrade to a version > 0.25.\n' +
                            numba_warning_str)
@@ -684,6 +955,38 @@ def _deactive(msg):
     return False
 
 
+# results which are calculated from the bus voltages alone, i.e. without the branch flows and the
+# power of the slacks (None: all columns)
+RESULTS_WITHOUT_FLOWS = {"res_bus": ["vm_pu", "va_degree"], "res_load": None, "res_motor": None,
+                         "res_sgen": None, "res_storage": None, "res_shunt": None, "res_ward": None}
+
+
+def _check_results_option(net, results, enforce_q_lims=False):
+    """
+    Checks the option "results" of runpp, a dict with the result tables and their columns which
+    are calculated, e.g. {"res_bus": ["vm_pu"], "res_line": ["loading_percent"]}. Returns the
+    results and True if the branch flows (pfsoln) must be calculated for these results.
+    """
+    if results is None:
+        return None, True
+    if not isinstance(results, dict):
+        raise ValueError("results must be a dict with result tables as keys and lists of columns "
+                         "as values, e.g. {'res_bus': ['vm_pu']}")
+    for table, columns in results.items():
+        empty_table = "_empty_%s" % table
+        if empty_table not in net:
+            raise ValueError("%s is not a result table of the power flow" % table)
+        if columns is not None:
+            unknown = set(columns) - set(net[empty_table].columns)
+            if len(unknown):
+                raise ValueError("%s has no columns %s" % (table, sorted(unknown)))
+    calculate_flows = enforce_q_lims or any(
+        table not in RESULTS_WITHOUT_FLOWS or (RESULTS_WITHOUT_FLOWS[table] is not None and (
+            columns is None or not set(columns) <= set(RESULTS_WITHOUT_FLOWS[table])))
+        for table, columns in results.items())
+    return results, calculate_flows
+
+
 def _check_lightsim2grid_compatibility(net, lightsim2grid, voltage_dependend_loads, algorithm, enforce_q_lims):
     if lightsim2grid:
         if not lightsim2grid_available:
@@ -778,19 +1081,26 @@ def phase_to_sequence(Xabc):
 # Calculating Sequence Current from sequence Voltages
 # =============================================================================
 
+def _sparse_product(Y, V):
+    """
+    Product of the sparse admittance matrix Y with the voltage vector or matrix V as 2d ndarray,
+    without creating the dense matrix of Y.
+    """
+    return np.atleast_2d(np.asarray(Y.dot(V)))
+
+
 def I0_from_V012(V012, Y):
     V0 = X012_to_X0(V012)
-    if type(Y) in [sp.sparse.csr.csr_matrix, sp.sparse.csc.csc_matrix]:
-        return np.asarray(np.matmul(Y.todense(), V0))
+    if sp.sparse.issparse(Y):
+        return _sparse_product(Y, V0)
     else:
         return np.asarray(np.matmul(Y, V0))
 
 
 def I1_from_V012(V012, Y):
     V1 = X012_to_X1(V012)[:, np.newaxis]
-    if type(Y) in [sp.sparse.csr.csr_matrix, sp.sparse.csc.csc_matrix]:
-        i1 = np.asarray(np.matmul(Y.todense(), V1))
-        return np.transpose(i1)
+    if sp.sparse.issparse(Y):
+        return np.transpose(_sparse_product(Y, V1))
     else:
         i1 = np.asarray(np.matmul(Y, V1))
         return np.transpose(i1)
@@ -798,8 +1108,8 @@ def I1_from_V012(V012, Y):
 
 def I2_from_V012(V012, Y):
     V2 = X012_to_X2(V012)
-    if type(Y) in [sp.sparse.csr.csr_matrix, sp.sparse.csc.csc_matrix]:
-        return np.asarray(np.matmul(Y.todense(), V2))
+    if sp.sparse.issparse(Y):
+        return _sparse_product(Y, V2)
     else:
         return np.asarray(np.matmul(Y, V2))
 
@@ -812,13 +1122,48 @@ def V1_from_ppc(ppc):
     )
 
 
+class FactorizedY(object):
+    """
+    Sparse LU factorization of an admittance matrix (or of the real B' and B'' matrices of the
+    fast-decoupled power flow). In contrast to the SuperLU object of scipy it can be copied and
+    pickled together with the net (e.g. in net["_ppc0"]["internal"] or net["_fdpf_cache"]): only
+    the matrix is copied and the factorization is calculated again with the next solve.
+    """
+
+    def __init__(self, Y):
+        self.Y = sp.sparse.csc_matrix(Y)
+        self._lu = sp.sparse.linalg.splu(self.Y)
+
+    def solve(self, I):
+        if self._lu is None:
+            self._lu = sp.sparse.linalg.splu(self.Y)
+        return self._lu.solve(np.asarray(I, dtype=self.Y.dtype))
+
+    def __getstate__(self):
+        return {"Y": self.Y, "_lu": None}
+
+
+def factorize_Y(Y):
+    """
+    Sparse LU factorization of the admittance matrix Y, which can be passed to V_from_I instead of
+    Y to solve for several currents with only one factorization. If Y is singular, Y is returned
+    and V_from_I solves with spsolve as before.
+    """
+    try:
+        return FactorizedY(Y)
+    except RuntimeError:
+        return Y
+
+
 def V_from_I(Y, I):
+    if isinstance(Y, FactorizedY):
+        return np.transpose(Y.solve(I))
     return np.transpose(np.array(sp.sparse.linalg.spsolve(Y, I)))
 
 
 def I_from_V(Y, V):
-    if type(Y) in [sp.sparse.csr.csr_matrix, sp.sparse.csc.csc_matrix]:
-        return np.asarray(np.matmul(Y.todense(), V))
+    if sp.sparse.issparse(Y):
+        return _sparse_product(Y, V)
     else:
         return np.asarray(np.matmul(Y, V))
 
@@ -906,10 +1251,21 @@ def _init_runpp_options(net, algorithm, calculate_voltage_angles, init,
     # recycle options
     recycle = kwargs.get("recycle", None)
     only_v_results = kwargs.get("only_v_results", False)
+    results, calculate_flows = _check_results_option(net, kwargs.get("results", None),
+                                                     enforce_q_lims)
     # scipy spsolve options in NR power flow
     use_umfpack = kwargs.get("use_umfpack", True)
     permc_spec = kwargs.get("permc_spec", None)
     lightsim2grid = kwargs.get("lightsim2grid", False)
+    # solve islands separately
+    parallel_islands = kwargs.get("parallel_islands", False)
+    n_jobs = kwargs.get("n_jobs", None)
+    # step control and divergence detection of the newton-raphson power flow
+    damping = kwargs.get("damping", None)
+    abort_on_divergence = kwargs.get("abort_on_divergence", False)
+
+    if damping not in [None, "line_search", "trust_region"]:
+        raise ValueError("damping has to be None, 'line_search' or 'trust_region'")
 
     if "init" in overrule_options:
         init = overrule_options["init"]
@@ -984,7 +1340,10 @@ def _init_runpp_options(net, algorithm, calculate_voltage_angles, init,
     _add_pf_options(net, tolerance_mva=tolerance_mva, trafo_loading=trafo_loading,
                     numba=numba, ac=ac, algorithm=algorithm, max_iteration=max_iteration,
                     v_debug=v_debug, only_v_results=only_v_results, use_umfpack=use_umfpack,
-                    permc_spec=permc_spec, lightsim2grid=lightsim2grid)
+                    permc_spec=permc_spec, lightsim2grid=lightsim2grid,
+                    parallel_islands=parallel_islands, n_jobs=n_jobs, results=results,
+                    calculate_flows=calculate_flows, damping=damping,
+                    abort_on_divergence=abort_on_divergence)
     net._options.update(overrule_options)
 
 
@@ -1114,8 +1473,11 @@ def _internal_stored(net):
     if net["_ppc"] is None:
         return False
 
-    mandatory_pf_variables = ["J", "bus", "gen", "branch", "baseMVA", "V", "pv", "pq", "ref",
+    mandatory_pf_variables = ["bus", "gen", "branch", "baseMVA", "V", "pv", "pq", "ref",
                               "Ybus", "Yf", "Yt", "Sbus", "ref_gens"]
+    if net["_options"]["algorithm"] not in ["fdbx", "fdxb"]:
+        # the fast-decoupled power flow has no jacobian
+        mandatory_pf_variables.append("J")
     for var in mandatory_pf_variables:
         if "internal" not in net["_ppc"] or var not in net["_ppc"]["internal"]:
             logger.warning("recycle is set to True, but internal variables are missing")
@@ -12,6 +12,7 @@ import numpy as np
 import pandas as pd
 
 from pandapower.auxiliary import get_values
+from pandapower.pd2ppc_model import _get_cache_model, _branch_inputs
 from pandapower.pypower.idx_brch import F_BUS, T_BUS, BR_R, BR_X, BR_B, TAP, SHIFT, BR_STATUS, RATE_A, \
     BR_R_ASYM, BR_X_ASYM, branch_cols
 from pandapower.pypower.idx_bus import BASE_KV, VM, VA
@@ -45,18 +46,27 @@ def _build_branch_ppc(net, ppc):
         branch_sc.fill(np.nan)
         ppc["branch"] = np.hstack((ppc["branch"], branch_sc))
     ppc["branch"][:, :13] = np.array([0, 0, 0, 0, 0, 250, 250, 250, 1, 0, 1, -360, 360])
-    if "line" in lookup:
-        _calc_line_parameter(net, ppc)
-    if "trafo" in lookup:
-        _calc_trafo_parameter(net, ppc)
-    if "trafo3w" in lookup:
-        _calc_trafo3w_parameter(net, ppc)
-    if "impedance" in lookup:
-        _calc_impedance_parameter(net, ppc)
-    if "xward" in lookup:
-        _calc_xward_parameter(net, ppc)
-    if "switch" in lookup:
-        _calc_switch_parameter(net, ppc)
+    model = _get_cache_model(net, ppc)
+    for element, calc_parameter in [("line", _calc_line_parameter),
+                                    ("trafo", _calc_trafo_parameter),
+                                    ("trafo3w", _calc_trafo3w_parameter),
+                                    ("impedance", _calc_impedance_parameter),
+                                    ("xward", _calc_xward_parameter),
+                                    ("switch", _calc_switch_parameter)]:
+        if element not in lookup:
+            continue
+        if model is None:
+            calc_parameter(net, ppc)
+            continue
+        # reuse the branch rows of the last conversion if the inputs of the element did not change
+        f, t = lookup[element]
+        inputs = _branch_inputs(net, ppc, element)
+        stored = model.get(("branch", element), inputs)
+        if stored is None:
+            calc_parameter(net, ppc)
+            model.set(("branch", element), inputs, ppc["branch"][f:t].copy())
+        else:
+            ppc["branch"][f:t] = stored
 
 
 def _initialize_branch_lookup(net):
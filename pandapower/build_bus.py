@@ -14,13 +14,11 @@ from pandapower.auxiliary import _sum_by_group
 from pandapower.pypower.idx_bus import BUS_I, BASE_KV, PD, QD, GS, BS, VMAX, VMIN, BUS_TYPE, NONE, VM, VA, \
     CID, CZD, bus_cols, REF
 
-try:
-    from numba import jit
-except ImportError:
-    from .pf.no_numba import jit
+from pandapower.pd2ppc_model import _get_cache_model, _bus_lookup_inputs
+from pandapower.pf.numba_cache import jit
 
 
-@jit(nopython=True, cache=False)
+@jit(nopython=True)
 def ds_find(ar, bus):  # pragma: no cover
     while True:
         p = ar[bus]
@@ -30,7 +28,7 @@ def ds_find(ar, bus):  # pragma: no cover
     return p
 
 
-@jit(nopython=True, cache=False)
+@jit(nopython=True)
 def ds_union(ar, bus1, bus2, bus_is_pv):  # pragma: no cover
     root1 = ds_find(ar, bus1)
     root2 = ds_find(ar, bus2)
@@ -42,7 +40,7 @@ def ds_union(ar, bus1, bus2, bus_is_pv):  # pragma: no cover
         ar[root2] = root1
 
 
-@jit(nopython=True, cache=False)
+@jit(nopython=True)
 def ds_create(ar, switch_bus, switch_elm, switch_et_bus, switch_closed, switch_z_ohm,
               bus_is_pv, bus_in_service):  # pragma: no cover
     for i in range(len(switch_bus)):
@@ -54,7 +52,7 @@ def ds_create(ar, switch_bus, switch_elm, switch_et_bus, switch_closed, switch_z
             ds_union(ar, bus1, bus2, bus_is_pv)
 
 
-@jit(nopython=True, cache=False)
+@jit(nopython=True)
 def fill_bus_lookup(ar, bus_lookup, bus_index):
     for i in range(len(bus_index)):
         bus_lookup[bus_index[i]] = i
@@ -178,7 +176,15 @@ def create_bus_lookup_numpy(net, bus_index, bus_is_idx, gen_is_mask, eg_is_mask,
     return bus_lookup
 
 
-def create_bus_lookup(net, bus_index, bus_is_idx, gen_is_mask, eg_is_mask, numba):
+def create_bus_lookup(net, bus_index, bus_is_idx, gen_is_mask, eg_is_mask, numba, model=None):
+    if model is not None:
+        # reuse the bus lookup of the last conversion if the buses and switches did not change
+        inputs = _bus_lookup_inputs(net, bus_index, bus_is_idx, gen_is_mask, eg_is_mask, numba)
+        stored = model.get("bus_lookup", inputs)
+        if stored is not None:
+            net._impedance_bb_switches = stored[1].copy()
+            return stored[0].copy()
+
     switches_with_pos_z_ohm = net["switch"]["z_ohm"].values > 0
     if switches_with_pos_z_ohm.any() or numba == False:
         # if there are any closed bus-bus switches find them
@@ -198,6 +204,8 @@ def create_bus_lookup(net, bus_index, bus_is_idx, gen_is_mask, eg_is_mask, numba
     else:
         bus_lookup = create_bus_lookup_numpy(net, bus_index, bus_is_idx,
                                              gen_is_mask, eg_is_mask, closed_bb_switch_mask)
+    if model is not None:
+        model.set("bus_lookup", inputs, (bus_lookup.copy(), net._impedance_bb_switches.copy()))
     return bus_lookup
 
 
@@ -273,7 +281,8 @@ def _build_bus_ppc(net, ppc):
         gen_is_mask = _is_elements['gen']
         bus_is_idx = _is_elements['bus_is_idx']
         bus_lookup = create_bus_lookup(net, bus_index, bus_is_idx,
-                                       gen_is_mask, eg_is_mask, numba=numba)
+                                       gen_is_mask, eg_is_mask, numba=numba,
+                                       model=_get_cache_model(net, ppc))
 
     n_bus_ppc = len(bus_index)
     # init ppc with empty values
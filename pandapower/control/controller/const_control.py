@@ -92,7 +92,8 @@ class ConstControl(Controller):
         self.set_recycle()
 
     def set_recycle(self):
-        allowed_elements = ["load", "sgen", "storage", "gen", "ext_grid", "trafo", "trafo3w", "line"]
+        allowed_elements = ["load", "sgen", "storage", "gen", "ext_grid", "trafo", "trafo3w", "line",
+                            "asymmetric_load", "asymmetric_sgen"]
         if self.recycle is False or self.element not in allowed_elements:
             # if recycle is set to False by the user when creating the controller it is deactivated or when
             # const control controls an element which is not able to be recycled
@@ -102,6 +103,9 @@ class ConstControl(Controller):
         recycle = dict(trafo=False, gen=False, bus_pq=False)
         if self.element in ["sgen", "load", "storage"] and self.variable in ["p_mw", "q_mvar", "scaling"]:
             recycle["bus_pq"] = True
+        if self.element in ["asymmetric_load", "asymmetric_sgen"] and self.variable in [
+                "p_a_mw", "p_b_mw", "p_c_mw", "q_a_mvar", "q_b_mvar", "q_c_mvar", "scaling"]:
+            recycle["bus_pq"] = True
         if self.element in ["gen"] and self.variable in ["p_mw", "vm_pu", "scaling"] \
                 or self.element in ["ext_grid"] and self.variable in ["vm_pu", "va_degree"]:
             recycle["gen"] = True
@@ -4,6 +4,10 @@
 # and Energy System Technology (IEE), Kassel. All rights reserved.
 
 
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache
+
 import pandas as pd
 from numpy import nan, isnan, arange, dtype, isin, any as np_any, zeros
 from packaging import version
@@ -40,6 +44,21 @@ def create_empty_network(name="", f_hz=50., sn_mva=1, add_stdtypes=True):
     EXAMPLE:
         net = create_empty_network()
 
+    """
+    net = _copy_empty_network_template()
+    net["name"] = name
+    net["f_hz"] = f_hz
+    net["sn_mva"] = sn_mva
+    if add_stdtypes:
+        add_basic_std_types(net)
+    return net
+
+
+@lru_cache(maxsize=None)
+def _empty_network_template():
+    """
+    Builds the empty tables of a net once. create_empty_network copies this template instead of
+    building all tables from their dtypes for every new net.
     """
     net = pandapowerNet({
         # structure data
@@ -503,9 +522,9 @@ def create_empty_network(name="", f_hz=50., sn_mva=1, add_stdtypes=True):
                             "branch": None},
         "version": __version__,
         "converged": False,
-        "name": name,
-        "f_hz": f_hz,
-        "sn_mva": sn_mva
+        "name": "",
+        "f_hz": 50.,
+        "sn_mva": 1
     })
 
     net._empty_res_load_3ph = net._empty_res_load
@@ -515,16 +534,240 @@ def create_empty_network(name="", f_hz=50., sn_mva=1, add_stdtypes=True):
     for s in net:
         if isinstance(net[s], list):
             net[s] = pd.DataFrame(zeros(0, dtype=net[s]), index=pd.Int64Index([]))
-    if add_stdtypes:
-        add_basic_std_types(net)
-    else:
-        net.std_types = {"line": {}, "trafo": {}, "trafo3w": {}}
+    net.std_types = {"line": {}, "trafo": {}, "trafo3w": {}}
     for mode in ["pf", "se", "sc", "pf_3ph"]:
         reset_results(net, mode)
     net['user_pf_options'] = dict()
     return net
 
 
+def _copy_empty_network_template():
+    template = _empty_network_template()
+    return pandapowerNet({key: value.copy() if isinstance(value, pd.DataFrame) else deepcopy(value)
+                          for key, value in template.items()})
+
+
+class _BulkTable(object):
+    """
+    Rows of an element table which are created within bulk_create. The values are stored in one
+    list per column and are written into the element table at once when bulk_create is left.
+    """
+
+    def __init__(self, table_columns):
+        self.table_columns = set(table_columns)
+        self.index = list()
+        self.positions = dict()
+        self.columns = dict()
+        # values of columns which are new to the element table for the rows of the element table
+        self.defaults = dict()
+        self.max_index = None
+
+    def add_row(self, index, entries):
+        if index not in self.positions:
+            self.positions[index] = len(self.index)
+            self.index.append(index)
+            self.max_index = index if self.max_index is None else max(self.max_index, index)
+            for values in self.columns.values():
+                values.append(nan)
+        for column, value in entries.items():
+            self.set_value(index, column, value)
+
+    def set_value(self, index, column, value, default_val=nan):
+        if index not in self.positions:
+            self.add_row(index, dict())
+        if column not in self.columns:
+            # rows created before got the default value in the table if the column is new to it
+            if column not in self.table_columns:
+                self.defaults[column] = default_val
+            else:
+                default_val = nan
+            self.columns[column] = [default_val] * len(self.index)
+        self.columns[column][self.positions[index]] = value
+
+    def get_value(self, index, column):
+        if column not in self.columns:
+            return self.defaults.get(column, nan)
+        return self.columns[column][self.positions[index]]
+
+    def materialize(self, net, element):
+        if not len(self.index):
+            return
+        table = net[element]
+        dtypes = table.dtypes
+        for column, default_val in self.defaults.items():
+            if column not in table.columns and len(table):
+                table.loc[:, column] = default_val
+        rows = pd.DataFrame(self.columns, index=self.index)
+        _append_rows(net, element, rows)
+        _preserve_dtypes(net[element], dtypes)
+
+
+@contextmanager
+def bulk_create(net):
+    """
+    Context manager to create a large number of elements with the create functions. Within the
+    context, the created elements are buffered and written into the element tables at once when
+    the context is left, instead of enlarging the tables element by element.
+
+    The element tables are not updated before the context is left, but indices and the existence
+    of buses or branches are checked with respect to the buffered elements as well.
+
+    INPUT:
+        **net** (pandapowerNet) - The pandapower network in which the elements are created
+
+    EXAMPLE:
+        with bulk_create(net):
+            for i in range(1000):
+                b = create_bus(net, vn_kv=0.4)
+                create_load(net, b, p_mw=0.001)
+    """
+    if net.get("_bulk_create", None) is not None:
+        # nested context, the elements are written by the outer context
+        yield net
+        return
+    net["_bulk_create"] = dict()
+    try:
+        yield net
+    finally:
+        _materialize_bulk_tables(net)
+        del net["_bulk_create"]
+
+
+def _materialize_bulk_tables(net):
+    # writes the elements buffered by bulk_create into the element tables
+    tables = net.get("_bulk_create", None)
+    if tables is None:
+        return
+    for element, table in tables.items():
+        table.materialize(net, element)
+    tables.clear()
+
+
+def _bulk_table(net, element, add=False):
+    tables = net.get("_bulk_create", None)
+    if tables is None:
+        return None
+    if add and element not in tables:
+        tables[element] = _BulkTable(net[element].columns)
+    return tables.get(element, None)
+
+
+def _get_free_id(net, element):
+    index = get_free_id(net[element])
+    table = _bulk_table(net, element)
+    if table is not None and table.max_index is not None:
+        index = max(index, table.max_index + 1)
+    return index
+
+
+def _element_exists(net, element, index):
+    if index in net[element].index:
+        return True
+    table = _bulk_table(net, element)
+    return table is not None and index in table.positions
+
+
+def _column_exists(net, element, column):
+    if column in net[element].columns:
+        return True
+    table = _bulk_table(net, element)
+    return table is not None and column in table.columns
+
+
+def _get_entry(net, element, index, column):
+    table = _bulk_table(net, element)
+    if table is not None and index in table.positions:
+        return table.get_value(index, column)
+    return net[element].at[index, column]
+
+
+def _set_entries(net, element, index, columns, values, preserve_dtypes=True):
+    # adds a row to the element table, or to the buffer within bulk_create
+    table = _bulk_table(net, element, add=True)
+    if table is not None:
+        table.add_row(index, dict(zip(columns, values)))
+        return
+    dtypes = net[element].dtypes
+    net[element].loc[index, columns] = values
+    if preserve_dtypes:
+        _preserve_dtypes(net[element], dtypes)
+
+
+def _set_value(net, element, index, column, value, default_val=nan):
+    # sets the value of an element and creates the column with default_val if it doesn't exist
+    table = _bulk_table(net, element, add=True)
+    if table is not None:
+        table.set_value(index, column, value, default_val=default_val)
+        return
+    if column not in net[element].columns:
+        net[element].loc[:, column] = default_val
+    net[element].at[index, column] = value
+
+
+def _set_controllable(net, index, controllable, element, default_val=False):
+    if not isnan(controllable):
+        _set_value(net, element, index, "controllable", bool(controllable),
+                   default_val=default_val)
+    elif _column_exists(net, element, "controllable"):
+        _set_value(net, element, index, "controllable", default_val)
+
+
+def _check_multiple_node_elements(net, buses, name="Elements"):
+    if np_any(~isin(buses, net["bus"].index.values)):
+        bus_not_exist = set(buses) - set(net["bus"].index.values)
+        raise UserWarning("%s trying to attach to non existing buses %s" % (name, bus_not_exist))
+
+
+def _get_multiple_index_with_check(net, element, index, number, name="Elements"):
+    if index is None:
+        bid = get_free_id(net[element])
+        return arange(bid, bid + number, 1)
+    if np_any(isin(index, net[element].index.values)):
+        raise UserWarning("%s with the ids %s already exist"
+                          % (name, net[element].index.values[isin(net[element].index.values,
+                                                                  index)]))
+    return index
+
+
+def _set_multiple_entries(net, element, index, entries, float_entries=None, **kwargs):
+    # appends the new elements to the element table at once. Columns of float_entries are only
+    # created if the values are not None
+    dtypes = net[element].dtypes
+
+    dd = pd.DataFrame(index=index, columns=net[element].columns)
+    for column, values in entries.items():
+        dd[column] = values
+    for column, values in (float_entries or dict()).items():
+        if values is not None:
+            dd[column] = values
+            dd[column] = dd[column].astype(float)
+    dd = dd.assign(**kwargs)
+
+    _append_rows(net, element, dd)
+
+    # and preserve dtypes
+    _preserve_dtypes(net[element], dtypes)
+
+
+def _append_rows(net, element, rows):
+    new_columns = rows.columns.difference(net[element].columns)
+    empty = not len(net[element])
+    net[element] = pd.concat([net[element], rows], sort=False)
+    if empty:
+        # columns which are new to an empty table keep the dtype of the new rows
+        for column in new_columns:
+            net[element][column] = net[element][column].astype(rows[column].dtype)
+
+
+def _set_coords(net, element, index, coords):
+    table = _bulk_table(net, element, add=True)
+    if table is not None:
+        table.add_row(index, {"coords": coords})
+        return
+    net[element].loc[index, "coords"] = None
+    net[element].at[index, "coords"] = coords
+
+
 def create_bus(net, vn_kv, name=None, index=None, geodata=None, type="b",
                zone=None, in_service=True, max_vm_pu=nan,
                min_vm_pu=nan, coords=None, **kwargs):
@@ -566,28 +809,23 @@ def create_bus(net, vn_kv, name=None, index=None, geodata=None, type="b",
     EXAMPLE:
         create_bus(net, name = "bus1")
     """
-    if index is not None and index in net["bus"].index:
+    if index is not None and _element_exists(net, "bus", index):
         raise UserWarning("A bus with index %s already exists" % index)
 
     if index is None:
-        index = get_free_id(net["bus"])
-
-    # store dtypes
-    dtypes = net.bus.dtypes
-
-    net.bus.loc[index, ["name", "vn_kv", "type", "zone", "in_service"]] = \
-        [name, vn_kv, type, zone, bool(in_service)]
+        index = _get_free_id(net, "bus")
 
-    # and preserve dtypes
-    _preserve_dtypes(net.bus, dtypes)
+    _set_entries(net, "bus", index,
+                 ["name", "vn_kv", "type", "zone", "in_service"],
+                 [name, vn_kv, type, zone, bool(in_service)])
 
     if geodata is not None:
         if len(geodata) != 2:
             raise UserWarning("geodata must be given as (x, y) tuple")
-        net["bus_geodata"].loc[index, ["x", "y"]] = geodata
+        _set_entries(net, "bus_geodata", index, ["x", "y"], geodata, preserve_dtypes=False)
 
     if coords is not None:
-        net["bus_geodata"].loc[index, "coords"] = coords
+        _set_coords(net, "bus_geodata", index, coords)
 
     # column needed by OPF. 0. and 2. are the default maximum / minimum voltages
     _create_column_and_set_value(net, index, min_vm_pu, "min_vm_pu", "bus", default_val=0.)
@@ -635,6 +873,7 @@ def create_buses(net, nr_buses, vn_kv, index=None, name=None, type="b", geodata=
     EXAMPLE:
         create_bus(net, name = "bus1")
     """
+    _materialize_bulk_tables(net)
     if index is not None:
         for idx in index:
             if idx in net.bus.index:
@@ -746,57 +985,25 @@ def create_load(net, bus, p_mw, q_mvar=0, const_z_percent=0, const_i_percent=0,
         create_load(net, bus=0, p_mw=10., q_mvar=2.)
 
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net["load"])
-    if index in net["load"].index:
+        index = _get_free_id(net, "load")
+    if _element_exists(net, "load", index):
         raise UserWarning("A load with the id %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.load.dtypes
-
-    net.load.loc[index, ["name", "bus", "p_mw", "const_z_percent", "const_i_percent", "scaling",
-                         "q_mvar", "sn_mva", "in_service", "type"]] = \
-        [name, bus, p_mw, const_z_percent, const_i_percent, scaling, q_mvar, sn_mva,
-         bool(in_service), type]
-
-    # and preserve dtypes
-    _preserve_dtypes(net.load, dtypes)
-
-    if not isnan(min_p_mw):
-        if "min_p_mw" not in net.load.columns:
-            net.load.loc[:, "min_p_mw"] = pd.Series()
-
-        net.load.loc[index, "min_p_mw"] = float(min_p_mw)
-
-    if not isnan(max_p_mw):
-        if "max_p_mw" not in net.load.columns:
-            net.load.loc[:, "max_p_mw"] = pd.Series()
-
-        net.load.loc[index, "max_p_mw"] = float(max_p_mw)
+    _set_entries(net, "load", index,
+                 ["name", "bus", "p_mw", "const_z_percent", "const_i_percent", "scaling", "q_mvar",
+                  "sn_mva", "in_service", "type"],
+                 [name, bus, p_mw, const_z_percent, const_i_percent, scaling, q_mvar, sn_mva,
+                  bool(in_service), type])
 
-    if not isnan(min_q_mvar):
-        if "min_q_mvar" not in net.load.columns:
-            net.load.loc[:, "min_q_mvar"] = pd.Series()
-
-        net.load.loc[index, "min_q_mvar"] = float(min_q_mvar)
-
-    if not isnan(max_q_mvar):
-        if "max_q_mvar" not in net.load.columns:
-            net.load.loc[:, "max_q_mvar"] = pd.Series()
-
-        net.load.loc[index, "max_q_mvar"] = float(max_q_mvar)
-
-    if not isnan(controllable):
-        if "controllable" not in net.load.columns:
-            net.load["controllable"] = False
-
-        net.load.loc[index, "controllable"] = bool(controllable)
-    else:
-        if "controllable" in net.load.columns:
-            net.load.loc[index, "controllable"] = False
+    _create_column_and_set_value(net, index, min_p_mw, "min_p_mw", "load")
+    _create_column_and_set_value(net, index, max_p_mw, "max_p_mw", "load")
+    _create_column_and_set_value(net, index, min_q_mvar, "min_q_mvar", "load")
+    _create_column_and_set_value(net, index, max_q_mvar, "max_q_mvar", "load")
+    _set_controllable(net, index, controllable, "load")
 
     return index
 
@@ -851,24 +1058,19 @@ def create_asymmetric_load(net, bus, p_a_mw=0, p_b_mw=0, p_c_mw=0, q_a_mvar=0, \
 		**create_asymmetric_load(net, bus=0, p_c_mw = 9., q_c_mvar = 1.8)**
 
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net["asymmetric_load"])
-    if index in net["asymmetric_load"].index:
+        index = _get_free_id(net, "asymmetric_load")
+    if _element_exists(net, "asymmetric_load", index):
         raise UserWarning("A 3 phase asymmetric_load with the id %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.asymmetric_load.dtypes
-
-    net.asymmetric_load.loc[index, ["name", "bus", "p_a_mw", "p_b_mw", "p_c_mw", "scaling",
-                                    "q_a_mvar", "q_b_mvar", "q_c_mvar", "sn_mva", "in_service", "type"]] = \
-        [name, bus, p_a_mw, p_b_mw, p_c_mw, scaling,
-         q_a_mvar, q_b_mvar, q_c_mvar, sn_mva, bool(in_service), type]
-
-    # and preserve dtypes
-    _preserve_dtypes(net.asymmetric_load, dtypes)
+    _set_entries(net, "asymmetric_load", index,
+                 ["name", "bus", "p_a_mw", "p_b_mw", "p_c_mw", "scaling", "q_a_mvar", "q_b_mvar",
+                  "q_c_mvar", "sn_mva", "in_service", "type"],
+                 [name, bus, p_a_mw, p_b_mw, p_c_mw, scaling, q_a_mvar, q_b_mvar, q_c_mvar, sn_mva,
+                  bool(in_service), type])
 
     return index
 
@@ -905,12 +1107,12 @@ def create_asymmetric_load(net, bus, p_a_mw=0, p_b_mw=0, p_c_mw=0, q_a_mvar=0, \
 #     positive, reactive power will be negative for inductive behaviour and positive for capacitive
 #     behaviour.
 #     """
-#     if bus not in net["bus"].index.values:
+#     if not _element_exists(net, "bus", bus):
 #         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 #
 #     if index is None:
-#         index = get_free_id(net["asymmetric_load"])
-#     if index in net["impedance_load"].index:
+#         index = _get_free_id(net, "asymmetric_load")
+#     if _element_exists(net, "impedance_load", index):
 #         raise UserWarning("A 3 phase asymmetric_load with the id %s already exists" % index)
 #
 #     # store dtypes
@@ -995,6 +1197,7 @@ def create_loads(net, buses, p_mw, q_mvar=0, const_z_percent=0, const_i_percent=
         create_loads(net, buses=[0, 2], p_mw=[10., 5.], q_mvar=[2., 0.])
 
     """
+    _materialize_bulk_tables(net)
     if np_any(~isin(buses, net["bus"].index.values)):
         bus_not_exist = set(buses) - set(net["bus"].index.values)
         raise UserWarning("Cannot attach to buses %s, they does not exist" % bus_not_exist)
@@ -1147,70 +1350,27 @@ def create_sgen(net, bus, p_mw, q_mvar=0, sn_mva=nan, name=None, index=None,
         create_sgen(net, 1, p_mw = -120)
 
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net["sgen"])
+        index = _get_free_id(net, "sgen")
 
-    if index in net["sgen"].index:
+    if _element_exists(net, "sgen", index):
         raise UserWarning("A static generator with the id %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.sgen.dtypes
-
-    net.sgen.loc[index, ["name", "bus", "p_mw", "scaling",
-                         "q_mvar", "sn_mva", "in_service", "type",
-                         "current_source"]] = \
-        [name, bus, p_mw, scaling, q_mvar, sn_mva, bool(in_service), type, current_source]
-
-    # and preserve dtypes
-    _preserve_dtypes(net.sgen, dtypes)
-
-    if not isnan(min_p_mw):
-        if "min_p_mw" not in net.sgen.columns:
-            net.sgen.loc[:, "min_p_mw"] = pd.Series()
-
-        net.sgen.loc[index, "min_p_mw"] = float(min_p_mw)
-
-    if not isnan(max_p_mw):
-        if "max_p_mw" not in net.sgen.columns:
-            net.sgen.loc[:, "max_p_mw"] = pd.Series()
-
-        net.sgen.loc[index, "max_p_mw"] = float(max_p_mw)
-
-    if not isnan(min_q_mvar):
-        if "min_q_mvar" not in net.sgen.columns:
-            net.sgen.loc[:, "min_q_mvar"] = pd.Series()
-
-        net.sgen.loc[index, "min_q_mvar"] = float(min_q_mvar)
-
-    if not isnan(max_q_mvar):
-        if "max_q_mvar" not in net.sgen.columns:
-            net.sgen.loc[:, "max_q_mvar"] = pd.Series()
+    _set_entries(net, "sgen", index,
+                 ["name", "bus", "p_mw", "scaling", "q_mvar", "sn_mva", "in_service", "type",
+                  "current_source"],
+                 [name, bus, p_mw, scaling, q_mvar, sn_mva, bool(in_service), type, current_source])
 
-        net.sgen.loc[index, "max_q_mvar"] = float(max_q_mvar)
-
-    if not isnan(controllable):
-        if "controllable" not in net.sgen.columns:
-            net.sgen.loc[:, "controllable"] = False
-
-        net.sgen.loc[index, "controllable"] = bool(controllable)
-    else:
-        if "controllable" in net.sgen.columns:
-            net.sgen.loc[index, "controllable"] = False
-
-    if not isnan(k):
-        if "k" not in net.sgen.columns:
-            net.sgen.loc[:, "k"] = pd.Series()
-
-        net.sgen.loc[index, "k"] = float(k)
-
-    if not isnan(rx):
-        if "rx" not in net.sgen.columns:
-            net.sgen.loc[:, "rx"] = pd.Series()
-
-        net.sgen.loc[index, "rx"] = float(rx)
+    _create_column_and_set_value(net, index, min_p_mw, "min_p_mw", "sgen")
+    _create_column_and_set_value(net, index, max_p_mw, "max_p_mw", "sgen")
+    _create_column_and_set_value(net, index, min_q_mvar, "min_q_mvar", "sgen")
+    _create_column_and_set_value(net, index, max_q_mvar, "max_q_mvar", "sgen")
+    _set_controllable(net, index, controllable, "sgen")
+    _create_column_and_set_value(net, index, k, "k", "sgen")
+    _create_column_and_set_value(net, index, rx, "rx", "sgen")
 
     return index
 
@@ -1286,6 +1446,7 @@ def create_sgens(net, buses, p_mw, q_mvar=0, sn_mva=nan, name=None, index=None,
          create_sgens(net, buses=[0, 2], p_mw=[10., 5.], q_mvar=[2., 0.])
 
      """
+    _materialize_bulk_tables(net)
     if np_any(~isin(buses, net["bus"].index.values)):
         bus_not_exist = set(buses) - set(net["bus"].index.values)
         raise UserWarning("Cannot attach to buses %s, they does not exist" % bus_not_exist)
@@ -1394,24 +1555,20 @@ def create_asymmetric_sgen(net, bus, p_a_mw=0, p_b_mw=0, p_c_mw=0, q_a_mvar=0, q
         create_asymmetric_sgen(net, 1, p_b_mw=0.12)
 
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net["asymmetric_sgen"])
+        index = _get_free_id(net, "asymmetric_sgen")
 
-    if index in net["asymmetric_sgen"].index:
+    if _element_exists(net, "asymmetric_sgen", index):
         raise UserWarning("A static generator with the id %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.asymmetric_sgen.dtypes
-
-    net.asymmetric_sgen.loc[index, ["name", "bus", "p_a_mw", "p_b_mw", "p_c_mw", "scaling",
-                                    "q_a_mvar", "q_b_mvar", "q_c_mvar", "sn_mva", "in_service", "type"]] = \
-        [name, bus, p_a_mw, p_b_mw, p_c_mw, scaling, q_a_mvar, q_b_mvar, q_c_mvar, sn_mva, bool(in_service), type]
-
-    # and preserve dtypes
-    _preserve_dtypes(net.asymmetric_sgen, dtypes)
+    _set_entries(net, "asymmetric_sgen", index,
+                 ["name", "bus", "p_a_mw", "p_b_mw", "p_c_mw", "scaling", "q_a_mvar", "q_b_mvar",
+                  "q_c_mvar", "sn_mva", "in_service", "type"],
+                 [name, bus, p_a_mw, p_b_mw, p_c_mw, scaling, q_a_mvar, q_b_mvar, q_c_mvar, sn_mva,
+                  bool(in_service), type])
 
     return index
 
@@ -1516,59 +1673,97 @@ def create_storage(net, bus, p_mw, max_e_mwh, q_mvar=0, sn_mva=nan, soc_percent=
         create_storage(net, 1, p_mw = -30, max_e_mwh = 60, soc_percent = 1.0, min_e_mwh = 5)
 
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net["storage"])
+        index = _get_free_id(net, "storage")
 
-    if index in net["storage"].index:
+    if _element_exists(net, "storage", index):
         raise UserWarning("A storage with the id %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.storage.dtypes
+    _set_entries(net, "storage", index,
+                 ["name", "bus", "p_mw", "q_mvar", "sn_mva", "scaling", "soc_percent", "min_e_mwh",
+                  "max_e_mwh", "in_service", "type"],
+                 [name, bus, p_mw, q_mvar, sn_mva, scaling, soc_percent, min_e_mwh, max_e_mwh,
+                  bool(in_service), type])
 
-    net.storage.loc[index, ["name", "bus", "p_mw", "q_mvar", "sn_mva", "scaling",
-                            "soc_percent", "min_e_mwh", "max_e_mwh", "in_service", "type"]] = \
-        [name, bus, p_mw, q_mvar, sn_mva, scaling,
-         soc_percent, min_e_mwh, max_e_mwh, bool(in_service), type]
+    # check for OPF parameters and add columns to network table
+    _create_column_and_set_value(net, index, min_p_mw, "min_p_mw", "storage")
+    _create_column_and_set_value(net, index, max_p_mw, "max_p_mw", "storage")
+    _create_column_and_set_value(net, index, min_q_mvar, "min_q_mvar", "storage")
+    _create_column_and_set_value(net, index, max_q_mvar, "max_q_mvar", "storage")
+    _set_controllable(net, index, controllable, "storage")
 
-    # and preserve dtypes
-    _preserve_dtypes(net.storage, dtypes)
+    return index
 
-    # check for OPF parameters and add columns to network table
-    if not isnan(min_p_mw):
-        if "min_p_mw" not in net.storage.columns:
-            net.storage.loc[:, "min_p_mw"] = pd.Series()
 
-        net.storage.loc[index, "min_p_mw"] = float(min_p_mw)
+def create_storages(net, buses, p_mw, max_e_mwh, q_mvar=0, sn_mva=nan, soc_percent=nan,
+                    min_e_mwh=0.0, name=None, index=None, scaling=1., type=None, in_service=True,
+                    max_p_mw=None, min_p_mw=None, max_q_mvar=None, min_q_mvar=None,
+                    controllable=None, **kwargs):
+    """
+    Adds a number of storages in table net["storage"].
 
-    if not isnan(max_p_mw):
-        if "max_p_mw" not in net.storage.columns:
-            net.storage.loc[:, "max_p_mw"] = pd.Series()
+    INPUT:
+        **net** - The net within this storages should be created
 
-        net.storage.loc[index, "max_p_mw"] = float(max_p_mw)
+        **buses** (list of int) - A list of bus ids to which the storages are connected
 
-    if not isnan(min_q_mvar):
-        if "min_q_mvar" not in net.storage.columns:
-            net.storage.loc[:, "min_q_mvar"] = pd.Series()
+        **p_mw** (list of floats) - The momentary active power of the storages \
+            (positive for charging, negative for discharging)
 
-        net.storage.loc[index, "min_q_mvar"] = float(min_q_mvar)
+        **max_e_mwh** (list of floats) - The maximum energy content of the storages \
+            (maximum charge level)
 
-    if not isnan(max_q_mvar):
-        if "max_q_mvar" not in net.storage.columns:
-            net.storage.loc[:, "max_q_mvar"] = pd.Series()
+    OPTIONAL:
+        **q_mvar** (list of floats, default 0) - The reactive power of the storages
 
-        net.storage.loc[index, "max_q_mvar"] = float(max_q_mvar)
+        **sn_mva** (list of floats, default NaN) - Nominal power of the storages
 
-    if not isnan(controllable):
-        if "controllable" not in net.storage.columns:
-            net.storage.loc[:, "controllable"] = False
+        **soc_percent** (list of floats, NaN) - The state of charge of the storages
 
-        net.storage.loc[index, "controllable"] = bool(controllable)
-    else:
-        if "controllable" in net.storage.columns:
-            net.storage.loc[index, "controllable"] = False
+        **min_e_mwh** (list of floats, 0) - The minimum energy content of the storages \
+            (minimum charge level)
+
+        **name** (list of strings, default None) - The name for the storages
+
+        **index** (list of int, None) - Force a specified ID if it is available. If None, the \
+            index is set to a range between one higher than the highest already existing index \
+            and the length of storages that shall be created.
+
+        **scaling** (list of floats, 1.) - An OPTIONAL scaling factor to be set customly
+
+        **type** (string, None) -  type variable to classify the storages
+
+        **in_service** (list of boolean) - True for in_service or False for out of service
+
+        **max_p_mw**, **min_p_mw**, **max_q_mvar**, **min_q_mvar** (list of floats, None) - \
+            OPF limits of the storages. The columns are only created if the values are given.
+
+        **controllable** (list of boolean, None) - States, whether the storages are \
+            controllable or not. Only respected for OPF
+
+    OUTPUT:
+        **index** (list of int) - The unique IDs of the created storages
+
+    EXAMPLE:
+        create_storages(net, [1, 2], p_mw=[-30, 10], max_e_mwh=[60, 20])
+
+    """
+    _materialize_bulk_tables(net)
+    _check_multiple_node_elements(net, buses, "Storages")
+    index = _get_multiple_index_with_check(net, "storage", index, len(buses), "Storages")
+
+    entries = {"name": name, "bus": buses, "p_mw": p_mw, "q_mvar": q_mvar, "sn_mva": sn_mva,
+               "scaling": scaling, "soc_percent": soc_percent, "min_e_mwh": min_e_mwh,
+               "max_e_mwh": max_e_mwh, "in_service": in_service, "type": type}
+    float_entries = {"min_p_mw": min_p_mw, "max_p_mw": max_p_mw, "min_q_mvar": min_q_mvar,
+                     "max_q_mvar": max_q_mvar}
+    if controllable is not None:
+        kwargs["controllable"] = pd.Series(controllable, index=index).astype(bool)
+
+    _set_multiple_entries(net, "storage", index, entries, float_entries, **kwargs)
 
     return index
 
@@ -1577,9 +1772,7 @@ def _create_column_and_set_value(net, index, variable, column, element, default_
     # if variable (e.g. p_mw) is not None and column (e.g. "p_mw") doesn't exist in element (e.g. "gen") table
     # create this column and write the value of variable to the index of this element
     if not isnan(variable):
-        if column not in net[element].columns:
-            net[element].loc[:, column] = float(default_val)
-        net[element].at[index, column] = float(variable)
+        _set_value(net, element, index, column, float(variable), default_val=float(default_val))
     return net
 
 
@@ -1651,33 +1844,22 @@ def create_gen(net, bus, p_mw, vm_pu=1., sn_mva=nan, name=None, index=None, max_
         create_gen(net, 1, p_mw = 120, vm_pu = 1.02)
 
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net["gen"])
+        index = _get_free_id(net, "gen")
 
-    if index in net["gen"].index:
+    if _element_exists(net, "gen", index):
         raise UserWarning("A generator with the id %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.gen.dtypes
-
     columns = ["name", "bus", "p_mw", "vm_pu", "sn_mva", "type", "slack", "in_service",
                "scaling"]
     variables = [name, bus, p_mw, vm_pu, sn_mva, type, slack, bool(in_service), scaling]
-    net.gen.loc[index, columns] = variables
-
-    # and preserve dtypes
-    _preserve_dtypes(net.gen, dtypes)
+    _set_entries(net, "gen", index, columns, variables)
 
     # OPF limits
-    if not isnan(controllable):
-        if "controllable" not in net.gen.columns:
-            net.gen.loc[:, "controllable"] = True
-        net.gen.at[index, "controllable"] = bool(controllable)
-    elif "controllable" in net.gen.columns:
-        net.gen.at[index, "controllable"] = True
+    _set_controllable(net, index, controllable, "gen", default_val=True)
     # P limits for OPF if controllable == True
     net = _create_column_and_set_value(net, index, min_p_mw, "min_p_mw", "gen")
     net = _create_column_and_set_value(net, index, max_p_mw, "max_p_mw", "gen")
@@ -1693,11 +1875,9 @@ def create_gen(net, bus, p_mw, vm_pu=1., sn_mva=nan, name=None, index=None, max_
     net = _create_column_and_set_value(net, index, cos_phi, "cos_phi", "gen")
 
     if not isnan(xdss_pu):
-        if "xdss_pu" not in net.gen.columns:
-            net.gen.loc[:, "xdss_pu"] = pd.Series()
-        if "rdss_pu" not in net.gen.columns:
-            net.gen.loc[:, "rdss_pu"] = pd.Series()
-        net.gen.at[index, "xdss_pu"] = float(xdss_pu)
+        _set_value(net, "gen", index, "xdss_pu", float(xdss_pu))
+        if not _column_exists(net, "gen", "rdss_pu"):
+            _set_value(net, "gen", index, "rdss_pu", nan)
 
     net = _create_column_and_set_value(net, index, rdss_pu, "rdss_pu", "gen")
 
@@ -1772,6 +1952,7 @@ def create_gens(net, buses, p_mw, vm_pu=1., sn_mva=nan, name=None, index=None, m
         create_gen(net, 1, p_mw = 120, vm_pu = 1.02)
 
     """
+    _materialize_bulk_tables(net)
     if np_any(~isin(buses, net["bus"].index.values)):
         bus_not_exist = set(buses) - set(net["bus"].index.values)
         raise UserWarning("Cannot attach to buses %s, they does not exist" % bus_not_exist)
@@ -1890,27 +2071,21 @@ def create_motor(net, bus, pn_mech_mw, cos_phi, efficiency_percent=100.,
         create_motor(net, 1, pn_mech_mw = 0.120, cos_ph=0.9, vn_kv=0.6, efficiency_percent=90, loading_percent=40, lrc_pu=6.0)
 
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net["motor"])
+        index = _get_free_id(net, "motor")
 
-    if index in net["motor"].index:
+    if _element_exists(net, "motor", index):
         raise UserWarning("A motor with the id %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.motor.dtypes
-
     columns = ["name", "bus", "pn_mech_mw", "cos_phi", "cos_phi_n", "vn_kv", "rx",
                "efficiency_n_percent", "efficiency_percent", "loading_percent",
                "lrc_pu", "scaling", "in_service"]
     variables = [name, bus, pn_mech_mw, cos_phi, cos_phi_n, vn_kv, rx, efficiency_n_percent,
                  efficiency_percent, loading_percent, lrc_pu, scaling, bool(in_service)]
-    net.motor.loc[index, columns] = variables
-
-    # and preserve dtypes
-    _preserve_dtypes(net.motor, dtypes)
+    _set_entries(net, "motor", index, columns, variables)
 
     return index
 
@@ -1980,89 +2155,93 @@ def create_ext_grid(net, bus, vm_pu=1.0, va_degree=0., name=None, in_service=Tru
 
         create_ext_grid(net, 1, voltage = 1.03,s_sc_max_mva= 1000, rx_max=0.1,r0x0_max=0.1,x0x_max= 1.0 )
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
-    if index is not None and index in net["ext_grid"].index:
+    if index is not None and _element_exists(net, "ext_grid", index):
         raise UserWarning("An external grid with with index %s already exists" % index)
 
     if index is None:
-        index = get_free_id(net["ext_grid"])
+        index = _get_free_id(net, "ext_grid")
 
-    # store dtypes
-    dtypes = net.ext_grid.dtypes
+    _set_entries(net, "ext_grid", index, ["bus", "name", "vm_pu", "va_degree", "in_service"],
+                 [bus, name, vm_pu, va_degree, bool(in_service)])
 
     # OPF limits
-    if not isnan(controllable):
-        if "controllable" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "controllable"] = False
-        net.ext_grid.at[index, "controllable"] = bool(controllable)
-    elif "controllable" in net.ext_grid.columns:
-        net.ext_grid.at[index, "controllable"] = False
-
-
-    net.ext_grid.loc[index, ["bus", "name", "vm_pu", "va_degree", "in_service"]] = \
-        [bus, name, vm_pu, va_degree, bool(in_service)]
+    _set_controllable(net, index, controllable, "ext_grid")
+
+    _create_column_and_set_value(net, index, s_sc_max_mva, "s_sc_max_mva", "ext_grid")
+    _create_column_and_set_value(net, index, s_sc_min_mva, "s_sc_min_mva", "ext_grid")
+    _create_column_and_set_value(net, index, rx_min, "rx_min", "ext_grid")
+    _create_column_and_set_value(net, index, rx_max, "rx_max", "ext_grid")
+    _create_column_and_set_value(net, index, min_p_mw, "min_p_mw", "ext_grid")
+    _create_column_and_set_value(net, index, max_p_mw, "max_p_mw", "ext_grid")
+    _create_column_and_set_value(net, index, min_q_mvar, "min_q_mvar", "ext_grid")
+    _create_column_and_set_value(net, index, max_q_mvar, "max_q_mvar", "ext_grid")
+    _create_column_and_set_value(net, index, x0x_max, "x0x_max", "ext_grid")
+    _create_column_and_set_value(net, index, r0x0_max, "r0x0_max", "ext_grid")
+    return index
 
-    if not isnan(s_sc_max_mva):
-        if "s_sc_max_mva" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "s_sc_max_mva"] = pd.Series()
 
-        net.ext_grid.at[index, "s_sc_max_mva"] = float(s_sc_max_mva)
+def create_ext_grids(net, buses, vm_pu=1.0, va_degree=0., name=None, in_service=True,
+                     s_sc_max_mva=None, s_sc_min_mva=None, rx_max=None, rx_min=None,
+                     max_p_mw=None, min_p_mw=None, max_q_mvar=None, min_q_mvar=None,
+                     index=None, r0x0_max=None, x0x_max=None, controllable=None, **kwargs):
+    """
+    Creates a number of external grid connections in table net["ext_grid"].
 
-    if not isnan(s_sc_min_mva):
-        if "s_sc_min_mva" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "s_sc_min_mva"] = pd.Series()
+    INPUT:
+        **net** - pandapower network
 
-        net.ext_grid.at[index, "s_sc_min_mva"] = float(s_sc_min_mva)
+        **buses** (list of int) - A list of bus ids to which the external grids are connected
 
-    if not isnan(rx_min):
-        if "rx_min" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "rx_min"] = pd.Series()
+    OPTIONAL:
+        **vm_pu** (list of floats, default 1.0) - voltage set points at the slack nodes in per unit
 
-        net.ext_grid.at[index, "rx_min"] = float(rx_min)
+        **va_degree** (list of floats, default 0.) - voltage angles at the slack nodes in degrees
 
-    if not isnan(rx_max):
-        if "rx_max" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "rx_max"] = pd.Series()
+        **name** (list of strings, default None) - The names of the external grids
 
-        net.ext_grid.at[index, "rx_max"] = float(rx_max)
+        **in_service** (list of boolean, default True) - True for in_service or False for out of \
+            service
 
-    if not isnan(min_p_mw):
-        if "min_p_mw" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "min_p_mw"] = pd.Series()
+        **s_sc_max_mva**, **s_sc_min_mva**, **rx_max**, **rx_min**, **r0x0_max**, **x0x_max** \
+            (list of floats, None) - short circuit parameters, see create_ext_grid
 
-        net.ext_grid.loc[index, "min_p_mw"] = float(min_p_mw)
+        **max_p_mw**, **min_p_mw**, **max_q_mvar**, **min_q_mvar** (list of floats, None) - \
+            OPF limits of the external grids
 
-    if not isnan(max_p_mw):
-        if "max_p_mw" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "max_p_mw"] = pd.Series()
+        **controllable** (list of boolean, None) - States, whether the external grids are \
+            controllable or not. Only respected for OPF
 
-        net.ext_grid.loc[index, "max_p_mw"] = float(max_p_mw)
+        **index** (list of int, None) - Force a specified ID if it is available. If None, the \
+            index is set to a range between one higher than the highest already existing index \
+            and the length of external grids that shall be created.
 
-    if not isnan(min_q_mvar):
-        if "min_q_mvar" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "min_q_mvar"] = pd.Series()
+        The columns of optional parameters which are None are not created.
 
-        net.ext_grid.loc[index, "min_q_mvar"] = float(min_q_mvar)
+    OUTPUT:
+        **index** (list of int) - The unique IDs of the created external grids
 
-    if not isnan(max_q_mvar):
-        if "max_q_mvar" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "max_q_mvar"] = pd.Series()
+    EXAMPLE:
+        create_ext_grids(net, [0, 5], vm_pu=[1.02, 1.0])
 
-        net.ext_grid.loc[index, "max_q_mvar"] = float(max_q_mvar)
-    if not isnan(x0x_max):
-        if "x0x_max" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "x0x_max"] = pd.Series()
+    """
+    _materialize_bulk_tables(net)
+    _check_multiple_node_elements(net, buses, "External grids")
+    index = _get_multiple_index_with_check(net, "ext_grid", index, len(buses), "External grids")
+
+    entries = {"bus": buses, "name": name, "vm_pu": vm_pu, "va_degree": va_degree,
+               "in_service": in_service}
+    float_entries = {"s_sc_max_mva": s_sc_max_mva, "s_sc_min_mva": s_sc_min_mva,
+                     "rx_min": rx_min, "rx_max": rx_max, "min_p_mw": min_p_mw,
+                     "max_p_mw": max_p_mw, "min_q_mvar": min_q_mvar, "max_q_mvar": max_q_mvar,
+                     "x0x_max": x0x_max, "r0x0_max": r0x0_max}
+    if controllable is not None:
+        kwargs["controllable"] = pd.Series(controllable, index=index).astype(bool)
 
-        net.ext_grid.loc[index, "x0x_max"] = float(x0x_max)
-    if not isnan(r0x0_max):
-        if "r0x0_max" not in net.ext_grid.columns:
-            net.ext_grid.loc[:, "r0x0_max"] = pd.Series()
+    _set_multiple_entries(net, "ext_grid", index, entries, float_entries, **kwargs)
 
-        net.ext_grid.loc[index, "r0x0_max"] = float(r0x0_max)
-        # and preserve dtypes
-    _preserve_dtypes(net.ext_grid, dtypes)
     return index
 
 
@@ -2122,13 +2301,13 @@ def create_line(net, from_bus, to_bus, length_km, std_type, name=None, index=Non
 
     # check if bus exist to attach the line to
     for b in [from_bus, to_bus]:
-        if b not in net["bus"].index.values:
+        if not _element_exists(net, "bus", b):
             raise UserWarning("Line %s tries to attach to non-existing bus %s" % (name, b))
 
     if index is None:
-        index = get_free_id(net["line"])
+        index = _get_free_id(net, "line")
 
-    if index in net["line"].index:
+    if _element_exists(net, "line", index):
         raise UserWarning("A line with index %s already exists" % index)
 
     v = {
@@ -2150,36 +2329,21 @@ def create_line(net, from_bus, to_bus, length_km, std_type, name=None, index=Non
         v["type"] = lineparam["type"]
 
     # if net.line column already has alpha, add it from std_type
-    if "alpha" in net.line.columns and "alpha" in lineparam:
+    if _column_exists(net, "line", "alpha") and "alpha" in lineparam:
         v["alpha"] = lineparam["alpha"]
 
-    # store dtypes
-    dtypes = net.line.dtypes
-
-    net.line.loc[index, list(v.keys())] = list(v.values())
-
-    # and preserve dtypes
-    _preserve_dtypes(net.line, dtypes)
+    _set_entries(net, "line", index, list(v.keys()), list(v.values()))
 
     if geodata is not None:
-        net["line_geodata"].loc[index, "coords"] = None
-        net["line_geodata"].at[index, "coords"] = geodata
-
-    if not isnan(max_loading_percent):
-        if "max_loading_percent" not in net.line.columns:
-            net.line.loc[:, "max_loading_percent"] = pd.Series()
+        _set_coords(net, "line_geodata", index, geodata)
 
-        net.line.loc[index, "max_loading_percent"] = float(max_loading_percent)
+    _create_column_and_set_value(net, index, max_loading_percent, "max_loading_percent", "line")
 
     if alpha is not None:
-        if "alpha" not in net.line.columns:
-            net.line.loc[:, "alpha"] = pd.Series()
-        net.line.loc[index, "alpha"] = alpha
+        _set_value(net, "line", index, "alpha", alpha)
 
     if temperature_degree_celsius is not None:
-        if "temperature_degree_celsius" not in net.line.columns:
-            net.line.loc[:, "temperature_degree_celsius"] = pd.Series()
-        net.line.loc[index, "temperature_degree_celsius"] = temperature_degree_celsius
+        _set_value(net, "line", index, "temperature_degree_celsius", temperature_degree_celsius)
 
     return index
 
@@ -2259,17 +2423,15 @@ def create_line_from_parameters(net, from_bus, to_bus, length_km, r_ohm_per_km,
 
     # check if bus exist to attach the line to
     for b in [from_bus, to_bus]:
-        if b not in net["bus"].index.values:
+        if not _element_exists(net, "bus", b):
             raise UserWarning("Line %s tries to attach to non-existing bus %s"
                               % (name, b))
 
     if index is None:
-        index = get_free_id(net["line"])
-    if index in net["line"].index:
+        index = _get_free_id(net, "line")
+    if _element_exists(net, "line", index):
         raise UserWarning("A line with index %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.line.dtypes
     v = {
         "name": name, "length_km": length_km, "from_bus": from_bus,
         "to_bus": to_bus, "in_service": bool(in_service), "std_type": None,
@@ -2278,49 +2440,26 @@ def create_line_from_parameters(net, from_bus, to_bus, length_km, r_ohm_per_km,
         "g_us_per_km": g_us_per_km
     }
 
-    net.line.loc[index, list(v.keys())] = list(v.values())
+    _set_entries(net, "line", index, list(v.keys()), list(v.values()))
 
     if not (isnan(r0_ohm_per_km) and isnan(x0_ohm_per_km) and isnan(c0_nf_per_km)):
-        if "r0_ohm_per_km" not in net.line.columns:
-            net.line.loc[:, "r0_ohm_per_km"] = pd.Series()
-
-        net.line.loc[index, "r0_ohm_per_km"] = float(r0_ohm_per_km)
-        if "x0_ohm_per_km" not in net.line.columns:
-            net.line.loc[:, "x0_ohm_per_km"] = pd.Series()
-
-        net.line.loc[index, "x0_ohm_per_km"] = float(x0_ohm_per_km)
-        if "c0_nf_per_km" not in net.line.columns:
-            net.line.loc[:, "c0_nf_per_km"] = pd.Series()
-
-        net.line.loc[index, "c0_nf_per_km"] = float(c0_nf_per_km)
-
-    # and preserve dtypes
-    _preserve_dtypes(net.line, dtypes)
+        _set_value(net, "line", index, "r0_ohm_per_km", float(r0_ohm_per_km))
+        _set_value(net, "line", index, "x0_ohm_per_km", float(x0_ohm_per_km))
+        _set_value(net, "line", index, "c0_nf_per_km", float(c0_nf_per_km))
 
     if geodata is not None:
-        net["line_geodata"].loc[index, "coords"] = None
-        net["line_geodata"].at[index, "coords"] = geodata
+        _set_coords(net, "line_geodata", index, geodata)
 
-    if not isnan(max_loading_percent):
-        if "max_loading_percent" not in net.line.columns:
-            net.line.loc[:, "max_loading_percent"] = pd.Series()
-
-        net.line.loc[index, "max_loading_percent"] = float(max_loading_percent)
+    _create_column_and_set_value(net, index, max_loading_percent, "max_loading_percent", "line")
 
     if alpha is not None:
-        if "alpha" not in net.line.columns:
-            net.line.loc[:, "alpha"] = pd.Series()
-        net.line.loc[index, "alpha"] = alpha
+        _set_value(net, "line", index, "alpha", alpha)
 
     if temperature_degree_celsius is not None:
-        if "temperature_degree_celsius" not in net.line.columns:
-            net.line.loc[:, "temperature_degree_celsius"] = pd.Series()
-        net.line.loc[index, "temperature_degree_celsius"] = temperature_degree_celsius
+        _set_value(net, "line", index, "temperature_degree_celsius", temperature_degree_celsius)
 
     if endtemp_degree is not None:
-        if "endtemp_degree" not in net.line.columns:
-            net.line.loc[:, "endtemp_degree"] = pd.Series()
-        net.line.loc[index, "endtemp_degree"] = endtemp_degree
+        _set_value(net, "line", index, "endtemp_degree", endtemp_degree)
 
     return index
 
@@ -2398,6 +2537,7 @@ def create_lines_from_parameters(net, from_buses, to_buses, length_km, r_ohm_per
         max_i_ka = 0.4)
 
     """
+    _materialize_bulk_tables(net)
     nr_lines = len(from_buses)
     if index is not None:
         if any(isin(index, net.line.index)):
@@ -2543,6 +2683,7 @@ def create_lines(net, from_buses, to_buses, length_km, std_type, name=None, inde
             create_line(net, "line1", from_bus = 0, to_bus = 1, length_km=0.1,  std_type="NAYY 4x50 SE")
 
     """
+    _materialize_bulk_tables(net)
 
     nr_lines = len(from_buses)
     if index is not None:
@@ -2679,7 +2820,7 @@ def create_transformer(net, hv_bus, lv_bus, std_type, name=None, tap_pos=nan, in
 
     # Check if bus exist to attach the trafo to
     for b in [hv_bus, lv_bus]:
-        if b not in net["bus"].index.values:
+        if not _element_exists(net, "bus", b):
             raise UserWarning("Trafo tries to attach to bus %s" % b)
 
     if df <= 0:
@@ -2692,9 +2833,9 @@ def create_transformer(net, hv_bus, lv_bus, std_type, name=None, tap_pos=nan, in
     ti = load_std_type(net, std_type, "trafo")
 
     if index is None:
-        index = get_free_id(net["trafo"])
+        index = _get_free_id(net, "trafo")
 
-    if index in net["trafo"].index:
+    if _element_exists(net, "trafo", index):
         raise UserWarning("A transformer with index %s already exists" % index)
 
     v.update({
@@ -2720,23 +2861,14 @@ def create_transformer(net, hv_bus, lv_bus, std_type, name=None, tap_pos=nan, in
         v["tap_pos"] = tap_pos
         if isinstance(tap_pos, float):
             net.trafo.tap_pos = net.trafo.tap_pos.astype(float)
-    # store dtypes
-    dtypes = net.trafo.dtypes
-
-    net.trafo.loc[index, list(v.keys())] = list(v.values())
 
-    if not isnan(max_loading_percent):
-        if "max_loading_percent" not in net.trafo.columns:
-            net.trafo.loc[:, "max_loading_percent"] = pd.Series()
+    _set_entries(net, "trafo", index, list(v.keys()), list(v.values()))
 
-        net.trafo.loc[index, "max_loading_percent"] = float(max_loading_percent)
+    _create_column_and_set_value(net, index, max_loading_percent, "max_loading_percent", "trafo")
 
     # tap_phase_shifter default False
     net.trafo.tap_phase_shifter.fillna(False, inplace=True)
 
-    # and preserve dtypes
-    _preserve_dtypes(net.trafo, dtypes)
-
     return index
 
 
@@ -2843,22 +2975,20 @@ def create_transformer_from_parameters(net, hv_bus, lv_bus, sn_mva, vn_hv_kv, vn
 
     # Check if bus exist to attach the trafo to
     for b in [hv_bus, lv_bus]:
-        if b not in net["bus"].index.values:
+        if not _element_exists(net, "bus", b):
             raise UserWarning("Trafo tries to attach to bus %s" % b)
 
     if df <= 0:
         raise UserWarning("derating factor df must be positive: df = %.3f" % df)
 
     if index is None:
-        index = get_free_id(net["trafo"])
+        index = _get_free_id(net, "trafo")
 
-    if index in net["trafo"].index:
+    if _element_exists(net, "trafo", index):
         raise UserWarning("A transformer with index %s already exists" % index)
 
     if tap_pos is nan:
         tap_pos = tap_neutral
-        # store dtypes
-    dtypes = net.trafo.dtypes
 
     v = {
         "name": name, "hv_bus": hv_bus, "lv_bus": lv_bus,
@@ -2876,41 +3006,17 @@ def create_transformer_from_parameters(net, hv_bus, lv_bus, sn_mva, vn_hv_kv, vn
         v["tap_pos"] = tap_pos
         if type(tap_pos) == float:
             net.trafo.tap_pos = net.trafo.tap_pos.astype(float)
-    net.trafo.loc[index, list(v.keys())] = list(v.values())
+    _set_entries(net, "trafo", index, list(v.keys()), list(v.values()))
 
     if not (isnan(vk0_percent) and isnan(vkr0_percent) and isnan(mag0_percent) \
             and isnan(mag0_rx) and isnan(si0_hv_partial) and vector_group is None):
-        if "vk0_percent" not in net.trafo.columns:
-            net.trafo.loc[:, "vk0_percent"] = pd.Series()
-
-        net.trafo.loc[index, "vk0_percent"] = float(vk0_percent)
-        if "vkr0_percent" not in net.trafo.columns:
-            net.trafo.loc[:, "vkr0_percent"] = pd.Series()
-
-        net.trafo.loc[index, "vkr0_percent"] = float(vkr0_percent)
-        if "mag0_percent" not in net.trafo.columns:
-            net.trafo.loc[:, "mag0_percent"] = pd.Series()
-
-        net.trafo.loc[index, "mag0_percent"] = float(mag0_percent)
-        if "mag0_rx" not in net.trafo.columns:
-            net.trafo.loc[:, "mag0_rx"] = pd.Series()
-
-        net.trafo.loc[index, "mag0_rx"] = float(mag0_rx)
-        if "si0_hv_partial" not in net.trafo.columns:
-            net.trafo.loc[:, "si0_hv_partial"] = pd.Series()
-
-        net.trafo.loc[index, "si0_hv_partial"] = float(si0_hv_partial)
-        if "vector_group" not in net.trafo.columns:
-            net.trafo.loc[:, "vector_group"] = pd.Series()
-
-        net.trafo.loc[index, "vector_group"] = str(vector_group)
-    if not isnan(max_loading_percent):
-        if "max_loading_percent" not in net.trafo.columns:
-            net.trafo.loc[:, "max_loading_percent"] = pd.Series()
-
-        net.trafo.loc[index, "max_loading_percent"] = float(max_loading_percent)
-    # and preserve dtypes
-    _preserve_dtypes(net.trafo, dtypes)
+        _set_value(net, "trafo", index, "vk0_percent", float(vk0_percent))
+        _set_value(net, "trafo", index, "vkr0_percent", float(vkr0_percent))
+        _set_value(net, "trafo", index, "mag0_percent", float(mag0_percent))
+        _set_value(net, "trafo", index, "mag0_rx", float(mag0_rx))
+        _set_value(net, "trafo", index, "si0_hv_partial", float(si0_hv_partial))
+        _set_value(net, "trafo", index, "vector_group", str(vector_group))
+    _create_column_and_set_value(net, index, max_loading_percent, "max_loading_percent", "trafo")
 
     return index
 
@@ -3015,6 +3121,7 @@ def create_transformers_from_parameters(net, hv_buses, lv_buses, sn_mva, vn_hv_k
             vn_hv_kv=110, vn_lv_kv=10, vk_percent=10, vkr_percent=0.3, pfe_kw=30, \
             i0_percent=0.1, shift_degree=30)
     """
+    _materialize_bulk_tables(net)
 
     nr_trafo = len(hv_buses)
     if index is not None:
@@ -3131,7 +3238,7 @@ def create_transformer3w(net, hv_bus, mv_bus, lv_bus, std_type, name=None, tap_p
 
     # Check if bus exist to attach the trafo to
     for b in [hv_bus, mv_bus, lv_bus]:
-        if b not in net["bus"].index.values:
+        if not _element_exists(net, "bus", b):
             raise UserWarning("Trafo tries to attach to bus %s" % b)
 
     v = {
@@ -3141,9 +3248,9 @@ def create_transformer3w(net, hv_bus, mv_bus, lv_bus, std_type, name=None, tap_p
     ti = load_std_type(net, std_type, "trafo3w")
 
     if index is None:
-        index = get_free_id(net["trafo3w"])
+        index = _get_free_id(net, "trafo3w")
 
-    if index in net["trafo3w"].index:
+    if _element_exists(net, "trafo3w", index):
         raise UserWarning("A three winding transformer with index %s already exists" % index)
 
     v.update({
@@ -3176,19 +3283,9 @@ def create_transformer3w(net, hv_bus, mv_bus, lv_bus, std_type, name=None, tap_p
         if type(tap_pos) == float:
             net.trafo3w.tap_pos = net.trafo3w.tap_pos.astype(float)
 
-    dd = pd.DataFrame(v, index=[index])
-    if version.parse(pd.__version__) < version.parse("0.21"):
-        net["trafo3w"] = net["trafo3w"].append(dd).reindex_axis(net["trafo3w"].columns, axis=1)
-    elif version.parse(pd.__version__) < version.parse("0.23"):
-        net["trafo3w"] = net["trafo3w"].append(dd).reindex(net["trafo3w"].columns, axis=1)
-    else:
-        net["trafo3w"] = net["trafo3w"].append(dd, sort=True).reindex(net["trafo3w"].columns, axis=1)
+    _set_entries(net, "trafo3w", index, list(v.keys()), list(v.values()))
 
-    if not isnan(max_loading_percent):
-        if "max_loading_percent" not in net.trafo3w.columns:
-            net.trafo3w.loc[:, "max_loading_percent"] = pd.Series()
-
-        net.trafo3w.loc[index, "max_loading_percent"] = float(max_loading_percent)
+    _create_column_and_set_value(net, index, max_loading_percent, "max_loading_percent", "trafo3w")
 
     return index
 
@@ -3291,43 +3388,32 @@ def create_transformer3w_from_parameters(net, hv_bus, mv_bus, lv_bus, vn_hv_kv,
 
     # Check if bus exist to attach the trafo to
     for b in [hv_bus, mv_bus, lv_bus]:
-        if b not in net["bus"].index.values:
+        if not _element_exists(net, "bus", b):
             raise UserWarning("Trafo tries to attach to non-existent bus %s" % b)
 
     if index is None:
-        index = get_free_id(net["trafo3w"])
+        index = _get_free_id(net, "trafo3w")
 
-    if index in net["trafo3w"].index:
+    if _element_exists(net, "trafo3w", index):
         raise UserWarning("A three winding transformer with index %s already exists" % index)
 
     if tap_pos is nan:
         tap_pos = tap_neutral
 
-    # store dtypes
-    dtypes = net.trafo3w.dtypes
-
-    net.trafo3w.loc[index, ["lv_bus", "mv_bus", "hv_bus", "vn_hv_kv", "vn_mv_kv", "vn_lv_kv",
-                            "sn_hv_mva", "sn_mv_mva", "sn_lv_mva", "vk_hv_percent",
-                            "vk_mv_percent", "vk_lv_percent", "vkr_hv_percent",
-                            "vkr_mv_percent", "vkr_lv_percent", "pfe_kw", "i0_percent",
-                            "shift_mv_degree", "shift_lv_degree", "tap_side", "tap_step_percent",
-                            "tap_step_degree", "tap_pos", "tap_neutral", "tap_max", "tap_min", "in_service",
-                            "name", "std_type", "tap_at_star_point"]] = \
-        [lv_bus, mv_bus, hv_bus, vn_hv_kv, vn_mv_kv, vn_lv_kv,
-         sn_hv_mva, sn_mv_mva, sn_lv_mva, vk_hv_percent, vk_mv_percent,
-         vk_lv_percent, vkr_hv_percent, vkr_mv_percent, vkr_lv_percent,
-         pfe_kw, i0_percent, shift_mv_degree, shift_lv_degree,
-         tap_side, tap_step_percent, tap_step_degree, tap_pos, tap_neutral, tap_max,
-         tap_min, bool(in_service), name, None, tap_at_star_point]
-
-    # and preserve dtypes
-    _preserve_dtypes(net.trafo3w, dtypes)
-
-    if not isnan(max_loading_percent):
-        if "max_loading_percent" not in net.trafo3w.columns:
-            net.trafo3w.loc[:, "max_loading_percent"] = pd.Series()
-
-        net.trafo3w.loc[index, "max_loading_percent"] = float(max_loading_percent)
+    _set_entries(net, "trafo3w", index,
+                 ["lv_bus", "mv_bus", "hv_bus", "vn_hv_kv", "vn_mv_kv", "vn_lv_kv", "sn_hv_mva",
+                  "sn_mv_mva", "sn_lv_mva", "vk_hv_percent", "vk_mv_percent", "vk_lv_percent",
+                  "vkr_hv_percent", "vkr_mv_percent", "vkr_lv_percent", "pfe_kw", "i0_percent",
+                  "shift_mv_degree", "shift_lv_degree", "tap_side", "tap_step_percent",
+                  "tap_step_degree", "tap_pos", "tap_neutral", "tap_max", "tap_min", "in_service",
+                  "name", "std_type", "tap_at_star_point"],
+                 [lv_bus, mv_bus, hv_bus, vn_hv_kv, vn_mv_kv, vn_lv_kv, sn_hv_mva, sn_mv_mva,
+                  sn_lv_mva, vk_hv_percent, vk_mv_percent, vk_lv_percent, vkr_hv_percent,
+                  vkr_mv_percent, vkr_lv_percent, pfe_kw, i0_percent, shift_mv_degree,
+                  shift_lv_degree, tap_side, tap_step_percent, tap_step_degree, tap_pos,
+                  tap_neutral, tap_max, tap_min, bool(in_service), name, None, tap_at_star_point])
+
+    _create_column_and_set_value(net, index, max_loading_percent, "max_loading_percent", "trafo3w")
 
     return index
 
@@ -3427,6 +3513,7 @@ def create_transformers3w_from_parameters(net, hv_buses, mv_buses, lv_buses, vn_
         shift_lv_degree=30)
 
     """
+    _materialize_bulk_tables(net)
     nr_trafo = len(hv_buses)
     if index is not None:
         for idx in index:
@@ -3529,49 +3616,44 @@ def create_switch(net, bus, element, et, closed=True, type=None, name=None, inde
         create_switch(net, bus = 0, element = 1, et = 'l')
 
     """
-    if bus not in net["bus"].index:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Unknown bus index")
     if et == "l":
         elm_tab = 'line'
-        if element not in net[elm_tab].index:
+        if not _element_exists(net, elm_tab, element):
             raise UserWarning("Unknown line index")
-        if (not net[elm_tab]["from_bus"].loc[element] == bus and
-                not net[elm_tab]["to_bus"].loc[element] == bus):
+        if (not _get_entry(net, elm_tab, element, "from_bus") == bus and
+                not _get_entry(net, elm_tab, element, "to_bus") == bus):
             raise UserWarning("Line %s not connected to bus %s" % (element, bus))
     elif et == "t":
         elm_tab = 'trafo'
-        if element not in net[elm_tab].index:
+        if not _element_exists(net, elm_tab, element):
             raise UserWarning("Unknown bus index")
-        if (not net[elm_tab]["hv_bus"].loc[element] == bus and
-                not net[elm_tab]["lv_bus"].loc[element] == bus):
+        if (not _get_entry(net, elm_tab, element, "hv_bus") == bus and
+                not _get_entry(net, elm_tab, element, "lv_bus") == bus):
             raise UserWarning("Trafo %s not connected to bus %s" % (element, bus))
     elif et == "t3":
         elm_tab = 'trafo3w'
-        if element not in net[elm_tab].index:
+        if not _element_exists(net, elm_tab, element):
             raise UserWarning("Unknown trafo3w index")
-        if (not net[elm_tab]["hv_bus"].loc[element] == bus and
-                not net[elm_tab]["mv_bus"].loc[element] == bus and
-                not net[elm_tab]["lv_bus"].loc[element] == bus):
+        if (not _get_entry(net, elm_tab, element, "hv_bus") == bus and
+                not _get_entry(net, elm_tab, element, "mv_bus") == bus and
+                not _get_entry(net, elm_tab, element, "lv_bus") == bus):
             raise UserWarning("Trafo3w %s not connected to bus %s" % (element, bus))
     elif et == "b":
-        if element not in net["bus"].index:
+        if not _element_exists(net, "bus", element):
             raise UserWarning("Unknown bus index")
     else:
         raise UserWarning("Unknown element type")
 
     if index is None:
-        index = get_free_id(net["switch"])
-    if index in net["switch"].index:
+        index = _get_free_id(net, "switch")
+    if _element_exists(net, "switch", index):
         raise UserWarning("A switch with index %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.switch.dtypes
-
-    net.switch.loc[index, ["bus", "element", "et", "closed", "type", "name", "z_ohm"]] = \
-        [bus, element, et, closed, type, name, z_ohm]
-
-    # and preserve dtypes
-    _preserve_dtypes(net.switch, dtypes)
+    _set_entries(net, "switch", index,
+                 ["bus", "element", "et", "closed", "type", "name", "z_ohm"],
+                 [bus, element, et, closed, type, name, z_ohm])
 
     return index
 
@@ -3622,6 +3704,7 @@ def create_switches(net, buses, elements, et, closed=True, type=None, name=None,
         create_switch(net, bus = 0, element = 1, et = 'l')
 
     """
+    _materialize_bulk_tables(net)
     nr_switches = len(buses)
     if index is not None:
         for idx in index:
@@ -3721,26 +3804,75 @@ def create_shunt(net, bus, q_mvar, p_mw=0., vn_kv=None, step=1, max_step=1, name
     EXAMPLE:
         create_shunt(net, 0, 20)
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net["shunt"])
+        index = _get_free_id(net, "shunt")
 
-    if index in net["shunt"].index:
+    if _element_exists(net, "shunt", index):
         raise UserWarning("A shunt with index %s already exists" % index)
 
     if vn_kv is None:
-        vn_kv = net.bus.vn_kv.at[bus]
-    # store dtypes
-    dtypes = net.shunt.dtypes
+        vn_kv = _get_entry(net, "bus", bus, "vn_kv")
 
-    net.shunt.loc[index, ["bus", "name", "p_mw", "q_mvar", "vn_kv", "step", "max_step",
-                          "in_service"]] = [bus, name, p_mw, q_mvar, vn_kv, step, max_step,
-                                            in_service]
+    _set_entries(net, "shunt", index, ["bus", "name", "p_mw", "q_mvar", "vn_kv", "step",
+                                       "max_step", "in_service"],
+                 [bus, name, p_mw, q_mvar, vn_kv, step, max_step, in_service])
 
-    # and preserve dtypes
-    _preserve_dtypes(net.shunt, dtypes)
+    return index
+
+
+def create_shunts(net, buses, q_mvar, p_mw=0., vn_kv=None, step=1, max_step=1, name=None,
+                  in_service=True, index=None, **kwargs):
+    """
+    Creates a number of shunt elements in table net["shunt"].
+
+    INPUT:
+        **net** (pandapowerNet) - The pandapower network in which the elements are created
+
+        **buses** (list of int) - bus numbers of the buses to whom the shunts are connected to
+
+        **q_mvar** (list of floats) - shunt susceptances in MVAr at v= 1.0 p.u.
+
+    OPTIONAL:
+        **p_mw** (list of floats, 0.) - shunt active powers in MW at v= 1.0 p.u.
+
+        **vn_kv** (list of floats, None) - rated voltages of the shunts. Missing values default \
+            to the rated voltages of the connected buses
+
+        **step** (list of int, 1) - steps of the shunts with which power values are multiplied
+
+        **max_step** (list of int, 1) - maximum allowed steps of the shunts
+
+        **name** (list of strings, None) - element names
+
+        **in_service** (list of boolean, True) - True for in_service or False for out of service
+
+        **index** (list of int, None) - Force a specified ID if it is available. If None, the \
+            index is set to a range between one higher than the highest already existing index \
+            and the length of shunts that shall be created.
+
+    OUTPUT:
+        **index** (list of int) - The unique IDs of the created shunts
+
+    EXAMPLE:
+        create_shunts(net, [0, 2], q_mvar=[20, 10])
+    """
+    _materialize_bulk_tables(net)
+    _check_multiple_node_elements(net, buses, "Shunts")
+    index = _get_multiple_index_with_check(net, "shunt", index, len(buses), "Shunts")
+
+    bus_vn_kv = net.bus.vn_kv.loc[buses].values
+    if vn_kv is None:
+        vn_kv = bus_vn_kv
+    else:
+        vn_kv = pd.Series(vn_kv, index=index, dtype=float).fillna(pd.Series(bus_vn_kv, index=index))
+
+    entries = {"bus": buses, "name": name, "p_mw": p_mw, "q_mvar": q_mvar, "vn_kv": vn_kv,
+               "step": step, "max_step": max_step, "in_service": in_service}
+
+    _set_multiple_entries(net, "shunt", index, entries, **kwargs)
 
     return index
 
@@ -3793,27 +3925,74 @@ def create_impedance(net, from_bus, to_bus, rft_pu, xft_pu, sn_mva, rtf_pu=None,
         impedance id
     """
     for b in [from_bus, to_bus]:
-        if b not in net["bus"].index.values:
+        if not _element_exists(net, "bus", b):
             raise UserWarning("Impedance %s tries to attach to non-existing bus %s" % (name, b))
 
     if index is None:
-        index = get_free_id(net.impedance)
+        index = _get_free_id(net, "impedance")
 
-    if index in net["impedance"].index:
+    if _element_exists(net, "impedance", index):
         raise UserWarning("An impedance with index %s already exists" % index)
 
-        # store dtypes
-    dtypes = net.impedance.dtypes
     if rtf_pu is None:
         rtf_pu = rft_pu
     if xtf_pu is None:
         xtf_pu = xft_pu
-    net.impedance.loc[index, ["from_bus", "to_bus", "rft_pu", "xft_pu", "rtf_pu", "xtf_pu",
-                              "name", "sn_mva", "in_service"]] = \
-        [from_bus, to_bus, rft_pu, xft_pu, rtf_pu, xtf_pu, name, sn_mva, in_service]
+    _set_entries(net, "impedance", index, ["from_bus", "to_bus", "rft_pu", "xft_pu", "rtf_pu",
+                                           "xtf_pu", "name", "sn_mva", "in_service"],
+                 [from_bus, to_bus, rft_pu, xft_pu, rtf_pu, xtf_pu, name, sn_mva, in_service])
 
-    # and preserve dtypes
-    _preserve_dtypes(net.impedance, dtypes)
+    return index
+
+
+def create_impedances(net, from_buses, to_buses, rft_pu, xft_pu, sn_mva, rtf_pu=None,
+                      xtf_pu=None, name=None, in_service=True, index=None, **kwargs):
+    """
+    Creates a number of per unit impedance elements in table net["impedance"].
+
+    INPUT:
+        **net** (pandapowerNet) - The pandapower network in which the elements are created
+
+        **from_buses** (list of int) - starting buses of the impedances
+
+        **to_buses** (list of int) - ending buses of the impedances
+
+        **rft_pu** (list of floats) - real parts of the impedances in per unit
+
+        **xft_pu** (list of floats) - imaginary parts of the impedances in per unit
+
+        **sn_mva** (list of floats) - rated powers of the impedances in MVA
+
+    OPTIONAL:
+        **rtf_pu**, **xtf_pu** (list of floats, None) - impedances from to_bus to from_bus. \
+            Default to rft_pu and xft_pu
+
+        **name** (list of strings, None) - element names
+
+        **in_service** (list of boolean, True) - True for in_service or False for out of service
+
+        **index** (list of int, None) - Force a specified ID if it is available. If None, the \
+            index is set to a range between one higher than the highest already existing index \
+            and the length of impedances that shall be created.
+
+    OUTPUT:
+        **index** (list of int) - The unique IDs of the created impedances
+    """
+    _materialize_bulk_tables(net)
+    _check_multiple_node_elements(net, from_buses, "Impedances")
+    _check_multiple_node_elements(net, to_buses, "Impedances")
+    index = _get_multiple_index_with_check(net, "impedance", index, len(from_buses),
+                                           "Impedances")
+
+    if rtf_pu is None:
+        rtf_pu = rft_pu
+    if xtf_pu is None:
+        xtf_pu = xft_pu
+    entries = {"from_bus": from_buses, "to_bus": to_buses, "rft_pu": rft_pu, "xft_pu": xft_pu,
+               "rtf_pu": rtf_pu, "xtf_pu": xtf_pu, "name": name, "sn_mva": sn_mva,
+               "in_service": in_service}
+
+    _set_multiple_entries(net, "impedance", index, entries, **kwargs)
 
     return index
 
@@ -3832,17 +4011,18 @@ def create_series_reactor_as_impedance(net, from_bus, to_bus, r_ohm, x_ohm, sn_m
     :return: index of the created element
     """
     for b in [from_bus, to_bus]:
-        if b not in net["bus"].index.values:
+        if not _element_exists(net, "bus", b):
             raise UserWarning(
                 "Series reactor %s tries to attach to non-existing bus %s" % (name, b))
 
-    if net.bus.at[from_bus, 'vn_kv'] == net.bus.at[to_bus, 'vn_kv']:
-        vn_kv = net.bus.at[from_bus, 'vn_kv']
+    vn_from_kv = _get_entry(net, "bus", from_bus, "vn_kv")
+    vn_to_kv = _get_entry(net, "bus", to_bus, "vn_kv")
+    if vn_from_kv == vn_to_kv:
+        vn_kv = vn_from_kv
     else:
         raise UserWarning('Unable to infer rated voltage vn_kv for series reactor %s due to '
                           'different rated voltages of from_bus %d (%.3f p.u.) and '
-                          'to_bus %d (%.3f p.u.)' % (name, from_bus, net.bus.at[from_bus, 'vn_kv'],
-                                                     to_bus, net.bus.at[to_bus, 'vn_kv']))
+                          'to_bus %d (%.3f p.u.)' % (name, from_bus, vn_from_kv, to_bus, vn_to_kv))
 
     base_z_ohm = vn_kv ** 2 / sn_mva
     rft_pu = r_ohm / base_z_ohm
@@ -3876,23 +4056,60 @@ def create_ward(net, bus, ps_mw, qs_mvar, pz_mw, qz_mvar, name=None, in_service=
     OUTPUT:
         ward id
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net.ward)
+        index = _get_free_id(net, "ward")
 
-    if index in net["ward"].index:
+    if _element_exists(net, "ward", index):
         raise UserWarning("A ward equivalent with index %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.ward.dtypes
+    _set_entries(net, "ward", index,
+                 ["bus", "ps_mw", "qs_mvar", "pz_mw", "qz_mvar", "name", "in_service"],
+                 [bus, ps_mw, qs_mvar, pz_mw, qz_mvar, name, in_service])
+
+    return index
 
-    net.ward.loc[index, ["bus", "ps_mw", "qs_mvar", "pz_mw", "qz_mvar", "name", "in_service"]] = \
-        [bus, ps_mw, qs_mvar, pz_mw, qz_mvar, name, in_service]
 
-    # and preserve dtypes
-    _preserve_dtypes(net.ward, dtypes)
+def create_wards(net, buses, ps_mw, qs_mvar, pz_mw, qz_mvar, name=None, in_service=True,
+                 index=None, **kwargs):
+    """
+    Creates a number of ward equivalents in table net["ward"].
+
+    INPUT:
+        **net** (pandapowernet) - The pandapower net within the elements should be created
+
+        **buses** (list of int) -  buses of the ward equivalents
+
+        **ps_mw** (list of floats) - active powers of the PQ loads
+
+        **qs_mvar** (list of floats) - reactive powers of the PQ loads
+
+        **pz_mw** (list of floats) - active powers of the impedance loads at 1.pu voltage
+
+        **qz_mvar** (list of floats) - reactive powers of the impedance loads at 1.pu voltage
+
+    OPTIONAL:
+        **name** (list of strings, None) - element names
+
+        **in_service** (list of boolean, True) - True for in_service or False for out of service
+
+        **index** (list of int, None) - Force a specified ID if it is available. If None, the \
+            index is set to a range between one higher than the highest already existing index \
+            and the length of wards that shall be created.
+
+    OUTPUT:
+        **index** (list of int) - The unique IDs of the created ward equivalents
+    """
+    _materialize_bulk_tables(net)
+    _check_multiple_node_elements(net, buses, "Ward equivalents")
+    index = _get_multiple_index_with_check(net, "ward", index, len(buses), "Ward equivalents")
+
+    entries = {"bus": buses, "ps_mw": ps_mw, "qs_mvar": qs_mvar, "pz_mw": pz_mw,
+               "qz_mvar": qz_mvar, "name": name, "in_service": in_service}
+
+    _set_multiple_entries(net, "ward", index, entries, **kwargs)
 
     return index
 
@@ -3927,24 +4144,69 @@ def create_xward(net, bus, ps_mw, qs_mvar, pz_mw, qz_mvar, r_ohm, x_ohm, vm_pu,
     OUTPUT:
         xward id
     """
-    if bus not in net["bus"].index.values:
+    if not _element_exists(net, "bus", bus):
         raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net.xward)
+        index = _get_free_id(net, "xward")
 
-    if index in net["xward"].index:
+    if _element_exists(net, "xward", index):
         raise UserWarning("An extended ward equivalent with index %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.xward.dtypes
+    _set_entries(net, "xward", index,
+                 ["bus", "ps_mw", "qs_mvar", "pz_mw", "qz_mvar", "r_ohm", "x_ohm", "vm_pu", "name",
+                  "in_service"],
+                 [bus, ps_mw, qs_mvar, pz_mw, qz_mvar, r_ohm, x_ohm, vm_pu, name, in_service])
+
+    return index
 
-    net.xward.loc[index, ["bus", "ps_mw", "qs_mvar", "pz_mw", "qz_mvar", "r_ohm", "x_ohm", "vm_pu",
-                          "name", "in_service"]] = \
-        [bus, ps_mw, qs_mvar, pz_mw, qz_mvar, r_ohm, x_ohm, vm_pu, name, in_service]
 
-    # and preserve dtypes
-    _preserve_dtypes(net.xward, dtypes)
+def create_xwards(net, buses, ps_mw, qs_mvar, pz_mw, qz_mvar, r_ohm, x_ohm, vm_pu,
+                  in_service=True, name=None, index=None, **kwargs):
+    """
+    Creates a number of extended ward equivalents in table net["xward"].
+
+    INPUT:
+        **net** - The pandapower net within the elements should be created
+
+        **buses** (list of int) -  buses of the extended ward equivalents
+
+        **ps_mw** (list of floats) - active powers of the PQ loads
+
+        **qs_mvar** (list of floats) - reactive powers of the PQ loads
+
+        **pz_mw** (list of floats) - active powers of the impedance loads at 1.pu voltage
+
+        **qz_mvar** (list of floats) - reactive powers of the impedance loads at 1.pu voltage
+
+        **r_ohm** (list of floats) - internal resistances of the voltage sources
+
+        **x_ohm** (list of floats) - internal reactances of the voltage sources
+
+        **vm_pu** (list of floats) - voltage magnitudes at the additional PV-nodes
+
+    OPTIONAL:
+        **in_service** (list of boolean, True) - True for in_service or False for out of service
+
+        **name** (list of strings, None) - element names
+
+        **index** (list of int, None) - Force a specified ID if it is available. If None, the \
+            index is set to a range between one higher than the highest already existing index \
+            and the length of extended wards that shall be created.
+
+    OUTPUT:
+        **index** (list of int) - The unique IDs of the created extended ward equivalents
+    """
+    _materialize_bulk_tables(net)
+    _check_multiple_node_elements(net, buses, "Extended ward equivalents")
+    index = _get_multiple_index_with_check(net, "xward", index, len(buses),
+                                           "Extended ward equivalents")
+
+    entries = {"bus": buses, "ps_mw": ps_mw, "qs_mvar": qs_mvar, "pz_mw": pz_mw,
+               "qz_mvar": qz_mvar, "r_ohm": r_ohm, "x_ohm": x_ohm, "vm_pu": vm_pu, "name": name,
+               "in_service": in_service}
+
+    _set_multiple_entries(net, "xward", index, entries, **kwargs)
 
     return index
 
@@ -3998,26 +4260,22 @@ def create_dcline(net, from_bus, to_bus, p_mw, loss_percent, loss_mw, vm_from_pu
             vm_from_pu=1.01, vm_to_pu=1.02)
     """
     for bus in [from_bus, to_bus]:
-        if bus not in net["bus"].index.values:
+        if not _element_exists(net, "bus", bus):
             raise UserWarning("Cannot attach to bus %s, bus does not exist" % bus)
 
     if index is None:
-        index = get_free_id(net["dcline"])
+        index = _get_free_id(net, "dcline")
 
-    if index in net["dcline"].index:
+    if _element_exists(net, "dcline", index):
         raise UserWarning("A dcline with the id %s already exists" % index)
 
-    # store dtypes
-    dtypes = net.dcline.dtypes
-
-    net.dcline.loc[index, ["name", "from_bus", "to_bus", "p_mw", "loss_percent", "loss_mw",
-                           "vm_from_pu", "vm_to_pu", "max_p_mw", "min_q_from_mvar",
-                           "min_q_to_mvar", "max_q_from_mvar", "max_q_to_mvar", "in_service"]] \
-        = [name, from_bus, to_bus, p_mw, loss_percent, loss_mw, vm_from_pu, vm_to_pu,
-           max_p_mw, min_q_from_mvar, min_q_to_mvar, max_q_from_mvar, max_q_to_mvar, in_service]
-
-    # and preserve dtypes
-    _preserve_dtypes(net.dcline, dtypes)
+    _set_entries(net, "dcline", index,
+                 ["name", "from_bus", "to_bus", "p_mw", "loss_percent", "loss_mw", "vm_from_pu",
+                  "vm_to_pu", "max_p_mw", "min_q_from_mvar", "min_q_to_mvar", "max_q_from_mvar",
+                  "max_q_to_mvar", "in_service"],
+                 [name, from_bus, to_bus, p_mw, loss_percent, loss_mw, vm_from_pu, vm_to_pu,
+                  max_p_mw, min_q_from_mvar, min_q_to_mvar, max_q_from_mvar, max_q_to_mvar,
+                  in_service])
 
     return index
 
@@ -4080,24 +4338,25 @@ def create_measurement(net, meas_type, element_type, value, std_dev, element, si
     if element_type not in ("bus", "line", "trafo", "trafo3w"):
         raise UserWarning("Invalid element type ({})".format(element_type))
 
-    if element_type == "bus" and element not in net["bus"].index.values:
+    if element_type == "bus" and not _element_exists(net, "bus", element):
         raise UserWarning("Bus with index={} does not exist".format(element))
 
-    if element is not None and element_type == "line" and element not in net["line"].index.values:
+    if element is not None and element_type == "line" and \
+            not _element_exists(net, "line", element):
         raise UserWarning("Line with index={} does not exist".format(element))
 
-    if element is not None and element_type == "trafo" and element not in \
-            net["trafo"].index.values:
+    if element is not None and element_type == "trafo" and \
+            not _element_exists(net, "trafo", element):
         raise UserWarning("Trafo with index={} does not exist".format(element))
 
-    if element is not None and element_type == "trafo3w" and element not in \
-            net["trafo3w"].index.values:
+    if element is not None and element_type == "trafo3w" and \
+            not _element_exists(net, "trafo3w", element):
         raise UserWarning("Trafo3w with index={} does not exist".format(element))
 
     if index is None:
-        index = get_free_id(net.measurement)
+        index = _get_free_id(net, "measurement")
 
-    if index in net["measurement"].index:
+    if _element_exists(net, "measurement", index):
         raise UserWarning("A measurement with index={} already exists".format(index))
 
     if meas_type in ("i", "ia") and element_type == "bus":
@@ -4107,6 +4366,8 @@ def create_measurement(net, meas_type, element_type, value, std_dev, element, si
         raise UserWarning("Voltage measurements can only be placed at buses, not at {}".format(element_type))
 
     if check_existing:
+        # the existing measurements are searched in the table, not in the buffer of bulk_create
+        _materialize_bulk_tables(net)
         if side is None:
             existing = net.measurement[(net.measurement.measurement_type == meas_type) &
                                        (net.measurement.element_type == element_type) &
@@ -4122,11 +4383,77 @@ def create_measurement(net, meas_type, element_type, value, std_dev, element, si
         elif len(existing) > 1:
             raise UserWarning("More than one measurement of this type exists")
 
-    dtypes = net.measurement.dtypes
     columns = ["name", "measurement_type", "element_type", "element", "value", "std_dev", "side"]
-    net.measurement.loc[index, columns] = \
-        [name, meas_type.lower(), element_type, element, value, std_dev, side]
-    _preserve_dtypes(net.measurement, dtypes)
+    _set_entries(net, "measurement", index, columns,
+                 [name, meas_type.lower(), element_type, element, value, std_dev, side])
+    return index
+
+
+def create_measurements(net, meas_type, element_type, value, std_dev, element, side=None,
+                        index=None, name=None):
+    """
+    Creates a number of measurements in table net["measurement"], which are used by the
+    estimation module. In contrast to create_measurement, existing measurements of the same type
+    are not searched and overwritten.
+
+    INPUT:
+        **meas_type** (string or list of strings) - Types of the measurements. "v", "p", "q", \
+            "i", "va", "ia" are possible
+
+        **element_type** (string or list of strings) - Clarifies which elements are measured. \
+            "bus", "line", "trafo", and "trafo3w" are possible
+
+        **value** (list of floats) - Measurement values
+
+        **std_dev** (list of floats) - Standard deviations in the same units as the measurements
+
+        **element** (list of int) - Indices of the measured elements
+
+    OPTIONAL:
+        **side** (list of int or strings, None) - Sides of the branch elements at which the \
+            measurements are located, see create_measurement
+
+        **index** (list of int, None) - Force a specified ID if it is available. If None, the \
+            index is set to a range between one higher than the highest already existing index \
+            and the length of measurements that shall be created.
+
+        **name** (list of strings, None) - names of the measurements
+
+    OUTPUT:
+        **index** (list of int) - The unique IDs of the created measurements
+
+    EXAMPLE:
+        create_measurements(net, "v", "bus", [1.006, 1.01], [.004, .004], [0, 3])
+
+    """
+    _materialize_bulk_tables(net)
+    nr_meas = len(element)
+    meas = pd.DataFrame({"measurement_type": meas_type, "element_type": element_type,
+                         "element": element}, index=arange(nr_meas))
+    meas["measurement_type"] = meas.measurement_type.str.lower()
+
+    unknown_types = set(meas.element_type) - {"bus", "line", "trafo", "trafo3w"}
+    if len(unknown_types):
+        raise UserWarning("Invalid element type ({})".format(unknown_types))
+    for et, et_name in [("bus", "Bus"), ("line", "Line"), ("trafo", "Trafo"),
+                        ("trafo3w", "Trafo3w")]:
+        elements = meas.element[meas.element_type == et].values
+        missing = set(elements) - set(net[et].index.values)
+        if len(missing):
+            raise UserWarning("{} with index={} does not exist".format(et_name, missing))
+    if np_any(meas.measurement_type.isin(["i", "ia"]) & (meas.element_type == "bus")):
+        raise UserWarning("Line current measurements cannot be placed at buses")
+    if np_any(meas.measurement_type.isin(["v", "va"]) & (meas.element_type != "bus")):
+        raise UserWarning("Voltage measurements can only be placed at buses")
+
+    index = _get_multiple_index_with_check(net, "measurement", index, nr_meas, "Measurements")
+
+    entries = {"name": name, "measurement_type": meas.measurement_type.values,
+               "element_type": meas.element_type.values, "element": element, "value": value,
+               "std_dev": std_dev, "side": side}
+
+    _set_multiple_entries(net, "measurement", index, entries)
+
     return index
 
 
@@ -4167,11 +4494,16 @@ def create_pwl_cost(net, element, et, points, power_type="p", index=None):
     """
 
     if index is None:
-        index = get_free_id(net["pwl_cost"])
+        index = _get_free_id(net, "pwl_cost")
 
-    if index in net["pwl_cost"].index:
+    if _element_exists(net, "pwl_cost", index):
         raise UserWarning("A piecewise_linear_cost with the id %s already exists" % index)
 
+    table = _bulk_table(net, "pwl_cost", add=True)
+    if table is not None:
+        table.add_row(index, {"power_type": power_type, "element": element, "et": et,
+                              "points": points})
+        return index
     dtypes = net.pwl_cost.dtypes
     net.pwl_cost.loc[index, ["power_type", "element", "et"]] = \
         [power_type, element, et]
@@ -4224,12 +4556,103 @@ def create_poly_cost(net, element, et, cp1_eur_per_mw, cp0_eur=0, cq1_eur_per_mv
     """
 
     if index is None:
-        index = get_free_id(net["poly_cost"])
+        index = _get_free_id(net, "poly_cost")
+    if _element_exists(net, "poly_cost", index):
+        raise UserWarning("A poly_cost with the id %s already exists" % index)
     columns = ["element", "et", "cp0_eur", "cp1_eur_per_mw", "cq0_eur", "cq1_eur_per_mvar",
                "cp2_eur_per_mw2", "cq2_eur_per_mvar2"]
     variables = [element, et, cp0_eur, cp1_eur_per_mw, cq0_eur, cq1_eur_per_mvar,
                  cp2_eur_per_mw2, cq2_eur_per_mvar2]
-    dtypes = net.poly_cost.dtypes
-    net.poly_cost.loc[index, columns] = variables
-    _preserve_dtypes(net.poly_cost, dtypes)
+    _set_entries(net, "poly_cost", index, columns, variables)
+    return index
+
+
+def create_pwl_costs(net, elements, et, points, power_type="p", index=None):
+    """
+    Creates entries for piecewise linear costs for a number of elements, see create_pwl_cost.
+
+    INPUT:
+        **elements** (list of int) - IDs of the elements in the respective element table
+
+        **et** (string or list of strings) - element types, one of "gen", "sgen", "ext_grid", \
+            "load", "dcline", "storage"
+
+        **points** - (list) list of the points of each cost entry, where every points entry is a \
+            list of lists with [[p1, p2, c1], [p2, p3, c2], ...]
+
+    OPTIONAL:
+        **power_type** - (string or list of strings) - Type of cost ["p", "q"] are allowed for \
+            active or reactive power
+
+        **index** (list of int, None) - Force a specified ID if it is available. If None, the \
+            index is set to a range between one higher than the highest already existing index \
+            and the length of cost entries that shall be created.
+
+    OUTPUT:
+        **index** (list of int) - The unique IDs of created cost entries
+
+    EXAMPLE:
+        create_pwl_costs(net, [0, 1], "gen", [[[0, 20, 1], [20, 30, 2]], [[0, 30, 1.5]]])
+    """
+    _materialize_bulk_tables(net)
+    if len(points) != len(elements):
+        raise UserWarning("The number of points entries (%i) must equal the number of elements "
+                          "(%i)" % (len(points), len(elements)))
+    index = _get_multiple_index_with_check(net, "pwl_cost", index, len(elements),
+                                           "Piecewise linear costs")
+
+    # every entry of points is a list of lists itself, which is why it is stored as an object
+    entries = {"power_type": power_type, "element": elements, "et": et,
+               "points": pd.Series(list(points), index=index, dtype=object)}
+
+    _set_multiple_entries(net, "pwl_cost", index, entries)
+
+    return index
+
+
+def create_poly_costs(net, elements, et, cp1_eur_per_mw, cp0_eur=0, cq1_eur_per_mvar=0,
+                      cq0_eur=0, cp2_eur_per_mw2=0, cq2_eur_per_mvar2=0, index=None):
+    """
+    Creates entries for polynomial costs for a number of elements, see create_poly_cost.
+
+    INPUT:
+        **elements** (list of int) - IDs of the elements in the respective element table
+
+        **et** (string or list of strings) - Types of the elements ["gen", "sgen", "ext_grid", \
+            "load", "dcline", "storage"] are possible
+
+        **cp1_eur_per_mw** (list of floats) - Linear costs per MW
+
+        **cp0_eur=0** (list of floats) - Offset active power costs in euro
+
+        **cq1_eur_per_mvar=0** (list of floats) - Linear costs per Mvar
+
+        **cq0_eur=0** (list of floats) - Offset reactive power costs in euro
+
+        **cp2_eur_per_mw2=0** (list of floats) - Quadratic costs per MW
+
+        **cq2_eur_per_mvar2=0** (list of floats) - Quadratic costs per Mvar
+
+    OPTIONAL:
+        **index** (list of int, None) - Force a specified ID if it is available. If None, the \
+            index is set to a range between one higher than the highest already existing index \
+            and the length of cost entries that shall be created.
+
+    OUTPUT:
+        **index** (list of int) - The unique IDs of created cost entries
+
+    EXAMPLE:
+        create_poly_costs(net, [0, 1], "load", cp1_eur_per_mw=[0.1, 0.2])
+    """
+    _materialize_bulk_tables(net)
+    index = _get_multiple_index_with_check(net, "poly_cost", index, len(elements),
+                                           "Polynomial costs")
+
+    entries = {"element": elements, "et": et, "cp0_eur": cp0_eur,
+               "cp1_eur_per_mw": cp1_eur_per_mw, "cq0_eur": cq0_eur,
+               "cq1_eur_per_mvar": cq1_eur_per_mvar, "cp2_eur_per_mw2": cp2_eur_per_mw2,
+               "cq2_eur_per_mvar2": cq2_eur_per_mvar2}
+
+    _set_multiple_entries(net, "poly_cost", index, entries)
+
     return index
@@ -7,6 +7,7 @@
 import json
 import os
 import pickle
+import sqlite3
 from warnings import warn
 
 import numpy
@@ -14,7 +15,7 @@ import pandas as pd
 from packaging import version
 
 import pandapower.io_utils as io_utils
-from pandapower.auxiliary import pandapowerNet
+from pandapower.auxiliary import pandapowerNet, _CopyOnWriteTable
 from pandapower.convert_format import convert_format
 from pandapower.create import create_empty_network
 
@@ -73,12 +74,16 @@ def to_excel(net, filename, include_empty_tables=False, include_results=True):
     writer.save()
 
 
-def to_json(net, filename=None, encryption_key=None):
+def to_json(net, filename=None, encryption_key=None, indent=2):
     """
         Saves a pandapower Network in JSON format. The index columns of all pandas DataFrames will
         be saved in ascending order. net elements which name begins with "_" (internal elements)
         will not be saved. Std types will also not be saved.
 
+        If a filename or file is given (and no encryption_key), the network is written
+        incrementally, one element after another, instead of creating the json string of the
+        whole network in memory.
+
         INPUT:
             **net** (dict) - The pandapower format network
 
@@ -89,13 +94,24 @@ def to_json(net, filename=None, encryption_key=None):
             **encrytion_key** (string, None) - If given, the pandapower network is stored as an
                                                encrypted json string
 
+            **indent** (int, 2) - indentation of the json file, None for the most compact
+                                  representation
 
         EXAMPLE:
 
              >>> pp.to_json(net, "example.json")
 
     """
-    json_string = json.dumps(net, cls=io_utils.PPJSONEncoder, indent=2)
+    if filename is not None and encryption_key is None:
+        # write the network incrementally
+        if hasattr(filename, 'write'):
+            json.dump(net, filename, cls=io_utils.PPJSONEncoder, indent=indent)
+        else:
+            with open(filename, "w") as fp:
+                json.dump(net, fp, cls=io_utils.PPJSONEncoder, indent=indent)
+        return
+
+    json_string = json.dumps(net, cls=io_utils.PPJSONEncoder, indent=indent)
     if encryption_key is not None:
         json_string = io_utils.encrypt_string(json_string, encryption_key)
 
@@ -109,17 +125,99 @@ def to_json(net, filename=None, encryption_key=None):
             fp.write(json_string)
 
 
-def to_sql(net, con, include_results=True):
+def to_binary(net, path, include_results=True):
+    """
+    Saves a pandapower Network in a binary columnar format. The network is stored in the
+    directory path: every column of the element tables is stored in a separate file, numeric,
+    boolean and datetime columns as raw arrays with their native dtype and all other columns
+    as json. A manifest (manifest.json) contains the structure of the tables and all other
+    elements of the net. net elements which name begins with "_" (internal elements) will not
+    be saved.
+
+    INPUT:
+        **net** (dict) - The pandapower format network
+
+        **path** (string) - The absolute or relative path to the output directory, which is
+                            created if it does not exist
+
+    OPTIONAL:
+        **include_results** (bool, True) - results are included in the files
+
+    EXAMPLE:
+
+        >>> pp.to_binary(net, "example_net")
+
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    tables = dict()
+    items = dict()
+    for key, item in net.items():
+        if key.startswith("_") or (key.startswith("res") and not include_results):
+            continue
+        if type(item) in (pd.DataFrame, _CopyOnWriteTable):
+            tables[key] = io_utils.write_binary_table(item, path, key)
+        else:
+            items[key] = item
+    manifest = {"format_version": io_utils.BINARY_FORMAT_VERSION, "tables": tables,
+                "items": items}
+    with open(os.path.join(path, io_utils.BINARY_MANIFEST), "w") as fp:
+        fp.write(json.dumps(manifest, cls=io_utils.PPJSONEncoder, indent=2))
+
+
+def to_sql(net, con, include_results=True, delta=False):
+    """
+    Saves a pandapower Network into an SQL database.
+
+    INPUT:
+        **net** (dict) - The pandapower format network
+
+        **con** - connection to the database, e.g. an sqlite3 connection or an SQLAlchemy
+            connectable. Delta saves need an sqlite3 connection
+
+    OPTIONAL:
+        **include_results** (bool, True) - results are included in the database
+
+        **delta** (bool, False) - If True, only the tables and rows which changed since the last
+            delta save into the database are written and the version of the net stored in the
+            database is increased. If False, all tables are replaced.
+
+    OUTPUT:
+        **version** (int) - the version of the net in the database if delta is True, else None
+
+    EXAMPLE:
+
+        >>> con = sqlite3.connect("example.db")
+        >>> pp.to_sql(net, con, delta=True)
+        >>> net.load.p_mw *= 1.1
+        >>> pp.to_sql(net, con, delta=True)  # only the load table is written
+
+    """
     dodfs = io_utils.to_dict_of_dfs(net, include_results=include_results)
+    if delta:
+        return io_utils.write_sql_delta(con, dodfs)
+    if isinstance(con, sqlite3.Connection):
+        # the rows stored for delta saves are outdated afterwards
+        io_utils.drop_sql_meta(con)
     for name, data in dodfs.items():
         data.to_sql(name, con, if_exists="replace")
 
 
-def to_sqlite(net, filename, include_results=True):
+def to_sqlite(net, filename, include_results=True, delta=False):
+    """
+    Saves a pandapower Network into an sqlite database file. See to_sql for the options.
+
+    EXAMPLE:
+
+        >>> pp.to_sqlite(net, "example.db", delta=True)
+
+    """
     import sqlite3
     conn = sqlite3.connect(filename)
-    to_sql(net, conn, include_results)
+    version = to_sql(net, conn, include_results, delta=delta)
+    conn.commit()
     conn.close()
+    return version
 
 
 def from_pickle(filename, convert=True):
@@ -212,6 +310,54 @@ def _from_excel_old(xls):
     return net
 
 
+def from_binary(path, tables=None, mmap=True, convert=True):
+    """
+    Load a pandapower network which was saved with to_binary.
+
+    INPUT:
+        **path** (string) - The absolute or relative path to the directory of the network
+
+    OPTIONAL:
+        **tables** (list, None) - names of the element tables to load, e.g. ["bus", "line"].
+            All other element tables are empty (with the stored columns and dtypes). If None, all
+            tables are loaded.
+
+        **mmap** (bool, True) - If True, the numeric columns are memory-mapped, so that they are
+            only read from disk when they are accessed
+
+        **convert** (bool, True) - If True, converts the format of the net loaded from the older
+            version of pandapower to the newer version format
+
+    OUTPUT:
+        **net** (dict) - The pandapower format network
+
+    EXAMPLE:
+
+        >>> net = pp.from_binary("example_net", tables=["bus", "line"])
+
+    """
+    manifest_file = os.path.join(path, io_utils.BINARY_MANIFEST)
+    if not os.path.isfile(manifest_file):
+        raise UserWarning("Directory %s does not contain a pandapower network!" % path)
+    with open(manifest_file) as fp:
+        manifest = json.load(fp, cls=io_utils.PPJSONDecoder)
+    if tables is not None:
+        missing = set(tables) - set(manifest["tables"].keys())
+        if len(missing):
+            raise ValueError("Tables %s are not stored in %s" % (sorted(missing), path))
+
+    net = create_empty_network()
+    net.update(manifest["items"])
+    for key, entry in manifest["tables"].items():
+        if tables is None or key in tables:
+            net[key] = io_utils.read_binary_table(path, entry, mmap=mmap)
+        else:
+            net[key] = io_utils.empty_binary_table(entry)
+    if convert:
+        convert_format(net)
+    return net
+
+
 def from_json(filename, convert=True, encryption_key=None):
     """
     Load a pandapower network from a JSON file.
@@ -234,6 +380,17 @@ def from_json(filename, convert=True, encryption_key=None):
         >>> net = pp.from_json("example.json")
 
     """
+    if encryption_key is None:
+        # parse the file incrementally
+        if hasattr(filename, 'read'):
+            net = io_utils.PPJSONStreamReader(filename).load()
+        elif not os.path.isfile(filename):
+            raise UserWarning("File {} does not exist!!".format(filename))
+        else:
+            with open(filename, "r") as fp:
+                net = io_utils.PPJSONStreamReader(fp).load()
+        return _from_json_object(net, convert)
+
     if hasattr(filename, 'read'):
         json_string = filename.read()
     elif not os.path.isfile(filename):
@@ -271,6 +428,10 @@ def from_json_string(json_string, convert=False, encryption_key=None):
         json_string = io_utils.decrypt_string(json_string, encryption_key)
 
     net = json.loads(json_string, cls=io_utils.PPJSONDecoder)
+    return _from_json_object(net, convert)
+
+
+def _from_json_object(net, convert):
     # this can be removed in the future
     # now net is saved with "_module", "_class", "_object"..., so json.load already returns
     # pandapowerNet. Older files don't have it yet, and are loaded as dict.
@@ -322,21 +483,46 @@ def from_json_dict(json_dict):
     return net
 
 
-def from_sql(con):
-    cursor = con.cursor()
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+def from_sql(con, tables=None):
+    """
+    Load a pandapower network from an SQL database.
+
+    INPUT:
+        **con** - sqlite3 connection to the database
+
+    OPTIONAL:
+        **tables** (list, None) - names of the element tables to load, e.g. ["bus", "line"].
+            All other element tables are empty. If None, all tables are loaded.
+
+    OUTPUT:
+        **net** (dict) - The pandapower format network
+
+    """
+    stored = io_utils.sql_table_names(con)
+    if tables is not None:
+        missing = set(tables) - set(stored)
+        if len(missing):
+            raise ValueError("Tables %s are not stored in the database" % sorted(missing))
     dodfs = dict()
-    for t, in cursor.fetchall():
-        table = pd.read_sql_query("SELECT * FROM %s" % t, con, index_col="index")
-        table.index.name = None
-        dodfs[t] = table
+    for t in stored:
+        if tables is None or t in tables or t in ["parameters", "dtypes", "user_pf_options"] or \
+                t.endswith("_std_types") or t.endswith("_profiles"):
+            dodfs[t] = io_utils.read_sql_table(con, t)
     net = io_utils.from_dict_of_dfs(dodfs)
     return net
 
 
-def from_sqlite(filename, netname=""):
+def from_sqlite(filename, netname="", tables=None):
+    """
+    Load a pandapower network from an sqlite database file. See from_sql for the options.
+
+    EXAMPLE:
+
+        >>> net = pp.from_sqlite("example.db", tables=["bus", "line"])
+
+    """
     import sqlite3
     con = sqlite3.connect(filename)
-    net = from_sql(con)
+    net = from_sql(con, tables=tables)
     con.close()
     return net
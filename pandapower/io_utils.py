@@ -2,12 +2,14 @@
 
 # Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
 # and Energy System Technology (IEE), Kassel. All rights reserved.
+import codecs
 import copy
 import importlib
 import json
 import numbers
 import os
 import pickle
+import re
 import sys
 import types
 import weakref
@@ -15,15 +17,20 @@ from functools import partial
 from inspect import isclass, signature, _findclass
 from warnings import warn
 
-import networkx
 import numpy
 import pandas as pd
-from networkx.readwrite import json_graph
 from numpy import ndarray, generic, equal, isnan, allclose, any as anynp
 from packaging import version
 from pandas.testing import assert_series_equal, assert_frame_equal
 
-from pandapower.auxiliary import pandapowerNet
+try:
+    # the json parser of pd.read_json
+    from pandas.io.json import loads as pd_json_loads
+except ImportError:
+    def pd_json_loads(s, precise_float=True):
+        return json.loads(s)
+
+from pandapower.auxiliary import pandapowerNet, _CopyOnWriteTable
 from pandapower.create import create_empty_network
 
 try:
@@ -131,6 +138,89 @@ def to_dict_of_dfs(net, include_results=False, fallback_to_pickle=True, include_
     return dodfs
 
 
+BINARY_MANIFEST = "manifest.json"
+BINARY_FORMAT_VERSION = 1
+
+
+def write_binary_table(table, path, name):
+    """
+    Writes a DataFrame into the directory path, one file per column. Numeric, boolean and datetime
+    columns are stored as raw arrays with their native dtype, all other columns are stored as
+    json lists (PPJSONEncoder). Returns the manifest entry of the table.
+    """
+    entry = {"n_rows": len(table), "index": _write_binary_column(table.index, path,
+                                                                 "%s_index" % name),
+             "columns": []}
+    for i, (column, series) in enumerate(table.items()):
+        column_entry = _write_binary_column(series, path, "%s_%i" % (name, i))
+        column_entry["name"] = column
+        entry["columns"].append(column_entry)
+    return entry
+
+
+def _write_binary_column(values, path, name):
+    dtype = values.dtype
+    if isinstance(dtype, numpy.dtype) and dtype.kind in "biufcmM":
+        # raw array, dtype and length are stored in the manifest -> no header to parse
+        filename = name + ".bin"
+        numpy.ascontiguousarray(values.values).tofile(os.path.join(path, filename))
+        return {"file": filename, "kind": "array", "dtype": dtype.str, "length": len(values)}
+    else:
+        filename = name + ".json"
+        # plain strings do not need the (slower) PPJSONEncoder
+        cls = json.JSONEncoder if pd.api.types.infer_dtype(values, skipna=True) in \
+            ["string", "empty"] else PPJSONEncoder
+        with open(os.path.join(path, filename), "w") as fp:
+            fp.write(json.dumps(list(values), cls=cls))
+    return {"file": filename, "kind": "json", "dtype": str(dtype)}
+
+
+def read_binary_table(path, entry, mmap=True):
+    """
+    Reads a DataFrame which was written by write_binary_table. If mmap is True, the raw arrays
+    are memory-mapped (copy-on-write), so that the data is only read from disk when it is
+    accessed.
+    """
+    index = pd.Index(_read_binary_column(path, entry["index"], mmap))
+    columns = [column["name"] for column in entry["columns"]]
+    data = {i: _read_binary_column(path, column, mmap)
+            for i, column in enumerate(entry["columns"])}
+    # copy=False keeps the memory-mapped arrays instead of consolidating them
+    table = pd.DataFrame(data, index=index, copy=False)
+    table.columns = pd.Index(columns, dtype=object) if len(columns) else table.columns
+    return table
+
+
+def empty_binary_table(entry):
+    """
+    Returns an empty DataFrame with the columns and dtypes of a manifest entry of
+    write_binary_table.
+    """
+    table = pd.DataFrame({i: pd.Series(dtype=column["dtype"])
+                          for i, column in enumerate(entry["columns"])},
+                         index=pd.Index([], dtype=entry["index"]["dtype"]))
+    if len(entry["columns"]):
+        table.columns = pd.Index([column["name"] for column in entry["columns"]], dtype=object)
+    return table
+
+
+def _read_binary_column(path, entry, mmap):
+    filename = os.path.join(path, entry["file"])
+    if entry["kind"] == "array":
+        dtype = numpy.dtype(entry["dtype"])
+        if mmap and entry["length"] > 0:
+            return numpy.memmap(filename, dtype=dtype, mode="c", shape=(entry["length"],))
+        return numpy.fromfile(filename, dtype=dtype, count=entry["length"])
+    with open(filename) as fp:
+        values = pd.Series(json.load(fp, cls=PPJSONDecoder), dtype=object)
+    if entry["dtype"] != "object":
+        try:
+            values = values.astype(entry["dtype"])
+        except (TypeError, ValueError):
+            logger.debug("could not restore dtype %s" % entry["dtype"])
+    return values.values
+
+
 def dicts_to_pandas(json_dict):
     warn("This function is deprecated and will be removed in a future release.\r\n"
          "Please resave your grid using the current pandapower version.", DeprecationWarning)
@@ -209,6 +299,207 @@ def restore_all_dtypes(net, dtypes):
             pass
 
 
+SQL_META_PREFIX = "_pp_"
+SQL_TIME_SERIES_PREFIX = "_pp_ts_"
+
+
+def _init_sql_meta(con):
+    con.execute("CREATE TABLE IF NOT EXISTS _pp_version "
+                "(version INTEGER PRIMARY KEY, saved TEXT, changed TEXT)")
+    con.execute("CREATE TABLE IF NOT EXISTS _pp_tables "
+                "(element TEXT PRIMARY KEY, schema TEXT, version INTEGER)")
+    con.execute("CREATE TABLE IF NOT EXISTS _pp_row_hashes "
+                "(element TEXT, idx, hash INTEGER, pos INTEGER, PRIMARY KEY (element, idx))")
+
+
+def drop_sql_meta(con):
+    """
+    Drops the tables which track the delta saves, e.g. because all tables are replaced.
+    """
+    for table in ["_pp_version", "_pp_tables", "_pp_row_hashes"]:
+        con.execute("DROP TABLE IF EXISTS %s" % table)
+
+
+def sql_table_names(con, prefix=None):
+    """
+    Returns the names of the tables in the database. Tables of the delta save and time series
+    results (starting with SQL_META_PREFIX) are only returned if they match the given prefix.
+    """
+    names = [t for t, in con.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+    if prefix is None:
+        return [t for t in names if not t.startswith(SQL_META_PREFIX)]
+    return [t for t in names if t.startswith(prefix)]
+
+
+def get_sql_version(con):
+    """
+    Returns the version of the net stored by delta saves in the database (0 if there is none).
+    """
+    if "_pp_version" not in sql_table_names(con, prefix="_pp_version"):
+        return 0
+    return con.execute("SELECT MAX(version) FROM _pp_version").fetchone()[0] or 0
+
+
+def _sql_schema(data):
+    return json.dumps([str(data.index.dtype)] + [[str(c), str(dt)] for c, dt in
+                                                  data.dtypes.items()])
+
+
+def write_sql_delta(con, dodfs):
+    """
+    Writes a dict of DataFrames into the database, but only the tables and rows which changed
+    since the last delta save. A hash of every row is stored in the table _pp_row_hashes to find
+    changed, added and deleted rows. Tables whose columns or dtypes changed are replaced
+    completely. Every save increases the version of the net in the table _pp_version.
+
+    INPUT:
+        **con** - sqlite3 connection
+
+        **dodfs** (dict) - dict of DataFrames as returned by to_dict_of_dfs
+
+    OUTPUT:
+        **version** (int) - the version of the saved net
+    """
+    _init_sql_meta(con)
+    version = get_sql_version(con) + 1
+    schemas = dict(con.execute("SELECT element, schema FROM _pp_tables").fetchall())
+    existing = set(sql_table_names(con))
+    changed = []
+    for name, data in dodfs.items():
+        schema = _sql_schema(data)
+        hashes = pd.util.hash_pandas_object(data, index=True).values.view(numpy.int64).tolist()
+        index = data.index.tolist()
+        if name not in existing or schemas.get(name, None) != schema:
+            data.to_sql(name, con, if_exists="replace")
+            con.execute("DELETE FROM _pp_row_hashes WHERE element=?", (name,))
+            con.executemany("INSERT INTO _pp_row_hashes VALUES (?, ?, ?, ?)",
+                            zip([name] * len(index), index, hashes, range(len(index))))
+        else:
+            stored = {idx: (h, pos) for idx, h, pos in con.execute(
+                "SELECT idx, hash, pos FROM _pp_row_hashes WHERE element=?", (name,))}
+            current = dict(zip(index, zip(hashes, range(len(index)))))
+            removed = [(i,) for i, (h, _) in stored.items() if i not in current or
+                       current[i][0] != h]
+            added = [i for i, (h, _) in current.items() if i not in stored or stored[i][0] != h]
+            moved = [(pos, name, i) for i, (h, pos) in current.items() if i in stored and
+                     stored[i][0] == h and stored[i][1] != pos]
+            if not len(removed) and not len(added) and not len(moved):
+                continue
+            if len(removed):
+                con.executemany('DELETE FROM "%s" WHERE "index"=?' % name, removed)
+                con.executemany("DELETE FROM _pp_row_hashes WHERE element=? AND idx=?",
+                                [(name, i) for i, in removed])
+            if len(added):
+                data.loc[added].to_sql(name, con, if_exists="append")
+                con.executemany("INSERT INTO _pp_row_hashes VALUES (?, ?, ?, ?)",
+                                [(name, i, current[i][0], current[i][1]) for i in added])
+            con.executemany("UPDATE _pp_row_hashes SET pos=? WHERE element=? AND idx=?", moved)
+        changed.append(name)
+        con.execute("INSERT OR REPLACE INTO _pp_tables VALUES (?, ?, ?)", (name, schema, version))
+    for name in set(schemas.keys()) - set(dodfs.keys()):
+        con.execute('DROP TABLE IF EXISTS "%s"' % name)
+        con.execute("DELETE FROM _pp_row_hashes WHERE element=?", (name,))
+        con.execute("DELETE FROM _pp_tables WHERE element=?", (name,))
+        changed.append(name)
+    con.execute("INSERT INTO _pp_version VALUES (?, datetime('now'), ?)",
+                (version, json.dumps(sorted(changed))))
+    con.commit()
+    return version
+
+
+def read_sql_table(con, name):
+    """
+    Reads a table from the database. The rows of tables written by delta saves are brought into
+    the order they had in the saved net.
+    """
+    table = pd.read_sql_query('SELECT * FROM "%s"' % name, con, index_col="index")
+    table.index.name = None
+    if "_pp_row_hashes" in sql_table_names(con, prefix="_pp_row_hashes"):
+        order = [i for i, in con.execute("SELECT idx FROM _pp_row_hashes WHERE element=? "
+                                         "ORDER BY pos", (name,))]
+        if len(order) == len(table) and not table.index.equals(pd.Index(order)):
+            table = table.loc[order]
+    return table
+
+
+def append_sql_time_series(con, name, time_steps, columns, values):
+    """
+    Appends time series results to the table SQL_TIME_SERIES_PREFIX + name. The values are
+    stored in long format (time_step, col, value) with an index on the time steps, so that a time
+    range can be read without reading the whole table. In contrast to one column per element,
+    the long format is not limited by the maximum number of columns of an sqlite table (2000) and
+    the rows of a batch are appended faster, but the database is larger.
+
+    INPUT:
+        **con** - sqlite3 connection
+
+        **name** (str) - name of the results, e.g. "res_bus.vm_pu"
+
+        **time_steps** (iterable) - time steps of the rows of values
+
+        **columns** (iterable) - columns of values, e.g. the element indices
+
+        **values** (2d array) - the results with shape (len(time_steps), len(columns))
+    """
+    table = SQL_TIME_SERIES_PREFIX + name
+    con.execute('CREATE TABLE IF NOT EXISTS "%s" (time_step, col, value REAL)' % table)
+    con.execute('CREATE INDEX IF NOT EXISTS "%s_time_step" ON "%s" (time_step)' % (table, table))
+    values = numpy.asarray(values, dtype=float)
+    n_time_steps, n_columns = values.shape
+    time_steps = [t.item() if isinstance(t, generic) else t for t in time_steps]
+    columns = [c.item() if isinstance(c, generic) else c for c in columns]
+    rows = zip([t for t in time_steps for _ in range(n_columns)], columns * n_time_steps,
+               values.ravel().tolist())
+    con.executemany('INSERT INTO "%s" VALUES (?, ?, ?)' % table, rows)
+
+
+def read_sql_time_series(con, name, start=None, stop=None, columns=None):
+    """
+    Reads time series results which were written by append_sql_time_series.
+
+    INPUT:
+        **con** - sqlite3 connection
+
+        **name** (str) - name of the results, e.g. "res_bus.vm_pu"
+
+    OPTIONAL:
+        **start** (None) - first time step to read. If None, the results are read from the first
+            time step
+
+        **stop** (None) - last time step to read (inclusive). If None, the results are read up to
+            the last time step
+
+        **columns** (iterable, None) - columns to read, e.g. the element indices. If None, all
+            columns are read
+
+    OUTPUT:
+        **results** (DataFrame) - the results with the time steps as index
+    """
+    conditions, params = [], []
+    if start is not None:
+        conditions.append("time_step >= ?")
+        params.append(start)
+    if stop is not None:
+        conditions.append("time_step <= ?")
+        params.append(stop)
+    if columns is not None:
+        columns = [c.item() if isinstance(c, generic) else c for c in columns]
+        conditions.append("col IN (%s)" % ", ".join(["?"] * len(columns)))
+        params.extend(columns)
+    query = 'SELECT time_step, col, value FROM "%s"' % (SQL_TIME_SERIES_PREFIX + name)
+    if len(conditions):
+        query += " WHERE " + " AND ".join(conditions)
+    data = pd.DataFrame(con.execute(query, params).fetchall(),
+                        columns=["time_step", "col", "value"])
+    order = pd.unique(data["col"]) if columns is None else \
+        [c for c in columns if c in set(data["col"])]
+    results = data.pivot(index="time_step", columns="col", values="value").reindex(
+        columns=order).astype(float)
+    results.index.name = None
+    results.columns.name = None
+    return results
+
+
 def to_dict_with_coord_transform(net, point_geo_columns, line_geo_columns):
     save_net = dict()
     for key, item in net.items():
@@ -411,7 +702,9 @@ class FromSerializableRegistry():
 
     @from_serializable.register(class_name='DataFrame', module_name='pandas.core.frame')
     def DataFrame(self):
-        df = pd.read_json(self.obj, precise_float=True, convert_axes=False, **self.d)
+        df = _split_json_to_df(self.obj, self.d)
+        if df is None:
+            df = pd.read_json(self.obj, precise_float=True, convert_axes=False, **self.d)
         try:
             df.set_index(df.index.astype(numpy.int64), inplace=True)
         except (ValueError, TypeError, AttributeError):
@@ -434,6 +727,7 @@ class FromSerializableRegistry():
 
     @from_serializable.register(class_name="MultiGraph", module_name="networkx")
     def networkx(self):
+        from networkx.readwrite import json_graph
         return json_graph.adjacency_graph(self.obj, attrs={'id': 'json_id', 'key': 'json_key'})
 
     @from_serializable.register(class_name="method")
@@ -497,6 +791,40 @@ class FromSerializableRegistry():
             return shapely.geometry.shape(self.obj)
 
 
+def _split_json_to_df(json_string, d):
+    """
+    Fast path of FromSerializableRegistry.DataFrame for tables which are saved with orient
+    "split" and dtypes of numeric, boolean or object kind: the columns are created directly
+    with their dtype instead of being inferred by pd.read_json. Returns None for all other
+    tables.
+    """
+    dtypes = d.get("dtype", None)
+    if d.get("orient", None) != "split" or not isinstance(dtypes, dict) or \
+            not isinstance(json_string, str):
+        return None
+    try:
+        split = pd_json_loads(json_string, precise_float=True)
+        columns = split["columns"]
+        if len(set(columns)) != len(columns) or any(not isinstance(c, str) for c in columns):
+            return None
+        column_dtypes = [numpy.dtype(dtypes[c]) for c in columns]
+        if any(dt.kind not in "biufO" for dt in column_dtypes):
+            return None
+        n_rows = len(split["index"])
+        values = list(zip(*split["data"])) if n_rows else [()] * len(columns)
+        data = dict()
+        for column, dt, v in zip(columns, column_dtypes, values):
+            if dt.kind == "O":
+                data[column] = numpy.empty(n_rows, dtype=object)
+                data[column][:] = v
+            else:
+                # null in float columns becomes nan, in other columns it raises TypeError
+                data[column] = numpy.array(v, dtype=dt)
+        return pd.DataFrame(data, index=split["index"], columns=columns)
+    except (TypeError, ValueError, KeyError, OverflowError):
+        return None
+
+
 class PPJSONDecoder(json.JSONDecoder):
     def __init__(self, **kwargs):
         # net = pandapowerNet.__new__(pandapowerNet)
@@ -506,6 +834,96 @@ class PPJSONDecoder(json.JSONDecoder):
         super().__init__(**super_kwargs)
 
 
+class PPJSONStreamReader(object):
+    """
+    Incremental parser for pandapower json files. The file is read in chunks and the members of
+    the pandapowerNet are decoded one after another with PPJSONDecoder, so that the json string
+    of the whole file is never held in memory. The result is the same as of
+    json.load(fp, cls=PPJSONDecoder).
+    """
+    whitespace = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, fp, chunk_size=2 ** 20):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = PPJSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self._bytes_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def load(self):
+        if self._peek() != "{":
+            return self._decode_value()
+        return pp_hook(self._decode_object(stream_keys=["_object"]))
+
+    def _read(self, size):
+        while True:
+            chunk = self.fp.read(size)
+            if not isinstance(chunk, bytes):
+                break
+            raw_eof = not chunk
+            # the chunk can end within a multibyte character, which is decoded with the next chunk
+            chunk = self._bytes_decoder.decode(chunk, final=raw_eof)
+            if chunk or raw_eof:
+                break
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            self.pos = self.whitespace.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self._read(self.chunk_size):
+                return self.buffer[self.pos:self.pos + 1]
+
+    def _expect(self, chars):
+        char = self._peek()
+        if char == "" or char not in chars:
+            raise json.JSONDecodeError("Expecting one of %s" % list(chars), self.buffer,
+                                       self.pos)
+        self.pos += 1
+        return char
+
+    def _decode_value(self):
+        self._peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # the value is not completely in the buffer yet
+                if not self._read(size):
+                    raise
+                size *= 2
+                continue
+            if isinstance(value, (int, float)) and self.buffer[end:end + 1] in ("", ".", "e", "E") \
+                    and self._read(self.chunk_size):
+                # a number at the end of the buffer might continue in the next chunk
+                continue
+            self.pos = end
+            return value
+
+    def _decode_object(self, stream_keys=()):
+        # decodes a json object member by member, members with a key in stream_keys are
+        # decoded member by member as well
+        self._expect("{")
+        d = dict()
+        if self._peek() == "}":
+            self.pos += 1
+            return d
+        while True:
+            key = self._decode_value()
+            self._expect(":")
+            if key in stream_keys and self._peek() == "{":
+                d[key] = pp_hook(self._decode_object())
+            else:
+                d[key] = self._decode_value()
+            if self._expect(",}") == "}":
+                return d
+
+
 def pp_hook(d, registry_class=FromSerializableRegistry):
     try:
         if '_module' in d and '_class' in d:
@@ -694,6 +1112,10 @@ def with_signature(obj, val, obj_module=None, obj_class=None):
 
 @singledispatch
 def to_serializable(obj):
+    # networkx is imported on demand, so graphs can't be registered with singledispatch
+    networkx = sys.modules.get("networkx")
+    if networkx is not None and isinstance(obj, networkx.Graph):
+        return json_networkx(obj)
     logger.debug('standard case')
     return str(obj)
 
@@ -710,7 +1132,11 @@ def json_dataframe(obj):
     logger.debug('DataFrame')
     orient = "split"
     json_string = obj.to_json(orient=orient, default_handler=to_serializable, double_precision=15)
-    d = with_signature(obj, json_string)
+    if type(obj) is _CopyOnWriteTable:
+        # tables of cloned nets are restored as plain DataFrames
+        d = with_signature(obj, json_string, obj_module="pandas.core.frame", obj_class="DataFrame")
+    else:
+        d = with_signature(obj, json_string)
     d['orient'] = orient
     if len(obj.columns) > 0 and isinstance(obj.columns[0], str):
         d['dtype'] = obj.dtypes.astype('str').to_dict()
@@ -802,8 +1228,8 @@ def json_frozenset(obj):
     return d
 
 
-@to_serializable.register(networkx.Graph)
 def json_networkx(obj):
+    from networkx.readwrite import json_graph
     logger.debug("nx graph")
     json_string = json_graph.adjacency_data(obj, attrs={'id': 'json_id', 'key': 'json_key'})
     d = with_signature(obj, json_string, obj_module="networkx")
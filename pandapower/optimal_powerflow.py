@@ -13,7 +13,6 @@ from scipy.sparse import csr_matrix as sparse
 
 from pandapower.auxiliary import ppException, _clean_up, _add_auxiliary_elements
 from pandapower.pypower.idx_bus import VM
-from pandapower.pypower.opf import opf
 from pandapower.pypower.printpf import printpf
 from pandapower.pd2ppc import _pd2ppc
 from pandapower.pf.run_newton_raphson_pf import _run_newton_raphson_pf
@@ -29,6 +28,10 @@ class OPFNotConverged(ppException):
 
 
 def _optimal_powerflow(net, verbose, suppress_warnings, **kwargs):
+    # the opf solvers are imported with the first optimal power flow to speed up the import of
+    # pandapower
+    from pandapower.pypower.opf import opf
+
     ac = net["_options"]["ac"]
     init = net["_options"]["init"]
 
@@ -11,6 +11,7 @@ _calc_shunts_and_add_on_ppc, _add_gen_impedances_ppc, _add_motor_impedances_ppc
 from pandapower.build_gen import _build_gen_ppc, _check_voltage_setpoints_at_same_bus, \
     _check_voltage_angles_at_same_bus, _check_for_reference_bus
 from pandapower.opf.make_objective import _make_objective
+from pandapower.pd2ppc_model import _get_network_model
 from pandapower.pypower.idx_area import PRICE_REF_BUS
 from pandapower.pypower.idx_brch import F_BUS, T_BUS, BR_STATUS
 from pandapower.pypower.idx_bus import NONE, BUS_I, BUS_TYPE
@@ -56,10 +57,17 @@ def _pd2ppc(net, sequence=None):
                               , "gen_is": np.array([], dtype=bool)
                               }
         **ppci** - The "internal" pypower format network for PF calculations
+
+    The results of the expensive stages are stored in the network model net["_pd2ppc_model"] and
+    reused by the next conversion if their inputs did not change. The duration of each stage is
+    stored in net["_pd2ppc_model"].timings.
         
     """
+    model = _get_network_model(net)
+    model.start()
     # select elements in service (time consuming, so we do it once)
     net["_is_elements"] = aux._select_is_elements_numba(net, sequence=sequence)
+    model.lap("is_elements")
 
     # Gets network configurations
     mode = net["_options"]["mode"]
@@ -70,6 +78,7 @@ def _pd2ppc(net, sequence=None):
 
     # generate ppc['bus'] and the bus lookup
     _build_bus_ppc(net, ppc)
+    model.lap("bus")
     if sequence == 0:
         from pandapower.pd2ppc_zero import _add_ext_grid_sc_impedance_zero, _build_branch_ppc_zero
         # Adds external grid impedance for 3ph and sc calculations in ppc0
@@ -79,6 +88,7 @@ def _pd2ppc(net, sequence=None):
     else:
         # Calculates ppc1/ppc2 branch impedances from branch elements  
         _build_branch_ppc(net, ppc)
+    model.lap("branch")
 
     # Adds P and Q for loads / sgens in ppc['bus'] (PQ nodes)
     if mode == "sc":
@@ -88,6 +98,7 @@ def _pd2ppc(net, sequence=None):
         _calc_pq_elements_and_add_on_ppc(net, ppc, sequence=sequence)
         # adds P and Q for shunts, wards and xwards (to PQ nodes)
         _calc_shunts_and_add_on_ppc(net, ppc)
+    model.lap("pq_elements")
 
     # adds auxilary buses for open switches at branches
     _switch_branches(net, ppc)
@@ -95,6 +106,7 @@ def _pd2ppc(net, sequence=None):
     # Adds auxilary buses for in service lines with out of service buses.
     # Also deactivates lines if they are connected to two out of service buses
     _branches_with_oos_buses(net, ppc)
+    model.lap("aux_buses")
 
     if check_connectivity:
         if sequence in [None, 1, 2]:
@@ -102,15 +114,23 @@ def _pd2ppc(net, sequence=None):
             if "opf" in mode:
                 net["_isolated_buses"], _, _ = aux._check_connectivity_opf(ppc)
             else:
-                net["_isolated_buses"], _, _ = aux._check_connectivity(ppc)
-            net["_is_elements_final"] = aux._select_is_elements_numba(net,
-                                                                      net._isolated_buses, sequence)
+                if net.get("_connectivity_cache", None) is None:
+                    net["_connectivity_cache"] = dict()
+                net["_isolated_buses"], _, _ = aux._check_connectivity(
+                    ppc, net["_connectivity_cache"])
+            if len(net._isolated_buses):
+                net["_is_elements_final"] = aux._select_is_elements_numba(
+                    net, net._isolated_buses, sequence)
+            else:
+                # no additional buses out of service -> same elements as selected above
+                net["_is_elements_final"] = net["_is_elements"]
         else:
             ppc["bus"][net._isolated_buses, BUS_TYPE] = NONE
         net["_is_elements"] = net["_is_elements_final"]
     else:
         # sets buses out of service, which aren't connected to branches / REF buses
         aux._set_isolated_buses_out_of_service(net, ppc)
+    model.lap("connectivity")
 
     _build_gen_ppc(net, ppc)
 
@@ -118,11 +138,13 @@ def _pd2ppc(net, sequence=None):
         _check_for_reference_bus(ppc)
 
     aux._replace_nans_with_default_limits(net, ppc)
+    model.lap("gen")
 
     # generates "internal" ppci format (for powerflow calc) 
     # from "external" ppc format and updates the bus lookup
     # Note: Also reorders buses and gens in ppc
     ppci = _ppc2ppci(ppc, net)
+    model.lap("ppc2ppci")
 
     if mode == "pf":
         # check if any generators connected to the same bus have different voltage setpoints
@@ -133,6 +155,7 @@ def _pd2ppc(net, sequence=None):
     if mode == "opf":
         # make opf objective
         ppci = _make_objective(ppci, net)
+    model.lap("checks")
 
     return ppc, ppci
 
@@ -196,6 +219,10 @@ def _ppc2ppci(ppc, net, ppci=None):
     ppci['bus'] = ppc['bus'][~oos_busses]
     # in ppc the OOS busses are included and at the end of the array
     ppc['bus'] = np.vstack([ppc['bus'][~oos_busses], ppc['bus'][oos_busses]])
+    if "bus_island" in ppc:
+        bus_island = ppc["bus_island"]
+        ppci["internal"]["bus_island"] = bus_island[~oos_busses]
+        ppc["bus_island"] = np.hstack([bus_island[~oos_busses], bus_island[oos_busses]])
 
     # generate bus_lookup_ppc_ppci (ppc -> ppci lookup)
     ppc_former_order = (ppc['bus'][:, BUS_I]).astype(int)
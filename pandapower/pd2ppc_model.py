@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+from collections import OrderedDict
+from time import perf_counter
+
+import numpy as np
+
+from pandapower.pypower.idx_bus import BASE_KV
+
+# columns which only describe an element and are not used in the conversion
+DESCRIPTIVE_COLUMNS = ("name", "std_type")
+
+# options which influence the branch parameters
+BRANCH_OPTIONS = ("mode", "case", "trafo_model", "calculate_voltage_angles", "trafo3w_losses",
+                  "consider_line_temperature", "switch_rx_ratio")
+
+
+class NetworkModel(object):
+    """
+    Stores the results of the expensive stages of the conversion of a pandapower net to the
+    ppc (see _pd2ppc) together with the element columns and options they were calculated from.
+    When the net is converted again, a stage is only calculated again if one of its input columns
+    changed, otherwise the stored result is used. Since the inputs are compared by value, changes
+    of the element tables never lead to outdated results.
+
+    The model is stored in net["_pd2ppc_model"] and is created with the first conversion. The
+    duration of each stage of the last conversion is stored in the attribute timings, the number
+    of reused and calculated stage results in hits and misses.
+    """
+
+    def __init__(self):
+        self.stages = dict()
+        self.timings = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._t0 = None
+
+    def get(self, stage, inputs):
+        """
+        Returns the stored result of the stage if it was calculated from the same inputs, else None.
+        """
+        if stage in self.stages:
+            stored_inputs, result = self.stages[stage]
+            if len(stored_inputs) == len(inputs) and all(
+                    _equal(a, b) for a, b in zip(stored_inputs, inputs)):
+                self.hits += 1
+                return result
+        self.misses += 1
+        return None
+
+    def set(self, stage, inputs, result):
+        """
+        Stores the result of the stage together with copies of its inputs.
+        """
+        self.stages[stage] = (tuple(_copy(i) for i in inputs), result)
+
+    def start(self):
+        self.timings = OrderedDict()
+        self._t0 = perf_counter()
+
+    def lap(self, stage):
+        """
+        Stores the time since the last lap (or start) as the duration of the stage.
+        """
+        t = perf_counter()
+        self.timings[stage] = self.timings.get(stage, 0.) + t - self._t0
+        self._t0 = t
+
+
+def _equal(a, b):
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        if not isinstance(a, np.ndarray) or not isinstance(b, np.ndarray) or \
+                a.shape != b.shape or a.dtype != b.dtype:
+            return False
+        return np.array_equal(a, b, equal_nan=a.dtype.kind in "fc")
+    return type(a) == type(b) and a == b
+
+
+def _copy(item):
+    return item.copy() if isinstance(item, np.ndarray) else item
+
+
+def _get_network_model(net):
+    model = net.get("_pd2ppc_model", None)
+    if model is None:
+        model = NetworkModel()
+        net["_pd2ppc_model"] = model
+    return model
+
+
+def _get_cache_model(net, ppc):
+    """
+    Returns the network model if its stored stage results can be used for the conversion of the
+    ppc, i.e. for the positive sequence power flow, else None.
+    """
+    if net["_options"]["mode"] != "pf" or "sequence" in ppc:
+        return None
+    return net.get("_pd2ppc_model", None)
+
+
+def _table_inputs(net, element):
+    table = net[element]
+    columns = tuple(c for c in table.columns if c not in DESCRIPTIVE_COLUMNS)
+    return (element, columns, table.index.values) + tuple(table[c].values for c in columns)
+
+
+def _bus_lookup_inputs(net, bus_index, bus_is_idx, gen_is_mask, eg_is_mask, numba):
+    switch = net["switch"]
+    return (bool(numba), bus_index, bus_is_idx, gen_is_mask, eg_is_mask,
+            net["ext_grid"]["bus"].values, net["gen"]["bus"].values, switch["bus"].values,
+            switch["element"].values, switch["et"].values, switch["closed"].values,
+            switch["z_ohm"].values)
+
+
+def _branch_inputs(net, ppc, element):
+    """
+    Inputs of the branch parameters of an element: the element table, the options, the lookups
+    and the base voltages of the buses.
+    """
+    lookups = net["_pd2ppc_lookups"]
+    options = tuple(net["_options"].get(o, None) for o in BRANCH_OPTIONS)
+    inputs = options + (net.sn_mva, net.f_hz, lookups["branch"][element], lookups["bus"],
+                        ppc["bus"][:, BASE_KV])
+    if element == "switch":
+        return inputs + (np.asarray(net["_impedance_bb_switches"]),) + \
+               _table_inputs(net, "switch")
+    if element in lookups["aux"]:
+        inputs += (lookups["aux"][element],)
+    if element == "xward":
+        inputs += (net["_is_elements"]["xward"],)
+    if element == "line" and net["_options"]["mode"] == "opf":
+        inputs += (net["bus"]["vn_kv"].values,)
+    return inputs + _table_inputs(net, element)
+
+
+def benchmark_pd2ppc(net, runs=10, **kwargs):
+    """
+    Profiles the conversion of a net to the ppc by running power flows with runpp and returns the
+    duration of each stage of the conversion for every run. The first run converts the net without
+    stored stage results, the later runs reuse the network model of the first run.
+
+    INPUT:
+        **net** (pandapowerNet) - the net to profile
+
+    OPTIONAL:
+        **runs** (int, 10) - number of power flows
+
+        **kwargs** - options of runpp
+
+    OUTPUT:
+        **timings** (DataFrame) - duration of the stages in seconds, with one column per run. The
+        row "pd2ppc" is the duration of the whole conversion, the row "runpp" the duration of the
+        whole power flow.
+
+    EXAMPLE:
+        >>> from pandapower.pd2ppc_model import benchmark_pd2ppc
+        >>> timings = benchmark_pd2ppc(pandapower.networks.case9241pegase())
+        >>> timings.mean(axis=1)
+    """
+    import pandas as pd
+    from pandapower.run import runpp
+
+    if "_pd2ppc_model" in net:
+        del net["_pd2ppc_model"]
+    timings = OrderedDict()
+    for run in range(runs):
+        t0 = perf_counter()
+        runpp(net, **kwargs)
+        t = perf_counter() - t0
+        stages = net["_pd2ppc_model"].timings
+        timings[run] = pd.Series(stages)
+        timings[run]["pd2ppc"] = sum(stages.values())
+        timings[run]["runpp"] = t
+    return pd.DataFrame(timings)
@@ -0,0 +1 @@
+from pandapower.pf.numba_cache import set_cache_dir, warmup
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+"""
+Backward/forward sweep on the breadth-first-search (bfs) ordering of the buses. Each bus stores
+its parent bus and the branch to its parent in the spanning tree of its reference bus, so that
+one iteration consists of one backward loop (bus injections to branch currents) and one forward
+loop (voltage drops from the reference buses). Branches which are not part of the spanning trees
+close loops; their currents are calculated with the loop impedance matrix, which is the Kron
+reduction of the Direct Load Flow (DLF) matrix of the meshed network.
+"""
+
+import numpy as np
+from numpy import complex128
+from scipy.sparse import csr_matrix, csgraph
+
+from pandapower.pf.numba_cache import jit
+from pandapower.pypower.idx_brch import F_BUS, T_BUS, BR_R, BR_X, TAP
+
+
+@jit(nopython=True)
+def _sweep(V, Iinj, order, parent, parent_branch, z_branch):  # pragma: no cover
+    """
+    backward sweep of the bus current injections and forward sweep of the voltage drops, the
+    voltages of the reference buses are not changed
+    """
+    I = Iinj.copy()
+    for k in range(order.shape[0] - 1, -1, -1):
+        b = order[k]
+        if parent[b] >= 0:
+            I[parent[b]] += I[b]
+    for k in range(order.shape[0]):
+        b = order[k]
+        if parent[b] >= 0:
+            V[b] = V[parent[b]] + z_branch[parent_branch[b]] * I[b]
+
+
+@jit(nopython=True)
+def _sweep_batch(V, Iinj, rows, order, parent, parent_branch, z_branch):  # pragma: no cover
+    """
+    backward/forward sweep of the snapshots in rows, V and Iinj are matrices (snapshots x buses)
+    """
+    I = np.empty(V.shape[1], dtype=complex128)
+    for r in rows:
+        I[:] = Iinj[r]
+        for k in range(order.shape[0] - 1, -1, -1):
+            b = order[k]
+            if parent[b] >= 0:
+                I[parent[b]] += I[b]
+        for k in range(order.shape[0]):
+            b = order[k]
+            if parent[b] >= 0:
+                V[r, b] = V[r, parent[b]] + z_branch[parent_branch[b]] * I[b]
+
+
+@jit(nopython=True)
+def _path_impedance(order, parent, parent_branch, z_branch):  # pragma: no cover
+    """
+    impedance of the path from the reference bus to each bus (diagonal of the DLF matrix)
+    """
+    z = np.zeros(parent.shape[0], dtype=complex128)
+    for k in range(order.shape[0]):
+        b = order[k]
+        if parent[b] >= 0:
+            z[b] = z[parent[b]] + z_branch[parent_branch[b]]
+    return z
+
+
+def _bfs_ordering(nobus, bus_from, bus_to, ref):
+    """
+    orders the buses by breadth-first search starting at the reference buses
+
+    :return: dict with the bfs order of all buses, the parent bus and the branch to the parent of
+             each bus (-1 for the reference buses), the loop branches and the buses of each
+             reference bus in bfs order. None if several reference buses are connected.
+    """
+    nobranch = bus_from.shape[0]
+    G = csr_matrix((np.ones(nobranch), (bus_from, bus_to)), shape=(nobus, nobus))
+    parent = np.full(nobus, -1, dtype=np.int64)
+    visited = np.zeros(nobus, dtype=bool)
+    buses_ordered_bfs_nets = []
+    for refbus in ref:
+        if visited[refbus]:
+            return None
+        buses_ordered_bfs, predecs = csgraph.breadth_first_order(G, refbus, directed=False,
+                                                                 return_predecessors=True)
+        visited[buses_ordered_bfs] = True
+        parent[buses_ordered_bfs[1:]] = predecs[buses_ordered_bfs[1:]]
+        buses_ordered_bfs_nets.append(buses_ordered_bfs)
+    order = np.concatenate(buses_ordered_bfs_nets).astype(np.int64)
+
+    # the first of parallel branches is the tree branch, the others are loop branches
+    lo, hi = np.minimum(bus_from, bus_to), np.maximum(bus_from, bus_to)
+    keys = lo.astype(np.int64) * nobus + hi
+    sorted_branches = np.argsort(keys, kind="stable")
+    children = order[parent[order] >= 0]
+    child_keys = np.minimum(children, parent[children]) * nobus + \
+        np.maximum(children, parent[children])
+    parent_branch = np.full(nobus, -1, dtype=np.int64)
+    parent_branch[children] = sorted_branches[np.searchsorted(keys[sorted_branches], child_keys)]
+
+    in_tree = np.zeros(nobranch, dtype=bool)
+    in_tree[parent_branch[children]] = True
+    # branches which connect a bus to itself do not carry a loop current
+    loops = np.flatnonzero(~in_tree & (bus_from != bus_to))
+
+    return {"order": order, "parent": parent, "parent_branch": parent_branch, "loops": loops,
+            "buses_ordered_bfs_nets": buses_ordered_bfs_nets}
+
+
+def _get_bfs_ordering(nobus, bus_from, bus_to, ref, cache=None):
+    """
+    returns the bfs ordering of the buses. If a cache dict is given, the ordering is stored and
+    reused as long as the branch connections and reference buses do not change.
+    """
+    if cache is not None and cache.get("nobus", None) == nobus and \
+            np.array_equal(cache["bus_from"], bus_from) and \
+            np.array_equal(cache["bus_to"], bus_to) and np.array_equal(cache["ref"], ref):
+        return cache["ordering"]
+    ordering = _bfs_ordering(nobus, bus_from, bus_to, ref)
+    if cache is not None:
+        cache.update({"nobus": nobus, "bus_from": bus_from.copy(), "bus_to": bus_to.copy(),
+                      "ref": ref.copy(), "ordering": ordering})
+    return ordering
+
+
+def _make_sweep_data(ordering, branch, nobus):
+    """
+    calculates the impedance dependent data of the sweep: the series impedance of the branches,
+    the voltage change of all buses caused by a unit current in each loop branch, the inverse loop
+    impedance matrix and the diagonal of the DLF matrix
+    """
+    z_branch = (branch[:, BR_R].real + 1j * branch[:, BR_X].real) * branch[:, TAP].real
+    order, parent, parent_branch = ordering["order"], ordering["parent"], \
+        ordering["parent_branch"]
+    loops = ordering["loops"]
+    loop_from = branch[loops, F_BUS].real.astype(np.int64)
+    loop_to = branch[loops, T_BUS].real.astype(np.int64)
+
+    z_diag = _path_impedance(order, parent, parent_branch, z_branch)
+    if len(loops):
+        # a loop current flows out of the from bus and into the to bus of the loop branch
+        DB = np.zeros((nobus, len(loops)), dtype=complex128, order="F")
+        for k in range(len(loops)):
+            Iloop = np.zeros(nobus, dtype=complex128)
+            Iloop[loop_from[k]] -= 1.
+            Iloop[loop_to[k]] += 1.
+            _sweep(DB[:, k], Iloop, order, parent, parent_branch, z_branch)
+        K = np.linalg.inv(np.diag(z_branch[loops]) + DB[loop_to, :] - DB[loop_from, :])
+        z_diag -= np.einsum("ik,kl,il->i", DB, K, DB)
+    else:
+        DB = K = None
+
+    return {"order": order, "parent": parent, "parent_branch": parent_branch,
+            "z_branch": z_branch, "loop_from": loop_from, "loop_to": loop_to, "DB": DB, "K": K,
+            "z_diag": z_diag}
+
+
+def _sweep_ordered(V, Iinj, sweep_data):
+    """
+    updates the bus voltages V in place by one backward/forward sweep with the current injections
+    Iinj
+    """
+    _sweep(V, Iinj, sweep_data["order"], sweep_data["parent"], sweep_data["parent_branch"],
+           sweep_data["z_branch"])
+    if sweep_data["DB"] is not None:
+        dV_loop = V[sweep_data["loop_to"]] - V[sweep_data["loop_from"]]
+        V += sweep_data["DB"].dot(-sweep_data["K"].dot(dV_loop))
+
+
+def _sweep_ordered_batch(V, Iinj, rows, sweep_data):
+    """
+    updates the bus voltages of the snapshots in rows in place by one backward/forward sweep, V
+    and Iinj are matrices (snapshots x buses)
+    """
+    _sweep_batch(V, Iinj, rows, sweep_data["order"], sweep_data["parent"],
+                 sweep_data["parent_branch"], sweep_data["z_branch"])
+    if sweep_data["DB"] is not None:
+        dV_loop = V[np.ix_(rows, sweep_data["loop_to"])] - V[np.ix_(rows, sweep_data["loop_from"])]
+        V[rows] += (-dV_loop.dot(sweep_data["K"].T)).dot(sweep_data["DB"].T)
@@ -4,14 +4,14 @@
 # and Energy System Technology (IEE), Kassel. All rights reserved.
 
 
-from numba import jit
+from pandapower.pf.numba_cache import jit
 from numpy import conj, zeros, complex128
 from scipy.sparse import issparse, csr_matrix as sparse
 from pandapower.pypower.dSbus_dV import dSbus_dV_dense
 
 
 # @jit(Tuple((c16[:], c16[:]))(c16[:], i4[:], i4[:], c16[:], c16[:]), nopython=True, cache=False)
-@jit(nopython=True, cache=False)
+@jit(nopython=True)
 def dSbus_dV_numba_sparse(Yx, Yp, Yj, V, Vnorm, Ibus): # pragma: no cover
     """Computes partial derivatives of power injection w.r.t. voltage.
 
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+"""
+Mismatch evaluation of the fast-decoupled power flow. Only the rows of the pv and pq buses of the
+admittance matrix are multiplied with the voltages, the active and reactive power mismatches are
+written to preallocated arrays.
+"""
+
+from numpy import conj
+
+from pandapower.pf.numba_cache import jit
+
+
+@jit(nopython=True)
+def _mismatch(Yp, Yj, Yx, V, Vm, Sbus, pvpq, npv, P, Q):  # pragma: no cover
+    """
+    active power mismatch of the pv and pq buses (P) and reactive power mismatch of the pq buses
+    (Q), both divided by the voltage magnitude. Ybus is given in CSR format (Yp, Yj, Yx) and
+    pvpq is [pv, pq].
+    """
+    for k in range(pvpq.shape[0]):
+        i = pvpq[k]
+        I = 0j
+        for l in range(Yp[i], Yp[i + 1]):
+            I += Yx[l] * V[Yj[l]]
+        mis = (V[i] * conj(I) - Sbus[i]) / Vm[i]
+        P[k] = mis.real
+        if k >= npv:
+            Q[k - npv] = mis.imag
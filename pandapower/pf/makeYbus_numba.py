@@ -9,7 +9,7 @@
 
 
 import numpy as np
-from numba import jit
+from pandapower.pf.numba_cache import jit
 from scipy.sparse import csr_matrix, coo_matrix
 
 from pandapower.pypower.idx_brch import F_BUS, T_BUS
@@ -17,7 +17,7 @@ from pandapower.pypower.idx_bus import GS, BS
 from pandapower.pypower.makeYbus import branch_vectors
 
 
-@jit(nopython=True, cache=False)
+@jit(nopython=True)
 def gen_Ybus(Yf_x, Yt_x, Ysh, col_Y, f, t, f_sort, t_sort, nb, nl, r_nl):  # pragma: no cover
     """
     Fast calculation of Ybus
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+"""
+Compilation of the numba kernels of the power flow. All kernels are compiled with cache=True, so
+that the machine code is written to an on-disk cache and loaded by later processes instead of
+being compiled again. The cache directory defaults to the __pycache__ folders of the kernel
+modules and can be changed by the environment variable NUMBA_CACHE_DIR or by set_cache_dir.
+warmup() compiles all kernels ahead of the first power flow, e.g. when a worker process is
+started or when a container image is built.
+
+numba itself is only imported when a kernel is called for the first time, so that
+"import pandapower" does not import numba.
+"""
+
+import functools
+import importlib.util
+import os
+
+from pandapower.pf.no_numba import jit as no_numba_jit
+
+numba_installed = importlib.util.find_spec("numba") is not None
+
+try:
+    import pplog as logging
+except ImportError:
+    import logging
+
+logger = logging.getLogger(__name__)
+
+# all kernels which are compiled with jit
+KERNELS = dict()
+
+
+def jit(*args, **kwargs):
+    """
+    Replacement of numba.jit for the kernels of pandapower, which enables the on-disk cache by
+    default and registers the kernel for warmup(). If numba is not installed, the functions are
+    returned as they are.
+    """
+    if not numba_installed:
+        return no_numba_jit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        # @jit without arguments
+        return _register(_LazyKernel(args[0], (), {}))
+
+    def decorator(func):
+        return _register(_LazyKernel(func, args, kwargs))
+    return decorator
+
+
+def _register(kernel):
+    KERNELS["%s.%s" % (kernel.py_func.__module__, kernel.py_func.__name__)] = kernel
+    return kernel
+
+
+class _LazyKernel(object):
+    """
+    A kernel which is passed to numba.jit when it is called (or one of the attributes of the numba
+    dispatcher is used) for the first time. Kernels which call other kernels get the dispatchers of
+    these kernels when they are compiled.
+    """
+
+    def __init__(self, func, args, kwargs):
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._dispatcher = None
+
+    @property
+    def dispatcher(self):
+        if self._dispatcher is None:
+            self._dispatcher = _compile(self.py_func, self._args, dict(self._kwargs))
+        return self._dispatcher
+
+    def __call__(self, *args, **kwargs):
+        return self.dispatcher(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name in ("_dispatcher", "py_func"):
+            raise AttributeError(name)
+        return getattr(self.dispatcher, name)
+
+
+def _compile(func, args, kwargs):
+    try:
+        from numba import jit as numba_jit
+    except ImportError:
+        # numba is installed but can't be imported, the function is used as it is
+        logger.warning("numba cannot be imported, %s is not compiled" % func.__name__)
+        return func
+    _register_typeof()
+    kwargs.setdefault("cache", True)
+    try:
+        return numba_jit(*args, **kwargs)(func)
+    except RuntimeError:
+        # no writable cache directory for the module of the kernel
+        kwargs["cache"] = False
+        return numba_jit(*args, **kwargs)(func)
+
+
+@functools.lru_cache(maxsize=None)
+def _register_typeof():
+    # a kernel which calls another kernel is typed with the dispatcher of the called kernel
+    from numba.core.typing.typeof import typeof_impl
+
+    @typeof_impl.register(_LazyKernel)
+    def _typeof_lazy_kernel(kernel, c):
+        return typeof_impl(kernel.dispatcher, c)
+
+
+def set_cache_dir(cache_dir):
+    """
+    Sets the directory in which the compiled numba kernels of pandapower are cached. The cache
+    directory is passed on to subprocesses (e.g. the workers of a process pool), so that the
+    kernels are only compiled once for all processes.
+
+    INPUT:
+        **cache_dir** (str) - directory of the cache, it is created if it doesn't exist
+    """
+    if not numba_installed:
+        logger.warning("numba is not installed, the cache directory has no effect")
+        return
+    import numba
+    cache_dir = os.path.abspath(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    os.environ["NUMBA_CACHE_DIR"] = cache_dir
+    numba.config.CACHE_DIR = cache_dir
+    for kernel in KERNELS.values():
+        # the cache directory is determined when the caching is enabled, kernels which are not
+        # compiled yet use the new cache directory anyway
+        if kernel._dispatcher is None:
+            continue
+        try:
+            kernel.enable_caching()
+        except RuntimeError:
+            pass
+
+
+def warmup():
+    """
+    Compiles the numba kernels of the power flow ahead of the first power flow, by running power
+    flows with numba on small example grids. The kernels are loaded from the on-disk cache if
+    they were compiled by an earlier process (see set_cache_dir), otherwise they are compiled and
+    written to the cache.
+
+    OUTPUT:
+        **signatures** (dict) - number of compiled signatures of each kernel
+
+    EXAMPLE:
+        >>> import pandapower.pf
+        >>> pandapower.pf.warmup()
+    """
+    if not numba_installed:
+        logger.warning("numba is not installed, there are no kernels to compile")
+        return dict()
+    # the kernels are registered when their modules are imported
+    from pandapower.run import runpp
+    from pandapower.networks import example_multivoltage, example_simple
+
+    net = example_multivoltage()
+    runpp(net, numba=True)
+    # a grid without PV buses uses a different jacobian kernel
+    net = example_simple()
+    net.gen.in_service = False
+    runpp(net, numba=True, calculate_voltage_angles=True)
+    runpp(net, numba=True, algorithm="bfsw")
+    runpp(net, numba=True, algorithm="fdbx")
+    return {name: len(kernel.signatures) for name, kernel in KERNELS.items()}
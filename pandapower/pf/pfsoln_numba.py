@@ -19,10 +19,7 @@ from pandapower.pypower.idx_bus import PD, QD
 from pandapower.pypower.idx_gen import GEN_BUS, GEN_STATUS, PG, QG
 from pandapower.pypower.pfsoln import _update_v, _update_q, _update_p
 
-try:
-    from numba import jit
-except ImportError:
-    from pandapower.pf.no_numba import jit
+from pandapower.pf.numba_cache import jit
 
 EPS = finfo(float).eps
 
@@ -90,7 +87,7 @@ def _update_branch_flows(Yf, Yt, V, baseMVA, branch):
     return branch
 
 
-@jit(nopython=True, cache=False)
+@jit(nopython=True)
 def calc_branch_flows(Yy_x, Yy_p, Yy_j, v, baseMVA, dim_x, bus_ind):  # pragma: no cover
 
     Sx = zeros(dim_x, dtype=complex128)
@@ -106,7 +103,7 @@ def calc_branch_flows(Yy_x, Yy_p, Yy_j, v, baseMVA, dim_x, bus_ind):  # pragma:
     return Sx
 
 
-@jit(nopython=True, cache=False)
+@jit(nopython=True)
 def calc_branch_flows_batch(Yy_x, Yy_p, Yy_j, V, baseMVA, dim_x, bus_ind, base_kv):  # pragma: no cover
     """
     Function to get branch flows with a batch computation for the timeseries module
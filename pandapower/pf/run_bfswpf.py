@@ -10,17 +10,19 @@ from time import time  # alternatively use import timeit.default_timer as time
 import numpy as np
 import scipy as sp
 from pandapower.pypower.idx_brch import F_BUS, T_BUS, BR_R, BR_X, BR_B, TAP, BR_STATUS, SHIFT
-from pandapower.pypower.idx_bus import BUS_I, BUS_TYPE, GS, BS
+from pandapower.pypower.idx_bus import BUS_I, BUS_TYPE, GS, BS, PD, QD, CID, CZD
 from pandapower.pypower.idx_gen import GEN_BUS, QG, QMAX, QMIN, GEN_STATUS, VG
 from pandapower.pypower.makeSbus import makeSbus
 from scipy.sparse import csr_matrix, csgraph
 from six import iteritems
 
 from pandapower.auxiliary import ppException
+from pandapower.pf.bfsw_numba import _get_bfs_ordering, _make_sweep_data, _sweep_ordered, \
+    _sweep_ordered_batch
 from pandapower.pypower.bustypes import bustypes
 from pandapower.pypower.newtonpf import _evaluate_Fx, _check_for_convergence
 from pandapower.pypower.pfsoln import pfsoln
-from pandapower.pf.run_newton_raphson_pf import _get_Y_bus
+from pandapower.pf.run_newton_raphson_pf import _get_Y_bus, _store_internal
 from pandapower.pf.runpf_pypower import _import_numba_extensions_if_flag_is_true
 from pandapower.pf.ppci_variables import _get_pf_variables_from_ppci
 
@@ -212,8 +214,15 @@ def _makeYsh_bfsw(bus, branch, baseMVA):
     return Ysh
 
 
+def _update_v(V, Iinj, DLF, V_ref, mask_root, sweep_data):
+    if sweep_data is None:
+        V[mask_root] = V_ref[mask_root] + DLF * Iinj[mask_root]
+    else:
+        _sweep_ordered(V, Iinj, sweep_data)
+
+
 def _bfswpf(DLF, bus, gen, branch, baseMVA, Ybus, Sbus, V0, ref, pv, pq, buses_ordered_bfs_nets,
-            options, **kwargs):
+            options, sweep_data=None, **kwargs):
     """
     distribution power flow solution according to [1]
     :param DLF: direct-Load-Flow matrix which relates bus current injections to voltage drops from the root bus
@@ -229,6 +238,8 @@ def _bfswpf(DLF, bus, gen, branch, baseMVA, Ybus, Sbus, V0, ref, pv, pq, buses_o
     :param pv: PV buses indices
     :param pq: PQ buses indices
     :param buses_ordered_bfs_nets: buses ordered according to breadth-first search
+    :param sweep_data: bfs ordering and impedances for the compiled sweep (see bfsw_numba), the DLF
+                       matrix is used if None
 
     :return: power flow result
     """
@@ -280,8 +291,7 @@ def _bfswpf(DLF, bus, gen, branch, baseMVA, Ybus, Sbus, V0, ref, pv, pq, buses_o
         n_iter_inner = 0
         n_iter += 1
 
-        deltaV = DLF * Iinj[mask_root]
-        V[mask_root] = V_ref[mask_root] + deltaV
+        _update_v(V, Iinj, DLF, V_ref, mask_root, sweep_data)
 
         # ##
         # inner loop for considering PV buses
@@ -289,11 +299,13 @@ def _bfswpf(DLF, bus, gen, branch, baseMVA, Ybus, Sbus, V0, ref, pv, pq, buses_o
         inner_loop_converged = False
         while not inner_loop_converged and len(pv) > 0:
 
-            pvi = pv - norefs  # internal PV buses indices, assuming reference node is always 0
-
             Vmis = (np.abs(gen[gen_pv, VG])) ** 2 - (np.abs(V[pv])) ** 2
-            # TODO improve getting values from sparse DLF matrix - DLF[pvi, pvi] is unefficient
-            dQ = (Vmis / (2 * DLF[pvi, pvi].A1.imag)).flatten()
+            if sweep_data is None:
+                pvi = pv - norefs  # internal PV buses indices, assuming reference node is always 0
+                # TODO improve getting values from sparse DLF matrix - DLF[pvi, pvi] is unefficient
+                dQ = (Vmis / (2 * DLF[pvi, pvi].A1.imag)).flatten()
+            else:
+                dQ = Vmis / (2 * sweep_data["z_diag"][pv].imag)
 
             gen[gen_pv, QG] += dQ
 
@@ -326,8 +338,7 @@ def _bfswpf(DLF, bus, gen, branch, baseMVA, Ybus, Sbus, V0, ref, pv, pq, buses_o
                     if voltage_depend_loads else
                     makeSbus(baseMVA, bus, gen))
             Iinj = np.conj(Sbus / V) - Ysh * V
-            deltaV = DLF * Iinj[mask_root]
-            V[mask_root] = V_ref[mask_root] + deltaV
+            _update_v(V, Iinj, DLF, V_ref, mask_root, sweep_data)
 
             if n_iter_inner > max_iter_pv:
                 raise LoadflowNotConverged(" FBSW Power Flow did not converge - inner iterations for PV nodes "
@@ -355,6 +366,40 @@ def _bfswpf(DLF, bus, gen, branch, baseMVA, Ybus, Sbus, V0, ref, pv, pq, buses_o
     return V, converged
 
 
+def _shift_voltage_angles(V, branch, ref, G, buses_ordered_bfs_nets):
+    """
+    rotates the voltages of the buses behind phase-shifting transformers by the shift angle, V can
+    be a vector or a matrix with the buses in the last dimension
+    """
+    # create spanning trees using breadth-first-search
+    # TODO add efficiency warning if a network is heavy-meshed
+    G_trees = [csgraph.breadth_first_tree(G, refbus, directed=False) for refbus in ref]
+    brch_shift_mask = branch[:, SHIFT] != 0
+    trafos_shift = dict(list(zip(list(zip(branch[brch_shift_mask, F_BUS].real.astype(int),
+                                          branch[brch_shift_mask, T_BUS].real.astype(int))),
+                                 branch[brch_shift_mask, SHIFT].real)))
+    for trafo_ind, shift_degree in iteritems(trafos_shift):
+        neti = 0
+        # if multiple reference nodes, find in which network trafo is located
+        if len(ref) > 0:
+            for refbusi in range(len(ref)):
+                if trafo_ind[0] in buses_ordered_bfs_nets[refbusi]:
+                    neti = refbusi
+                    break
+        G_tree = G_trees[neti]
+        buses_ordered_bfs = buses_ordered_bfs_nets[neti]
+        if (np.argwhere(buses_ordered_bfs == trafo_ind[0]) <
+                np.argwhere(buses_ordered_bfs == trafo_ind[1])):
+            lv_bus = trafo_ind[1]
+            shift_degree *= -1
+        else:
+            lv_bus = trafo_ind[0]
+
+        buses_shifted_from_root = csgraph.breadth_first_order(G_tree, lv_bus,
+                                                              directed=True, return_predecessors=False)
+        V[..., buses_shifted_from_root] *= np.exp(1j * np.pi / 180 * shift_degree)
+
+
 def _get_options(options):
     enforce_q_lims = options['enforce_q_lims']
     tolerance_mva = options['tolerance_mva']
@@ -365,15 +410,20 @@ def _get_options(options):
     return enforce_q_lims, tolerance_mva, max_iteration, calculate_voltage_angles, numba
 
 
-def _run_bfswpf(ppci, options, **kwargs):
+def _run_bfswpf(ppci, options, bfsw_cache=None, **kwargs):
     """
     SPARSE version of distribution power flow solution according to [1]
     :References:
     [1] Jen-Hao Teng, "A Direct Approach for Distribution System Load Flow Solutions",
     IEEE Transactions on Power Delivery, vol. 18, no. 3, pp. 882-887, July 2003.
 
+    With numba, the sweeps are calculated by compiled loops over the breadth-first-search ordering
+    of the buses instead of the DLF matrix (see bfsw_numba).
+
     :param ppci: matpower-style case data
     :param options: pf options
+    :param bfsw_cache: dict in which the bus ordering is stored and reused as long as the topology
+                       does not change
     :return: results (pypower style), success (flag about PF convergence)
     """
     time_start = time()  # starting pf calculation timing
@@ -398,14 +448,16 @@ def _run_bfswpf(ppci, options, **kwargs):
     bus_to = branch[:, T_BUS].real.astype(int)
     G = csr_matrix((np.ones(nobranch), (bus_from, bus_to)),
                    shape=(nobus, nobus))
-    # create spanning trees using breadth-first-search
-    # TODO add efficiency warning if a network is heavy-meshed
-    G_trees = []
-    for refbus in ref:
-        G_trees.append(csgraph.breadth_first_tree(G, refbus, directed=False))
 
+    ordering = _get_bfs_ordering(nobus, bus_from, bus_to, ref, bfsw_cache) if numba else None
+    if ordering is not None:
+        # the compiled sweep works on the bfs ordering, the DLF matrix is not needed
+        DLF, buses_ordered_bfs_nets = None, ordering["buses_ordered_bfs_nets"]
+        sweep_data = _make_sweep_data(ordering, branch, nobus)
+    else:
         # depth-first-search bus ordering and generating Direct Load Flow matrix DLF = BCBV * BIBC
         ppci, DLF, buses_ordered_bfs_nets = _get_bibc_bcbv(ppci, options, bus, branch, G)
+        sweep_data = None
 
     # if there are trafos with phase-shift calculate Ybus without phase-shift for bfswpf
     any_trafo_shift = (branch[:, SHIFT] != 0).any()
@@ -419,34 +471,11 @@ def _run_bfswpf(ppci, options, **kwargs):
     # #-----  run the power flow  -----
     V_final, success = _bfswpf(DLF, bus, gen, branch, baseMVA, Ybus_noshift,
                                Sbus, V0, ref, pv, pq, buses_ordered_bfs_nets,
-                               options, **kwargs)
+                               options, sweep_data=sweep_data, **kwargs)
 
     # if phase-shifting trafos are present adjust final state vector angles accordingly
     if calculate_voltage_angles and any_trafo_shift:
-        brch_shift_mask = branch[:, SHIFT] != 0
-        trafos_shift = dict(list(zip(list(zip(branch[brch_shift_mask, F_BUS].real.astype(int),
-                                              branch[brch_shift_mask, T_BUS].real.astype(int))),
-                                     branch[brch_shift_mask, SHIFT].real)))
-        for trafo_ind, shift_degree in iteritems(trafos_shift):
-            neti = 0
-            # if multiple reference nodes, find in which network trafo is located
-            if len(ref) > 0:
-                for refbusi in range(len(ref)):
-                    if trafo_ind[0] in buses_ordered_bfs_nets[refbusi]:
-                        neti = refbusi
-                        break
-            G_tree = G_trees[neti]
-            buses_ordered_bfs = buses_ordered_bfs_nets[neti]
-            if (np.argwhere(buses_ordered_bfs == trafo_ind[0]) <
-                    np.argwhere(buses_ordered_bfs == trafo_ind[1])):
-                lv_bus = trafo_ind[1]
-                shift_degree *= -1
-            else:
-                lv_bus = trafo_ind[0]
-
-            buses_shifted_from_root = csgraph.breadth_first_order(G_tree, lv_bus,
-                                                                  directed=True, return_predecessors=False)
-            V_final[buses_shifted_from_root] *= np.exp(1j * np.pi / 180 * shift_degree)
+        _shift_voltage_angles(V_final, branch, ref, G, buses_ordered_bfs_nets)
 
     # #----- output results to ppc ------
     ppci["et"] = time() - time_start  # pf time end
@@ -458,4 +487,104 @@ def _run_bfswpf(ppci, options, **kwargs):
 
     ppci["bus"], ppci["gen"], ppci["branch"] = bus, gen, branch
 
+    # keep the variables of the power flow, e.g. for the batch read of time series results
+    _store_internal(ppci, {"bus": bus, "gen": gen, "branch": branch, "baseMVA": baseMVA,
+                           "V": V_final, "Ybus": Ybus, "Yf": Yf, "Yt": Yt, "ref": ref, "pv": pv,
+                           "pq": pq})
+
     return ppci, success
+
+
+def _get_Sbus_batch(baseMVA, S_gen, S_load, V, zip_loads=None):
+    # power injections of the snapshots, zip_loads are the constant current and constant impedance
+    # shares of the loads
+    if zip_loads is None:
+        return S_gen - S_load / baseMVA
+    ci, cz = zip_loads
+    vm = np.abs(V)
+    return S_gen - S_load * (1 - ci - cz + ci * vm + cz * vm ** 2) / baseMVA
+
+
+def _run_bfswpf_batch(ppci, options, S_load, bfsw_cache=None):
+    """
+    Vectorized distribution power flow for several snapshots of the same network, e.g. the time
+    steps of a time series. All snapshots are swept at once by the compiled sweep (see
+    bfsw_numba); the convergence is checked for each snapshot and converged snapshots are not
+    swept again. The generation of the snapshots is taken from ppci, PV buses are not supported.
+
+    :param ppci: matpower-style case data, the bus voltages are the initial values of all snapshots
+    :param options: pf options
+    :param S_load: complex load of the buses (PD + j QD in MVA) of each snapshot
+                   (snapshots x buses in ppci bus order)
+    :param bfsw_cache: dict in which the bus ordering is stored and reused as long as the topology
+                       does not change
+    :return: V - complex bus voltages (snapshots x buses)
+             converged - convergence flag of each snapshot
+             iterations - number of iterations of each snapshot
+    """
+    baseMVA, bus, gen, branch, ref, pv, pq, on, gbus, V0, ref_gens = \
+        _get_pf_variables_from_ppci(ppci)
+    if len(pv):
+        raise NotImplementedError("PV buses are not supported by the batched bfsw power flow")
+
+    enforce_q_lims, tolerance_mva, max_iteration, calculate_voltage_angles, numba = \
+        _get_options(options)
+    numba, makeYbus = _import_numba_extensions_if_flag_is_true(numba)
+
+    nobus = bus.shape[0]
+    nobranch = branch.shape[0]
+    nosnap = S_load.shape[0]
+
+    bus_from = branch[:, F_BUS].real.astype(int)
+    bus_to = branch[:, T_BUS].real.astype(int)
+    ordering = _get_bfs_ordering(nobus, bus_from, bus_to, ref, bfsw_cache)
+    if ordering is None:
+        raise NotImplementedError("several reference buses in one network are not supported by "
+                                  "the batched bfsw power flow")
+    sweep_data = _make_sweep_data(ordering, branch, nobus)
+
+    # Ybus without phase-shift for the sweep, the angles are shifted after the power flow
+    branch_noshift = branch.copy()
+    branch_noshift[:, SHIFT] = 0
+    Ybus_noshift = makeYbus(baseMVA, bus, branch_noshift)[0]
+    Ysh = _makeYsh_bfsw(bus, branch, baseMVA)
+
+    # generation of the buses (constant for all snapshots) and voltage dependency of the loads
+    S_gen = makeSbus(baseMVA, bus, gen) + (bus[:, PD] + 1j * bus[:, QD]) / baseMVA
+    ci, cz = bus[:, CID], bus[:, CZD]
+    zip_loads = (ci, cz) if options["voltage_depend_loads"] and (ci.any() or cz.any()) else None
+
+    V = np.tile(V0, (nosnap, 1))
+    converged = np.zeros(nosnap, dtype=bool)
+    iterations = np.zeros(nosnap, dtype=int)
+    rows = np.arange(nosnap)
+    Sbus = _get_Sbus_batch(baseMVA, S_gen, S_load, V, zip_loads)
+    Iinj = np.conj(Sbus / V) - Ysh * V
+
+    for n_iter in range(1, max_iteration + 1):
+        _sweep_ordered_batch(V, Iinj, rows, sweep_data)
+        iterations[rows] = n_iter
+
+        # mismatch of each snapshot
+        V_rows = V[rows]
+        Sbus = _get_Sbus_batch(baseMVA, S_gen, S_load[rows], V_rows, zip_loads)
+        mis = V_rows * np.conj(Ybus_noshift.dot(V_rows.T).T) - Sbus
+        if len(pq):
+            normF = np.maximum(np.abs(mis[:, pq].real).max(axis=1),
+                               np.abs(mis[:, pq].imag).max(axis=1))
+        else:
+            normF = np.zeros(len(rows))
+        converged[rows[normF < tolerance_mva]] = True
+
+        # only the snapshots which did not converge are swept again
+        not_converged = normF >= tolerance_mva
+        rows, Sbus, V_rows = rows[not_converged], Sbus[not_converged], V_rows[not_converged]
+        if not len(rows):
+            break
+        Iinj[rows] = np.conj(Sbus / V_rows) - Ysh * V_rows
+
+    if calculate_voltage_angles and (branch[:, SHIFT] != 0).any():
+        G = csr_matrix((np.ones(nobranch), (bus_from, bus_to)), shape=(nobus, nobus))
+        _shift_voltage_angles(V, branch, ref, G, ordering["buses_ordered_bfs_nets"])
+
+    return V, converged, iterations
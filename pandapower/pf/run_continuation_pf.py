@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+"""
+Continuation power flow for PV curves. The bus power injections are changed along a direction,
+Sbus(lambda) = Sbus + lambda * dS, starting at the power flow solution (lambda = 0). Every step
+consists of a tangent predictor and a Newton corrector with the pseudo arc length as additional
+equation, so that the curve can be traced through the nose point (maximum loadability), where
+the Jacobian of the power flow is singular. The Jacobian is created by the same functions as in
+the Newton-Raphson power flow.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+from numpy import r_, angle, exp, linalg, Inf
+from scipy.sparse import csr_matrix, vstack, hstack
+from scipy.sparse.linalg import spsolve
+
+from pandapower.pf.create_jacobian import create_jacobian_matrix, get_fastest_jacobian_function
+from pandapower.pypower.newtonpf import _evaluate_Fx
+
+try:
+    import pplog as logging
+except ImportError:
+    import logging
+
+logger = logging.getLogger(__name__)
+
+# sign of the power of the elements in the direction of the continuation
+DIRECTION_ELEMENTS = {"load": -1., "sgen": 1., "gen": 1.}
+
+
+def runcpf(net, direction=None, step=0.1, min_step=1e-4, max_step=1., max_steps=1000,
+           stop_at_nose=True, max_lambda=None, **kwargs):
+    """
+    Runs a continuation power flow, which traces the PV curve of the grid along a direction of
+    load and generation change. The power of the elements is p_mw * (1 + lambda * factor) (and
+    q_mvar accordingly for loads and sgens). Loads are considered with constant power, Q limits
+    of gens are not considered.
+
+    INPUT:
+        **net** - The pandapower format network
+
+    OPTIONAL:
+        **direction** (dict, None) - factors of the elements with which their power is changed,
+        e.g. {"load": 1., "sgen": pd.Series([1.], index=[3])}. Keys are "load", "sgen" and "gen",
+        values are a float for all elements or a Series with a factor for each element (missing
+        elements are not changed). If None, all loads are increased: {"load": 1.}
+
+        **step** (float, 0.1) - initial arc length of a step of the continuation. The step is
+        doubled if the corrector converges within 3 iterations
+
+        **min_step** (float, 1e-4) - minimum arc length of a step. The step is halved if the
+        corrector does not converge or if the nose point is passed, the continuation stops if the
+        step becomes smaller than min_step
+
+        **max_step** (float, 1.) - maximum arc length of a step
+
+        **max_steps** (int, 1000) - maximum number of steps
+
+        **stop_at_nose** (bool, True) - if True, the continuation stops at the nose point.
+        Otherwise the lower part of the PV curve is traced until lambda is below 0
+
+        **max_lambda** (float, None) - the continuation stops if lambda exceeds max_lambda
+
+        ****kwargs** - keyword arguments for runpp, which calculates the starting point
+
+    OUTPUT:
+        **result** (dict) - the PV curve with the keys
+
+            - "lambda": lambda of each point of the curve
+            - "vm_pu", "va_degree": voltages of each point (points x buses in the order of \
+                net.bus, nan for out of service buses)
+            - "bus": index of the buses
+            - "nose": True if the nose point was reached
+            - "lambda_max": maximum lambda of the curve
+
+    EXAMPLE:
+        >>> import pandapower as pp
+        >>> import pandapower.networks as nw
+        >>> net = nw.case9()
+        >>> curve = pp.runcpf(net)
+        >>> curve["lambda_max"]
+    """
+    data = _init_cpf(net, **kwargs)
+    dS = _get_direction(net, direction, data["baseMVA"], data["nb"])
+    lam, V, nose = _run_cpf(data["Ybus"], data["Sbus"], dS, data["V"], data["pv"], data["pq"],
+                            net["_options"], step, min_step, max_step, max_steps, stop_at_nose,
+                            max_lambda)
+    return _cpf_result(net, data["nb"], lam, V, nose)
+
+
+def runcpf_screening(net, directions, parallel=True, n_jobs=None, step=0.1, min_step=1e-4,
+                     max_step=1., max_steps=1000, stop_at_nose=True, max_lambda=None, **kwargs):
+    """
+    Runs the continuation power flow (see runcpf) for several directions, e.g. transfers between
+    areas, from the same starting point. The directions are calculated in a thread or process
+    pool.
+
+    INPUT:
+        **net** - The pandapower format network
+
+        **directions** (list) - directions of the continuation power flows (see runcpf)
+
+    OPTIONAL:
+        **parallel** (bool/str, True) - True or "thread" for a thread pool, "process" for a
+        process pool, False to calculate the directions one after another
+
+        **n_jobs** (int, None) - number of workers of the pool. If None, the default of
+        concurrent.futures is used
+
+        **step**, **min_step**, **max_step**, **max_steps**, **stop_at_nose**, **max_lambda** -
+        see runcpf
+
+        ****kwargs** - keyword arguments for runpp, which calculates the starting point
+
+    OUTPUT:
+        **results** (list) - the PV curve of each direction (see runcpf)
+    """
+    data = _init_cpf(net, **kwargs)
+    dS = [_get_direction(net, direction, data["baseMVA"], data["nb"]) for direction in directions]
+    run = partial(_run_cpf, data["Ybus"], data["Sbus"], V0=data["V"], pv=data["pv"],
+                  pq=data["pq"], options=dict(net["_options"]), step=step, min_step=min_step,
+                  max_step=max_step, max_steps=max_steps, stop_at_nose=stop_at_nose,
+                  max_lambda=max_lambda)
+    if parallel is False or n_jobs == 1:
+        curves = [run(d) for d in dS]
+    else:
+        if parallel == "process":
+            executor = ProcessPoolExecutor
+        elif parallel is True or parallel == "thread":
+            executor = ThreadPoolExecutor
+        else:
+            raise ValueError("parallel must be True, False, 'thread' or 'process', not %s" % parallel)
+        with executor(max_workers=n_jobs) as pool:
+            curves = list(pool.map(run, dS))
+    return [_cpf_result(net, data["nb"], lam, V, nose) for lam, V, nose in curves]
+
+
+def _init_cpf(net, **kwargs):
+    # the starting point of the continuation is the power flow solution
+    if kwargs.get("enforce_q_lims", False):
+        raise NotImplementedError("Q limits are not considered by the continuation power flow")
+    from pandapower.run import runpp
+    kwargs["voltage_depend_loads"] = False
+    runpp(net, **kwargs)
+    internal = net["_ppc"]["internal"]
+    if "Ybus" not in internal or "Sbus" not in internal:
+        raise NotImplementedError("the continuation power flow requires the internal variables "
+                                  "of the power flow, e.g. of algorithm 'nr'")
+    return {"Ybus": internal["Ybus"], "Sbus": internal["Sbus"], "V": internal["V"],
+            "pv": internal["pv"], "pq": internal["pq"], "baseMVA": internal["baseMVA"],
+            "nb": internal["bus"].shape[0]}
+
+
+def _get_direction(net, direction, baseMVA, nb):
+    """
+    change of the complex bus power injections in p.u. per unit of lambda, in ppci bus order
+    """
+    if direction is None:
+        direction = {"load": 1.}
+    bus_lookup = net["_pd2ppc_lookups"]["bus"]
+    dS = np.zeros(nb, dtype=complex)
+    for element, factor in direction.items():
+        if element not in DIRECTION_ELEMENTS:
+            raise ValueError("the direction of the continuation power flow can only contain %s, "
+                             "not %s" % (sorted(DIRECTION_ELEMENTS), element))
+        tab = net[element]
+        if not len(tab):
+            continue
+        if hasattr(factor, "reindex"):
+            factor = factor.reindex(tab.index).fillna(0.).values
+        s = tab.p_mw.values * tab.scaling.values * factor * tab.in_service.values
+        if element != "gen":
+            s = s + 1j * tab.q_mvar.values * tab.scaling.values * factor * tab.in_service.values
+        # out of service buses are at the end of the ppc
+        buses = bus_lookup[tab.bus.values]
+        in_ppci = buses < nb
+        np.add.at(dS, buses[in_ppci], DIRECTION_ELEMENTS[element] * s[in_ppci] / baseMVA)
+    return dS
+
+
+def _run_cpf(Ybus, Sbus, dS, V0, pv, pq, options, step=0.1, min_step=1e-4, max_step=1.,
+             max_steps=1000, stop_at_nose=True, max_lambda=None):
+    """
+    Continuation power flow along Sbus + lambda * dS with a tangent predictor and a Newton
+    corrector with the pseudo arc length parametrization. The state is
+    x = [Va(pv), Va(pq), Vm(pq), lambda].
+
+    :return: lam - lambda of each point of the curve
+             V - complex bus voltages of each point (points x buses)
+             nose - True if the nose point was reached
+    """
+    tol = options["tolerance_mva"]
+    max_it = options["max_iteration"]
+    numba = options["numba"]
+
+    Ybus = Ybus.tocsr()
+    pvpq = r_[pv, pq]
+    npv, npq = len(pv), len(pq)
+    # generate lookup pvpq -> index pvpq (used in createJ)
+    pvpq_lookup = np.zeros(max(Ybus.indices) + 1, dtype=int)
+    pvpq_lookup[pvpq] = np.arange(len(pvpq))
+    createJ = get_fastest_jacobian_function(pvpq, pq, numba)
+    dF_dlam = csr_matrix(-r_[dS[pv].real, dS[pq].real, dS[pq].imag].reshape(-1, 1))
+    Va0, Vm0 = angle(V0), abs(V0)
+
+    def to_V(x):
+        Va, Vm = Va0.copy(), Vm0.copy()
+        Va[pvpq] = x[:npv + npq]
+        Vm[pq] = x[npv + npq:-1]
+        return Vm * exp(1j * Va)
+
+    def augmented_jacobian(V, z):
+        J = create_jacobian_matrix(Ybus, V, pvpq, pq, createJ, pvpq_lookup, npv, npq, numba)
+        return vstack([hstack([J, dF_dlam]), csr_matrix(z)], format="csc")
+
+    def tangent(x, z):
+        # the tangent keeps the orientation of the previous tangent z
+        rhs = np.zeros(len(x))
+        rhs[-1] = 1.
+        z_new = spsolve(augmented_jacobian(to_V(x), z), rhs)
+        return z_new / linalg.norm(z_new)
+
+    def corrector(x_prev, z, sigma):
+        x = x_prev + sigma * z
+        for i in range(max_it + 1):
+            V = to_V(x)
+            F = r_[_evaluate_Fx(Ybus, V, Sbus + x[-1] * dS, pv, pq), z.dot(x - x_prev) - sigma]
+            if linalg.norm(F, Inf) < tol:
+                return x, True, i
+            if i < max_it:
+                x = x - spsolve(augmented_jacobian(V, z), F)
+        return x, False, max_it
+
+    x = r_[Va0[pvpq], Vm0[pq], 0.]
+    z = np.zeros(len(x))
+    z[-1] = 1.
+    z = tangent(x, z)
+    points = [x]
+    sigma = step
+    nose = False
+    locating_nose = False
+    for _ in range(max_steps):
+        x_new, converged, iterations = corrector(x, z, sigma)
+        if converged:
+            z_new = tangent(x_new, z)
+            # lambda decreases along the tangent after the nose point
+            passed_nose = z_new[-1] < 0 <= z[-1]
+            if passed_nose and stop_at_nose and sigma / 2 >= min_step:
+                # approach the nose point with smaller steps
+                sigma /= 2
+                locating_nose = True
+                continue
+        else:
+            sigma /= 2
+            if sigma < min_step:
+                logger.warning("continuation power flow stopped at lambda=%.4f, the corrector did "
+                               "not converge" % x[-1])
+                break
+            continue
+        x, z = x_new, z_new
+        points.append(x)
+        nose = nose or passed_nose
+        if nose and stop_at_nose or x[-1] < 0 or max_lambda is not None and x[-1] >= max_lambda:
+            break
+        if not locating_nose and iterations <= 3:
+            sigma = min(2 * sigma, max_step)
+
+    points = np.array(points)
+    V = np.array([to_V(x) for x in points])
+    return points[:, -1], V, nose
+
+
+def _cpf_result(net, nb, lam, V, nose):
+    # voltages of the pandapower buses, out of service buses are at the end of the ppc
+    buses = net["_pd2ppc_lookups"]["bus"][net.bus.index.values]
+    in_ppci = buses < nb
+    vm = np.full((len(lam), len(buses)), np.nan)
+    va = np.full((len(lam), len(buses)), np.nan)
+    vm[:, in_ppci] = abs(V[:, buses[in_ppci]])
+    va[:, in_ppci] = np.rad2deg(angle(V[:, buses[in_ppci]]))
+    return {"lambda": lam, "vm_pu": vm, "va_degree": va, "bus": net.bus.index.values,
+            "nose": nose, "lambda_max": lam.max()}
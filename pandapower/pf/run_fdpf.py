@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+"""
+Fast-decoupled power flow (XB and BX versions) on the pandapower power flow stack. The reduced
+B' and B'' matrices are factorized once and the factorizations are reused by later power flows as
+long as the branch parameters, the bus shunts and the bus types do not change.
+"""
+
+from functools import partial
+from time import time
+
+import numpy as np
+from numpy import angle, exp, conj, r_, linalg, Inf
+
+from pandapower.auxiliary import FactorizedY
+from pandapower.pf.fdpf_numba import _mismatch
+from pandapower.pf.ppci_variables import _get_pf_variables_from_ppci, \
+    _store_results_from_pf_in_ppci
+from pandapower.pf.run_dc_pf import _run_dc_pf
+from pandapower.pf.run_newton_raphson_pf import _get_numba_functions, _get_Y_bus, _get_Sbus, \
+    _store_internal, ppci_to_pfsoln, _run_ac_pf_with_qlims_enforced
+from pandapower.pypower.idx_brch import F_BUS, T_BUS, BR_R, BR_X, BR_B, TAP, SHIFT, BR_STATUS
+from pandapower.pypower.idx_bus import BS
+from pandapower.pypower.makeB import makeB
+
+# makeB uses the PF_ALG values of pypower
+FDPF_ALG = {"fdbx": 2, "fdxb": 3}
+
+
+def _run_fdpf(ppci, options, fdpf_cache=None, **kwargs):
+    """
+    Runs a fast-decoupled power flow.
+
+    INPUT
+    ppci (dict) - the "internal" ppc (without out ot service elements and sorted elements)
+    options(dict) - options for the power flow
+    fdpf_cache (dict, None) - dict in which the factorizations of B' and B'' are stored and reused
+
+    """
+    t0 = time()
+    if isinstance(options["init_va_degree"], str) and options["init_va_degree"] == "dc":
+        ppci = _run_dc_pf(ppci)
+    run_pf = partial(_run_ac_fdpf_without_qlims_enforced, fdpf_cache=fdpf_cache)
+    if options["enforce_q_lims"]:
+        ppci, success, iterations, bus, gen, branch = _run_ac_pf_with_qlims_enforced(
+            ppci, options, run_pf=run_pf)
+    else:
+        ppci, success, iterations = run_pf(ppci, options)
+        bus, gen, branch = ppci_to_pfsoln(ppci, options)
+    et = time() - t0
+    ppci = _store_results_from_pf_in_ppci(ppci, bus, gen, branch, success, iterations, et)
+    return ppci
+
+
+def _run_ac_fdpf_without_qlims_enforced(ppci, options, fdpf_cache=None):
+    makeYbus, _ = _get_numba_functions(ppci, options)
+
+    baseMVA, bus, gen, branch, ref, pv, pq, _, _, V0, ref_gens = _get_pf_variables_from_ppci(ppci)
+
+    ppci, Ybus, Yf, Yt = _get_Y_bus(ppci, options, makeYbus, baseMVA, bus, branch)
+
+    # compute complex bus power injections [generation - load]
+    Sbus = _get_Sbus(ppci, options["recycle"])
+
+    Bp_solver, Bpp_solver = _get_B_factorizations(baseMVA, bus, branch, pv, pq,
+                                                  FDPF_ALG[options["algorithm"]], fdpf_cache)
+
+    V, success, iterations = fdpf(Ybus, Sbus, V0, Bp_solver, Bpp_solver, pv, pq, options)
+
+    # keep "internal" variables in  memory / net["_ppc"]["internal"] -> needed for recycle.
+    ppci = _store_internal(ppci, {"bus": bus, "gen": gen, "branch": branch, "baseMVA": baseMVA,
+                                  "V": V, "pv": pv, "pq": pq, "ref": ref, "Sbus": Sbus,
+                                  "ref_gens": ref_gens, "Ybus": Ybus, "Yf": Yf, "Yt": Yt})
+
+    return ppci, success, iterations
+
+
+def _get_B_factorizations(baseMVA, bus, branch, pv, pq, alg, cache=None):
+    """
+    returns the LU factorizations of B' (pv and pq buses) and B'' (pq buses). If a cache dict is
+    given, the factorizations are stored and reused as long as the parameters they depend on do
+    not change.
+    """
+    branch_data = branch[:, [F_BUS, T_BUS, BR_R, BR_X, BR_B, TAP, SHIFT, BR_STATUS]].real
+    key = {"alg": alg, "baseMVA": baseMVA, "branch": branch_data, "bs": bus[:, BS].copy(),
+           "pv": pv, "pq": pq}
+    if cache is not None and "factorizations" in cache and cache["alg"] == alg and \
+            cache["baseMVA"] == baseMVA and all(np.array_equal(cache[k], key[k]) for k in
+                                                ["branch", "bs", "pv", "pq"]):
+        return cache["factorizations"]
+
+    pvpq = r_[pv, pq]
+    Bp, Bpp = makeB(baseMVA, bus, branch.real, alg)
+    # unlike the SuperLU objects of scipy, the factorizations can be copied with the net
+    Bp_solver = FactorizedY(Bp[pvpq, :][:, pvpq])
+    Bpp_solver = FactorizedY(Bpp[pq, :][:, pq])
+    if cache is not None:
+        cache.clear()
+        cache.update(key)
+        cache["factorizations"] = (Bp_solver, Bpp_solver)
+    return Bp_solver, Bpp_solver
+
+
+def fdpf(Ybus, Sbus, V0, Bp_solver, Bpp_solver, pv, pq, options):
+    """
+    Solves the power flow using a fast decoupled method (see pypower.fdpf), with the factorized
+    reduced B' and B'' matrices. If numba is enabled, the mismatch is evaluated by a compiled
+    kernel.
+
+    :return: V - complex bus voltages
+             converged - True if the power flow converged
+             i - number of P iterations
+    """
+    tol = options["tolerance_mva"]
+    max_it = options["max_iteration"]
+    numba = options["numba"]
+
+    # initialize
+    i = 0
+    V = V0.copy()
+    Va = angle(V)
+    Vm = abs(V)
+
+    pvpq = r_[pv, pq].astype(np.int64)
+    npv = len(pv)
+    P = np.empty(len(pvpq))
+    Q = np.empty(len(pq))
+    if numba:
+        Ybus = Ybus.tocsr()
+
+    def evaluate_mismatch(V):
+        if numba:
+            _mismatch(Ybus.indptr, Ybus.indices, Ybus.data, V, Vm, Sbus, pvpq, npv, P, Q)
+        else:
+            mis = (V * conj(Ybus * V) - Sbus) / Vm
+            P[:] = mis[pvpq].real
+            Q[:] = mis[pq].imag
+        return linalg.norm(P, Inf) < tol and linalg.norm(Q, Inf) < tol
+
+    # evaluate initial mismatch
+    converged = evaluate_mismatch(V)
+
+    # do P and Q iterations
+    while not converged and i < max_it:
+        i += 1
+
+        # P iteration, update Va
+        Va[pvpq] -= Bp_solver.solve(P)
+        V = Vm * exp(1j * Va)
+        converged = evaluate_mismatch(V)
+        if converged:
+            break
+
+        # Q iteration, update Vm
+        Vm[pq] -= Bpp_solver.solve(Q)
+        V = Vm * exp(1j * Va)
+        converged = evaluate_mismatch(V)
+
+    return V, converged, i
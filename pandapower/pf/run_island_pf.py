@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+"""
+Newton-Raphson power flow which solves the islands of a grid independently of each other. Every
+island with a slack is converted into a ppci of its own, which is solved with its own
+convergence check in a thread or process pool. The results are scattered back into the ppci of the
+whole grid afterwards, so that the result is the same as if the grid was solved as a whole.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from time import time
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
+
+from pandapower.auxiliary import _find_islands
+from pandapower.pf.ppci_variables import _store_results_from_pf_in_ppci
+from pandapower.pf.run_newton_raphson_pf import _run_newton_raphson_pf
+from pandapower.pypower.bustypes import bustypes
+from pandapower.pypower.idx_brch import F_BUS, T_BUS
+from pandapower.pypower.idx_bus import BUS_I, VM, VA
+from pandapower.pypower.idx_gen import GEN_BUS
+
+try:
+    import pplog as logging
+except ImportError:
+    import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _run_island_pf(ppci, options):
+    """
+    Runs a Newton-Raphson power flow for each island of the ppci separately. Falls back to
+    _run_newton_raphson_pf if the ppci consists of one island only or if it contains buses
+    which are not connected to a slack (check_connectivity=False).
+
+    INPUT
+    ppci (dict) - the "internal" ppc (without out ot service elements and sorted elements)
+    options(dict) - options for the power flow, the pool is defined by options["parallel_islands"]
+        (True/"thread" or "process") and options["n_jobs"]
+
+    """
+    t0 = time()
+    bus_island = ppci["internal"].get("bus_island", None)
+    if bus_island is None or len(bus_island) != ppci["bus"].shape[0]:
+        bus_island = _find_islands(ppci)
+    n_islands = bus_island.max() + 1 if len(bus_island) else 0
+    if n_islands < 2 or np.any(bus_island < 0):
+        return _run_newton_raphson_pf(ppci, options)
+
+    bus_islands = _split_by_island(bus_island, n_islands)
+    branch_island = bus_island[np.real(ppci["branch"][:, F_BUS]).astype(int)]
+    branch_islands = _split_by_island(branch_island, n_islands)
+    gen_island = bus_island[np.real(ppci["gen"][:, GEN_BUS]).astype(int)]
+    gen_islands = _split_by_island(gen_island, n_islands)
+
+    # position of each bus and gen within its island
+    bus_local = np.empty(len(bus_island), dtype=int)
+    gen_local = np.empty(len(gen_island), dtype=int)
+    for buses, gens in zip(bus_islands, gen_islands):
+        bus_local[buses] = np.arange(len(buses))
+        gen_local[gens] = np.arange(len(gens))
+
+    ref_gens = ppci["internal"]["ref_gens"]
+    island_ppcis = []
+    for k in range(n_islands):
+        island_ref_gens = gen_local[ref_gens[gen_island[ref_gens] == k]]
+        island_ppcis.append(_island_ppci(ppci, bus_islands[k], branch_islands[k], gen_islands[k],
+                                         bus_local, island_ref_gens))
+
+    results = _solve_islands(island_ppcis, options)
+
+    _merge_island_results(ppci, results, bus_islands, branch_islands, gen_islands)
+    success = all(result["success"] for result in results)
+    iterations = max(result["iterations"] for result in results)
+    ppci["internal"]["bus_island"] = bus_island
+    ppci["internal"]["island_iterations"] = np.array([result["iterations"] for result in results])
+    ppci["internal"]["island_success"] = np.array([result["success"] for result in results])
+    if not success:
+        logger.debug("power flow did not converge in islands %s" %
+                     np.flatnonzero(~ppci["internal"]["island_success"]))
+    et = time() - t0
+    return _store_results_from_pf_in_ppci(ppci, ppci["internal"]["bus"], ppci["internal"]["gen"],
+                                          ppci["internal"]["branch"], success, iterations, et)
+
+
+def _split_by_island(island, n_islands):
+    order = np.argsort(island, kind="stable")
+    bounds = np.searchsorted(island[order], np.arange(1, n_islands))
+    return np.split(order, bounds)
+
+
+def _island_ppci(ppci, buses, branches, gens, bus_local, ref_gens):
+    bus = ppci["bus"][buses]
+    bus[:, BUS_I] = np.arange(len(buses))
+    branch = ppci["branch"][branches]
+    branch[:, F_BUS] = bus_local[np.real(branch[:, F_BUS]).astype(int)]
+    branch[:, T_BUS] = bus_local[np.real(branch[:, T_BUS]).astype(int)]
+    gen = ppci["gen"][gens]
+    gen[:, GEN_BUS] = bus_local[np.real(gen[:, GEN_BUS]).astype(int)]
+    return {"baseMVA": ppci["baseMVA"], "bus": bus, "branch": branch, "gen": gen,
+            "internal": {"ref_gens": ref_gens}}
+
+
+def _solve_islands(island_ppcis, options):
+    parallel = options.get("parallel_islands", True)
+    n_jobs = options.get("n_jobs", None)
+    if n_jobs == 1:
+        return [_solve_island(island_ppci, options) for island_ppci in island_ppcis]
+    if parallel == "process":
+        executor = ProcessPoolExecutor
+    elif parallel is True or parallel == "thread":
+        executor = ThreadPoolExecutor
+    else:
+        raise ValueError("parallel_islands must be True, 'thread' or 'process', not %s" % parallel)
+    with executor(max_workers=n_jobs) as pool:
+        return list(pool.map(_solve_island, island_ppcis, [options] * len(island_ppcis)))
+
+
+def _solve_island(island_ppci, options):
+    if island_ppci["branch"].shape[0] == 0:
+        from pandapower.powerflow import _pf_without_branches
+        result = _pf_without_branches(island_ppci, options)
+        # store the internal variables as in the Newton-Raphson power flow
+        V = result["bus"][:, VM] * np.exp(1j * np.deg2rad(result["bus"][:, VA]))
+        ref, pv, pq = bustypes(result["bus"], result["gen"])
+        result["internal"].update({"bus": result["bus"], "gen": result["gen"],
+                                   "branch": result["branch"], "V": V, "ref": ref, "pv": pv,
+                                   "pq": pq})
+        return result
+    return _run_newton_raphson_pf(island_ppci, options)
+
+
+def _merge_island_results(ppci, results, bus_islands, branch_islands, gen_islands):
+    n_bus, n_branch = ppci["bus"].shape[0], ppci["branch"].shape[0]
+    internals = [result["internal"] for result in results]
+
+    bus = _scatter_rows([i["bus"] for i in internals], bus_islands, n_bus)
+    bus[:, BUS_I] = ppci["bus"][:, BUS_I]
+    branch = _scatter_rows([i["branch"] for i in internals], branch_islands, n_branch)
+    branch[:, [F_BUS, T_BUS]] = ppci["branch"][:, [F_BUS, T_BUS]]
+    gen = _scatter_rows([i["gen"] for i in internals], gen_islands, ppci["gen"].shape[0])
+    gen[:, GEN_BUS] = ppci["gen"][:, GEN_BUS]
+
+    V = np.zeros(n_bus, dtype=complex)
+    Sbus = np.zeros(n_bus, dtype=complex)
+    for internal, buses in zip(internals, bus_islands):
+        V[buses] = internal["V"]
+        if "Sbus" in internal:
+            Sbus[buses] = internal["Sbus"]
+    ref, pv, pq = [np.sort(np.concatenate([buses[internal[key]] for internal, buses in
+                                           zip(internals, bus_islands)])).astype(int)
+                   for key in ["ref", "pv", "pq"]]
+
+    internal = ppci["internal"]
+    internal.update({"bus": bus, "gen": gen, "branch": branch, "baseMVA": ppci["baseMVA"],
+                     "V": V, "Sbus": Sbus, "ref": ref, "pv": pv, "pq": pq})
+    internal["Ybus"] = _scatter_matrix(internals, "Ybus", bus_islands, bus_islands,
+                                       (n_bus, n_bus))
+    internal["Yf"] = _scatter_matrix(internals, "Yf", branch_islands, bus_islands,
+                                     (n_branch, n_bus))
+    internal["Yt"] = _scatter_matrix(internals, "Yt", branch_islands, bus_islands,
+                                     (n_branch, n_bus))
+    internal["J"] = _scatter_jacobian(internals, bus_islands, n_bus, pv, pq)
+    internal["Vm_it"], internal["Va_it"] = [_scatter_iterations(internals, key, bus_islands, n_bus)
+                                            for key in ["Vm_it", "Va_it"]]
+
+
+def _scatter_rows(arrays, rows, n_rows):
+    merged = np.empty((n_rows, arrays[0].shape[1]), dtype=arrays[0].dtype)
+    for array, r in zip(arrays, rows):
+        merged[r] = array
+    return merged
+
+
+def _scatter_matrix(internals, key, rows, cols, shape):
+    data, row_ind, col_ind = [], [], []
+    for internal, r, c in zip(internals, rows, cols):
+        if internal.get(key, None) is None:
+            continue
+        m = coo_matrix(internal[key])
+        data.append(m.data)
+        row_ind.append(r[m.row])
+        col_ind.append(c[m.col])
+    if not len(data):
+        return csr_matrix(shape, dtype=complex)
+    return csr_matrix((np.concatenate(data), (np.concatenate(row_ind), np.concatenate(col_ind))),
+                      shape=shape)
+
+
+def _scatter_jacobian(internals, bus_islands, n_bus, pv, pq):
+    # position of the variables in the jacobian of the whole grid: [Va(pv), Va(pq), Vm(pq)]
+    va_pos = np.full(n_bus, -1)
+    va_pos[np.r_[pv, pq]] = np.arange(len(pv) + len(pq))
+    vm_pos = np.full(n_bus, -1)
+    vm_pos[pq] = len(pv) + len(pq) + np.arange(len(pq))
+    positions = []
+    for internal, buses in zip(internals, bus_islands):
+        if internal.get("J", None) is None:
+            positions.append(np.array([], dtype=int))
+            continue
+        island_pv, island_pq = buses[internal["pv"]], buses[internal["pq"]]
+        positions.append(np.r_[va_pos[island_pv], va_pos[island_pq], vm_pos[island_pq]])
+    n = len(pv) + 2 * len(pq)
+    return _scatter_matrix(internals, "J", positions, positions, (n, n))
+
+
+def _scatter_iterations(internals, key, bus_islands, n_bus):
+    if any(internal.get(key, None) is None for internal in internals):
+        return None
+    values = [internal[key].reshape(len(buses), -1)
+              for internal, buses in zip(internals, bus_islands)]
+    # islands which converged earlier keep their final voltage in the following iterations
+    n_it = max(v.shape[1] for v in values)
+    merged = np.empty((n_bus, n_it))
+    for v, buses in zip(values, bus_islands):
+        merged[buses] = np.hstack([v, np.repeat(v[:, -1:], n_it - v.shape[1], axis=1)])
+    return merged
@@ -6,7 +6,8 @@
 
 from time import time
 
-from numpy import flatnonzero as find, r_, zeros, argmax, setdiff1d, any
+from numpy import flatnonzero as find, r_, zeros, argmax, setdiff1d, any, bincount, sort, where, \
+    ones
 
 from pandapower.pf.ppci_variables import _get_pf_variables_from_ppci, _store_results_from_pf_in_ppci
 from pandapower.pf.run_dc_pf import _run_dc_pf
@@ -45,8 +46,15 @@ def _run_newton_raphson_pf(ppci, options):
     t0 = time()
     if isinstance(options["init_va_degree"], str) and options["init_va_degree"] == "dc":
         ppci = _run_dc_pf(ppci)
-    if options["enforce_q_lims"]:
+    if options["enforce_q_lims"] == 2 or \
+            (options["enforce_q_lims"] and options["voltage_depend_loads"]):
+        # only the largest violation is fixed in each power flow of the outer loop (with
+        # enforce_q_lims=2). With voltage dependent loads, the reactive power of the generators is
+        # calculated with the nominal load (pfsoln) and therefore checked in the outer loop as well
         ppci, success, iterations, bus, gen, branch = _run_ac_pf_with_qlims_enforced(ppci, options)
+    elif options["enforce_q_lims"]:
+        ppci, success, iterations, bus, gen, branch = _run_ac_pf_with_qlims_in_newton(ppci,
+                                                                                      options)
     else:
         ppci, success, iterations = _run_ac_pf_without_qlims_enforced(ppci, options)
         # update data matrices with solution store in ppci
@@ -58,7 +66,7 @@ def _run_newton_raphson_pf(ppci, options):
 
 def ppci_to_pfsoln(ppci, options):
     internal = ppci["internal"]
-    if options["only_v_results"]:
+    if options["only_v_results"] or not options.get("calculate_flows", True):
         # time series relevant hack which ONLY saves V from ppci
         _update_v(internal["bus"], internal["V"])
         return internal["bus"], internal["gen"], internal["branch"]
@@ -138,7 +146,93 @@ def _run_ac_pf_without_qlims_enforced(ppci, options):
     return ppci, success, iterations
 
 
-def _run_ac_pf_with_qlims_enforced(ppci, options):
+def _run_ac_pf_with_qlims_in_newton(ppci, options):
+    """
+    enforces the reactive power limits of the generators within the newton iterations: pv buses
+    are switched to pq buses at their limits (and back), so that the admittance matrix, Sbus and the
+    power flow results are only calculated once. If the newton iterations do not converge, the q
+    limits are enforced by the outer loop (_run_ac_pf_with_qlims_enforced), which runs a complete
+    power flow with max_iteration iterations for every round of limit violations.
+
+    In contrast to the outer loop, buses are switched back to pv buses if their voltage passes the
+    setpoint. The results can therefore differ from the outer loop where it keeps a generator at
+    its limit although the voltage is beyond the setpoint (e.g. up to 1e-4 p.u. on case9241pegase).
+    """
+    makeYbus, pfsoln = _get_numba_functions(ppci, options)
+
+    baseMVA, bus, gen, branch, ref, pv, pq, _, _, V0, ref_gens = _get_pf_variables_from_ppci(ppci)
+
+    ppci, Ybus, Yf, Yt = _get_Y_bus(ppci, options, makeYbus, baseMVA, bus, branch)
+
+    # compute complex bus power injections [generation - load]
+    Sbus = _get_Sbus(ppci, options["recycle"])
+
+    q_lims = _get_q_lims(baseMVA, bus, gen)
+    V, success, iterations, J, Vm_it, Va_it = newtonpf(Ybus, Sbus, V0, pv, pq, ppci, options,
+                                                       q_lims=q_lims)
+    if not success:
+        return _run_ac_pf_with_qlims_enforced(ppci, options)
+    # buses at their limits are pq buses in the solution
+    at_lim = q_lims["at_lim"][pv] != 0
+    pq = sort(r_[pq, pv[at_lim]])
+    pv = pv[~at_lim]
+
+    # keep "internal" variables in  memory / net["_ppc"]["internal"] -> needed for recycle.
+    ppci = _store_internal(ppci, {"J": J, "Vm_it": Vm_it, "Va_it": Va_it, "bus": bus, "gen": gen, "branch": branch,
+                                  "baseMVA": baseMVA, "V": V, "pv": pv, "pq": pq, "ref": ref, "Sbus": Sbus,
+                                  "ref_gens": ref_gens, "Ybus": Ybus, "Yf": Yf, "Yt": Yt})
+
+    bus, gen, branch = ppci_to_pfsoln(ppci, options)
+    if not options["only_v_results"] and options.get("calculate_flows", True):
+        _limit_q_at_ref_buses(gen, ref, ref_gens)
+    return ppci, success, iterations, bus, gen, branch
+
+
+def _get_q_lims(baseMVA, bus, gen):
+    """
+    returns the reactive power limits of the generators summed up for each bus, relative to the
+    reactive power of the generators in Sbus (p.u.)
+    """
+    nb = bus.shape[0]
+    on = find(gen[:, GEN_STATUS] > 0)
+    gbus = gen[on, GEN_BUS].astype(int)
+    return {"dq_max": bincount(gbus, gen[on, QMAX] - gen[on, QG], nb) / baseMVA,
+            "dq_min": bincount(gbus, gen[on, QMIN] - gen[on, QG], nb) / baseMVA,
+            "at_lim": zeros(nb, dtype=int)}
+
+
+def _limit_q_at_ref_buses(gen, ref, ref_gens):
+    """
+    limits the reactive power of the generators at the reference buses (except the reference
+    generators), the rest of the reactive power is provided by the reference generators of the bus
+    in proportion to their reactive power range
+    """
+    on = gen[:, GEN_STATUS] > 0
+    gbus = gen[:, GEN_BUS].astype(int)
+    is_ref_gen = zeros(gen.shape[0], dtype=bool)
+    is_ref_gen[ref_gens] = True
+    for b in ref:
+        at_bus = on & (gbus == b)
+        gens = find(at_bus & ~is_ref_gen)
+        if not len(gens):
+            continue
+        qg = gen[gens, QG]
+        qg_lim = where(qg > gen[gens, QMAX], gen[gens, QMAX],
+                       where(qg < gen[gens, QMIN], gen[gens, QMIN], qg))
+        dq = (qg - qg_lim).sum()
+        if dq == 0:
+            continue
+        gen[gens, QG] = qg_lim
+        refs = find(at_bus & is_ref_gen)
+        q_range = gen[refs, QMAX] - gen[refs, QMIN]
+        share = q_range / q_range.sum() if q_range.sum() > 0 else ones(len(refs)) / len(refs)
+        gen[refs, QG] += dq * share
+
+
+def _run_ac_pf_with_qlims_enforced(ppci, options, run_pf=None):
+    # run_pf is the power flow without q limits, e.g. the fast-decoupled power flow
+    if run_pf is None:
+        run_pf = _run_ac_pf_without_qlims_enforced
     baseMVA, bus, gen, branch, ref, pv, pq, on, _, V0, ref_gens = _get_pf_variables_from_ppci(ppci)
 
     qlim = options["enforce_q_lims"]
@@ -146,7 +240,7 @@ def _run_ac_pf_with_qlims_enforced(ppci, options):
     fixedQg = zeros(gen.shape[0])  # Qg of gens at Q limits
 
     while True:
-        ppci, success, iterations = _run_ac_pf_without_qlims_enforced(ppci, options)
+        ppci, success, iterations = run_pf(ppci, options)
         bus, gen, branch = ppci_to_pfsoln(ppci, options)
 
         # find gens with violated Q constraints
@@ -162,7 +256,7 @@ def _run_ac_pf_with_qlims_enforced(ppci, options):
             if qlim == 2:  # fix largest violation, ignore the rest
                 k = argmax(r_[gen[mx, QG] - gen[mx, QMAX],
                               gen[mn, QMIN] - gen[mn, QG]])
-                if k > len(mx):
+                if k >= len(mx):
                     mn = mn[k - len(mx)]
                     mx = []
                 else:
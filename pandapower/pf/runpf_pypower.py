@@ -99,7 +99,7 @@ def _import_numba_extensions_if_flag_is_true(numba):
     ## check if numba is available and the corresponding flag
     if numba:
         try:
-            from numba._version import version_version as nb_version
+            from numba import __version__ as nb_version
             # get numba Version (in order to use it it must be > 0.25)
             if version.parse(nb_version) < version.parse("0.25"):
                 logger.warning('Warning: Numba version too old -> Upgrade to a version > 0.25. Numba is disabled\n')
@@ -15,13 +15,13 @@ from pandapower.pypower.idx_gen import PG, QG
 from pandapower.pd2ppc import _pd2ppc
 from pandapower.pypower.makeYbus import makeYbus
 from pandapower.pypower.idx_bus import GS, BS, PD , QD
-from pandapower.auxiliary import _sum_by_group, _check_if_numba_is_installed,\
+from pandapower.auxiliary import _check_if_numba_is_installed,\
     _check_bus_index_and_print_warning_if_high,\
     _check_gen_index_and_print_warning_if_high, \
     _add_pf_options, _add_ppc_options, _clean_up, sequence_to_phase, \
     phase_to_sequence, X012_to_X0, X012_to_X2, \
     I1_from_V012, S_from_VI_elementwise, V1_from_ppc, V_from_I,\
-    combine_X012, I0_from_V012, I2_from_V012, ppException
+    combine_X012, I0_from_V012, I2_from_V012, ppException, factorize_Y
 from pandapower.pf.run_newton_raphson_pf import _run_newton_raphson_pf
 from pandapower.build_bus import _add_ext_grid_sc_impedance
 from pandapower.pypower.bustypes import bustypes
@@ -70,86 +70,56 @@ def _store_results_from_pf_in_ppci(ppci, bus, gen, branch):
     return ppci
 
 
-def _get_elements(params,net,element,phase,typ):
-    sign = -1 if element.endswith("sgen") else 1
-    elm = net[element].values
-#   # Trying to find the column no for using numpy filters for active loads
-    scaling = net[element].columns.get_loc("scaling")
-    typ_col = net[element].columns.get_loc("type") # Type = Delta or Wye load
-    # active wye or active delta row selection
-    active = (net["_is_elements"][element]) & (elm[:,typ_col] == typ)
-    bus = [net[element].columns.get_loc("bus")]
-    if len(elm):
-        if element == 'load' or element == 'sgen':
-            vl = elm[active,scaling].ravel()
-            p_mw = [net[element].columns.get_loc("p_mw")]
-            q_mvar = [net[element].columns.get_loc("q_mvar")]
-            params['p'+phase+typ] = np.hstack([params['p'+phase+typ],
-                                               elm[active,p_mw]/3 * vl * sign])
-            params['q'+phase+typ] = np.hstack([params['q'+phase+typ],
-                                               (elm[active,q_mvar]/3) * vl * sign])
-            params['b'+typ] = np.hstack([params['b'+typ],
-                                         elm[active,bus].astype(int)])
-
-        elif element.startswith('asymmetric'):
-            vl = elm[active,scaling].ravel()
-            p = {'a': net[element].columns.get_loc("p_a_mw")
-         ,'b': net[element].columns.get_loc("p_b_mw")
-         ,'c': net[element].columns.get_loc("p_c_mw")
-            }
-            q = {'a' : net[element].columns.get_loc("q_a_mvar")
-         ,'b' : net[element].columns.get_loc("q_b_mvar")
-         ,'c' : net[element].columns.get_loc("q_c_mvar")
-            }
-
-            params['p'+phase+typ] = np.hstack([params['p'+phase+typ],
-                                             elm[active,p[phase]] * vl * sign])
-            params['q'+phase+typ] = np.hstack([params['q'+phase+typ],
-                                             elm[active,q[phase]] * vl * sign])
-            params['b'+typ] = np.hstack([params['b'+typ],
-                                         elm[active,bus].astype(int)])
-    return params
-
-
-def _load_mapping(net, ppci1):
+def _get_load_mapping(net):
+    """
+    Selects the active wye and delta loads / sgens once: returns a list with the element, the
+    load type, the positions of the active elements in the element table and their ppc buses.
+    The mapping only changes with the in service elements and the topology, so it can be reused
+    by _load_mapping if only the P, Q values of the elements change.
+    """
+    bus_lookup = net["_pd2ppc_lookups"]["bus"]
+    load_mapping = []
+    for element in ['load', 'asymmetric_load', 'sgen', 'asymmetric_sgen']:
+        if not len(net[element]):
+            continue
+        active = net["_is_elements"][element]
+        typ = net[element]["type"].values
+        for load_type in ['wye', 'delta']:
+            rows = np.flatnonzero(active & (typ == load_type))
+            if len(rows):
+                buses = bus_lookup[net[element]["bus"].values[rows].astype(int)]
+                load_mapping.append((element, load_type, rows, buses))
+    return load_mapping
+
+
+def _load_mapping(net, ppci1, load_mapping=None):
     """
     Takes three phase P, Q values from PQ elements
     sums them up for each bus
     maps them in ppc bus order and forms s_abc matrix
     """
-    bus_lookup = net["_pd2ppc_lookups"]["bus"]
-    params = dict()
-    phases = ['a', 'b', 'c']
-    load_types = ['wye', 'delta']
-    load_elements = ['load', 'asymmetric_load', 'sgen', 'asymmetric_sgen']
-# =============================================================================
-#        Loop to initialize and feed s_abc wye and delta values
-# =============================================================================
-    for phase in phases:
-        for typ in load_types:
-            params['S'+phase+typ] = (ppci1["bus"][:, PD] +
-                                     ppci1["bus"][:, QD]*1j)*0
-            params['p'+phase+typ] = np.array([])  # p values from loads/sgens
-            params['q'+phase+typ] = np.array([])  # q values from loads/sgens
-            params['P'+phase+typ] = np.array([])  # Aggregated Active Power
-            params['Q'+phase+typ] = np.array([])  # Aggregated reactive Power
-            params['b'+phase+typ] = np.array([], dtype=int)  # bus map for phases
-            params['b'+typ] = np.array([], dtype=int)  # aggregated bus map(s_abc)
-            for element in load_elements:
-                _get_elements(params,net,element,phase,typ)
-            # Mapping constant power loads to buses
-            if params['b'+typ].size:
-                params['b'+phase+typ] = bus_lookup[params['b'+typ]]
-                params['b'+phase+typ], params['P'+phase+typ],\
-                    params['Q'+phase+typ] = _sum_by_group(params['b'+phase+typ],
-                                                          params['p'+phase+typ],
-                                                          params['q'+phase+typ] * 1j)
-                params['S'+phase+typ][params['b'+phase+typ]] = \
-                    (params['P'+phase+typ] + params['Q'+phase+typ])
-    Sabc_del = np.vstack((params['Sadelta'],params['Sbdelta'],params['Scdelta']))
-    Sabc_wye = np.vstack((params['Sawye'],params['Sbwye'],params['Scwye']))
+    if load_mapping is None:
+        load_mapping = _get_load_mapping(net)
+    nb = ppci1["bus"].shape[0]
+    s_abc = {'wye': np.zeros((3, nb), dtype=np.complex128),
+             'delta': np.zeros((3, nb), dtype=np.complex128)}
+    for element, load_type, rows, buses in load_mapping:
+        table = net[element]
+        sign = -1 if element.endswith("sgen") else 1
+        scaling = table["scaling"].values[rows] * sign
+        if element.startswith('asymmetric'):
+            p = table[["p_a_mw", "p_b_mw", "p_c_mw"]].values[rows].T
+            q = table[["q_a_mvar", "q_b_mvar", "q_c_mvar"]].values[rows].T
+        else:
+            p = np.tile(table["p_mw"].values[rows] / 3, (3, 1))
+            q = np.tile(table["q_mvar"].values[rows] / 3, (3, 1))
+        s_element = (p + 1j * q) * scaling
+        for phase in range(3):
+            # sums up the power of all elements at the same bus
+            s_abc[load_type][phase] += np.bincount(buses, s_element[phase].real, nb) + \
+                1j * np.bincount(buses, s_element[phase].imag, nb)
     # last return varaible left for constant impedance loads
-    return Sabc_del, Sabc_wye
+    return s_abc['delta'], s_abc['wye']
 
 
 # =============================================================================
@@ -340,16 +310,19 @@ def runpp_3ph(net, calculate_voltage_angles=True, init="auto",
 
         **recycle** (dict, none)
 
-        (Not tested with 3 Phase load flow) - Reuse of internal powerflow variables for
-        time series calculation
+        - Reuse of internal powerflow variables for time series calculation
+
+            Contains a dict with the following parameters (same as for runpp):
+            bus_pq: The P, Q values of the loads and sgens are always mapped
+            to the buses again
+            trafo: If True the sequence networks are built again
+            gen: If True the sequence networks are built again
 
-            Contains a dict with the following parameters:
-            _is_elements: If True in service elements are not filtered again
-            and are taken from the last result in net["_is_elements"]
-            ppc: If True the ppc is taken from net["_ppc"] and gets updated
-            instead of reconstructed entirely
-            Ybus: If True the admittance matrix (Ybus, Yf, Yt) is taken from
-            ppc["internal"] and not reconstructed
+            If neither trafo nor gen is True, the sequence networks, the
+            factorized admittance matrices, the mapping of loads to buses and
+            the voltages of the last power flow are taken from
+            net["_ppc0/1/2"]["internal"]. In service elements and topology
+            must not change between the power flows.
 
         **neglect_open_switch_branches** (bool, False)
 
@@ -411,8 +384,11 @@ def runpp_3ph(net, calculate_voltage_angles=True, init="auto",
 
     neglect_open_switch_branches = kwargs.get("neglect_open_switch_branches", False)
     only_v_results = kwargs.get("only_v_results", False)
-    if (recycle is not None and recycle is not False):
-        raise ValueError("recycle is only available with Balanced Load Flow ")
+    if isinstance(recycle, dict):
+        # the positive sequence loads change in every iteration, so Sbus is always calculated again
+        recycle = dict(recycle, bus_pq=True)
+    else:
+        recycle = None
     net._options = {}
     _add_ppc_options(net, calculate_voltage_angles=calculate_voltage_angles,
                      trafo_model=trafo_model, check_connectivity=check_connectivity,
@@ -433,13 +409,20 @@ def runpp_3ph(net, calculate_voltage_angles=True, init="auto",
     # =========================================================================
     # pd2ppc conversion
     # =========================================================================
-    net["_is_elements"] = None
-    _, ppci1 = _pd2ppc(net, 1)
+    recycled = _recycle_possible(net, recycle)
+    if recycled:
+        # the sequence networks, admittance matrices and the load mapping of the last power flow
+        # are reused, only the P, Q values of the loads are mapped again
+        ppci0, ppci1, ppci2 = [_ppci_from_internal(net["_ppc%i" % sequence])
+                               for sequence in range(3)]
+    else:
+        net["_is_elements"] = None
+        _, ppci1 = _pd2ppc(net, 1)
 
-    _, ppci2 = _pd2ppc(net, 2)
-    gs_eg, bs_eg = _add_ext_grid_sc_impedance(net, ppci2)
+        _, ppci2 = _pd2ppc(net, 2)
+        gs_eg, bs_eg = _add_ext_grid_sc_impedance(net, ppci2)
 
-    _, ppci0 = _pd2ppc(net, 0)
+        _, ppci0 = _pd2ppc(net, 0)
 
     _,       bus0, gen0, branch0,      _,      _,      _, _, _,\
         v00, ref_gens = _get_pf_variables_from_ppci(ppci0)
@@ -452,24 +435,29 @@ def runpp_3ph(net, calculate_voltage_angles=True, init="auto",
 #     P Q values aggragated and summed up for each bus to make s_abc matrix
 #     s_abc for wye connections ; s_abc_delta for delta connection
 # =============================================================================
-    s_abc_delta, s_abc = _load_mapping(net, ppci1)
+    load_mapping = ppci1["internal"]["load_mapping"] if recycled else _get_load_mapping(net)
+    s_abc_delta, s_abc = _load_mapping(net, ppci1, load_mapping)
     # =========================================================================
     # Construct Sequence Frame Bus admittance matrices Ybus
     # =========================================================================
 
-    ppci0, ppci1, ppci2, y_0_pu, y_1_pu, y_2_pu, y_0_f, y_1_f, y_2_f,\
-        y_0_t, y_1_t, y_2_t = _get_y_bus(ppci0, ppci1, ppci2, recycle)
+    y_0_lu, y_1_pu, y_2_lu, y_1_f, y_1_t, y_2_pu, y_2_f, y_2_t = \
+        _get_y_bus(ppci0, ppci1, ppci2, recycled)
     # =========================================================================
     # Initial voltage values
     # =========================================================================
     nb = ppci1["bus"].shape[0]
-    v_012_it = np.concatenate(
-        (
-            np.array(np.zeros((1, nb), dtype=np.complex128)),
-            np.array(np.ones((1, nb), dtype=np.complex128)),
-            np.array(np.zeros((1, nb), dtype=np.complex128))
-        ),
-        axis=0)
+    if recycled:
+        # the voltages of the last power flow are a good start for the next time step
+        v_012_it = ppci1["internal"]["V012"].copy()
+    else:
+        v_012_it = np.concatenate(
+            (
+                np.array(np.zeros((1, nb), dtype=np.complex128)),
+                np.array(np.ones((1, nb), dtype=np.complex128)),
+                np.array(np.zeros((1, nb), dtype=np.complex128))
+            ),
+            axis=0)
     # For Delta transformation:
     # Voltage changed from line-earth to line-line using V_T
     # s_abc/v_abc will now give line-line currents. This is converted to line-earth
@@ -524,8 +512,8 @@ def runpp_3ph(net, calculate_voltage_angles=True, init="auto",
         # =============================================================================
         # Conduct Negative and Zero sequence power flow
         # =============================================================================
-        v0_pu_it = V_from_I(y_0_pu, i0_pu_it)
-        v2_pu_it = V_from_I(y_2_pu, i2_pu_it)
+        v0_pu_it = V_from_I(y_0_lu, i0_pu_it)
+        v2_pu_it = V_from_I(y_2_lu, i2_pu_it)
         # =============================================================================
         #    Evaluate Positive Sequence Power Mismatch
         # =============================================================================
@@ -547,10 +535,15 @@ def runpp_3ph(net, calculate_voltage_angles=True, init="auto",
     # TODO: Add reference to paper to explain the following steps
     # This is required since the ext_grid power results are not correct if its
     # not done
-    ref, pv, pq = bustypes(ppci0["bus"], ppci0["gen"])
-    ppci0["bus"][ref, GS] -= gs_eg
-    ppci0["bus"][ref, BS] -= bs_eg
-    y_0_pu, y_0_f, y_0_t = makeYbus(ppci0["baseMVA"], ppci0["bus"], ppci0["branch"])
+    if recycled:
+        # the stored ppci0 and its admittance matrix are already without the ext_grid impedance
+        y_0_pu, y_0_f, y_0_t = ppci0["internal"]["Ybus"], ppci0["internal"]["Yf"], \
+            ppci0["internal"]["Yt"]
+    else:
+        ref, pv, pq = bustypes(ppci0["bus"], ppci0["gen"])
+        ppci0["bus"][ref, GS] -= gs_eg
+        ppci0["bus"][ref, BS] -= bs_eg
+        y_0_pu, y_0_f, y_0_t = makeYbus(ppci0["baseMVA"], ppci0["bus"], ppci0["branch"])
     # Bus, Branch, and Gen  power values
     bus0, gen0, branch0 = pfsoln(base_mva, bus0, gen0, branch0, y_0_pu, y_0_f, y_0_t, v_012_it[0, :].flatten(),
                                  sl_bus, ref_gens)
@@ -570,6 +563,15 @@ def runpp_3ph(net, calculate_voltage_angles=True, init="auto",
     ppci0["internal"]["Yt"] = y_0_t
     ppci1["internal"]["Yt"] = y_1_t
     ppci2["internal"]["Yt"] = y_2_t
+    # keep the variables which are needed to recycle the sequence networks in
+    # net["_ppc0/1/2"]["internal"]
+    for ppci in [ppci0, ppci1, ppci2]:
+        ppci["internal"].update({"bus": ppci["bus"], "gen": ppci["gen"], "branch": ppci["branch"],
+                                 "baseMVA": ppci["baseMVA"]})
+    ppci0["internal"]["Ybus_lu"] = y_0_lu
+    ppci2["internal"]["Ybus_lu"] = y_2_lu
+    ppci1["internal"]["load_mapping"] = load_mapping
+    ppci1["internal"]["V012"] = v_012_it
     i_012_res = _current_from_voltage_results(y_0_pu, y_1_pu, v_012_it)
     s_012_res = S_from_VI_elementwise(v_012_it, i_012_res) * ppci1["baseMVA"]
     eg_is_mask = net["_is_elements"]['ext_grid']
@@ -615,20 +617,46 @@ def _current_from_voltage_results(y_0_pu, y_1_pu, v_012_pu):
                             I2_from_V012(v_012_pu, y_1_pu))
     return I012_pu
 
-def _get_y_bus(ppci0, ppci1, ppci2, recycle):
-    if recycle is not None and recycle["Ybus"] and ppci0["internal"]["Ybus"].size and \
-            ppci1["internal"]["Ybus"].size and ppci2["internal"]["Ybus"].size:
-        y_0_bus, y_0_f, y_0_t = ppci0["internal"]['Ybus'], ppci0["internal"]['Yf'], ppci0["internal"]['Yt']
+
+def _get_y_bus(ppci0, ppci1, ppci2, recycled):
+    """
+    Returns the factorized zero and negative sequence admittance matrices, which do not change
+    during the iteration, and the admittance matrices of the positive and negative sequence
+    networks. If recycled, the matrices of the last power flow are used.
+    """
+    if recycled:
+        y_0_lu, y_2_lu = ppci0["internal"]["Ybus_lu"], ppci2["internal"]["Ybus_lu"]
         y_1_bus, y_1_f, y_1_t = ppci1["internal"]['Ybus'], ppci1["internal"]['Yf'], ppci1["internal"]['Yt']
         y_2_bus, y_2_f, y_2_t = ppci2["internal"]['Ybus'], ppci2["internal"]['Yf'], ppci2["internal"]['Yt']
     else:
         # build admittance matrices
-        y_0_bus, y_0_f, y_0_t = makeYbus(ppci0["baseMVA"], ppci0["bus"], ppci0["branch"])
+        y_0_bus, _, _ = makeYbus(ppci0["baseMVA"], ppci0["bus"], ppci0["branch"])
         y_1_bus, y_1_f, y_1_t = makeYbus(ppci1["baseMVA"], ppci1["bus"], ppci1["branch"])
         y_2_bus, y_2_f, y_2_t = makeYbus(ppci2["baseMVA"], ppci2["bus"], ppci2["branch"])
-        if recycle is not None and recycle["Ybus"]:
-            ppci0["internal"]['Ybus'], ppci0["internal"]['Yf'], ppci0["internal"]['Yt'] = y_0_bus, y_0_f, y_0_t
-            ppci1["internal"]['Ybus'], ppci1["internal"]['Yf'], ppci1["internal"]['Yt'] = y_1_bus, y_1_f, y_1_t
-            ppci2["internal"]['Ybus'], ppci2["internal"]['Yf'], ppci2["internal"]['Yt'] = y_2_bus, y_2_f, y_2_t
+        y_0_lu, y_2_lu = factorize_Y(y_0_bus), factorize_Y(y_2_bus)
 
-    return ppci0, ppci1, ppci2, y_0_bus, y_1_bus, y_2_bus, y_0_f, y_1_f, y_2_f, y_0_t, y_1_t, y_2_t
+    return y_0_lu, y_1_bus, y_2_lu, y_1_f, y_1_t, y_2_bus, y_2_f, y_2_t
+
+
+def _recycle_possible(net, recycle):
+    """
+    Checks if the sequence networks of the last power flow can be recycled. They are built again
+    if the trafos or gens are changed (see the recycle dict of the controllers) or if internal
+    variables are missing.
+    """
+    if not isinstance(recycle, dict) or recycle.get("trafo", False) or recycle.get("gen", False):
+        return False
+    for sequence, variables in [(0, ["Ybus_lu"]), (1, ["load_mapping", "V012"]),
+                                (2, ["Ybus_lu"])]:
+        ppc = net.get("_ppc%i" % sequence, None)
+        variables = variables + ["bus", "gen", "branch", "baseMVA", "Ybus", "Yf", "Yt", "ref_gens"]
+        if ppc is None or "internal" not in ppc or \
+                any(var not in ppc["internal"] for var in variables):
+            return False
+    return True
+
+
+def _ppci_from_internal(ppc):
+    internal = ppc["internal"]
+    return {"bus": internal["bus"], "gen": internal["gen"], "branch": internal["branch"],
+            "baseMVA": internal["baseMVA"], "internal": internal}
@@ -5,13 +5,16 @@
 
 from numpy import nan_to_num, array
 
-from pandapower.auxiliary import ppException, _clean_up, _add_auxiliary_elements
+from pandapower.auxiliary import ppException, _clean_up, _add_auxiliary_elements, \
+    _check_results_option
 from pandapower.build_branch import _calc_trafo_parameter, _calc_trafo3w_parameter
 from pandapower.build_gen import _build_gen_ppc
 from pandapower.pd2ppc import _pd2ppc, _calc_pq_elements_and_add_on_ppc, _ppc2ppci
 from pandapower.pf.ppci_variables import _get_pf_variables_from_ppci
 from pandapower.pf.run_bfswpf import _run_bfswpf
 from pandapower.pf.run_dc_pf import _run_dc_pf
+from pandapower.pf.run_fdpf import _run_fdpf
+from pandapower.pf.run_island_pf import _run_island_pf
 from pandapower.pf.run_newton_raphson_pf import _run_newton_raphson_pf
 from pandapower.pf.runpf_pypower import _runpf_pypower
 from pandapower.pypower.idx_bus import VM
@@ -70,6 +73,17 @@ def _powerflow(net, **kwargs):
     if not "VERBOSE" in kwargs:
         kwargs["VERBOSE"] = 0
 
+    if algorithm == "bfsw":
+        # the bus ordering of the backward/forward sweep is reused while the topology is unchanged
+        if net.get("_bfsw_cache", None) is None:
+            net["_bfsw_cache"] = dict()
+        kwargs["bfsw_cache"] = net["_bfsw_cache"]
+    elif algorithm in ["fdbx", "fdxb"]:
+        # the factorizations of B' and B'' are reused while the branch parameters are unchanged
+        if net.get("_fdpf_cache", None) is None:
+            net["_fdpf_cache"] = dict()
+        kwargs["fdpf_cache"] = net["_fdpf_cache"]
+
     # ----- run the powerflow -----
     result = _run_pf_algorithm(ppci, net["_options"], **kwargs)
     # read the results (=ppci with results) to net
@@ -79,6 +93,8 @@ def _powerflow(net, **kwargs):
 def _recycled_powerflow(net, **kwargs):
     options = net["_options"]
     options["recycle"] = kwargs.get("recycle", None)
+    options["results"], options["calculate_flows"] = _check_results_option(
+        net, kwargs.get("results", None), options["enforce_q_lims"])
     options["init_vm_pu"] = "results"
     options["init_va_degree"] = "results"
     algorithm = options["algorithm"]
@@ -94,8 +110,9 @@ def _recycled_powerflow(net, **kwargs):
         result = _run_dc_pf(ppci)
         _ppci_to_net(result, net)
         return
-    if not algorithm in ['nr', 'iwamoto_nr'] and ac:
-        raise ValueError("recycle is only available with Newton-Raphson power flow. Choose algorithm='nr'")
+    if not algorithm in ['nr', 'iwamoto_nr', 'fdbx', 'fdxb'] and ac:
+        raise ValueError("recycle is only available with Newton-Raphson and fast-decoupled power flow. "
+                         "Choose algorithm='nr'")
 
     recycle = options["recycle"]
     ppc = net["_ppc"]
@@ -124,8 +141,14 @@ def _recycled_powerflow(net, **kwargs):
     ppci["internal"] = net["_ppc"]["internal"]
     net["_ppc"] = ppc
 
-    # run the Newton-Raphson power flow
-    result = _run_newton_raphson_pf(ppci, options)
+    if algorithm in ['fdbx', 'fdxb']:
+        # run the fast-decoupled power flow
+        if net.get("_fdpf_cache", None) is None:
+            net["_fdpf_cache"] = dict()
+        result = _run_fdpf(ppci, options, fdpf_cache=net["_fdpf_cache"])
+    else:
+        # run the Newton-Raphson power flow
+        result = _run_newton_raphson_pf(ppci, options)
     ppc["success"] = ppci["success"]
     ppc["iterations"] = ppci["iterations"]
     ppc["et"] = ppci["et"]
@@ -147,9 +170,13 @@ def _run_pf_algorithm(ppci, options, **kwargs):
             result = _pf_without_branches(ppci, options)
         elif algorithm == 'bfsw':  # forward/backward sweep power flow algorithm
             result = _run_bfswpf(ppci, options, **kwargs)[0]
+        elif algorithm in ['nr', 'iwamoto_nr'] and options.get("parallel_islands", False):
+            result = _run_island_pf(ppci, options)
         elif algorithm in ['nr', 'iwamoto_nr']:
             result = _run_newton_raphson_pf(ppci, options)
-        elif algorithm in ['fdbx', 'fdxb', 'gs']:  # algorithms existing within pypower
+        elif algorithm in ['fdbx', 'fdxb']:  # fast-decoupled power flow
+            result = _run_fdpf(ppci, options, **kwargs)
+        elif algorithm == 'gs':  # algorithm existing within pypower
             result = _runpf_pypower(ppci, options, **kwargs)[0]
         else:
             raise AlgorithmUnknown("Algorithm {0} is unknown!".format(algorithm))
@@ -172,6 +199,9 @@ def _ppci_to_net(result, net):
         _clean_up(net, res=False)
         algorithm = net["_options"]["algorithm"]
         max_iteration = net["_options"]["max_iteration"]
+        if result.get("internal", {}).get("diverged", False):
+            raise LoadflowNotConverged("Power Flow {0} diverged after {1} iterations!".format(
+                algorithm, result["iterations"]))
         raise LoadflowNotConverged("Power Flow {0} did not converge after "
                                    "{1} iterations!".format(algorithm, max_iteration))
     else:
@@ -32,6 +32,13 @@ def _get_Sload(bus, vm):
     return S_load
 
 
+def _get_zip_coefficients(baseMVA, bus):
+    # constant current and constant impedance parts of the power injected by loads in p.u. at a
+    # voltage of 1 p.u., so that Sbus(vm) = Sbus + Si * (vm - 1) + Sz * (vm ** 2 - 1)
+    S_load = (bus[:, PD] + 1j * bus[:, QD]) / baseMVA
+    return -S_load * bus[:, CID], -S_load * bus[:, CZD]
+
+
 def _get_Cg(gen_on, bus):
     gbus = gen_on[:, GEN_BUS]  ## what buses are they at?
 
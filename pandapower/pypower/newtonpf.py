@@ -11,15 +11,32 @@
 """Solves the power flow using a full Newton's method.
 """
 
-from numpy import angle, exp, linalg, conj, r_, Inf, arange, zeros, max, zeros_like, column_stack
+from time import time
+
+from numpy import angle, exp, linalg, conj, r_, Inf, arange, zeros, max, zeros_like, column_stack, \
+    array, isfinite, where
+from scipy.sparse import csr_matrix
 from scipy.sparse.linalg import spsolve
 
 from pandapower.pf.iwamoto_multiplier import _iwamoto_step
-from pandapower.pypower.makeSbus import makeSbus
+from pandapower.pypower.makeSbus import _get_zip_coefficients
 from pandapower.pf.create_jacobian import create_jacobian_matrix, get_fastest_jacobian_function
 
+# step control of the damped Newton-Raphson power flow (option "damping")
+LINE_SEARCH_MAX_HALVINGS = 10
+TRUST_REGION_RADIUS = 1.
+TRUST_REGION_MIN_RADIUS = 1e-4
+TRUST_REGION_MAX_RADIUS = 10.
+# divergence detection (option "abort_on_divergence"): the iterations are aborted if the mismatch
+# increases in DIVERGENCE_ITERATIONS consecutive iterations or if it exceeds DIVERGENCE_FACTOR
+# times the smallest mismatch so far
+DIVERGENCE_ITERATIONS = 3
+DIVERGENCE_FACTOR = 1e3
+# the reactive power limits of the pv buses are checked once the mismatch is below Q_LIM_TOL
+Q_LIM_TOL = 1e-1
+
 
-def newtonpf(Ybus, Sbus, V0, pv, pq, ppci, options):
+def newtonpf(Ybus, Sbus, V0, pv, pq, ppci, options, q_lims=None):
     """Solves the power flow using a full Newton's method.
     Solves for bus voltages given the full system admittance matrix (for
     all buses), the complex bus power injection vector (for all buses),
@@ -33,6 +50,12 @@ def newtonpf(Ybus, Sbus, V0, pv, pq, ppci, options):
     @author: Ray Zimmerman (PSERC Cornell)
     @author: Richard Lincoln
     Modified by University of Kassel (Florian Schaefer) to use numba
+
+    If q_lims is given (dict with the arrays "dq_max" and "dq_min" of the reactive power limits of
+    each bus relative to the reactive power injection in Sbus and "at_lim"), pv buses that exceed
+    their limits are switched to pq buses during the iterations and back to pv buses if their
+    voltage passes the setpoint. "at_lim" is updated with the buses at their upper (1) and lower
+    (-1) limit.
     """
 
     # options
@@ -44,10 +67,11 @@ def newtonpf(Ybus, Sbus, V0, pv, pq, ppci, options):
     v_debug = options["v_debug"]
     use_umfpack = options["use_umfpack"]
     permc_spec = options["permc_spec"]
+    damping = options.get("damping", None)
+    abort_on_divergence = options.get("abort_on_divergence", False)
 
     baseMVA = ppci['baseMVA']
     bus = ppci['bus']
-    gen = ppci['gen']
 
     # initialize
     i = 0
@@ -83,21 +107,115 @@ def newtonpf(Ybus, Sbus, V0, pv, pq, ppci, options):
     j5 = j4
     j6 = j4 + npq  # j5:j6 - V mag of pq buses
 
+    # reactive power of the buses at their limits relative to Sbus
+    dQ = 0.
+    if q_lims is not None:
+        pv0, pq0 = pv, pq
+        Vm_set = abs(V0)
+
+    if voltage_depend_loads:
+        # Sbus is given for a voltage of 1 p.u., the constant current and constant impedance parts
+        # of the loads are scaled with the voltage magnitude
+        Si, Sz = _get_zip_coefficients(baseMVA, bus)
+        Sbus_vm1 = Sbus
+
+        def get_Sbus(Vm):
+            return Sbus_vm1 + Si * (Vm - 1) + Sz * (Vm * Vm - 1)
+
+        Sbus = get_Sbus(Vm)
+
+    def evaluate_mismatch(Va, Vm):
+        V = Vm * exp(1j * Va)
+        S = get_Sbus(Vm) if voltage_depend_loads else Sbus
+        F = _evaluate_Fx(Ybus, V, S, pv, pq)
+        return V, F, linalg.norm(F, Inf)
+
+    def update(Va, Vm, dx):
+        Va, Vm = Va.copy(), Vm.copy()
+        Va[pv] += dx[j1:j2]
+        Va[pq] += dx[j3:j4]
+        Vm[pq] += dx[j5:j6]
+        return Va, Vm
+
     # evaluate F(x0)
     F = _evaluate_Fx(Ybus, V, Sbus, pv, pq)
     converged = _check_for_convergence(F, tol)
 
+    # mismatch (infinity norm) and elapsed time of each iteration, the first entry is the initial
+    # mismatch
+    t0 = time()
+    F_norm_it = [linalg.norm(F, Inf)]
+    et_it = [0.]
+    diverged = False
+    radius = TRUST_REGION_RADIUS
+    # start of the mismatch history for the divergence detection
+    k_div = 0
+
     Ybus = Ybus.tocsr()
     J = None
 
     # do Newton iterations
-    while (not converged and i < max_it):
+    while True:
+        if q_lims is not None and (converged or F_norm_it[-1] < Q_LIM_TOL):
+            to_pv = _switch_q_lims(Ybus, V, Sbus, pv0, Vm_set, q_lims)
+            if to_pv is not None:
+                # update the bus types and the reactive power at the limits, the structure of
+                # the admittance matrix and the lookup of the pv and pq buses are kept
+                at_lim = q_lims["at_lim"]
+                dQ_new = where(at_lim == 1, q_lims["dq_max"],
+                               where(at_lim == -1, q_lims["dq_min"], 0.))
+                Sbus = Sbus + 1j * (dQ_new - dQ)
+                dQ = dQ_new
+                Vm[to_pv] = Vm_set[to_pv]
+                V = Vm * exp(1j * Va)
+                pv = pv0[at_lim[pv0] == 0]
+                pq = r_[pq0, pv0[at_lim[pv0] != 0]]
+                pvpq = r_[pv, pq]
+                pvpq_lookup[pvpq] = arange(len(pvpq))
+                createJ = get_fastest_jacobian_function(pvpq, pq, numba)
+                npv = len(pv)
+                npq = len(pq)
+                j2 = npv
+                j3 = j2
+                j4 = j2 + npq
+                j5 = j4
+                j6 = j4 + npq
+                F = _evaluate_Fx(Ybus, V, Sbus, pv, pq)
+                converged = _check_for_convergence(F, tol)
+                F_norm_it[-1] = linalg.norm(F, Inf)
+                k_div = len(F_norm_it) - 1
+        if converged or i >= max_it:
+            break
+
         # update iteration counter
         i = i + 1
 
         J = create_jacobian_matrix(Ybus, V, pvpq, pq, createJ, pvpq_lookup, npv, npq, numba)
+        if voltage_depend_loads:
+            J = _add_zip_derivatives(J, Si[pq] + 2 * Sz[pq] * Vm[pq], npv, npq)
 
         dx = -1 * spsolve(J, F, permc_spec=permc_spec, use_umfpack=use_umfpack)
+        if damping is not None and not iwamoto:
+            # damped step, the mismatch is evaluated for the step
+            if damping == "line_search":
+                Va, Vm, V, F, normF = _line_search(evaluate_mismatch, update, Va, Vm, dx,
+                                                   F_norm_it[-1])
+            else:
+                Va, Vm, V, F, normF, radius = _trust_region_step(evaluate_mismatch, update, Va,
+                                                                 Vm, dx, F_norm_it[-1], radius)
+            Vm = abs(V)
+            Va = angle(V)
+            if v_debug:
+                Vm_it = column_stack((Vm_it, Vm))
+                Va_it = column_stack((Va_it, Va))
+            converged = normF < tol
+            F_norm_it.append(normF)
+            et_it.append(time() - t0)
+            if abort_on_divergence and not converged and _is_diverging(F_norm_it[k_div:]):
+                diverged = True
+                break
+            continue
+
         # update voltage
         if npv and not iwamoto:
             Va[pv] = Va[pv] + dx[j1:j2]
@@ -118,15 +236,103 @@ def newtonpf(Ybus, Sbus, V0, pv, pq, ppci, options):
             Va_it = column_stack((Va_it, Va))
 
         if voltage_depend_loads:
-            Sbus = makeSbus(baseMVA, bus, gen, vm=Vm)
+            Sbus = get_Sbus(Vm)
 
         F = _evaluate_Fx(Ybus, V, Sbus, pv, pq)
 
         converged = _check_for_convergence(F, tol)
 
+        F_norm_it.append(linalg.norm(F, Inf))
+        et_it.append(time() - t0)
+        if abort_on_divergence and not converged and _is_diverging(F_norm_it[k_div:]):
+            diverged = True
+            break
+
+    if "internal" in ppci:
+        ppci["internal"]["F_norm_it"] = array(F_norm_it)
+        ppci["internal"]["et_it"] = array(et_it)
+        ppci["internal"]["diverged"] = diverged
+
     return V, converged, i, J, Vm_it, Va_it
 
 
+def _line_search(evaluate_mismatch, update, Va, Vm, dx, normF):
+    """
+    backtracking line search: the step is halved until the mismatch decreases
+    """
+    alpha = 1.
+    for _ in range(LINE_SEARCH_MAX_HALVINGS + 1):
+        Va_new, Vm_new = update(Va, Vm, alpha * dx)
+        V, F, normF_new = evaluate_mismatch(Va_new, Vm_new)
+        if normF_new < (1 - 1e-4 * alpha) * normF:
+            break
+        alpha /= 2
+    return Va_new, Vm_new, V, F, normF_new
+
+
+def _trust_region_step(evaluate_mismatch, update, Va, Vm, dx, normF, radius):
+    """
+    the step is limited to the trust region radius (infinity norm). The radius is increased if the
+    mismatch decreases and reduced until it does
+    """
+    norm_dx = linalg.norm(dx, Inf)
+    while True:
+        scale = min(1., radius / norm_dx) if norm_dx > 0 else 1.
+        Va_new, Vm_new = update(Va, Vm, scale * dx)
+        V, F, normF_new = evaluate_mismatch(Va_new, Vm_new)
+        if normF_new < normF:
+            radius = min(2 * radius, TRUST_REGION_MAX_RADIUS)
+            return Va_new, Vm_new, V, F, normF_new, radius
+        if radius < TRUST_REGION_MIN_RADIUS:
+            # no decrease within the minimum radius, the step is taken anyway
+            return Va_new, Vm_new, V, F, normF_new, radius
+        radius = min(radius, norm_dx) / 4
+
+
+def _add_zip_derivatives(J, dSbus_dVm, npv, npq):
+    """
+    adds the derivatives of the voltage dependent loads of the pq buses (dSbus_dVm) to the
+    diagonal of dP/dVm and dQ/dVm, the entries already exist in the structure of the jacobian
+    """
+    k = arange(npq)
+    rows = r_[npv + k, npv + npq + k]
+    cols = r_[npv + npq + k, npv + npq + k]
+    return J - csr_matrix((r_[dSbus_dVm.real, dSbus_dVm.imag], (rows, cols)), shape=J.shape)
+
+
+def _switch_q_lims(Ybus, V, Sbus, pv0, Vm_set, q_lims):
+    """
+    switches pv buses with a reactive power injection beyond their limits to pq buses and buses at
+    their upper (lower) limit back to pv buses if the voltage is above (below) the setpoint.
+    Returns the buses switched back to pv buses or None if no bus type changed.
+    """
+    at_lim = q_lims["at_lim"]
+    pv = pv0[at_lim[pv0] == 0]
+    dq = (V[pv] * conj(Ybus[pv, :] * V)).imag - Sbus[pv].imag
+    to_max = pv[dq > q_lims["dq_max"][pv]]
+    to_min = pv[dq < q_lims["dq_min"][pv]]
+    lim = pv0[at_lim[pv0] != 0]
+    Vm = abs(V[lim])
+    to_pv = lim[((at_lim[lim] == 1) & (Vm > Vm_set[lim])) |
+                ((at_lim[lim] == -1) & (Vm < Vm_set[lim]))]
+    if not len(to_max) and not len(to_min) and not len(to_pv):
+        return None
+    at_lim[to_max] = 1
+    at_lim[to_min] = -1
+    at_lim[to_pv] = 0
+    return to_pv
+
+
+def _is_diverging(F_norm_it):
+    if not isfinite(F_norm_it[-1]):
+        return True
+    if F_norm_it[-1] > DIVERGENCE_FACTOR * min(F_norm_it):
+        return True
+    last = F_norm_it[-DIVERGENCE_ITERATIONS - 1:]
+    return len(last) == DIVERGENCE_ITERATIONS + 1 and \
+        all(last[k + 1] > last[k] for k in range(DIVERGENCE_ITERATIONS))
+
+
 def _evaluate_Fx(Ybus, V, Sbus, pv, pq):
     # evalute F(x)
     mis = V * conj(Ybus * V) - Sbus
@@ -7,7 +7,11 @@
 import numpy as np
 import pandas as pd
 
-from pandapower.results_branch import _get_branch_results, _get_branch_results_3ph
+from pandapower.array_store import _init_array_table
+from pandapower.auxiliary import _CopyOnWriteTable
+from pandapower.results_branch import _get_branch_results, _get_branch_results_3ph, \
+    _get_branch_flows, _get_line_results, _get_trafo_results, _get_trafo3w_results, \
+    _get_impedance_results, _get_xward_branch_results
 from pandapower.results_bus import _get_bus_results, _set_buses_out_of_service, \
     _get_shunt_results, _get_p_q_results, _get_bus_v_results, _get_bus_v_results_3ph, _get_p_q_results_3ph, \
     _get_bus_results_3ph
@@ -15,11 +19,29 @@ from pandapower.results_gen import _get_gen_results, _get_gen_results_3ph
 
 suffix_mode = {"sc": "sc", "se": "est", "pf_3ph": "3ph"}
 
+# the power results of these elements are summed up to the power results of the buses
+PQ_RESULT_TABLES = ("res_load", "res_motor", "res_sgen", "res_storage", "res_shunt", "res_ward",
+                    "res_xward", "res_gen", "res_ext_grid", "res_dcline")
+GEN_RESULT_TABLES = ("res_gen", "res_ext_grid", "res_dcline")
+
+
+def _copy_shared_result_tables(net):
+    # the results are written into the arrays of existing result tables, which are read-only if
+    # they are shared with a cloned net
+    for key, table in net.items():
+        if key.startswith("res_") and type(table) is _CopyOnWriteTable:
+            net[key] = table.copy()
+
 
 def _extract_results(net, ppc):
+    _copy_shared_result_tables(net)
     _set_buses_out_of_service(ppc)
     bus_lookup_aranged = _get_aranged_lookup(net)
     _get_bus_v_results(net, ppc)
+    results = net._options.get("results", None)
+    if results is not None:
+        _extract_selected_results(net, ppc, bus_lookup_aranged, results)
+        return
     bus_pq = _get_p_q_results(net, ppc, bus_lookup_aranged)
     _get_shunt_results(net, ppc, bus_lookup_aranged, bus_pq)
     _get_branch_results(net, ppc, bus_lookup_aranged, bus_pq)
@@ -29,8 +51,40 @@ def _extract_results(net, ppc):
         _get_costs(net, ppc)
 
 
+def _extract_selected_results(net, ppc, bus_lookup_aranged, results):
+    """
+    Extracts only the result tables which are selected with the option "results" of runpp. Each
+    table is calculated in one vectorized pass over all of its columns. The power results of the
+    elements are summed up to the bus power, so they are extracted together if one of them or the
+    bus power is selected. The branch flows are only calculated if a branch table is selected.
+    """
+    bus_columns = results.get("res_bus", [])
+    bus_power = bus_columns is None or "p_mw" in bus_columns or "q_mvar" in bus_columns
+    if bus_power or any(table in results for table in PQ_RESULT_TABLES):
+        bus_pq = _get_p_q_results(net, ppc, bus_lookup_aranged)
+        _get_shunt_results(net, ppc, bus_lookup_aranged, bus_pq)
+        if bus_power or "res_xward" in results:
+            _get_xward_branch_results(net, ppc, bus_lookup_aranged, bus_pq)
+        if bus_power or any(table in results for table in GEN_RESULT_TABLES):
+            _get_gen_results(net, ppc, bus_lookup_aranged, bus_pq)
+        if bus_power:
+            _get_bus_results(net, ppc, bus_pq)
+
+    branch_results = {"res_line": _get_line_results, "res_impedance": _get_impedance_results}
+    trafo_results = {"res_trafo": _get_trafo_results, "res_trafo3w": _get_trafo3w_results}
+    if any(table in results for table in list(branch_results) + list(trafo_results)):
+        i_ft, s_ft = _get_branch_flows(ppc)
+        for table, get_results in branch_results.items():
+            if table in results:
+                get_results(net, ppc, i_ft)
+        for table, get_results in trafo_results.items():
+            if table in results:
+                get_results(net, ppc, s_ft, i_ft)
+
+
 def _extract_results_3ph(net, ppc0, ppc1, ppc2):
     # reset_results(net, False)
+    _copy_shared_result_tables(net)
     _set_buses_out_of_service(ppc0)
     _set_buses_out_of_service(ppc1)
     _set_buses_out_of_service(ppc2)
@@ -45,6 +99,7 @@ def _extract_results_3ph(net, ppc0, ppc1, ppc2):
 
 
 def _extract_results_se(net, ppc):
+    _copy_shared_result_tables(net)
     _set_buses_out_of_service(ppc)
     bus_lookup_aranged = _get_aranged_lookup(net)
     _get_bus_v_results(net, ppc, suffix="_est")
@@ -111,8 +166,12 @@ def init_element(net, element, suffix=None):
         # init empty dataframe
         if res_empty_element in net:
             columns = net[res_empty_element].columns
-            net[res_element] = pd.DataFrame(np.nan, index=index,
-                                            columns=columns, dtype='float')
+            if net.get("_array_store", None) is not None:
+                # reuse the arrays of the last power flow
+                _init_array_table(net, res_element, index, columns)
+            else:
+                net[res_element] = pd.DataFrame(np.nan, index=index,
+                                                columns=columns, dtype='float')
         else:
             net[res_element] = pd.DataFrame(index=index, dtype='float')
     else:
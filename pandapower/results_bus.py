@@ -7,6 +7,7 @@
 import numpy as np
 from numpy import complex128
 import pandas as pd
+from pandapower.array_store import _set_result_column
 from pandapower.auxiliary import _sum_by_group, sequence_to_phase, _sum_by_group_nvals
 from pandapower.pypower.idx_bus import VM, VA, PD, QD, LAM_P, LAM_Q, BASE_KV,NONE
 
@@ -29,9 +30,9 @@ def _get_bus_v_results(net, ppc, suffix=None):
 
     res_table = "res_bus" if suffix is None else "res_bus%s" % suffix
     if ac:
-        net[res_table]["vm_pu"] = ppc["bus"][bus_idx][:, VM]
+        _set_result_column(net, res_table, "vm_pu", ppc["bus"][bus_idx, VM])
     # voltage angles
-    net[res_table]["va_degree"] = ppc["bus"][bus_idx][:, VA]
+    _set_result_column(net, res_table, "va_degree", ppc["bus"][bus_idx, VA])
 
 
 def _get_bus_v_results_3ph(net, ppc0, ppc1, ppc2):
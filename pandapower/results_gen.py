@@ -9,6 +9,7 @@ from numpy import complex128
 from pandapower.pypower.idx_bus import VM, VA,BASE_KV
 from pandapower.pypower.idx_gen import PG, QG, GEN_BUS
 
+from pandapower.array_store import _set_result_column
 from pandapower.auxiliary import _sum_by_group, sequence_to_phase, _sum_by_group_nvals, \
     I_from_SV_elementwise, S_from_VI_elementwise, SVabc_from_SV012
 
@@ -88,12 +89,12 @@ def _get_ext_grid_results(net, ppc):
     q = np.zeros(n_res_eg)
     p[eg_is_mask] = ppc["gen"][gen_idx_ppc, PG]
     # store result in net['res']
-    net["res_ext_grid"]["p_mw"] = p
+    _set_result_column(net, "res_ext_grid", "p_mw", p)
 
     # if ac PF q results are also available
     if ac:
         q[eg_is_mask] = ppc["gen"][gen_idx_ppc, QG]
-        net["res_ext_grid"]["q_mvar"] = q
+        _set_result_column(net, "res_ext_grid", "q_mvar", q)
 
     # get bus values for pq_bus
     b = net['ext_grid'].bus.values
@@ -78,8 +78,8 @@ def runpp(net, algorithm='nr', calculate_voltage_angles="auto", init="auto",
                 - "iwamoto_nr" Newton-Raphson with Iwamoto multiplier (maybe slower than NR but more robust)
                 - "bfsw" backward/forward sweep (specially suited for radial and weakly-meshed networks)
                 - "gs" gauss-seidel (pypower implementation)
-                - "fdbx" fast-decoupled (pypower implementation)
-                - "fdxb" fast-decoupled (pypower implementation)
+                - "fdbx" fast-decoupled, BX version (the factorizations of B' and B'' are reused while the branch parameters are unchanged)
+                - "fdxb" fast-decoupled, XB version (the factorizations of B' and B'' are reused while the branch parameters are unchanged)
 
         **calculate_voltage_angles** (str or bool, "auto") - consider voltage angles in loadflow calculation
 
@@ -133,11 +133,15 @@ def runpp(net, algorithm='nr', calculate_voltage_angles="auto", init="auto",
         **enforce_q_lims** (bool, False) - respect generator reactive power limits
 
             If True, the reactive power limits in net.gen.max_q_mvar/min_q_mvar are respected in the
-            loadflow. This is done by running a second loadflow if reactive power limits are
-            violated at any generator, so that the runtime for the loadflow will increase if reactive
-            power has to be curtailed.
-
-            Note: enforce_q_lims only works if algorithm="nr"!
+            loadflow. With algorithm "nr" and "iwamoto_nr", generator buses are switched to PQ buses
+            at their reactive power limits (and back to PV buses if the voltage passes the setpoint)
+            within the newton iterations, so that only a few additional iterations are needed. If
+            these iterations do not converge, with voltage dependent loads or with
+            enforce_q_lims=2, the generators are limited in an outer loop as with the fast-decoupled
+            algorithms "fdbx" and "fdxb": the loadflow is repeated as long as reactive power limits
+            are violated at any generator (with enforce_q_lims=2 only the largest violation is fixed
+            in each loadflow), so that the runtime for the loadflow will increase if reactive power
+            has to be curtailed.
 
 
         **check_connectivity** (bool, True) - Perform an extra connectivity test after the conversion from pandapower to PYPOWER
@@ -194,8 +198,33 @@ def runpp(net, algorithm='nr', calculate_voltage_angles="auto", init="auto",
             trafo: If True trafo relevant variables, e.g., the Ybus matrix, is recalculated
             gen: If True Sbus and the gen table in the ppc are recalculated
 
+            Only available for algorithm "nr", "iwamoto_nr", "fdbx" and "fdxb".
+
         **neglect_open_switch_branches** (bool, False) - If True no auxiliary buses are created for branches when switches are opened at the branch. Instead branches are set out of service
 
+        **parallel_islands** (bool/str, False) - Solve the islands of the grid (groups of buses with own slack that are not connected to each other) separately with their own convergence check. Only available for algorithm "nr" and "iwamoto_nr".
+
+            - False: the grid is solved as a whole
+            - True or "thread": the islands are solved in a thread pool
+            - "process": the islands are solved in a process pool
+
+        **n_jobs** (int, None) - number of workers of the pool for parallel_islands. If None, the default of concurrent.futures is used, if 1 the islands are solved one after another
+
+        **results** (dict, None) - result tables which are calculated, with a list of columns for each table (None for all columns), e.g. {"res_bus": ["vm_pu"], "res_line": ["loading_percent"]}. If None, all results are calculated.
+
+            - the bus voltages (res_bus.vm_pu and va_degree) are always calculated
+            - each selected table is calculated as a whole, i.e. the other columns of the table are calculated as well
+            - the branch flows and the power of the slacks (pfsoln) are only calculated if they are needed for the selected results. If only voltages or load, sgen, storage, motor, shunt and ward results are selected, they are skipped (only with algorithm "nr", "fdbx" or "fdxb" and enforce_q_lims=False)
+            - the other result tables are not calculated and contain nan or, with init="results", the values of the last power flow
+
+        **damping** (str, None) - step control of the newton-raphson power flow (algorithm "nr"). The mismatch norm and the elapsed time of each iteration are stored in net._ppc["internal"]["F_norm_it"] and ["et_it"].
+
+            - None: full newton steps
+            - "line_search": the newton step is halved until the mismatch decreases
+            - "trust_region": the newton step is limited to a trust region radius which is adapted to the decrease of the mismatch
+
+        **abort_on_divergence** (bool, False) - if True, the newton-raphson power flow is aborted as soon as the mismatch increases in three consecutive iterations, becomes infinite or exceeds 1000 times the smallest mismatch so far, instead of running to max_iteration
+
     """
 
     # if dict 'user_pf_options' is present in net, these options overrule the net.__internal_options
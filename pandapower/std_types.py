@@ -4,6 +4,9 @@
 # and Energy System Technology (IEE), Kassel. All rights reserved.
 
 
+import copy
+from functools import lru_cache
+
 import pandas as pd
 import warnings
 
@@ -348,10 +351,94 @@ def add_temperature_coefficient(net, fill=None):
     parameter_from_std_type(net, "alpha", fill=fill)
 
 
+class _SharedStdType(dict):
+    """
+    Parameters of a basic standard type, which are shared by the standard type libraries of all
+    nets and must not be changed in place.
+    """
+
+
+class _StdTypeLibrary(dict):
+    """
+    Standard types of one element type of a net. The basic standard types are shared by all nets,
+    so that adding them to a new net doesn't copy the whole library. A shared type is copied into
+    the library of the net when it is accessed, so that changing the parameters of a type doesn't
+    affect other nets.
+    """
+
+    def __getitem__(self, name):
+        data = dict.__getitem__(self, name)
+        if type(data) is _SharedStdType:
+            data = dict(data)
+            dict.__setitem__(self, name, data)
+        return data
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def items(self):
+        self._copy_shared_types()
+        return dict.items(self)
+
+    def values(self):
+        self._copy_shared_types()
+        return dict.values(self)
+
+    def pop(self, name, *args):
+        data = dict.pop(self, name, *args)
+        return dict(data) if type(data) is _SharedStdType else data
+
+    def copy(self):
+        return _StdTypeLibrary(dict.items(self))
+
+    def __deepcopy__(self, memo):
+        # the shared types are not changed in place, so the copy can share them as well
+        result = _StdTypeLibrary()
+        memo[id(self)] = result
+        for name, data in dict.items(self):
+            dict.__setitem__(result, name, data if type(data) is _SharedStdType else
+                             copy.deepcopy(data, memo))
+        return result
+
+    def _copy_shared_types(self):
+        for name, data in dict.items(self):
+            if type(data) is _SharedStdType:
+                dict.__setitem__(self, name, dict(data))
+
+
+@lru_cache(maxsize=None)
+def _basic_std_types():
+    linetypes, trafotypes, trafo3wtypes = _create_basic_std_types()
+    return {element: {name: _SharedStdType(data) for name, data in types.items()}
+            for element, types in [("line", linetypes), ("trafo", trafotypes),
+                                   ("trafo3w", trafo3wtypes)]}
+
+
 def add_basic_std_types(net):
+    """
+    Adds the basic standard types of pandapower to the standard type library of the net. Existing
+    standard types with the same names are overwritten.
+
+    INPUT:
+        **net** - The pandapower network
+
+    OUTPUT:
+        **linetypes**, **trafotypes**, **trafo3wtypes** - dictionaries of the added standard types
+    """
     if "std_types" not in net:
         net.std_types = {"line": {}, "trafo": {}, "trafo3w": {}}
-
+    basic_std_types = _basic_std_types()
+    for element, types in basic_std_types.items():
+        library = net.std_types.get(element, None)
+        if not isinstance(library, _StdTypeLibrary):
+            library = _StdTypeLibrary(library or dict())
+            net.std_types[element] = library
+        dict.update(library, types)
+    return tuple({name: dict(data) for name, data in basic_std_types[element].items()}
+                 for element in ["line", "trafo", "trafo3w"])
+
+
+def _create_basic_std_types():
     alpha_al = 4.03e-3
     alpha_cu = 3.93e-3
 
@@ -789,7 +876,6 @@ def add_basic_std_types(net):
              "q_mm2": 679,
              "alpha": alpha_al}
     }
-    create_std_types(net, data=linetypes, element="line")
 
     trafotypes = {
         # derived from Oswald - Transformatoren - Vorlesungsskript Elektrische Energieversorgung I
@@ -1042,7 +1128,6 @@ def add_basic_std_types(net):
             "tap_step_percent": 2.5,
             "tap_phase_shifter": False},
     }
-    create_std_types(net, data=trafotypes, element="trafo")
 
     trafo3wtypes = {
         # generic trafo3w
@@ -1093,5 +1178,4 @@ def add_basic_std_types(net):
             "tap_max": 10,
             "tap_step_percent": 1.2}
     }
-    create_std_types(net, data=trafo3wtypes, element="trafo3w")
     return linetypes, trafotypes, trafo3wtypes
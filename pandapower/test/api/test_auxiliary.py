@@ -7,6 +7,7 @@
 import pytest
 import gc
 import copy
+import pickle
 import numpy as np
 import pandas as pd
 
@@ -18,7 +19,7 @@ try:
 except ImportError:
     GEOPANDAS_INSTALLED = False
 
-from pandapower.auxiliary import get_indices
+from pandapower.auxiliary import get_indices, pandapowerNet
 
 import pandapower as pp
 import pandapower.networks
@@ -208,5 +209,103 @@ def test_memory_leak_dict():
     assert types_dict2[MemoryLeakDemoDict] - types_dict1.get(MemoryLeakDemoDict, 0) <= 1
 
 
+def test_net_clone():
+    net = pp.networks.example_simple()
+    net.line_geodata.loc[0, 'coords'] = [[0, 1], [1, 2]]
+    ds = pp.timeseries.DFData(pd.DataFrame(data=[[0, 1, 2], [3, 4, 5]]))
+    pp.control.ConstControl(net, element='load', variable='p_mw', element_index=[0],
+                            profile_name=[0], data_source=ds)
+    pp.runpp(net)
+    net_ref = copy.deepcopy(net)
+
+    net1 = net.clone()
+    assert type(net) is pandapowerNet and type(net1) is pandapowerNet
+    # the data of the tables is shared, also after a power flow of the clone
+    pp.runpp(net1)
+    for element, column in [("bus", "vn_kv"), ("line", "length_km"), ("load", "p_mw")]:
+        assert np.shares_memory(net1[element][column].values, net[element][column].values)
+    # controllers are not equal after deepcopy
+    assert pp.nets_equal(net1, net_ref, check_only_results=False, exclude_elms=["controller"])
+    for element in ["bus", "load", "line"]:
+        pd.testing.assert_frame_equal(net_ref[element], net1[element])
+        pd.testing.assert_frame_equal(net1[element], net_ref[element])
+
+    # mutable elements of tables are copied
+    net1.line_geodata.coords.at[0].append([2, 3])
+    assert len(net.line_geodata.coords.at[0]) == 2
+    assert net1.controller.object.at[0] is not net.controller.object.at[0]
+    assert net1.get("std_types") is not net.get("std_types")
+
+    net2 = net_ref.clone(structure_only=True)
+    for element in ["res_bus", "res_line", "line_geodata", "controller"]:
+        assert len(net2[element]) == 0
+        assert len(net_ref[element]) > 0
+    assert "_ppc" not in net2 and "_ppc" in net_ref
+    for element in ["bus", "load", "sgen", "line", "trafo", "switch"]:
+        pd.testing.assert_frame_equal(net2[element], net_ref[element])
+    pp.runpp(net2)
+    assert pp.nets_equal(net2, net_ref, check_only_results=True)
+
+    # copies of clones are plain nets with plain tables
+    net3 = net_ref.clone()
+    for net_copy in [copy.deepcopy(net3), pickle.loads(pickle.dumps(net3)),
+                     pp.from_json_string(pp.to_json(net3))]:
+        assert type(net_copy) is pandapowerNet
+        assert type(net_copy.bus) is pd.DataFrame
+        assert pp.nets_equal(net_copy, net_ref, exclude_elms=["controller"])
+
+
+def test_net_clone_copy_on_write():
+    net = pp.networks.example_simple()
+    net_ref = copy.deepcopy(net)
+    load = net.load
+    sgen_p_mw = net.sgen.p_mw
+
+    def assert_unchanged(n, elements=("bus", "load", "sgen", "gen", "line", "switch")):
+        for element in elements:
+            pd.testing.assert_frame_equal(n[element], net_ref[element])
+
+    # tables changed by items() or values()
+    net1 = net.clone()
+    for element, table in net1.items():
+        if element == "load":
+            table["p_mw"] *= 10
+    for table in net1.values():
+        if isinstance(table, pd.DataFrame) and "vm_pu" in table.columns:
+            table.loc[table.index, "vm_pu"] = 1.1
+    assert np.allclose(net1.load.p_mw.values, net_ref.load.p_mw.values * 10)
+    assert np.allclose(net1.gen.vm_pu.values, 1.1)
+    assert_unchanged(net)
+
+    # tables and columns which have been taken from the net before cloning
+    net2 = net.clone()
+    load.loc[load.index[0], "p_mw"] = 99.
+    sgen_p_mw *= 2
+    assert net.load.p_mw.at[load.index[0]] == 99.
+    assert np.allclose(net.sgen.p_mw.values, net_ref.sgen.p_mw.values * 2)
+    assert_unchanged(net2)
+    net.load, net.sgen = net_ref.load.copy(), net_ref.sgen.copy()
+
+    # all kinds of changes of the clone
+    net3 = net.clone()
+    net3.load.p_mw *= 2
+    net3.sgen.p_mw.loc[net3.sgen.index[0]] = 5.
+    net3.gen.at[net3.gen.index[0], "vm_pu"] = 1.1
+    net3.line.iloc[:, 2] *= 2
+    net3.bus.drop(net3.bus.index[0], inplace=True)
+    net3.switch.closed.fillna(False, inplace=True)
+    net3["ext_grid"] = net3.ext_grid.iloc[:0]
+    assert net3.sgen.p_mw.at[net3.sgen.index[0]] == 5.
+    assert len(net3.bus) == len(net.bus) - 1
+    assert_unchanged(net)
+    assert len(net.ext_grid) == 1
+
+    # the shared data is read-only on the numpy level
+    net4 = net.clone()
+    with pytest.raises(ValueError):
+        net4.load.p_mw.values[0] = 1.
+    assert_unchanged(net)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, "-x"])
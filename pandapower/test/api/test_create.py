@@ -818,5 +818,163 @@ def test_create_gens_raise_except():
                        min_vm_pu=0.85, max_vm_pu=1.15, vn_kv=0.4, xdss_pu=0.1, rdss_pu=0.1, cos_phi=1.,
                        index=g)
 
+
+def _create_example_elements(net):
+    b1 = pp.create_bus(net, 110, geodata=(1., 2.))
+    b2 = pp.create_bus(net, 110, max_vm_pu=1.1, index=5)
+    b3 = pp.create_bus(net, 20, name="lv")
+    pp.create_ext_grid(net, b1, controllable=True, max_p_mw=100.)
+    pp.create_line(net, b1, b2, 10., "149-AL1/24-ST1A 110.0", geodata=[(1., 2.), (3., 4.)])
+    pp.create_line(net, b2, b1, 5., "149-AL1/24-ST1A 110.0", max_loading_percent=80.)
+    t = pp.create_transformer(net, b2, b3, "25 MVA 110/20 kV")
+    pp.create_switch(net, b3, t, et="t", closed=True)
+    pp.create_load(net, b3, p_mw=10., q_mvar=2., controllable=False)
+    g = pp.create_gen(net, b3, p_mw=5., max_q_mvar=3., min_q_mvar=-3.)
+    pp.create_sgen(net, b3, p_mw=1.)
+    pp.create_shunt(net, b3, q_mvar=1.)
+    pp.create_measurement(net, "v", "bus", 1.01, 0.01, b1, check_existing=False)
+    pp.create_measurement(net, "p", "line", 1.02, 0.01, 0, side="from", check_existing=False)
+    pp.create_poly_cost(net, g, "gen", cp1_eur_per_mw=10.)
+    pp.create_pwl_cost(net, g, "gen", [[0, 20, 1], [20, 30, 2]])
+
+
+def test_bulk_create():
+    net = pp.create_empty_network()
+    _create_example_elements(net)
+
+    net_bulk = pp.create_empty_network()
+    with pp.bulk_create(net_bulk):
+        _create_example_elements(net_bulk)
+        assert len(net_bulk.bus) == 0
+        assert "_bulk_create" in net_bulk
+    assert "_bulk_create" not in net_bulk
+
+    for element in ["bus", "bus_geodata", "ext_grid", "line", "line_geodata", "trafo", "switch",
+                    "load", "gen", "sgen", "shunt", "measurement", "poly_cost", "pwl_cost"]:
+        pd.testing.assert_frame_equal(net[element], net_bulk[element])
+
+    pp.runpp(net)
+    pp.runpp(net_bulk)
+    assert np.allclose(net.res_bus.vm_pu.values, net_bulk.res_bus.vm_pu.values)
+
+
+def test_bulk_create_raise_except():
+    net = pp.create_empty_network()
+    with pytest.raises(UserWarning, match="A bus with index 0 already exists"):
+        with pp.bulk_create(net):
+            pp.create_bus(net, 0.4)
+            pp.create_bus(net, 0.4, index=0)
+    # the elements created before the exception are written into the table
+    assert len(net.bus) == 1
+
+    with pp.bulk_create(net):
+        b = pp.create_bus(net, 0.4)
+        with pytest.raises(UserWarning):
+            pp.create_load(net, b + 1, p_mw=0.1)
+        # plural create functions write the buffered elements into the tables first
+        pp.create_loads(net, [0, b], p_mw=0.1)
+    assert len(net.bus) == 2
+    assert len(net.load) == 2
+
+
+def test_create_shunts_wards_impedances():
+    net = pp.create_empty_network()
+    b = pp.create_buses(net, 3, 20)
+    pp.create_ext_grid(net, b[0])
+    pp.create_line(net, b[0], b[1], 1., "NA2XS2Y 1x95 RM/25 12/20 kV")
+
+    sh = pp.create_shunts(net, [b[1], b[2]], q_mvar=[0.1, 0.2], vn_kv=[None, 19.])
+    assert list(net.shunt.index) == list(sh)
+    assert net.shunt.vn_kv.at[sh[1]] == 19.
+    assert np.allclose(net.shunt.step.values, 1)
+    sh2 = pp.create_shunts(net, [b[1]], q_mvar=0.1, p_mw=0.01, index=[7])
+    assert sh2 == [7]
+    assert net.shunt.vn_kv.at[7] == 20.
+
+    w = pp.create_wards(net, [b[1], b[2]], ps_mw=1., qs_mvar=0.5, pz_mw=[0.1, 0.2],
+                        qz_mvar=0., name=["w1", "w2"])
+    assert list(net.ward.name.loc[w]) == ["w1", "w2"]
+    xw = pp.create_xwards(net, [b[1], b[2]], ps_mw=1., qs_mvar=0.5, pz_mw=0., qz_mvar=0.,
+                          r_ohm=0.1, x_ohm=[1., 2.], vm_pu=1.01)
+    assert np.allclose(net.xward.x_ohm.loc[xw].values, [1., 2.])
+    imp = pp.create_impedances(net, [b[1]], [b[2]], rft_pu=0.01, xft_pu=0.02, sn_mva=10.)
+    assert net.impedance.rtf_pu.at[imp[0]] == 0.01
+
+    for element in ["shunt", "ward", "xward", "impedance"]:
+        assert net[element].in_service.dtype == bool
+    pp.runpp(net)
+    assert net.converged
+
+    with pytest.raises(UserWarning, match="non existing buses"):
+        pp.create_shunts(net, [b[1], 10], q_mvar=0.1)
+    with pytest.raises(UserWarning, match="already exist"):
+        pp.create_wards(net, [b[1]], 1., 0., 0., 0., index=w[:1])
+    with pytest.raises(UserWarning, match="non existing buses"):
+        pp.create_impedances(net, [b[1]], [10], 0.01, 0.02, 10.)
+
+
+def test_create_ext_grids_storages():
+    net = pp.create_empty_network()
+    b = pp.create_buses(net, 3, 20)
+    eg = pp.create_ext_grids(net, b[:2], vm_pu=[1.01, 1.02], s_sc_max_mva=1000.,
+                             controllable=[True, False])
+    assert list(net.ext_grid.vm_pu.loc[eg]) == [1.01, 1.02]
+    assert net.ext_grid.controllable.dtype == bool
+    assert "s_sc_min_mva" not in net.ext_grid.columns
+
+    st = pp.create_storages(net, b[1:], p_mw=[0.1, -0.1], max_e_mwh=1., min_p_mw=-0.2)
+    assert np.allclose(net.storage.min_p_mw.loc[st].values, -0.2)
+    assert "max_p_mw" not in net.storage.columns
+    assert net.storage.in_service.dtype == bool
+
+    with pytest.raises(UserWarning, match="already exist"):
+        pp.create_storages(net, b[1:], p_mw=0., max_e_mwh=1., index=st)
+
+
+def test_create_measurements_and_costs():
+    net = pp.create_empty_network()
+    b = pp.create_buses(net, 2, 110)
+    l = pp.create_line(net, b[0], b[1], 1., "149-AL1/24-ST1A 110.0")
+    g = pp.create_gens(net, b, p_mw=[1., 2.])
+
+    m = pp.create_measurements(net, ["v", "P", "p"], ["bus", "bus", "line"], [1., 2., 3.], 0.01,
+                               [b[0], b[1], l], side=[None, None, "from"])
+    assert list(net.measurement.measurement_type.loc[m]) == ["v", "p", "p"]
+    assert net.measurement.side.at[m[2]] == "from"
+    with pytest.raises(UserWarning, match="does not exist"):
+        pp.create_measurements(net, "p", "line", [1.], 0.01, [l + 1])
+    with pytest.raises(UserWarning, match="Voltage measurements"):
+        pp.create_measurements(net, "v", "line", [1.], 0.01, [l])
+
+    pc = pp.create_poly_costs(net, g, "gen", cp1_eur_per_mw=[1., 2.], cp2_eur_per_mw2=0.1)
+    assert np.allclose(net.poly_cost.cp1_eur_per_mw.loc[pc].values, [1., 2.])
+    points = [[[0, 20, 1], [20, 30, 2]], [[0, 30, 1.5]]]
+    pwl = pp.create_pwl_costs(net, g, "gen", points)
+    assert net.pwl_cost.points.at[pwl[0]] == points[0]
+    assert net.pwl_cost.points.at[pwl[1]] == points[1]
+    with pytest.raises(UserWarning, match="number of points entries"):
+        pp.create_pwl_costs(net, g, "gen", points[:1])
+
+
+def test_create_empty_network():
+    net = pp.create_empty_network(name="test", f_hz=60., sn_mva=10.)
+    assert net.name == "test"
+    assert net.f_hz == 60.
+    assert net.sn_mva == 10.
+    assert net.bus.dtypes["vn_kv"] == np.float64
+    assert net.load.dtypes["bus"] == np.uint32
+
+    # the tables of new nets are independent of each other
+    pp.create_bus(net, 0.4)
+    net.user_pf_options["init"] = "dc"
+    net.res_bus.loc[0, "vm_pu"] = 1.
+    net2 = pp.create_empty_network()
+    assert len(net2.bus) == 0
+    assert len(net2.res_bus) == 0
+    assert net2.user_pf_options == dict()
+    assert net2.name == ""
+    assert net2.f_hz == 50.
+
+
 if __name__ == '__main__':
     pytest.main(["test_create.py"])
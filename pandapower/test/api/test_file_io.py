@@ -3,6 +3,7 @@
 # Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
 # and Energy System Technology (IEE), Kassel. All rights reserved.
 import copy
+import io
 import json
 import os
 
@@ -15,7 +16,7 @@ import pandapower.control as control
 import pandapower.networks as networks
 import pandapower.topology as topology
 from pandapower import pp_dir
-from pandapower.io_utils import PPJSONEncoder, PPJSONDecoder
+from pandapower.io_utils import PPJSONEncoder, PPJSONDecoder, PPJSONStreamReader
 from pandapower.test.toolbox import assert_net_equal, create_test_network
 from pandapower.timeseries import DFData
 
@@ -135,6 +136,95 @@ def test_sqlite(net_in, tmp_path):
     assert_net_equal(net_in, net_out)
 
 
+def test_sql_without_execute(net_in, tmp_path):
+    import sqlite3
+
+    class Connection(object):
+        # DBAPI connection without the execute shortcut of sqlite3 connections
+        def __init__(self, con):
+            self._con = con
+
+        def cursor(self):
+            return self._con.cursor()
+
+        def commit(self):
+            self._con.commit()
+
+        def rollback(self):
+            self._con.rollback()
+
+    filename = os.path.join(os.path.abspath(str(tmp_path)), "testfile.db")
+    con = sqlite3.connect(filename)
+    pp.to_sql(net_in, Connection(con))
+    net_out = pp.from_sql(con)
+    con.close()
+    assert_net_equal(net_in, net_out)
+
+
+def test_sqlite_delta(net_in, tmp_path):
+    import sqlite3
+    filename = os.path.join(os.path.abspath(str(tmp_path)), "testfile.db")
+    pp.runpp(net_in)
+    assert pp.to_sqlite(net_in, filename, delta=True) == 1
+    assert_net_equal(net_in, pp.from_sqlite(filename))
+
+    # change, add and delete rows -> only the changed rows are written
+    net_in.load.loc[net_in.load.index[1], "p_mw"] *= 2
+    pp.create_load(net_in, net_in.bus.index[0], p_mw=0.1)
+    pp.drop_lines(net_in, net_in.line.index[:1])
+    net_in.bus.sort_index(ascending=False, inplace=True)
+    assert pp.to_sqlite(net_in, filename, delta=True, include_results=False) == 2
+    con = sqlite3.connect(filename)
+    changed = con.execute("SELECT changed FROM _pp_version WHERE version=2").fetchone()[0]
+    con.close()
+    assert all(t in json.loads(changed) for t in ["bus", "load", "line", "res_bus"])
+    assert not any(t in json.loads(changed) for t in ["trafo", "sgen", "ext_grid"])
+    net_out = pp.from_sqlite(filename)
+    assert len(net_out.res_bus) == 0
+    assert list(net_out.bus.index) == list(net_in.bus.index)
+    pp.clear_result_tables(net_in)
+    assert_net_equal(net_in, net_out)
+
+    # a save without delta replaces everything
+    pp.to_sqlite(net_in, filename)
+    assert pp.to_sqlite(net_in, filename, delta=True) == 1
+
+    # only load selected tables
+    net_out = pp.from_sqlite(filename, tables=["bus", "load"])
+    pd.testing.assert_frame_equal(net_in.bus, net_out.bus)
+    pd.testing.assert_frame_equal(net_in.load, net_out.load)
+    assert len(net_out.line) == 0
+    with pytest.raises(ValueError):
+        pp.from_sqlite(filename, tables=["bus", "no_element"])
+
+
+def test_binary(net_in, tmp_path):
+    path = os.path.join(os.path.abspath(str(tmp_path)), "testnet")
+    pp.runpp(net_in)
+    pp.to_binary(net_in, path)
+    for mmap in [True, False]:
+        net_out = pp.from_binary(path, mmap=mmap)
+        assert_net_equal(net_in, net_out)
+        for element in ["bus", "line", "res_bus"]:
+            assert net_in[element].dtypes.equals(net_out[element].dtypes)
+    # memory-mapped data can be changed without changing the file
+    net_out = pp.from_binary(path, mmap=True)
+    assert isinstance(net_out.load.p_mw.values, np.memmap)
+    net_out.load.p_mw *= 2
+    pp.runpp(net_out)
+    assert_net_equal(net_in, pp.from_binary(path))
+
+    # only load selected tables
+    net_out = pp.from_binary(path, tables=["bus", "line"])
+    pd.testing.assert_frame_equal(net_in.bus, net_out.bus)
+    pd.testing.assert_frame_equal(net_in.line, net_out.line)
+    assert len(net_out.load) == 0 and len(net_out.res_bus) == 0
+    assert net_in.load.dtypes.equals(net_out.load.dtypes)
+    assert list(net_in.load.columns) == list(net_out.load.columns)
+    with pytest.raises(ValueError):
+        pp.from_binary(path, tables=["bus", "no_element"])
+
+
 def test_convert_format():  # TODO what is this thing testing ?
     net = pp.from_pickle(os.path.join(pp.pp_dir, "test", "api", "old_net.p"))
     pp.runpp(net)
@@ -157,6 +247,36 @@ def test_to_json_dtypes(tmp_path):
     assert_net_equal(net, net1)
 
 
+@pytest.mark.parametrize("chunk_size", [1, 13, 2 ** 20])
+def test_json_stream(net_in, tmp_path, chunk_size):
+    filename = os.path.abspath(str(tmp_path)) + "testfile.json"
+    pp.runpp(net_in)
+    net_in.line["test"] = 1.5e-20
+    # the file written incrementally is the same as the json string
+    pp.to_json(net_in, filename)
+    with open(filename) as fp:
+        assert fp.read() == pp.to_json(net_in)
+
+    json_string = pp.to_json(net_in, indent=None)
+    for fp in [io.StringIO(json_string), io.BytesIO(json_string.encode())]:
+        net_out = PPJSONStreamReader(fp, chunk_size=chunk_size).load()
+        assert_net_equal(net_in, net_out)
+        assert net_out.line.test.values[0] == 1.5e-20
+        assert net_out.std_types == net_in.std_types
+
+    pp.to_json(net_in, filename, indent=None)
+    assert_net_equal(net_in, pp.from_json(filename))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_json_stream_multibyte_characters(chunk_size):
+    # the chunks of the file end within multibyte characters
+    for n in range(4):
+        obj = {"name": "x" * n + "\u00e4\u20ac\U0001f600", "values": ["\u20ac" * n, 1.5]}
+        fp = io.BytesIO(json.dumps(obj, ensure_ascii=False).encode())
+        assert PPJSONStreamReader(fp, chunk_size=chunk_size).load() == obj
+
+
 def test_json_encoding_decoding():
     net = networks.mv_oberrhein()
     net.tuple = (1, "4")
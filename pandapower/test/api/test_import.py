@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pandapower as pp
+
+# modules which are only imported when they are needed, not by "import pandapower": numba is
+# imported when the first kernel is called and the opf solvers with the first optimal power flow
+DEFERRED_MODULES = ["networkx", "numba", "pandapower.topology", "pandapower.plotting",
+                    "pandapower.pypower.opf", "pandapower.pypower.pips"]
+
+
+def _modules_after_import():
+    code = "import sys; import pandapower; print(' '.join(sys.modules))"
+    output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True,
+                                     cwd=os.path.dirname(pp.pp_dir))
+    return output.strip().split("\n")[-1].split()
+
+
+def test_deferred_modules_not_imported():
+    modules = _modules_after_import()
+    assert "pandapower.run" in modules
+    for module in DEFERRED_MODULES:
+        assert module not in modules
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, "-xs"])
@@ -4,6 +4,8 @@
 # and Energy System Technology (IEE), Kassel. All rights reserved.
 
 
+import copy
+
 import pytest
 
 import pandapower as pp
@@ -321,5 +323,37 @@ def test_add_temperature_coefficient():
     assert all(net.line.alpha == 4.03e-3)
 
 
+def test_basic_std_types_are_not_shared():
+    net1 = pp.create_empty_network()
+    net2 = pp.create_empty_network()
+    name = "NAYY 4x50 SE"
+    r_ohm_per_km = net2.std_types["line"][name]["r_ohm_per_km"]
+
+    # changing a basic type in place only affects this net
+    net1.std_types["line"][name]["r_ohm_per_km"] = 2 * r_ohm_per_km
+    assert pp.load_std_type(net1, name)["r_ohm_per_km"] == 2 * r_ohm_per_km
+    for _, typdata in net1.std_types["trafo"].items():
+        typdata["sn_mva"] = 0.
+    pp.delete_std_type(net1, "0.25 MVA 20/0.4 kV", element="trafo")
+
+    net3 = pp.create_empty_network()
+    for net in [net2, net3]:
+        assert pp.load_std_type(net, name)["r_ohm_per_km"] == r_ohm_per_km
+        assert pp.std_type_exists(net, "0.25 MVA 20/0.4 kV", element="trafo")
+        assert all(pp.available_std_types(net, "trafo").sn_mva > 0)
+    assert net2.std_types == net3.std_types
+    assert net1.std_types != net3.std_types
+
+    # a copied net doesn't share the types with the original net
+    net4 = copy.deepcopy(net3)
+    net4.std_types["line"][name]["r_ohm_per_km"] = 0.
+    assert net3.std_types["line"][name]["r_ohm_per_km"] == r_ohm_per_km
+
+    empty = pp.create_empty_network(add_stdtypes=False)
+    assert empty.std_types == {"line": {}, "trafo": {}, "trafo3w": {}}
+    linetypes, _, _ = pp.add_basic_std_types(empty)
+    assert empty.std_types["line"] == linetypes
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandapower as pp
+import pandapower.networks as nw
+from pandapower.array_store import ArrayTable
+
+
+def _assert_results_equal(net, net_ref):
+    for table in ["res_bus", "res_line", "res_trafo", "res_trafo3w", "res_ext_grid", "res_gen",
+                  "res_load", "res_sgen", "res_shunt", "res_xward"]:
+        assert net[table].index.equals(net_ref[table].index)
+        assert list(net[table].columns) == list(net_ref[table].columns)
+        assert np.allclose(net[table].values, net_ref[table].values, equal_nan=True)
+
+
+def test_array_table():
+    table = ArrayTable(pd.Index([3, 5, 7]), ["p_mw", "q_mvar"])
+    assert table.df.isnull().all().all()
+    table["p_mw"] = [1., 2., 3.]
+    assert np.allclose(table.df.p_mw.values, [1., 2., 3.])
+    table.df.q_mvar.values[:] = 4.
+    assert np.allclose(table["q_mvar"], 4.)
+    assert table.is_valid(table.df, pd.Index([3, 5, 7]), ["p_mw", "q_mvar"])
+    assert not table.is_valid(table.df, pd.Index([3, 5]), ["p_mw", "q_mvar"])
+    # replacing a column detaches the DataFrame from the arrays
+    table.df["p_mw"] = 0.
+    assert not table.is_valid(table.df, pd.Index([3, 5, 7]), ["p_mw", "q_mvar"])
+
+
+def test_array_store():
+    net = nw.example_multivoltage()
+    net_ref = copy.deepcopy(net)
+    pp.use_array_store(net)
+    pp.runpp(net)
+    pp.runpp(net_ref)
+    _assert_results_equal(net, net_ref)
+
+    res_bus = net.res_bus
+    vm_pu = pp.get_result_arrays(net, "res_bus")["vm_pu"]
+    assert np.shares_memory(vm_pu, net.res_bus.vm_pu.values)
+
+    # the result tables are overwritten in place
+    for n in [net, net_ref]:
+        n.load.p_mw *= 1.5
+        pp.runpp(n)
+    assert net.res_bus is res_bus
+    _assert_results_equal(net, net_ref)
+
+    # new element -> new result table
+    for n in [net, net_ref]:
+        pp.create_load(n, 10, p_mw=0.1)
+        pp.runpp(n, init="results")
+        pp.runpp(n)
+    assert net.res_bus is res_bus
+    assert len(net.res_load) == len(net.load)
+    _assert_results_equal(net, net_ref)
+
+    # result tables which are replaced by the user are not used anymore
+    net.res_bus = net.res_bus.copy()
+    assert pp.get_result_arrays(net, "res_bus") is None
+    pp.runpp(net)
+    assert pp.get_result_arrays(net, "res_bus") is not None
+
+    # result tables which are shared with a cloned net are not overwritten
+    net_clone = net.clone()
+    res_bus_clone = net_clone.res_bus.copy()
+    for n in [net, net_ref]:
+        n.load.p_mw *= 0.5
+        pp.runpp(n)
+    _assert_results_equal(net, net_ref)
+    pd.testing.assert_frame_equal(net_clone.res_bus, res_bus_clone)
+
+    pp.use_array_store(net, False)
+    assert "_array_store" not in net
+    res_bus = net.res_bus
+    pp.runpp(net)
+    assert net.res_bus is not res_bus
+    _assert_results_equal(net, net_ref)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, "-xs"])
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandapower as pp
+import pandapower.networks as nw
+
+
+def _two_bus_net():
+    # the maximum power of a load behind a reactance x is v^2 / (2 * x) at a voltage of v / sqrt(2)
+    net = pp.create_empty_network(sn_mva=1.)
+    b0 = pp.create_bus(net, 110)
+    b1 = pp.create_bus(net, 110)
+    pp.create_ext_grid(net, b0)
+    pp.create_impedance(net, b0, b1, rft_pu=0., xft_pu=0.1, sn_mva=1.)
+    pp.create_load(net, b1, p_mw=1.)
+    return net
+
+
+def test_nose_point():
+    net = _two_bus_net()
+    curve = pp.runcpf(net)
+    assert curve["nose"]
+    assert np.isclose(curve["lambda_max"], 4., atol=1e-6)
+    assert np.isclose(curve["vm_pu"][-1, 1], 1 / np.sqrt(2), atol=1e-3)
+    assert curve["lambda"][0] == 0
+    # the last point is at or just behind the nose point
+    assert np.all(np.diff(curve["lambda"][:-1]) > 0)
+    assert np.all(np.diff(curve["vm_pu"][:, 1]) < 0)
+
+    # the lower part of the curve
+    curve = pp.runcpf(net, stop_at_nose=False)
+    assert curve["nose"]
+    assert curve["lambda"][-1] < 0
+    assert curve["vm_pu"][-1, 1] < 1 / np.sqrt(2)
+
+    curve = pp.runcpf(net, max_lambda=2.)
+    assert not curve["nose"]
+    assert 2. <= curve["lambda_max"] < 4.
+
+
+@pytest.mark.parametrize("numba", [True, False])
+def test_curve_points(numba):
+    net = nw.case30()
+    net.bus.loc[5, "in_service"] = False
+    curve = pp.runcpf(net, numba=numba)
+    assert curve["nose"]
+    assert np.all(np.isnan(curve["vm_pu"][:, curve["bus"] == 5]))
+
+    # the points of the curve are power flow solutions with scaled loads
+    for k in np.flatnonzero(curve["lambda"] < 0.9 * curve["lambda_max"])[-2:]:
+        net.load.scaling = 1 + curve["lambda"][k]
+        pp.runpp(net)
+        assert np.allclose(net.res_bus.vm_pu.values, curve["vm_pu"][k], equal_nan=True)
+        assert np.allclose(net.res_bus.va_degree.values, curve["va_degree"][k], equal_nan=True)
+
+
+def test_direction():
+    net = nw.case9()
+    # transfer from the gen at bus 1 to the load at bus 4
+    direction = {"load": pd.Series([2.], index=net.load.index[net.load.bus == 4]),
+                 "gen": pd.Series([1.], index=net.gen.index[net.gen.bus == 1])}
+    curve = pp.runcpf(net, direction=direction)
+    k = len(curve["lambda"]) // 2
+    lam = curve["lambda"][k]
+    net.load.loc[net.load.bus == 4, ["p_mw", "q_mvar"]] *= 1 + 2 * lam
+    net.gen.loc[net.gen.bus == 1, "p_mw"] *= 1 + lam
+    pp.runpp(net)
+    assert np.allclose(net.res_bus.vm_pu.values, curve["vm_pu"][k])
+
+    with pytest.raises(ValueError):
+        pp.runcpf(net, direction={"line": 1.})
+
+
+@pytest.mark.parametrize("parallel", [False, True, "process"])
+def test_screening(parallel):
+    net = nw.case30()
+    directions = [{"load": 1.}, {"load": pd.Series(1., index=net.load.index[:5])},
+                  {"load": 1., "gen": 1.}]
+    curves = pp.runcpf_screening(net, directions, parallel=parallel, n_jobs=2)
+    assert len(curves) == len(directions)
+    for direction, curve in zip(directions, curves):
+        curve_single = pp.runcpf(net, direction=direction)
+        assert np.allclose(curve["lambda"], curve_single["lambda"])
+        assert np.allclose(curve["vm_pu"], curve_single["vm_pu"])
+    # the nose point depends on the direction
+    assert curves[1]["lambda_max"] > curves[0]["lambda_max"]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, "-xs"])
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pandapower as pp
+import pandapower.networks
+import pandapower.topology as top
+from pandapower.pf import numba_cache
+
+pytestmark = pytest.mark.skipif(not numba_cache.numba_installed, reason="requires numba")
+
+WARMUP = "\n".join([
+    "import pandapower.pf",
+    "from pandapower.pf.numba_cache import KERNELS",
+    "pandapower.pf.warmup()",
+    "print(sum(sum(kernel.stats.cache_hits.values()) for kernel in KERNELS.values()))"])
+
+
+def _run_warmup(cache_dir):
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(cache_dir))
+    output = subprocess.check_output([sys.executable, "-c", WARMUP], universal_newlines=True,
+                                     cwd=os.path.dirname(pp.pp_dir), env=env)
+    return int(output.strip().split("\n")[-1])
+
+
+def test_warmup():
+    signatures = numba_cache.warmup()
+    for name in ["pandapower.pf.makeYbus_numba.gen_Ybus",
+                 "pandapower.pf.create_jacobian_numba.create_J",
+                 "pandapower.pf.create_jacobian_numba.create_J2",
+                 "pandapower.pf.dSbus_dV_numba.dSbus_dV_numba_sparse",
+                 "pandapower.pf.pfsoln_numba.calc_branch_flows",
+                 "pandapower.pf.bfsw_numba._sweep",
+                 "pandapower.pf.bfsw_numba._path_impedance",
+                 "pandapower.pf.fdpf_numba._mismatch"]:
+        assert signatures[name] > 0, name
+
+
+def test_topology_kernels():
+    net = pp.networks.example_multivoltage()
+    mg = top.create_nxgraph(net)
+    top.find_graph_characteristics(mg, net.ext_grid.bus, ["required_bridges", "notn1_areas"],
+                                   numba=True)
+    for name in ["_dfs_bridges", "_is_bridge", "_dfs_required_bridges"]:
+        kernel = numba_cache.KERNELS["pandapower.topology.graph_searches_numba." + name]
+        # _is_bridge is only compiled on its own if _dfs_required_bridges is not loaded from the
+        # on-disk cache
+        assert name == "_is_bridge" or len(kernel.signatures) > 0, name
+        # the graph searches are cached on disk like the power flow kernels
+        assert kernel._cache.__class__.__name__ == "FunctionCache", name
+
+
+def test_on_disk_cache(tmp_path):
+    cache_dir = tmp_path / "numba_cache"
+    assert _run_warmup(cache_dir) == 0
+    files = [f for _, _, names in os.walk(str(cache_dir)) for f in names]
+    assert any(f.endswith(".nbi") for f in files)
+    assert any(f.endswith(".nbc") for f in files)
+    # a second process loads the kernels from the cache instead of compiling them
+    assert _run_warmup(cache_dir) > 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, "-xs"])
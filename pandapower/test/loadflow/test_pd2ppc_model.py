@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+import copy
+
+import numpy as np
+import pytest
+
+import pandapower as pp
+import pandapower.networks as nw
+from pandapower.pd2ppc_model import NetworkModel, benchmark_pd2ppc
+
+
+def _assert_same_as_without_model(net, **kwargs):
+    pp.runpp(net, **kwargs)
+    net_ref = copy.deepcopy(net)
+    del net_ref["_pd2ppc_model"]
+    pp.runpp(net_ref, **kwargs)
+    assert np.allclose(net._ppc["branch"], net_ref._ppc["branch"], equal_nan=True)
+    assert np.allclose(net._ppc["bus"], net_ref._ppc["bus"], equal_nan=True)
+    for table in ["res_bus", "res_line", "res_trafo", "res_trafo3w"]:
+        assert np.allclose(net[table].values, net_ref[table].values, equal_nan=True)
+
+
+def test_network_model():
+    net = nw.example_multivoltage()
+    pp.runpp(net)
+    model = net._pd2ppc_model
+    assert isinstance(model, NetworkModel)
+    for stage in ["is_elements", "bus", "branch", "ppc2ppci"]:
+        assert stage in model.timings
+
+    # nothing changed -> the stored bus lookup and branch parameters are used
+    hits, misses = model.hits, model.misses
+    pp.runpp(net)
+    assert model.misses == misses
+    assert model.hits > hits
+
+    net.line.length_km.at[0] *= 2
+    net.trafo.tap_pos.at[0] = 2
+    _assert_same_as_without_model(net)
+
+    # changed topology
+    net.switch.closed.at[net.switch.index[net.switch.et == "b"][0]] = False
+    net.switch.closed.at[net.switch.index[net.switch.et == "l"][0]] = False
+    _assert_same_as_without_model(net)
+
+    net.bus.in_service.at[net.line.to_bus.at[1]] = False
+    _assert_same_as_without_model(net)
+
+    net.switch.z_ohm.at[net.switch.index[net.switch.et == "b"][1]] = 0.1
+    _assert_same_as_without_model(net)
+    _assert_same_as_without_model(net, trafo_model="pi", calculate_voltage_angles=True)
+
+
+def test_network_model_dc():
+    net = nw.example_simple()
+    pp.rundcpp(net)
+    hits = net._pd2ppc_model.hits
+    pp.rundcpp(net)
+    assert net._pd2ppc_model.hits > hits
+    net.trafo.tap_pos.at[0] = 3
+    pp.rundcpp(net)
+    net_ref = copy.deepcopy(net)
+    del net_ref["_pd2ppc_model"]
+    pp.rundcpp(net_ref)
+    assert np.allclose(net.res_bus.values, net_ref.res_bus.values, equal_nan=True)
+
+
+def test_benchmark_pd2ppc():
+    net = nw.example_simple()
+    timings = benchmark_pd2ppc(net, runs=3)
+    assert list(timings.columns) == [0, 1, 2]
+    for stage in ["bus", "branch", "ppc2ppci", "pd2ppc", "runpp"]:
+        assert stage in timings.index
+    assert (timings.loc["pd2ppc"] < timings.loc["runpp"]).all()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, "-xs"])
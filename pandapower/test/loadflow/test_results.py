@@ -5,9 +5,10 @@
 
 
 import pytest
-from numpy import in1d, isnan
+from numpy import allclose, in1d, isnan
 
 import pandapower as pp
+from pandapower.networks import example_multivoltage
 from pandapower.test.consistency_checks import runpp_with_consistency_checks
 from pandapower.test.loadflow.result_test_network_generator import add_test_enforce_qlims, \
     add_test_gen
@@ -557,5 +558,44 @@ def test_open(result_test_network):
 
     assert isnan(net['res_line'].at[lines.index[1], "i_ka"])
 
+
+def test_selected_results():
+    net = example_multivoltage()
+    pp.runpp(net)
+    ref = net.deepcopy()
+
+    pp.runpp(net, results={"res_bus": ["vm_pu"], "res_line": ["loading_percent"]})
+    assert allclose(net.res_bus.vm_pu, ref.res_bus.vm_pu)
+    assert allclose(net.res_bus.va_degree, ref.res_bus.va_degree)
+    assert allclose(net.res_line.loading_percent, ref.res_line.loading_percent)
+    assert allclose(net.res_line.p_from_mw, ref.res_line.p_from_mw)
+    assert net.res_trafo.p_hv_mw.isnull().all()
+    assert net.res_ext_grid.p_mw.isnull().all()
+
+    # voltages only: the branch flows are not calculated
+    pp.runpp(net, results={"res_bus": ["vm_pu"], "res_load": None})
+    assert allclose(net.res_bus.vm_pu, ref.res_bus.vm_pu)
+    assert allclose(net.res_load.p_mw, ref.res_load.p_mw)
+    assert net.res_line.loading_percent.isnull().all()
+    assert net.res_bus.p_mw.isnull().all()
+
+    pp.runpp(net)
+    assert allclose(net.res_trafo.p_hv_mw, ref.res_trafo.p_hv_mw)
+    assert allclose(net.res_bus.p_mw, ref.res_bus.p_mw)
+
+
+def test_selected_results_invalid():
+    net = example_multivoltage()
+    with pytest.raises(ValueError):
+        pp.runpp(net, results={"res_cable": None})
+    # res_switch is only created for switches with an impedance, it can't be selected
+    with pytest.raises(ValueError):
+        pp.runpp(net, results={"res_switch": None})
+    with pytest.raises(ValueError):
+        pp.runpp(net, results={"res_line": ["loading"]})
+    with pytest.raises(ValueError):
+        pp.runpp(net, results=["res_line"])
+
+
 if __name__ == "__main__":
     pytest.main(["-xs"])
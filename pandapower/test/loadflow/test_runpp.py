@@ -10,19 +10,25 @@ import os
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.sparse import csr_matrix
 
 import pandapower as pp
 from pandapower.auxiliary import _check_connectivity, _add_ppc_options, lightsim2grid_available
 from pandapower.networks import create_cigre_network_mv, four_loads_with_branches_out, \
-    example_simple, simple_four_bus_system, example_multivoltage
+    example_simple, simple_four_bus_system, example_multivoltage, case30, case118, \
+    create_cigre_network_lv, case_illinois200, case9241pegase
 from pandapower.pd2ppc import _pd2ppc
+from pandapower.pf import run_newton_raphson_pf
 from pandapower.pf.create_jacobian import _create_J_without_numba
 from pandapower.pf.run_newton_raphson_pf import _get_pf_variables_from_ppci
 from pandapower.powerflow import LoadflowNotConverged
+from pandapower.pypower.makeSbus import _get_zip_coefficients
+from pandapower.pypower.newtonpf import _switch_q_lims, _add_zip_derivatives
 from pandapower.test.consistency_checks import runpp_with_consistency_checks
 from pandapower.test.loadflow.result_test_network_generator import add_test_xward, add_test_trafo3w, \
     add_test_line, add_test_oos_bus_with_is_element, result_test_network_generator, add_test_trafo
-from pandapower.test.toolbox import add_grid_connection, create_test_line, assert_net_equal
+from pandapower.test.toolbox import add_grid_connection, create_test_line, assert_net_equal, \
+    assert_res_equal
 from pandapower.toolbox import nets_equal
 
 
@@ -359,6 +365,87 @@ def test_connectivity_check_island_without_pv_bus():
     runpp_with_consistency_checks(net, check_connectivity=True)
 
 
+def test_connectivity_check_islands_and_cache():
+    net = create_cigre_network_mv(with_der=False)
+    # second energized island with its own ext_grid and an isolated island without slack
+    b1 = pp.create_bus(net, vn_kv=20.)
+    b2 = pp.create_bus(net, vn_kv=20.)
+    pp.create_ext_grid(net, b1)
+    pp.create_line(net, b1, b2, length_km=1, std_type="NA2XS2Y 1x185 RM/25 12/20 kV")
+    pp.create_load(net, b2, p_mw=0.1)
+    b3 = pp.create_bus(net, vn_kv=20.)
+    b4 = pp.create_bus(net, vn_kv=20.)
+    pp.create_line(net, b3, b4, length_km=1, std_type="NA2XS2Y 1x185 RM/25 12/20 kV")
+
+    pp.runpp(net)
+    lookup = net._pd2ppc_lookups["bus"]
+    # island labels of the ppci buses
+    bus_island = net._ppc["internal"]["bus_island"]
+    assert len(bus_island) == net._ppc["internal"]["Ybus"].shape[0]
+    assert set(bus_island) == {0, 1}
+    assert bus_island[lookup[b1]] == bus_island[lookup[b2]]
+    assert bus_island[lookup[b1]] != bus_island[lookup[net.ext_grid.bus.at[0]]]
+    # isolated buses are not in the ppci
+    assert lookup[b3] >= len(bus_island) and lookup[b4] >= len(bus_island)
+
+    # the connectivity result is reused if the topology does not change
+    cached = net._connectivity_cache["bus_island"]
+    net.load.p_mw *= 1.1
+    pp.runpp(net)
+    assert net._connectivity_cache["bus_island"] is cached
+    res_bus = net.res_bus.copy()
+
+    # changing the topology leads to a new connectivity check
+    pp.create_line(net, b2, b3, length_km=1, std_type="NA2XS2Y 1x185 RM/25 12/20 kV")
+    pp.runpp(net)
+    assert net._connectivity_cache["bus_island"] is not cached
+    assert not net.res_bus.vm_pu.loc[[b3, b4]].isnull().any()
+    assert np.allclose(net.res_bus.vm_pu.loc[res_bus.index[res_bus.vm_pu.notnull()]].values,
+                       res_bus.vm_pu.dropna().values, atol=1e-3)
+
+
+@pytest.mark.parametrize("parallel_islands", [True, "process"])
+def test_parallel_islands(parallel_islands):
+    net = create_cigre_network_mv(with_der="pv_wind")
+    # second island with own ext_grid, island consisting of an ext_grid bus only, unsupplied island
+    b1 = pp.create_bus(net, vn_kv=20.)
+    b2 = pp.create_bus(net, vn_kv=20.)
+    pp.create_ext_grid(net, b1)
+    pp.create_line(net, b1, b2, length_km=1, std_type="NA2XS2Y 1x185 RM/25 12/20 kV")
+    pp.create_load(net, b2, p_mw=0.1)
+    b3 = pp.create_bus(net, vn_kv=20.)
+    pp.create_ext_grid(net, b3)
+    b4 = pp.create_bus(net, vn_kv=20.)
+    b5 = pp.create_bus(net, vn_kv=20.)
+    pp.create_line(net, b4, b5, length_km=1, std_type="NA2XS2Y 1x185 RM/25 12/20 kV")
+    pp.create_gen(net, 5, p_mw=1, vm_pu=1.01, max_q_mvar=0.1, min_q_mvar=-0.1)
+
+    for kwargs in [dict(), dict(enforce_q_lims=True), dict(init="dc")]:
+        pp.runpp(net, **kwargs)
+        net_ref = copy.deepcopy(net)
+        Ybus = net._ppc["internal"]["Ybus"]
+        for n_jobs in [None, 1]:
+            pp.runpp(net, parallel_islands=parallel_islands, n_jobs=n_jobs, **kwargs)
+            assert net.converged
+            assert_res_equal(net, net_ref, atol=1e-8)
+            assert abs(net._ppc["internal"]["Ybus"] - Ybus).max() < 1e-10
+            # each island has its own convergence check
+            island_iterations = net._ppc["internal"]["island_iterations"]
+            assert len(island_iterations) == 3
+            assert net._ppc["iterations"] == max(island_iterations)
+            assert min(island_iterations) < max(island_iterations)
+
+    # recycle uses the internal variables of the whole grid
+    net.load.p_mw *= 1.1
+    pp.runpp(net)
+    net_ref = copy.deepcopy(net)
+    net.load.p_mw /= 1.1
+    pp.runpp(net, parallel_islands=parallel_islands)
+    net.load.p_mw *= 1.1
+    pp.runpp(net, recycle=dict(trafo=False, gen=False, bus_pq=True))
+    assert_res_equal(net, net_ref, atol=1e-8)
+
+
 def test_connectivity_check_island_with_one_pv_bus():
     # Network with islands with one PV bus -> PV bus should be converted to the reference bus
     net = create_cigre_network_mv(with_der=False)
@@ -495,7 +582,6 @@ def test_bsfw_algorithm():
     assert np.allclose(va_nr, va_alg)
 
 
-@pytest.mark.xfail(reason="unknown")
 def test_bsfw_algorithm_multi_net():
     net = example_simple()
     add_grid_connection(net, vn_kv=110., zone="second")
@@ -562,6 +648,263 @@ def test_bsfw_algorithm_with_branch_loops():
     assert np.allclose(va_nr, va_alg)
 
 
+@pytest.mark.parametrize("numba", [True, False])
+def test_bsfw_algorithm_numba(numba):
+    net = example_simple()
+    pp.create_line(net, 0, 6, length_km=2.5,
+                   std_type="NA2XS2Y 1x240 RM/25 12/20 kV", name="Line meshed")
+    net.switch.loc[:, "closed"] = True
+    net.gen["max_q_mvar"] = [5.]
+    net.gen["min_q_mvar"] = [4.]
+
+    pp.runpp(net, enforce_q_lims=True)
+    vm_nr = net.res_bus.vm_pu.copy()
+    va_nr = net.res_bus.va_degree.copy()
+
+    pp.runpp(net, algorithm='bfsw', enforce_q_lims=True, numba=numba)
+    assert np.allclose(vm_nr, net.res_bus.vm_pu)
+    assert np.allclose(va_nr, net.res_bus.va_degree)
+
+
+def test_bsfw_algorithm_parallel_branches():
+    net = example_simple()
+    pp.create_line(net, 0, 6, length_km=2.5,
+                   std_type="NA2XS2Y 1x240 RM/25 12/20 kV", name="Line meshed")
+    pp.create_line(net, 5, 6, length_km=1.5,
+                   std_type="NA2XS2Y 1x240 RM/25 12/20 kV", name="Line parallel")
+    net.switch.loc[:, "closed"] = True
+
+    pp.runpp(net)
+    vm_nr = net.res_bus.vm_pu.copy()
+    va_nr = net.res_bus.va_degree.copy()
+
+    pp.runpp(net, algorithm='bfsw')
+    assert np.allclose(vm_nr, net.res_bus.vm_pu)
+    assert np.allclose(va_nr, net.res_bus.va_degree)
+
+
+def test_bsfw_ordering_cache():
+    net = example_simple()
+    pp.runpp(net, algorithm='bfsw')
+    ordering = net._bfsw_cache["ordering"]
+
+    net.load.p_mw *= 2
+    pp.runpp(net, algorithm='bfsw')
+    assert net._bfsw_cache["ordering"] is ordering
+    vm_bfsw = net.res_bus.vm_pu.copy()
+    pp.runpp(net)
+    assert np.allclose(vm_bfsw, net.res_bus.vm_pu)
+
+    # a change of the topology creates a new ordering
+    net.switch.loc[:, "closed"] = True
+    pp.runpp(net, algorithm='bfsw')
+    assert net._bfsw_cache["ordering"] is not ordering
+
+
+@pytest.mark.parametrize("numba", [True, False])
+def test_fdpf_factorization_cache(numba):
+    net = case30()
+    pp.runpp(net)
+    vm_nr = net.res_bus.vm_pu.values.copy()
+    for algorithm in ["fdbx", "fdxb"]:
+        pp.runpp(net, algorithm=algorithm, numba=numba)
+        assert np.allclose(net.res_bus.vm_pu.values, vm_nr)
+        factorizations = net._fdpf_cache["factorizations"]
+
+        # the factorizations of B' and B'' are reused while the branch parameters are unchanged
+        net.load.p_mw *= 1.1
+        pp.runpp(net, algorithm=algorithm, numba=numba)
+        assert net._fdpf_cache["factorizations"] is factorizations
+        vm_fdpf = net.res_bus.vm_pu.values.copy()
+        pp.runpp(net)
+        assert np.allclose(vm_fdpf, net.res_bus.vm_pu.values)
+        net.load.p_mw /= 1.1
+
+        net.line.loc[0, "length_km"] *= 2
+        pp.runpp(net, algorithm=algorithm, numba=numba)
+        assert net._fdpf_cache["factorizations"] is not factorizations
+        net.line.loc[0, "length_km"] /= 2
+        pp.runpp(net)
+
+
+def test_fdpf_copy_and_pickle(tmp_path):
+    net = case30()
+    pp.runpp(net, algorithm="fdbx")
+    vm_pu = net.res_bus.vm_pu.values.copy()
+    filename = os.path.join(str(tmp_path), "net.p")
+    pp.to_pickle(net, filename)
+    # the factorizations of B' and B'' are copied with the net and can be reused by the copies
+    for net_copy in [copy.deepcopy(net), net.deepcopy(), pp.from_pickle(filename)]:
+        assert "factorizations" in net_copy._fdpf_cache
+        pp.runpp(net_copy, algorithm="fdbx")
+        assert np.allclose(net_copy.res_bus.vm_pu.values, vm_pu)
+
+
+@pytest.mark.parametrize("damping", ["line_search", "trust_region"])
+def test_nr_damping(damping):
+    net = case118()
+    pp.runpp(net)
+    vm_nr = net.res_bus.vm_pu.values.copy()
+    va_nr = net.res_bus.va_degree.values.copy()
+    iterations = net._ppc["iterations"]
+
+    # full newton steps are not reduced as long as the mismatch decreases
+    pp.runpp(net, damping=damping)
+    assert net._ppc["iterations"] == iterations
+    assert np.allclose(net.res_bus.vm_pu.values, vm_nr)
+    assert np.allclose(net.res_bus.va_degree.values, va_nr)
+
+    # the mismatch norm and the elapsed time of each iteration are recorded
+    F_norm_it = net._ppc["internal"]["F_norm_it"]
+    assert len(F_norm_it) == len(net._ppc["internal"]["et_it"]) == iterations + 1
+    assert F_norm_it[-1] < 1e-8 < F_norm_it[0]
+    assert np.all(np.diff(net._ppc["internal"]["et_it"]) >= 0)
+
+    # with a bad initial voltage, the undamped power flow does not converge
+    with pytest.raises(LoadflowNotConverged):
+        pp.runpp(net, init_vm_pu=2., init_va_degree=0., max_iteration=30)
+    if damping == "trust_region":
+        pp.runpp(net, init_vm_pu=2., init_va_degree=0., max_iteration=30, damping=damping)
+        assert np.allclose(net.res_bus.vm_pu.values, vm_nr)
+        assert np.allclose(net.res_bus.va_degree.values, va_nr)
+
+    # the voltage dependent loads are considered in the damped steps
+    net.load["const_z_percent"] = 50
+    pp.runpp(net, enforce_q_lims=True, voltage_depend_loads=True)
+    iterations = net._ppc["iterations"]
+    vm = net.res_bus.vm_pu.values.copy()
+    q_gen = net.res_gen.q_mvar.values.copy()
+    pp.runpp(net, enforce_q_lims=True, voltage_depend_loads=True, damping=damping)
+    assert net._ppc["iterations"] == iterations
+    assert np.allclose(net.res_bus.vm_pu.values, vm)
+    assert np.allclose(net.res_gen.q_mvar.values, q_gen, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        pp.runpp(net, damping="newton")
+
+
+def test_nr_abort_on_divergence():
+    net = case30()
+    # no power flow solution exists beyond the nose point of the PV curve
+    net.load.scaling = 5.
+    with pytest.raises(LoadflowNotConverged, match="did not converge"):
+        pp.runpp(net, max_iteration=50)
+    assert net._ppc["iterations"] == 50
+    assert not net._ppc["internal"]["diverged"]
+
+    with pytest.raises(LoadflowNotConverged, match="diverged"):
+        pp.runpp(net, max_iteration=50, abort_on_divergence=True)
+    assert net._ppc["iterations"] < 10
+    assert net._ppc["internal"]["diverged"]
+    assert len(net._ppc["internal"]["F_norm_it"]) == net._ppc["iterations"] + 1
+
+    # converging power flows are not affected
+    net.load.scaling = 1.
+    pp.runpp(net, abort_on_divergence=True)
+    assert not net._ppc["internal"]["diverged"]
+
+
+@pytest.mark.parametrize("numba", [True, False])
+def test_q_lims_in_newton(numba):
+    net = case118()
+    pp.runpp(net, numba=numba)
+    iterations = net._ppc["iterations"]
+    gen_buses = net._pd2ppc_lookups["bus"][net.gen.bus.values]
+    assert np.any(net.res_gen.q_mvar.values > net.gen.max_q_mvar.values + 1e-3)
+
+    # the gen buses are switched to pq buses in the newton iterations
+    pp.runpp(net, enforce_q_lims=True, numba=numba)
+    assert net._ppc["iterations"] <= 2 * iterations
+    assert np.all(net.res_gen.q_mvar.values <= net.gen.max_q_mvar.values + 1e-6)
+    assert np.all(net.res_gen.q_mvar.values >= net.gen.min_q_mvar.values - 1e-6)
+    at_lim = np.isin(gen_buses, net._ppc["internal"]["pq"])
+    assert np.any(at_lim)
+    assert np.allclose(net.res_gen.vm_pu.values[~at_lim], net.gen.vm_pu.values[~at_lim])
+    vm = net.res_bus.vm_pu.values.copy()
+    q_gen = net.res_gen.q_mvar.values.copy()
+
+    # the fast-decoupled power flow repeats the power flow for the q limits
+    pp.runpp(net, enforce_q_lims=True, algorithm="fdbx", max_iteration=100)
+    assert np.allclose(net.res_bus.vm_pu.values, vm)
+    assert np.allclose(net.res_gen.q_mvar.values, q_gen, atol=1e-5)
+
+    # with enforce_q_lims=2, only the largest violation is fixed in each power flow
+    pp.runpp(net, enforce_q_lims=2, numba=numba)
+    assert np.allclose(net.res_bus.vm_pu.values, vm)
+    assert np.allclose(net.res_gen.q_mvar.values, q_gen, atol=1e-5)
+
+
+def test_q_lims_in_newton_fallback():
+    # the bus type switching needs more than max_iteration iterations, the q limits are
+    # enforced by the outer loop instead
+    net = case_illinois200()
+    pp.runpp(net, enforce_q_lims=True)
+    assert net.converged
+    assert np.all(net.res_gen.q_mvar.values <= net.gen.max_q_mvar.values + 1e-6)
+    assert np.all(net.res_gen.q_mvar.values >= net.gen.min_q_mvar.values - 1e-6)
+
+
+def test_q_lims_with_voltage_depend_loads():
+    # the generators are either at their reactive power limit or at their voltage setpoint
+    net = case118()
+    net.load["const_z_percent"] = 40
+    net.load["const_i_percent"] = 30
+    pp.runpp(net, enforce_q_lims=True)
+    q_gen = net.res_gen.q_mvar.values
+    at_lim = np.isclose(q_gen, net.gen.max_q_mvar.values, atol=1e-3) | \
+        np.isclose(q_gen, net.gen.min_q_mvar.values, atol=1e-3)
+    assert np.any(at_lim)
+    assert np.allclose(net.res_gen.vm_pu.values[~at_lim], net.gen.vm_pu.values[~at_lim])
+    assert np.all(q_gen <= net.gen.max_q_mvar.values + 1e-3)
+    assert np.all(q_gen >= net.gen.min_q_mvar.values - 1e-3)
+    p_slack = net.res_ext_grid.p_mw.values.copy()
+
+    pp.runpp(net, enforce_q_lims=2)
+    assert np.allclose(net.res_ext_grid.p_mw.values, p_slack)
+    assert np.allclose(net.res_gen.q_mvar.values, q_gen, atol=1e-5)
+
+
+@pytest.mark.slow
+def test_q_lims_in_newton_vs_outer_loop(monkeypatch):
+    def gens_at_min_below_setpoint(net):
+        gen_vm = net.res_bus.vm_pu.loc[net.gen.bus].values
+        at_min = np.isclose(net.res_gen.q_mvar.values, net.gen.min_q_mvar.values)
+        return np.sum(at_min & (gen_vm < net.gen.vm_pu.values - 1e-6))
+
+    net = case9241pegase()
+    pp.runpp(net, enforce_q_lims=True)
+    assert gens_at_min_below_setpoint(net) == 0
+    vm = net.res_bus.vm_pu.values.copy()
+    q_gen = net.res_gen.q_mvar.values.copy()
+
+    # the outer loop keeps one generator at its lower limit although its voltage is below the
+    # setpoint, the newton iterations switch it back to a pv bus. The results differ accordingly
+    monkeypatch.setattr(run_newton_raphson_pf, "_run_ac_pf_with_qlims_in_newton",
+                        run_newton_raphson_pf._run_ac_pf_with_qlims_enforced)
+    pp.runpp(net, enforce_q_lims=True)
+    assert gens_at_min_below_setpoint(net) == 1
+    assert np.allclose(net.res_bus.vm_pu.values, vm, atol=1e-4)
+    assert np.allclose(net.res_gen.q_mvar.values, q_gen, atol=5)
+
+
+def test_switch_q_lims():
+    # two buses connected by a reactance of 0.1 p.u., the pv bus 1 has no reactive power injection
+    Ybus = csr_matrix(np.array([[-10j, 10j], [10j, -10j]]))
+    Sbus = np.zeros(2, dtype=complex)
+    pv = np.array([1])
+    Vm_set = np.ones(2)
+    q_lims = {"dq_max": np.array([0., -0.5]), "dq_min": np.array([0., -1.]),
+              "at_lim": np.zeros(2, dtype=int)}
+    to_pv = _switch_q_lims(Ybus, np.ones(2, dtype=complex), Sbus, pv, Vm_set, q_lims)
+    assert len(to_pv) == 0
+    assert q_lims["at_lim"][1] == 1
+    # no switching while the voltage is below the setpoint
+    assert _switch_q_lims(Ybus, np.array([1., 0.99]), Sbus, pv, Vm_set, q_lims) is None
+    # the bus is switched back to a pv bus if the voltage exceeds the setpoint at the upper limit
+    to_pv = _switch_q_lims(Ybus, np.array([1., 1.01]), Sbus, pv, Vm_set, q_lims)
+    assert np.array_equal(to_pv, pv)
+    assert q_lims["at_lim"][1] == 0
+
 @pytest.mark.slow
 def test_pypower_algorithms_iter():
     alg_to_test = ['fdbx', 'fdxb', 'gs']
@@ -735,6 +1078,43 @@ def test_zip_loads_with_voltage_angles():
     assert np.allclose(net.res_load.values, res_load.values)
 
 
+@pytest.mark.parametrize("numba", [True, False])
+def test_zip_loads_jacobian(numba):
+    net = create_cigre_network_lv()
+    net.load['const_i_percent'] = 30
+    net.load['const_z_percent'] = 50
+    pp.runpp(net, numba=numba)
+    iterations = net._ppc["iterations"]
+
+    # with the derivatives of the voltage dependent loads in the jacobian, the number of
+    # iterations is the same as with constant power loads
+    pp.runpp(net, voltage_depend_loads=True, numba=numba)
+    assert net._ppc["iterations"] == iterations
+    vm = net.res_bus.vm_pu.loc[net.load.bus].values
+    assert np.allclose(net.res_load.p_mw, net.load.p_mw * (0.2 + 0.3 * vm + 0.5 * vm ** 2))
+
+    # the jacobian matches the finite differences of the mismatch
+    ppci = net._ppc["internal"]
+    Ybus, V, pv, pq = ppci["Ybus"], ppci["V"], ppci["pv"], ppci["pq"]
+    Si, Sz = _get_zip_coefficients(ppci["baseMVA"], ppci["bus"])
+    pvpq = np.r_[pv, pq]
+    Vm = abs(V)
+
+    def mismatch(Vm):
+        V_ = Vm * np.exp(1j * np.angle(V))
+        mis = V_ * np.conj(Ybus * V_) - (ppci["Sbus"] + Si * (Vm - 1) + Sz * (Vm ** 2 - 1))
+        return np.r_[mis[pvpq].real, mis[pq].imag]
+
+    J = _create_J_without_numba(Ybus, V, pvpq, pq)
+    J = _add_zip_derivatives(J, Si[pq] + 2 * Sz[pq] * Vm[pq], len(pv), len(pq)).toarray()
+    eps = 1e-7
+    for k, b in enumerate(pq):
+        dVm = np.zeros(len(V))
+        dVm[b] = eps
+        dF = (mismatch(Vm + dVm) - mismatch(Vm - dVm)) / (2 * eps)
+        assert np.allclose(J[:, len(pvpq) + k], dF, atol=1e-5)
+
+
 def test_xward_buses():
     """
     Issue: xward elements create dummy buses for the load flow, that are cleaned up afterwards.
@@ -418,5 +418,30 @@ def test_3ph_isolated_nodes():
                        "p_c_mw", "q_c_mvar"]], 0.0)
 
 
+def test_sparse_sequence_solves():
+    from scipy.sparse import csr_matrix
+    from pandapower.auxiliary import factorize_Y, V_from_I, I_from_V, I0_from_V012, \
+        I1_from_V012, I2_from_V012
+    y = np.array([[2. - 4.j, -1. + 2.j, 0.],
+                  [-1. + 2.j, 3. - 6.j, -1. + 2.j],
+                  [0., -1. + 2.j, 2. - 4.j]])
+    v012 = np.array([[0.01 + 0.j, 0.02 - 0.01j, 0.],
+                     [1. + 0.j, 0.98 - 0.02j, 0.97 - 0.03j],
+                     [0.001j, 0.02 + 0.j, 0.01 - 0.01j]])
+    y_sparse = csr_matrix(y)
+    for func in [I0_from_V012, I1_from_V012, I2_from_V012]:
+        # same results as with the dense matrix which was used before
+        i_dense, i_sparse = func(v012, y_sparse.todense()), func(v012, y_sparse)
+        assert i_sparse.shape == i_dense.shape
+        assert np.allclose(i_sparse, i_dense)
+    assert np.allclose(I_from_V(y_sparse, v012.T), I_from_V(y, v012.T))
+    i = v012[1, :]
+    assert np.allclose(V_from_I(factorize_Y(y_sparse), i), V_from_I(y_sparse, i))
+    assert np.allclose(y.dot(V_from_I(factorize_Y(y_sparse), i)), i)
+    # singular matrices are not factorized
+    y_singular = csr_matrix(np.zeros((3, 3)))
+    assert factorize_Y(y_singular) is y_singular
+
+
 if __name__ == "__main__":
     pytest.main(["test_runpp_3ph.py"])
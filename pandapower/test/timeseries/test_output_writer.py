@@ -90,6 +90,39 @@ def test_output_writer_with_timesteps_set(simple_test_net):
     assert len(ow.output["res_line.i_ka"]) == n_timesteps
 
 
+def test_output_writer_sql(simple_test_net, tmp_path):
+    net = simple_test_net
+    n_timesteps = 10
+    profiles, ds = create_data_source(n_timesteps)
+    ConstControl(net, element='load', variable='p_mw', element_index=[0, 1, 2],
+                 data_source=ds, profile_name=["load1", "load2_mv_p", "load3_hv_p"])
+
+    time_steps = range(0, n_timesteps)
+    ow = OutputWriter(net, time_steps, output_path=str(tmp_path), output_file_type=".sqlite",
+                      batch_size=3)
+    ow.log_variable('res_line', 'i_ka')
+    ow.log_variable('res_line', 'loading_percent', eval_function=np.max, eval_name="max_loading")
+    run_timeseries(net, time_steps, verbose=False)
+    filename = os.path.join(str(tmp_path), "results.sqlite")
+    output = ts.read_sql_output(filename)
+    assert sorted(output.keys()) == sorted(ow.output.keys())
+    for name in ["res_bus.vm_pu", "res_line.i_ka", "res_line.loading_percent"]:
+        pd.testing.assert_frame_equal(output[name], ow.output[name], check_dtype=False)
+    assert not output["Parameters"]["powerflow_failed"].any()
+
+    # read a bounded time range of selected elements only
+    output = ts.read_sql_output(filename, names=["res_bus.vm_pu"], start=4, stop=7, columns=[1, 3])
+    assert list(output.keys()) == ["res_bus.vm_pu"]
+    pd.testing.assert_frame_equal(output["res_bus.vm_pu"],
+                                  ow.output["res_bus.vm_pu"].loc[4:7, [1, 3]], check_dtype=False)
+
+    # a new time series simulation replaces the results
+    run_timeseries(net, range(2), verbose=False)
+    assert len(ts.read_sql_output(filename)["res_bus.vm_pu"]) == 2
+    with pytest.raises(ValueError):
+        ts.read_sql_output(filename, names=["res_trafo.loading_percent"])
+
+
 def test_output_writer_without_timesteps_set(simple_test_net):
     net = simple_test_net
     n_timesteps = 5
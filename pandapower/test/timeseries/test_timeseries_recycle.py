@@ -133,6 +133,83 @@ def test_const_pq(simple_test_net):
     assert np.allclose(ll, ow.output["res_line.loading_percent"])
 
 
+def test_const_pq_bfsw(simple_test_net):
+    # only the Newton-Raphson power flow is recycled, bfsw reuses the bus ordering
+    net = simple_test_net
+    _, ds = create_data_source(n_timesteps)
+    add_const(net, ds, recycle=None)
+    ow = OutputWriter(net, output_path=tempfile.gettempdir(), output_file_type=".json")
+    run_timeseries(net, time_steps, algorithm="bfsw", verbose=False)
+    assert "ordering" in net._bfsw_cache
+    vm_pu = copy.deepcopy(ow.output["res_bus.vm_pu"])
+    net.output_writer.drop(index=net.output_writer.index, inplace=True)
+    del ow
+
+    ow = _run_normal(net)
+    assert np.allclose(vm_pu, ow.output["res_bus.vm_pu"])
+
+
+@pytest.mark.parametrize("algorithm", ["fdbx", "fdxb"])
+def test_const_pq_fdpf(simple_test_net, algorithm):
+    # the fast-decoupled power flow is recycled and reuses the factorizations of B' and B''
+    net = simple_test_net
+    _, ds = create_data_source(n_timesteps)
+    add_const(net, ds, recycle=None)
+    ow = OutputWriter(net, output_path=tempfile.gettempdir(), output_file_type=".json")
+    # the fast-decoupled power flow needs many iterations due to the trafo3w of the test net
+    run_timeseries(net, time_steps, algorithm=algorithm, max_iteration=200, verbose=False)
+    assert "factorizations" in net._fdpf_cache
+    vm_pu = copy.deepcopy(ow.output["res_bus.vm_pu"])
+    ll = copy.deepcopy(ow.output["res_line.loading_percent"])
+    net.output_writer.drop(index=net.output_writer.index, inplace=True)
+    del ow
+
+    ow = _run_normal(net)
+    assert np.allclose(vm_pu, ow.output["res_bus.vm_pu"])
+    assert np.allclose(ll, ow.output["res_line.loading_percent"])
+
+
+def test_const_pq_bfsw_batch(simple_test_net):
+    # all time steps are calculated at once by the batched backward/forward sweep
+    net = simple_test_net
+    _, ds = create_data_source(n_timesteps)
+    add_const(net, ds, recycle=None)
+    ow = OutputWriter(net, output_path=tempfile.gettempdir(), output_file_type=".json")
+    run_timeseries(net, time_steps, algorithm="bfsw", batch=True, verbose=False)
+    vm_pu = copy.deepcopy(ow.output["res_bus.vm_pu"])
+    # the results of the first time step remain in the net
+    assert np.allclose(net.res_bus.vm_pu.values, vm_pu.values[0])
+    ll = copy.deepcopy(ow.output["res_line.loading_percent"])
+    net.output_writer.drop(index=net.output_writer.index, inplace=True)
+    del ow
+
+    ow = _run_normal(net)
+    assert np.allclose(vm_pu, ow.output["res_bus.vm_pu"])
+    assert np.allclose(ll, ow.output["res_line.loading_percent"])
+
+
+def test_const_pq_bfsw_batch_fallback(simple_test_net):
+    # a controller of the ext_grid voltage can not be batched, the time steps are calculated one
+    # after another
+    net = simple_test_net
+    profiles, _ = create_data_source(n_timesteps)
+    profiles['ext_grid'] = np.ones(n_timesteps) + np.arange(0, n_timesteps) * 1e-2
+    ds = DFData(profiles)
+    add_const(net, ds, recycle=None)
+    add_const(net, ds, recycle=None, profile_name="ext_grid", variable="vm_pu", element_index=0,
+              element="ext_grid")
+    ow = OutputWriter(net, output_path=tempfile.gettempdir(), output_file_type=".json")
+    run_timeseries(net, time_steps, algorithm="bfsw", batch=True, verbose=False)
+    vm_pu = copy.deepcopy(ow.output["res_bus.vm_pu"])
+    assert np.allclose(net.res_bus.vm_pu.values, vm_pu.values[-1])
+    net.output_writer.drop(index=net.output_writer.index, inplace=True)
+    del ow
+
+    ow = _run_normal(net)
+    assert np.allclose(vm_pu, ow.output["res_bus.vm_pu"])
+    assert np.allclose(vm_pu.values[:, 0], profiles["ext_grid"])
+
+
 def test_const_gen(simple_test_net):
     # allows to use recycle = {"gen"} and fast output read
     net = simple_test_net
@@ -249,5 +326,38 @@ def test_const_pq_out_of_service(simple_test_net):
     assert np.allclose(ll.loc[:, in_service], ow.output["res_line.loading_percent"].loc[:, in_service])
 
 
+def _run_3ph(recycle):
+    import pandas as pd
+    import pandapower.networks as nw
+    net = nw.ieee_european_lv_asymmetric("on_peak_566")
+    loads = net.asymmetric_load.index[:5]
+    profiles = pd.DataFrame(np.outer(np.linspace(0.5, 2., n_timesteps),
+                                     net.asymmetric_load.p_a_mw.loc[loads].values), columns=loads)
+    ConstControl(net, element="asymmetric_load", variable="p_a_mw", element_index=loads,
+                 data_source=DFData(profiles), profile_name=loads, recycle=recycle)
+    ow = OutputWriter(net, output_path=tempfile.gettempdir(), output_file_type=".json",
+                      log_variables=list())
+    ow.log_variable('res_bus_3ph', 'vm_a_pu')
+    ow.log_variable('res_line_3ph', 'i_a_from_ka')
+    run_timeseries(net, time_steps, run=pp.runpp_3ph, verbose=False)
+    return net, ow.output["res_bus_3ph.vm_a_pu"], ow.output["res_line_3ph.i_a_from_ka"]
+
+
+def test_const_pq_3ph():
+    net, vm_pu, i_ka = _run_3ph(recycle=True)
+    assert "load_mapping" in net._ppc1["internal"]
+    assert not np.allclose(vm_pu.iloc[0], vm_pu.iloc[-1])
+
+    # calculate the same results without recycle
+    _, vm_pu_normal, i_ka_normal = _run_3ph(recycle=False)
+    assert np.allclose(vm_pu, vm_pu_normal, atol=1e-5)
+    assert np.allclose(i_ka, i_ka_normal, atol=1e-5)
+
+    # the stored factorizations are copied without the scipy objects and calculated again
+    net_copy = copy.deepcopy(net)
+    pp.runpp_3ph(net_copy, recycle=dict(trafo=False, gen=False, bus_pq=True))
+    assert np.allclose(net_copy.res_bus_3ph.vm_a_pu, net.res_bus_3ph.vm_a_pu, atol=1e-5)
+
+
 if __name__ == "__main__":
     pytest.main(['-s', __file__])
@@ -15,7 +15,8 @@ from pandapower.test.loadflow.result_test_network_generator import add_test_traf
     add_test_impedance, \
     add_test_bus_bus_switch
 from pandapower.test.loadflow.test_scenarios import network_with_trafo3ws
-from pandapower.topology import create_nxgraph
+import pandapower.networks as nw
+from pandapower.topology import create_nxgraph, get_cached_nxgraph, get_topology_cache
 from pandapower.topology.create_graph import graph_tool_available
 
 
@@ -264,5 +265,53 @@ def test_nogo_graph_tool():
     assert set(mg.nodes()) == set(net.bus.index) - {0}
 
 
+def _assert_same_graph(mg1, mg2):
+    assert set(mg1.nodes()) == set(mg2.nodes())
+    assert sorted((min(f, t), max(f, t), k) for f, t, k in mg1.edges(keys=True)) == \
+        sorted((min(f, t), max(f, t), k) for f, t, k in mg2.edges(keys=True))
+
+
+def test_cached_graph():
+    net = nw.example_multivoltage()
+    cache = get_topology_cache(net)
+    mg = get_cached_nxgraph(net)
+    _assert_same_graph(mg, create_nxgraph(net))
+    assert cache.n_builds == 1
+
+    # nothing changed -> the same graph is returned
+    assert get_cached_nxgraph(net) is mg
+    assert cache.n_builds == 1 and cache.n_updates == 0
+
+    # switch positions and in_service flags are patched into the cached graph
+    np.random.seed(1)
+    for _ in range(5):
+        net.switch.closed = np.random.rand(len(net.switch)) > 0.3
+        net.line.in_service = np.random.rand(len(net.line)) > 0.2
+        net.bus.in_service = np.random.rand(len(net.bus)) > 0.1
+        net.trafo3w.in_service = np.random.rand(len(net.trafo3w)) > 0.5
+        for kwargs in [dict(), dict(respect_switches=False), dict(include_out_of_service=True),
+                       dict(calc_branch_impedances=True)]:
+            _assert_same_graph(get_cached_nxgraph(net, **kwargs), create_nxgraph(net, **kwargs))
+    assert cache.n_builds == 4
+    assert cache.n_updates > 0
+
+    # structural changes lead to a rebuild
+    net.line.length_km.iat[0] *= 2
+    mg = get_cached_nxgraph(net)
+    f, t = net.line.from_bus.iat[0], net.line.to_bus.iat[0]
+    if mg.has_edge(f, t, key=("line", net.line.index[0])):
+        assert mg.get_edge_data(f, t, key=("line", net.line.index[0]))["weight"] == \
+            net.line.length_km.iat[0]
+    b = pp.create_bus(net, vn_kv=20.)
+    pp.create_line(net, net.line.from_bus.iat[0], b, 1., "NA2XS2Y 1x95 RM/25 12/20 kV")
+    _assert_same_graph(get_cached_nxgraph(net), create_nxgraph(net))
+    assert cache.n_builds == 6
+
+    # non-multi graphs are cached as well
+    mg = get_cached_nxgraph(net, multi=False)
+    assert not mg.is_multigraph()
+    assert get_cached_nxgraph(net, multi=False) is mg
+
+
 if __name__ == '__main__':
     pytest.main(__file__)
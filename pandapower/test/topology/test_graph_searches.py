@@ -5,6 +5,7 @@
 
 
 import numpy as np
+import pandas as pd
 import pandapower as pp
 import pytest
 import pandapower.topology as top
@@ -110,6 +111,37 @@ def test_distance(feeder_network):
     dist = top.calc_distance_to_bus(net, 0, weight=None)
     assert np.allclose(dist.sort_index().values, [0, 1, 2, 1])
 
+
+def test_distance_matrix():
+    net = nw.mv_oberrhein()
+    sources = net.trafo.lv_bus.values
+    for weight in ["weight", None, "z_ohm", "r_pu"]:
+        dist = top.calc_distance_matrix(net, sources, weight=weight, batch_size=1)
+        assert dist.shape == (len(sources), len(net.bus))
+        mg = top.create_nxgraph(net, calc_branch_impedances=weight in ["z_ohm", "r_pu"],
+                                branch_impedance_unit="pu" if weight == "r_pu" else "ohm")
+        for source in sources:
+            ref = pd.Series(nx.single_source_dijkstra_path_length(mg, source, weight=weight))
+            assert np.allclose(dist.loc[source, ref.index].values, ref.values)
+            assert np.all(np.isinf(dist.loc[source, ~dist.columns.isin(ref.index)].values))
+
+        nearest = top.calc_nearest_source(net, sources, weight=weight)
+        assert np.allclose(nearest.dist.values, dist.min(axis=0).values)
+        connected = np.isfinite(nearest.dist.values)
+        assert np.allclose(dist.values[pd.Index(sources).get_indexer(nearest.source[connected]),
+                                       np.flatnonzero(connected)], nearest.dist[connected])
+        assert np.all(nearest.source[~connected] == -1)
+
+    dist = top.calc_distance_matrix(net, sources, batch_size=1, n_jobs=2)
+    assert np.allclose(dist.values, top.calc_distance_matrix(net, sources).values)
+
+    # default sources are the slack buses
+    dist = top.calc_distance_matrix(net)
+    assert list(dist.index) == sorted(net.ext_grid.bus.values)
+    with pytest.raises(ValueError):
+        top.calc_distance_matrix(net, [max(net.bus.index) + 1])
+
+
 def test_unsupplied_buses_with_in_service():
     # IS ext_grid --- open switch --- OOS bus --- open switch --- IS bus
     net = pp.create_empty_network()
@@ -187,7 +219,8 @@ def test_unsupplied_buses_with_switches():
     assert ub == {14}
 
 
-def test_graph_characteristics(feeder_network):
+@pytest.mark.parametrize("numba", [True, False])
+def test_graph_characteristics(feeder_network, numba):
     # adapt network
     net = feeder_network
     bus0 = pp.create_bus(net, vn_kv=20.0)
@@ -210,7 +243,7 @@ def test_graph_characteristics(feeder_network):
     mg = top.create_nxgraph(net, respect_switches=False)
     characteristics = ["bridges", "articulation_points", "connected", "stub_buses",
                        "required_bridges", "notn1_areas"]
-    char_dict = top.find_graph_characteristics(mg, net.ext_grid.bus, characteristics)
+    char_dict = top.find_graph_characteristics(mg, net.ext_grid.bus, characteristics, numba=numba)
     bridges = char_dict["bridges"]
     articulation_points = char_dict["articulation_points"]
     connected = char_dict["connected"]
@@ -226,6 +259,22 @@ def test_graph_characteristics(feeder_network):
     assert notn1_areas == {8: {9, 10}, 3: {4, 5, 6}, 2: {11, 12, 13}}
 
 
+def test_determine_stubs_numba():
+    net = nw.mv_oberrhein()
+    for respect_switches in [True, False]:
+        stubs = top.determine_stubs(net, respect_switches=respect_switches, numba=False)
+        on_stub = net.bus.on_stub.copy()
+        assert top.determine_stubs(net, respect_switches=respect_switches, numba=True) == stubs
+        assert net.bus.on_stub.equals(on_stub)
+
+    mg = top.create_nxgraph(net)
+    roots = net.ext_grid.bus.values
+    characteristics = ["bridges", "articulation_points", "connected", "stub_buses",
+                       "required_bridges", "notn1_areas"]
+    assert top.find_graph_characteristics(mg, roots, characteristics, numba=True) == \
+        top.find_graph_characteristics(mg, roots, characteristics, numba=False)
+
+
 def test_elements_on_path():
     net = nw.example_simple()
     for multi in [True, False]:
@@ -1,3 +1,3 @@
 from pandapower.timeseries.data_sources.frame_data import DFData
 from pandapower.timeseries.run_time_series import run_timeseries
-from pandapower.timeseries.output_writer import OutputWriter
\ No newline at end of file
+from pandapower.timeseries.output_writer import OutputWriter, read_sql_output
\ No newline at end of file
@@ -5,14 +5,16 @@
 import copy
 import functools
 import os
+import sqlite3
 from time import time
 from types import FunctionType
 
 import numpy as np
 import pandas as pd
 from collections.abc import Iterable
-from pandapower.io_utils import JSONSerializableClass
-from pandapower.io_utils import mkdirs_if_not_existent
+from pandapower.io_utils import JSONSerializableClass, SQL_TIME_SERIES_PREFIX
+from pandapower.io_utils import mkdirs_if_not_existent, append_sql_time_series, \
+    read_sql_time_series, sql_table_names
 from pandapower.pd2ppc import _pd2ppc
 from pandapower.pypower.idx_bus import VM, VA, NONE, BUS_TYPE
 from pandapower.run import _init_runpp_options
@@ -25,6 +27,8 @@ except ImportError:
     import logging as pplog
 logger = pplog.getLogger(__name__)
 
+SQL_FILE_TYPES = [".sqlite", ".db"]
+
 
 class OutputWriter(JSONSerializableClass):
     """
@@ -57,13 +61,19 @@ class OutputWriter(JSONSerializableClass):
         **output_path** (string, None) - Path to a folder where the output is written to.
 
         **output_file_type** (string, ".p") - output filetype to use.
-        Allowed file extensions: [*.xls, *.xlsx, *.csv, *.p, *.json]
+        Allowed file extensions: [*.xls, *.xlsx, *.csv, *.p, *.json, *.sqlite, *.db]
         Note: XLS has a maximum number of 256 rows.
+        With *.sqlite and *.db, all results are appended to the database "results.sqlite" (or
+        "results.db") in output_path and can be read with read_sql_output.
 
         **csv_separator** (string, ";") - The separator used when writing to a csv file
 
         **write_time** (int, None) - Time to save periodically to disk in minutes. Deactivated by default
 
+        **batch_size** (int, None) - Number of time steps after which the results are appended
+        to the database if the output_file_type is *.sqlite or *.db. If None, the results are
+        written at the end of the time series (or periodically with write_time)
+
         **log_variables** (list, None) - list of tuples with (table, column) values to  be logged by output writer.
         Defaults are: res_bus.vm_pu and res_line.loading_percent. Additional variables can be added later on
         with ow.log_variable or removed with ow.remove_log_variable
@@ -87,11 +97,14 @@ class OutputWriter(JSONSerializableClass):
     """
 
     def __init__(self, net, time_steps=None, output_path=None, output_file_type=".p", write_time=None,
-                 log_variables=None, csv_separator=";"):
+                 log_variables=None, csv_separator=";", batch_size=None):
         super().__init__()
         self.output_path = output_path
         self.output_file_type = output_file_type
         self.write_time = write_time
+        self.batch_size = batch_size
+        # number of time steps which are already written to the sql database
+        self._sql_stop = 0
         self.log_variables = log_variables
         # these are the default log variables which are added if log_variables is None
         self.default_log_variables = [("res_bus", "vm_pu"), ("res_line", "loading_percent")]
@@ -160,6 +173,7 @@ class OutputWriter(JSONSerializableClass):
             self.output = dict()
             self.np_results = dict()
             self.output_list = list()
+            self._sql_stop = 0
             self.init_log_variables(net)
             self.init_timesteps(self.time_steps)
             self._init_np_results()
@@ -219,6 +233,37 @@ class OutputWriter(JSONSerializableClass):
                 elif self.output_file_type == ".csv":
                     data.to_csv(file_path, sep=self.csv_separator)
 
+    def _save_sql(self, stop):
+        # appends the results of the time steps which are not written yet up to stop
+        start = self._sql_stop
+        mkdirs_if_not_existent(self.output_path)
+        con = sqlite3.connect(os.path.join(self.output_path, "results" + self.output_file_type))
+        try:
+            if start == 0:
+                # results of earlier time series simulations are replaced
+                for table in sql_table_names(con, prefix=SQL_TIME_SERIES_PREFIX):
+                    con.execute('DROP TABLE "%s"' % table)
+            time_steps = list(self.time_steps)
+            for partial in self.output_list:
+                if isinstance(partial, tuple):
+                    # batch outputs are calculated for all time steps at the end
+                    name = self._get_output_name(*partial)
+                    data = self.output[name]
+                    append_sql_time_series(con, name, data.index, data.columns, data.values)
+                elif stop > start:
+                    name = self._get_output_name(*partial.args[:2])
+                    values = self.np_results[self._get_np_name(partial.args)][start:stop]
+                    append_sql_time_series(con, name, time_steps[start:stop],
+                                           self._get_output_columns(partial.args), values)
+            if stop > start:
+                parameters = self.output["Parameters"].iloc[start:stop]
+                append_sql_time_series(con, "Parameters", time_steps[start:stop],
+                                       parameters.columns, parameters.values.astype(float))
+            con.commit()
+        finally:
+            con.close()
+        self._sql_stop = stop
+
     def dump_to_file(self, net, append=False, recycle_options=None):
         """
         Save the output to separate files in output_path with the file_type output_file_type. This is called after
@@ -236,9 +281,12 @@ class OutputWriter(JSONSerializableClass):
                     self._save_single_xls_sheet(append)
                 elif self.output_file_type in [".csv", ".xls", ".xlsx", ".json", ".p"]:
                     self._save_separate(append)
+                elif self.output_file_type in SQL_FILE_TYPES:
+                    self._save_sql(self.time_step_lookup[self.time_step] + 1)
                 else:
                     raise UserWarning(
-                        "Specify output file with .csv, .xls, .xlsx, .p or .json ending")
+                        "Specify output file with .csv, .xls, .xlsx, .p, .json, .sqlite or .db "
+                        "ending")
                 if append:
                     self._init_output()
 
@@ -266,6 +314,14 @@ class OutputWriter(JSONSerializableClass):
         else:
             self.save_to_parameters()
 
+        # append the results to the database in batches. The last batch is written before dump,
+        # since the output_list is replaced by the batch outputs in dump if recycle is used
+        if self.output_path is not None and self.output_file_type in SQL_FILE_TYPES:
+            stop = self.time_step_lookup[time_step] + 1
+            if stop == len(self.time_steps) or \
+                    (self.batch_size is not None and stop - self._sql_stop >= self.batch_size):
+                self._save_sql(stop)
+
         # if write time is exceeded or it is the last time step, data is written
         if self.write_time is not None:
             if time() - self.cur_realtime > self.write_time:
@@ -404,7 +460,11 @@ class OutputWriter(JSONSerializableClass):
 
         if np.any(pd.isnull(index)):
             # check how many elements there are in net
-            index = net[table.split("res_")[-1]].index
+            element = table.split("res_")[-1]
+            if element.endswith("_3ph"):
+                # three phase results, e.g. res_bus_3ph
+                element = element[:-len("_3ph")]
+            index = net[element].index
         if not hasattr(index, '__iter__'):
             index = [index]
         if isinstance(index, (np.ndarray, pd.Index, pd.Series)):
@@ -507,13 +567,7 @@ class OutputWriter(JSONSerializableClass):
             # res_name = self._get_hash(table, variable)
             res_name = self._get_output_name(table, variable)
             np_name = self._get_np_name(partial_func.args)
-            columns = index
-            if eval_name is not None and eval_func is not None:
-                if isinstance(eval_func, FunctionType):
-                    if "n_columns" not in eval_func.__code__.co_varnames:
-                        columns = [eval_name]
-                else:
-                    columns = [eval_name]
+            columns = self._get_output_columns(partial_func.args)
 
             res_df = pd.DataFrame(self.np_results[np_name], index=self.time_steps, columns=columns)
             if res_name in self.output and eval_name is not None:
@@ -527,6 +581,16 @@ class OutputWriter(JSONSerializableClass):
                 # new dataframe
                 self.output[res_name] = res_df
 
+    def _get_output_columns(self, partial_args):
+        (table, variable, net, index, eval_func, eval_name) = partial_args
+        if eval_name is not None and eval_func is not None:
+            if isinstance(eval_func, FunctionType):
+                if "n_columns" not in eval_func.__code__.co_varnames:
+                    return [eval_name]
+            else:
+                return [eval_name]
+        return index
+
     def _get_output_name(self, table, variable):
         return "%s.%s" % (table, variable)
 
@@ -590,3 +654,49 @@ class OutputWriter(JSONSerializableClass):
                 self.output[output_name] = pd.DataFrame(data=results[table][variable], index=self.time_steps)
                 new_output_list.append((table, variable))
             self.output_list = new_output_list
+
+
+def read_sql_output(filename, names=None, start=None, stop=None, columns=None):
+    """
+    Reads the results of a time series simulation which were written by an OutputWriter with
+    output_file_type *.sqlite or *.db.
+
+    INPUT:
+        **filename** (string) - path of the database, e.g.
+        os.path.join(output_path, "results.sqlite")
+
+    OPTIONAL:
+        **names** (list, None) - names of the outputs to read, e.g. ["res_bus.vm_pu"]. If None,
+        all outputs are read
+
+        **start** (None) - first time step to read. If None, the results are read from the first
+        time step
+
+        **stop** (None) - last time step to read (inclusive). If None, the results are read up to
+        the last time step
+
+        **columns** (iterable, None) - columns to read, e.g. the element indices. If None, all
+        columns are read
+
+    OUTPUT:
+        **output** (dict) - DataFrames of the results with the time steps as index, as in
+        OutputWriter.output
+
+    EXAMPLE:
+        >>> output = read_sql_output(os.path.join(output_path, "results.sqlite"),
+        >>>                          names=["res_bus.vm_pu"], start=24, stop=47)
+
+    """
+    con = sqlite3.connect(filename)
+    try:
+        stored = [t[len(SQL_TIME_SERIES_PREFIX):] for t in
+                  sql_table_names(con, prefix=SQL_TIME_SERIES_PREFIX)]
+        if names is None:
+            names = stored
+        missing = set(names) - set(stored)
+        if len(missing):
+            raise ValueError("Outputs %s are not stored in %s" % (sorted(missing), filename))
+        return {name: read_sql_time_series(con, name, start=start, stop=stop, columns=columns)
+                for name in names}
+    finally:
+        con.close()
@@ -4,11 +4,16 @@
 # and Energy System Technology (IEE), Kassel. All rights reserved.
 import tempfile
 
+import numpy as np
+
 import pandapower as pp
 from pandapower import LoadflowNotConverged, OPFNotConverged
+from pandapower.build_bus import _calc_pq_elements_and_add_on_ppc
 from pandapower.control.run_control import ControllerNotConverged, get_controller_order, \
     check_for_initial_run, run_control
 from pandapower.control.util.diagnostic import control_diagnostic
+from pandapower.pf.run_bfswpf import _run_bfswpf_batch
+from pandapower.pypower.idx_bus import PD, QD, VM, VA
 from pandapower.timeseries.output_writer import OutputWriter
 from collections.abc import Iterable
 
@@ -190,6 +195,10 @@ def get_recycle_settings(net, **kwargs):
     """
 
     recycle = kwargs.get("recycle", None)
+    if kwargs.get("algorithm", "nr") not in ["nr", "iwamoto_nr", "fdbx", "fdxb"]:
+        # only the Newton-Raphson and the fast-decoupled power flow reuse the internal variables
+        # of the last time step
+        recycle = False
     if recycle is not False:
         # check if every controller can be recycled and what can be recycled
         recycle = _check_controller_recyclability(net)
@@ -200,6 +209,37 @@ def get_recycle_settings(net, **kwargs):
     return recycle
 
 
+def get_batch_settings(net, **kwargs):
+    """
+    checks if all time steps can be calculated at once by the batched backward/forward sweep
+    (run_timeseries(net, algorithm="bfsw", batch=True)). This is possible if the controllers only
+    change the power of loads, sgens or storages, the net has no gens (PV buses) and the output
+    writer only logs results which are read in batch.
+
+    INPUT:
+        **net** - The pandapower format network
+
+    RETURN:
+        **recycle** - a dict with recycle options to be used by the output writer or False if the
+        time steps have to be calculated one after another
+    """
+    if kwargs.get("algorithm", "nr") != "bfsw":
+        logger.warning("batch is only available with algorithm='bfsw'")
+        return False
+    if kwargs.get("recycle", None) is False:
+        return False
+    if net.gen.in_service.any():
+        # the batched power flow does not support PV buses
+        return False
+    recycle = _check_controller_recyclability(net)
+    if recycle is False or recycle["trafo"] or recycle["gen"]:
+        return False
+    recycle = _check_output_writer_recyclability(net, recycle)
+    if not isinstance(recycle["batch_read"], list):
+        return False
+    return recycle
+
+
 def init_time_steps(net, time_steps, **kwargs):
     # initializes time steps if as a range
     if not isinstance(time_steps, Iterable):
@@ -245,9 +285,21 @@ def init_time_series(net, time_steps, continue_on_divergence=False, verbose=True
     # get run function
     run = kwargs.pop("run", pp.runpp)
     recycle_options = None
+    batch = False
     if hasattr(run, "__name__") and run.__name__ == "runpp":
-        # use faster runpp options if possible
-        recycle_options = get_recycle_settings(net, **kwargs)
+        if kwargs.get("batch", False):
+            # calculate all time steps at once if possible
+            recycle_options = get_batch_settings(net, **kwargs)
+            batch = recycle_options is not False
+        if not batch:
+            # use faster runpp options if possible
+            recycle_options = get_recycle_settings(net, **kwargs)
+    elif hasattr(run, "__name__") and run.__name__ == "runpp_3ph":
+        # the sequence networks are recycled, the results are read from the net as usual
+        if kwargs.get("recycle", None) is not False:
+            recycle_options = _check_controller_recyclability(net)
+        if isinstance(recycle_options, dict):
+            recycle_options.update(batch_read=False, only_v_results=False)
 
     init_output_writer(net, time_steps)
     # True at default. Initial power flow is calculated before each control step (some controllers need inits)
@@ -258,6 +310,8 @@ def init_time_series(net, time_steps, continue_on_divergence=False, verbose=True
     ts_variables["run"] = run
     # recycle options, which define what can be recycled
     ts_variables["recycle_options"] = recycle_options
+    # If True, the power flows of all time steps are calculated at once
+    ts_variables["batch"] = batch
     # time steps to be calculated (list or range)
     ts_variables["time_steps"] = time_steps
     # If True, a diverged run is ignored and the next step is calculated
@@ -310,6 +364,54 @@ def run_loop(net, ts_variables, **kwargs):
         run_time_step(net, time_step, ts_variables, **kwargs)
 
 
+def run_batch(net, ts_variables, **kwargs):
+    """
+    runs the time series with the batched backward/forward sweep. The controllers are applied for
+    each time step to collect the power of the buses, afterwards the power flows of all time steps
+    are calculated at once and the bus voltages are passed to the output writer
+
+    Parameters
+    ----------
+    net - pandapower net
+    ts_variables - settings for time series
+
+    """
+    time_steps = ts_variables["time_steps"]
+    for i, time_step in enumerate(time_steps):
+        print_progress(i, time_step, time_steps, ts_variables["verbose"], **kwargs)
+        control_time_step(net, ts_variables["controller_order"], time_step)
+        for levelorder in ts_variables["controller_order"]:
+            for ctrl in levelorder:
+                ctrl.control_step(net)
+        if i == 0:
+            # the first time step is calculated as usual to create the ppc
+            pp.runpp(net, **kwargs)
+            ppc = net["_ppc"]
+            internal = ppc["internal"]
+            nb = internal["bus"].shape[0]
+            S_load = np.empty((len(time_steps), nb), dtype=complex)
+            # changes of the ppc bus power are added to the bus power of the power flow
+            S_load[i] = internal["bus"][:, PD] + 1j * internal["bus"][:, QD]
+            _calc_pq_elements_and_add_on_ppc(net, ppc)
+            S_ppc = ppc["bus"][:nb, PD] + 1j * ppc["bus"][:nb, QD]
+        else:
+            _calc_pq_elements_and_add_on_ppc(net, ppc)
+            S_load[i] = S_load[0] + ppc["bus"][:nb, PD] + 1j * ppc["bus"][:nb, QD] - S_ppc
+
+    ppci = {"bus": internal["bus"], "gen": internal["gen"], "branch": internal["branch"],
+            "baseMVA": internal["baseMVA"], "internal": internal}
+    V, converged, _ = _run_bfswpf_batch(ppci, net["_options"], S_load, net["_bfsw_cache"])
+
+    # the output writer reads the voltages of each time step from the ppc
+    bus = internal["bus"]
+    for i, time_step in enumerate(time_steps):
+        bus[:, VM] = np.abs(V[i])
+        bus[:, VA] = np.angle(V[i], deg=True)
+        if not converged[i]:
+            pf_not_converged(time_step, ts_variables)
+        output_writer_routine(net, time_step, converged[i], True, ts_variables["recycle_options"])
+
+
 def run_timeseries(net, time_steps=None, continue_on_divergence=False, verbose=True, **kwargs):
     """
     Time Series main function
@@ -330,12 +432,22 @@ def run_timeseries(net, time_steps=None, continue_on_divergence=False, verbose=T
 
         **kwargs** - Keyword arguments for run_control and runpp. If "run" is in kwargs the default call to runpp()
         is replaced by the function kwargs["run"]
+
+        **batch** (bool, False) - If True and algorithm="bfsw", the power flows of all time steps are calculated
+        at once by the batched backward/forward sweep. This is only used if the controllers only change the power
+        of loads, sgens or storages, so that no controller depends on the results of the time steps, and the
+        output writer only logs res_bus, res_line, res_trafo and res_trafo3w results (see get_batch_settings).
+        Otherwise, or if the net contains gens, the time steps are calculated one after another. The results in
+        net are the results of the first time step.
     """
 
     ts_variables = init_time_series(net, time_steps, continue_on_divergence, verbose, **kwargs)
 
     control_diagnostic(net)
-    run_loop(net, ts_variables, **kwargs)
+    if ts_variables["batch"]:
+        run_batch(net, ts_variables, **kwargs)
+    else:
+        run_loop(net, ts_variables, **kwargs)
 
     # cleanup functions after the last time step was calculated
     cleanup(ts_variables)
@@ -1,2 +1,3 @@
 from pandapower.topology.create_graph import *
-from pandapower.topology.graph_searches import *
\ No newline at end of file
+from pandapower.topology.graph_searches import *
+from pandapower.topology.graph_cache import *
@@ -6,6 +6,8 @@ from itertools import combinations
 
 import networkx as nx
 import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
 
 from pandapower.auxiliary import _init_nx_options
 from pandapower.build_branch import _calc_impedance_parameters_from_dataframe, \
@@ -115,6 +117,161 @@ def create_nxgraph(net, respect_switches=True, include_lines=True, include_imped
         mg = nx.Graph()
     if branch_impedance_unit not in ["ohm", "pu"]:
         raise ValueError("branch impedance unit can be either 'ohm' or 'pu'")
+
+    for element, indices, parameter, in_service in get_edge_blocks(
+            net, respect_switches=respect_switches, include_lines=include_lines,
+            include_impedances=include_impedances, include_dclines=include_dclines,
+            include_trafos=include_trafos, include_trafo3ws=include_trafo3ws,
+            calc_branch_impedances=calc_branch_impedances,
+            branch_impedance_unit=branch_impedance_unit):
+        add_edges(mg, indices, parameter, in_service, net, element, calc_branch_impedances,
+                  branch_impedance_unit)
+
+    # add all buses that were not added when creating branches
+    if len(mg.nodes()) < len(net.bus.index):
+        if graph_tool_available and isinstance(mg, GraphToolInterface):
+            mg.add_vertex(max(net.bus.index) + 1)
+        else:
+            for b in set(net.bus.index) - set(mg.nodes()):
+                mg.add_node(b)
+
+    # remove nogobuses
+    if nogobuses is not None:
+        for b in nogobuses:
+            mg.remove_node(b)
+
+    # remove the edges pointing away of notravbuses
+    if notravbuses is not None:
+        for b in notravbuses:
+            for i in list(mg[b].keys()):
+                try:
+                    del mg[b][i]  # networkx versions < 2.0
+                except:
+                    del mg._adj[b][i]  # networkx versions 2.0
+
+    # remove out of service buses
+    if not include_out_of_service:
+        for b in net.bus.index[~net.bus.in_service.values]:
+            mg.remove_node(b)
+
+    return mg
+
+
+def create_csgraph(net, respect_switches=True, weight="weight", include_out_of_service=False,
+                   include_lines=True, include_impedances=True, include_dclines=True,
+                   include_trafos=True, include_trafo3ws=True):
+    """
+     Converts a pandapower network into a symmetric scipy sparse matrix, which can be used with
+     the graph algorithms of scipy.sparse.csgraph. The matrix represents the same graph as the
+     MultiGraph of create_nxgraph, but it is created without any loop over the elements. Parallel
+     edges are merged, the entry of two connected buses is the minimum weight of all edges between
+     them. Edges with zero weight (e.g. bus-bus switches) are stored as explicit zeros.
+
+     INPUT:
+        **net** (pandapowerNet) - variable that contains a pandapower network
+
+     OPTIONAL:
+        **respect_switches** (boolean, True) - True: open switches are being considered
+
+        **weight** (str, "weight") - the edge attribute of create_nxgraph which is used as matrix
+            entry: "weight" (line length in km), one of the branch impedances "r_ohm", "x_ohm",
+            "z_ohm", "r_pu", "x_pu", "z_pu" or None, which sets all entries to 1 (topological
+            distance). Edges with infinite weight (dclines for impedances) are left out.
+
+        **include_out_of_service** (bool, False) - defines if out of service buses are included
+
+        **include_lines**, **include_impedances**, **include_dclines**, **include_trafos**,
+        **include_trafo3ws** - see create_nxgraph
+
+     OUTPUT:
+        **buses** (array) - the bus indices of the rows and columns of the matrix
+
+        **csgraph** (scipy.sparse.csr_matrix) - the weighted adjacency matrix
+
+     EXAMPLE:
+         import pandapower.topology as top
+         from scipy.sparse.csgraph import dijkstra
+
+         buses, csgraph = top.create_csgraph(net)
+         dist = dijkstra(csgraph, directed=False, indices=0)
+    """
+    if weight in ["weight", None]:
+        calc_branch_impedances = False
+        branch_impedance_unit = "ohm"
+        col = WEIGHT
+    elif isinstance(weight, str) and weight[:2] in ["r_", "x_", "z_"] and \
+            weight[2:] in ["ohm", "pu"]:
+        calc_branch_impedances = True
+        branch_impedance_unit = weight[2:]
+        col = {"r": BR_R, "x": BR_X, "z": BR_Z}[weight[0]]
+    else:
+        raise ValueError("weight %s is not supported" % weight)
+
+    if include_out_of_service:
+        buses = net.bus.index.values
+    else:
+        buses = net.bus.index.values[net.bus.in_service.values.astype(bool)]
+    f, t, w = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)], [np.zeros(0)]
+    for _, indices, parameter, in_service in get_edge_blocks(
+            net, respect_switches=respect_switches, include_lines=include_lines,
+            include_impedances=include_impedances, include_dclines=include_dclines,
+            include_trafos=include_trafos, include_trafo3ws=include_trafo3ws,
+            calc_branch_impedances=calc_branch_impedances,
+            branch_impedance_unit=branch_impedance_unit):
+        in_service = in_service.astype(bool)
+        f.append(indices[in_service, F_BUS])
+        t.append(indices[in_service, T_BUS])
+        if weight is None:
+            w.append(np.ones(in_service.sum()))
+        elif col == BR_Z:
+            w.append(np.sqrt(parameter[in_service, BR_R] ** 2 + parameter[in_service, BR_X] ** 2))
+        else:
+            w.append(parameter[in_service, col])
+
+    bus_index = pd.Index(buses)
+    f = bus_index.get_indexer(np.concatenate(f))
+    t = bus_index.get_indexer(np.concatenate(t))
+    w = np.concatenate(w)
+    valid = (f >= 0) & (t >= 0) & np.isfinite(w)
+    f, t, w = f[valid], t[valid], w[valid]
+
+    # both directions, sorted by (row, column, weight) -> the first entry of each bus pair has the
+    # minimum weight of all parallel edges
+    n = len(buses)
+    key = np.concatenate([f * n + t, t * n + f])
+    w = np.concatenate([w, w])
+    order = np.lexsort((w, key))
+    key, w = key[order], w[order]
+    first = np.ones(len(key), dtype=bool)
+    first[1:] = key[1:] != key[:-1]
+    key, w = key[first], w[first]
+    row, column = key // n, key % n
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(row, minlength=n))
+    return buses, csr_matrix((w, column, indptr), shape=(n, n))
+
+
+def get_edge_blocks(net, respect_switches=True, include_lines=True, include_impedances=True,
+                    include_dclines=True, include_trafos=True, include_trafo3ws=True,
+                    calc_branch_impedances=False, branch_impedance_unit="ohm"):
+    """
+    Yields the edges of the graph representation of a pandapower network element-wise as numpy
+    arrays. This is the vectorized part of create_nxgraph which does not depend on the graph
+    library, so that it can also be used to compare the topology of a network with an already
+    existing graph (see pandapower.topology.graph_cache).
+
+    INPUT:
+        **net** (pandapowerNet) - variable that contains a pandapower network
+
+    OPTIONAL:
+        see create_nxgraph
+
+    OUTPUT:
+        **edge_blocks** (generator) - yields tuples of (element, indices, parameter, in_service),
+            where indices contains the element index, from bus and to bus of each edge,
+            parameter contains the edge weight (and branch impedances) and in_service is a
+            boolean mask of the edges which are part of the graph
+    """
     if respect_switches:
         open_sw = ~net.switch.closed.values.astype(bool)
     if calc_branch_impedances:
@@ -143,8 +300,7 @@ def create_nxgraph(net, respect_switches=True, include_lines=True, include_imped
             parameter[:, BR_R] = r / baseR
             parameter[:, BR_X] = x / baseR
 
-        add_edges(mg, indices, parameter, in_service, net, "line", calc_branch_impedances,
-                  branch_impedance_unit)
+        yield "line", indices, parameter, in_service
 
     impedance = get_edge_table(net, "impedance", include_impedances)
     if impedance is not None:
@@ -159,8 +315,7 @@ def create_nxgraph(net, respect_switches=True, include_lines=True, include_imped
             parameter[:, BR_R] = r * baseR
             parameter[:, BR_X] = x * baseR
 
-        add_edges(mg, indices, parameter, in_service, net, "impedance",
-                  calc_branch_impedances, branch_impedance_unit)
+        yield "impedance", indices, parameter, in_service
 
     dclines = get_edge_table(net, "dcline", include_dclines)
     if dclines is not None:
@@ -172,8 +327,7 @@ def create_nxgraph(net, respect_switches=True, include_lines=True, include_imped
             parameter[:, BR_R] = np.inf
             parameter[:, BR_X] = np.inf
 
-        add_edges(mg, indices, parameter, in_service, net, "dcline",
-                  calc_branch_impedances, branch_impedance_unit)
+        yield "dcline", indices, parameter, in_service
 
     trafo = get_edge_table(net, "trafo", include_trafos)
     if trafo is not None:
@@ -195,8 +349,7 @@ def create_nxgraph(net, respect_switches=True, include_lines=True, include_imped
             parameter[:, BR_R] = r * baseR
             parameter[:, BR_X] = x * baseR
 
-        add_edges(mg, indices, parameter, in_service, net, "trafo",
-                  calc_branch_impedances, branch_impedance_unit)
+        yield "trafo", indices, parameter, in_service
 
     trafo3w = get_edge_table(net, "trafo3w", include_trafo3ws)
     if trafo3w is not None:
@@ -230,8 +383,7 @@ def create_nxgraph(net, respect_switches=True, include_lines=True, include_imped
             if calc_branch_impedances:
                 parameter[:, BR_R] = (r[f] + r[t]) * baseR
                 parameter[:, BR_X] = (x[f] + x[t]) * baseR
-            add_edges(mg, indices, parameter, in_service, net, "trafo3w",
-                      calc_branch_impedances, branch_impedance_unit)
+            yield "trafo3w", indices, parameter, in_service
 
     switch = net.switch
     if len(switch):
@@ -244,37 +396,7 @@ def create_nxgraph(net, respect_switches=True, include_lines=True, include_imped
         indices, parameter = init_par(switch, calc_branch_impedances)
         indices[:, F_BUS] = switch.bus.values
         indices[:, T_BUS] = switch.element.values
-        add_edges(mg, indices, parameter, in_service, net, "switch",
-                  calc_branch_impedances, branch_impedance_unit)
-
-    # add all buses that were not added when creating branches
-    if len(mg.nodes()) < len(net.bus.index):
-        if graph_tool_available and isinstance(mg, GraphToolInterface):
-            mg.add_vertex(max(net.bus.index) + 1)
-        else:
-            for b in set(net.bus.index) - set(mg.nodes()):
-                mg.add_node(b)
-
-    # remove nogobuses
-    if nogobuses is not None:
-        for b in nogobuses:
-            mg.remove_node(b)
-
-    # remove the edges pointing away of notravbuses
-    if notravbuses is not None:
-        for b in notravbuses:
-            for i in list(mg[b].keys()):
-                try:
-                    del mg[b][i]  # networkx versions < 2.0
-                except:
-                    del mg._adj[b][i]  # networkx versions 2.0
-
-    # remove out of service buses
-    if not include_out_of_service:
-        for b in net.bus.index[~net.bus.in_service.values]:
-            mg.remove_node(b)
-
-    return mg
+        yield "switch", indices, parameter, in_service
 
 
 def get_edge_table(net, table_name, include_edges):
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from pandapower.topology.create_graph import create_nxgraph, get_edge_blocks, add_edges, \
+    INDEX, F_BUS, T_BUS
+
+try:
+    import pplog as logging
+except ImportError:
+    import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TopologyCache(object):
+    """
+    Cache of NetworkX graphs of a pandapower network, which is stored in net["_topology_cache"].
+
+    One graph is stored for each combination of create_nxgraph parameters. Whenever a graph is
+    requested, the edges of the network are determined with the vectorized get_edge_blocks and
+    compared to the edges of the cached graph:
+
+        - if the buses, the branches (index, buses, weights and impedances) and the switches are
+          unchanged and only switch positions or in_service flags of buses and branches have
+          changed, the cached graph is patched by removing and adding the affected nodes and edges
+        - if the structure of the network has changed, the graph is rebuilt from scratch
+        - if nothing has changed, the cached graph is returned as it is
+
+    The graphs are shared between all callers and must therefore not be modified. If a graph
+    is going to be modified, it has to be copied first.
+    """
+
+    def __init__(self):
+        self.graphs = dict()
+        self.n_builds = 0
+        self.n_updates = 0
+
+    def clear(self):
+        self.graphs.clear()
+
+    def get_graph(self, net, multi=True, include_out_of_service=False, **kwargs):
+        key = _cache_key(multi=multi, include_out_of_service=include_out_of_service, **kwargs)
+        blocks = [(element, indices, parameter.copy(), in_service.astype(bool))
+                  for element, indices, parameter, in_service in get_edge_blocks(net, **kwargs)]
+        bus_index = net.bus.index.values
+        if include_out_of_service:
+            bus_is = np.ones(len(bus_index), dtype=bool)
+        else:
+            bus_is = net.bus.in_service.values.astype(bool)
+        for element, indices, parameter, in_service in blocks:
+            in_service &= _buses_in_service(bus_index, bus_is, indices[:, F_BUS])
+            in_service &= _buses_in_service(bus_index, bus_is, indices[:, T_BUS])
+
+        entry = self.graphs.get(key)
+        if entry is None or not _same_structure(entry, bus_index, blocks):
+            mg = self._build(net, bus_index, bus_is, blocks, multi, **kwargs)
+        elif _same_state(entry, bus_is, blocks):
+            return entry["graph"]
+        elif multi:
+            mg = self._update(net, entry, bus_index, bus_is, blocks, **kwargs)
+        else:
+            # parallel edges are merged in nx.Graph, so that removing an edge could also remove
+            # the connection of another element -> no incremental update possible
+            mg = self._build(net, bus_index, bus_is, blocks, multi, **kwargs)
+
+        self.graphs[key] = {"graph": mg, "bus_index": bus_index.copy(), "bus_is": bus_is,
+                            "blocks": blocks}
+        return mg
+
+    def _build(self, net, bus_index, bus_is, blocks, multi, calc_branch_impedances=False,
+               branch_impedance_unit="ohm", **kwargs):
+        self.n_builds += 1
+        mg = nx.MultiGraph() if multi else nx.Graph()
+        for element, indices, parameter, in_service in blocks:
+            add_edges(mg, indices, parameter.copy(), in_service, net, element,
+                      calc_branch_impedances, branch_impedance_unit)
+        mg.add_nodes_from(bus_index[bus_is])
+        return mg
+
+    def _update(self, net, entry, bus_index, bus_is, blocks, calc_branch_impedances=False,
+                branch_impedance_unit="ohm", **kwargs):
+        self.n_updates += 1
+        mg = entry["graph"]
+        for (_, indices, _, old), (element, _, _, new) in zip(entry["blocks"], blocks):
+            for idx in indices[old & ~new]:
+                key = (element, idx[INDEX])
+                if mg.has_edge(idx[F_BUS], idx[T_BUS], key=key):
+                    mg.remove_edge(idx[F_BUS], idx[T_BUS], key=key)
+        old_bus_is = entry["bus_is"]
+        mg.remove_nodes_from(bus_index[old_bus_is & ~bus_is])
+        mg.add_nodes_from(bus_index[bus_is & ~old_bus_is])
+        for (_, _, _, old), (element, indices, parameter, new) in zip(entry["blocks"], blocks):
+            added = new & ~old
+            if added.any():
+                add_edges(mg, indices, parameter.copy(), added, net, element,
+                          calc_branch_impedances, branch_impedance_unit)
+        return mg
+
+
+def get_cached_nxgraph(net, respect_switches=True, include_lines=True, include_impedances=True,
+                       include_dclines=True, include_trafos=True, include_trafo3ws=True,
+                       nogobuses=None, notravbuses=None, multi=True,
+                       calc_branch_impedances=False, branch_impedance_unit="ohm",
+                       library="networkx", include_out_of_service=False):
+    """
+     Returns the NetworkX graph of a pandapower network from the topology cache of the net. The
+     graph is built with the first call and then kept up to date with the network: changes of
+     switch positions and in_service flags are patched into the cached graph, while structural
+     changes (new or deleted elements, changed buses or line lengths) lead to a rebuild.
+
+     The returned graph is identical to the one of create_nxgraph with the same parameters, but
+     it is shared between all calls and must not be modified.
+
+     Graphs with nogobuses or notravbuses and graph_tool graphs are not cached, these are
+     directly created with create_nxgraph.
+
+     INPUT:
+        **net** (pandapowerNet) - variable that contains a pandapower network
+
+     OPTIONAL:
+        see create_nxgraph
+
+     OUTPUT:
+        **mg** - Returns the required NetworkX graph
+
+     EXAMPLE:
+         import pandapower.topology as top
+
+         mg = top.get_cached_nxgraph(net)
+         net.switch.closed.at[0] = False
+         mg = top.get_cached_nxgraph(net)  # the cached graph is updated, not rebuilt
+
+    """
+    if nogobuses is not None or notravbuses is not None or library != "networkx":
+        return create_nxgraph(
+            net, respect_switches=respect_switches, include_lines=include_lines,
+            include_impedances=include_impedances, include_dclines=include_dclines,
+            include_trafos=include_trafos, include_trafo3ws=include_trafo3ws,
+            nogobuses=nogobuses, notravbuses=notravbuses, multi=multi,
+            calc_branch_impedances=calc_branch_impedances,
+            branch_impedance_unit=branch_impedance_unit, library=library,
+            include_out_of_service=include_out_of_service)
+    if branch_impedance_unit not in ["ohm", "pu"]:
+        raise ValueError("branch impedance unit can be either 'ohm' or 'pu'")
+    return get_topology_cache(net).get_graph(
+        net, multi=multi, include_out_of_service=include_out_of_service,
+        respect_switches=respect_switches, include_lines=include_lines,
+        include_impedances=include_impedances, include_dclines=include_dclines,
+        include_trafos=include_trafos, include_trafo3ws=include_trafo3ws,
+        calc_branch_impedances=calc_branch_impedances,
+        branch_impedance_unit=branch_impedance_unit)
+
+
+def get_topology_cache(net):
+    """
+    Returns the topology cache of the net. It is created if it does not exist yet.
+    """
+    cache = net.get("_topology_cache", None)
+    if cache is None:
+        cache = TopologyCache()
+        net["_topology_cache"] = cache
+    return cache
+
+
+def clear_topology_cache(net):
+    """
+    Deletes all cached graphs of the net.
+    """
+    if net.get("_topology_cache", None) is not None:
+        net["_topology_cache"].clear()
+
+
+def _cache_key(**kwargs):
+    return tuple(sorted((k, v if isinstance(v, (bool, str)) else tuple(v))
+                        for k, v in kwargs.items()))
+
+
+def _buses_in_service(bus_index, bus_is, buses):
+    # buses which are not in net.bus are nodes of the graph, as in create_nxgraph
+    pos = pd.Index(bus_index).get_indexer(buses)
+    in_service = np.ones(len(buses), dtype=bool)
+    found = pos >= 0
+    in_service[found] = bus_is[pos[found]]
+    return in_service
+
+
+def _same_structure(entry, bus_index, blocks):
+    if not np.array_equal(entry["bus_index"], bus_index) or len(entry["blocks"]) != len(blocks):
+        return False
+    for (el1, ind1, par1, _), (el2, ind2, par2, _) in zip(entry["blocks"], blocks):
+        if el1 != el2 or not np.array_equal(ind1, ind2) or \
+                not np.array_equal(par1, par2, equal_nan=True):
+            return False
+    return True
+
+
+def _same_state(entry, bus_is, blocks):
+    return np.array_equal(entry["bus_is"], bus_is) and \
+        all(np.array_equal(old[3], new[3]) for old, new in zip(entry["blocks"], blocks))
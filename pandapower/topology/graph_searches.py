@@ -5,11 +5,17 @@
 
 
 import networkx as nx
+import numpy as np
 import pandas as pd
 from collections import deque
-from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, repeat
+from scipy.sparse.csgraph import dijkstra
 
-from pandapower.topology.create_graph import create_nxgraph
+from pandapower.topology.create_graph import create_nxgraph, create_csgraph
+from pandapower.topology.graph_cache import get_cached_nxgraph
+from pandapower.topology.graph_searches_numba import numba_installed, nxgraph_to_csr, \
+    net_to_csr, find_graph_characteristics_csr
 
 
 def connected_component(mg, bus, notravbuses=[]):
@@ -118,11 +124,127 @@ def calc_distance_to_bus(net, bus, respect_switches=True, nogobuses=None,
          dist = top.calc_distance_to_bus(net, 5)
 
     """
-    g = create_nxgraph(net, respect_switches=respect_switches,
-                       nogobuses=nogobuses, notravbuses=notravbuses)
+    g = get_cached_nxgraph(net, respect_switches=respect_switches,
+                           nogobuses=nogobuses, notravbuses=notravbuses)
     return pd.Series(nx.single_source_dijkstra_path_length(g, bus, weight=weight))
 
 
+def calc_distance_matrix(net, sources=None, respect_switches=True, weight="weight",
+                         batch_size=256, n_jobs=1):
+    """
+        Calculates the shortest distance between each of the source buses and all buses of the
+        network. The network is converted with create_csgraph and the distances are calculated
+        with scipy.sparse.csgraph.dijkstra in batches of source buses, which can be distributed
+        over several processes.
+
+     INPUT:
+        **net** (pandapowerNet) - Variable that contains a pandapower network.
+
+     OPTIONAL:
+        **sources** (list, None) - Indices of the source buses. If None, the buses of all in
+            service external grids and slack generators are used.
+
+        **respect_switches** (boolean, True) - True: open switches are being considered
+                                               False: open switches are being ignored
+
+        **weight** (string, "weight") - Edge attribute of the distance: "weight" for the line
+            length in km, None for the topological distance, or one of the branch impedances
+            "r_ohm", "x_ohm", "z_ohm", "r_pu", "x_pu", "z_pu" (see create_csgraph)
+
+        **batch_size** (int, 256) - number of sources which are calculated in one dijkstra call
+
+        **n_jobs** (int, 1) - number of processes over which the batches are distributed
+
+     OUTPUT:
+        **dist** (DataFrame) - distances with the source buses as index and the in service buses
+            as columns. Buses which are not connected to a source have the distance inf.
+
+     EXAMPLE:
+         import pandapower.topology as top
+
+         dist = top.calc_distance_matrix(net, net.trafo.lv_bus.values, weight="z_ohm")
+
+    """
+    buses, csgraph = create_csgraph(net, respect_switches=respect_switches, weight=weight)
+    sources = _get_sources(net, sources)
+    source_pos = _get_bus_positions(buses, sources)
+    batches = [source_pos[i: i + batch_size] for i in range(0, len(source_pos), batch_size)]
+    if n_jobs > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(_dijkstra_batch, repeat(csgraph), batches))
+    else:
+        results = [_dijkstra_batch(csgraph, batch) for batch in batches]
+    dist = np.vstack(results) if len(results) else np.zeros((0, len(buses)))
+    return pd.DataFrame(dist, index=sources, columns=buses)
+
+
+def calc_nearest_source(net, sources=None, respect_switches=True, weight="weight"):
+    """
+        Determines for each bus the nearest of the source buses and the distance to it, e.g.
+        for the assignment of buses to feeders or substations. In contrast to
+        calc_distance_matrix, no distance matrix is calculated, so that this function can also be
+        used for a large number of sources in large networks.
+
+     INPUT:
+        **net** (pandapowerNet) - Variable that contains a pandapower network.
+
+     OPTIONAL:
+        **sources** (list, None) - Indices of the source buses. If None, the buses of all in
+            service external grids and slack generators are used.
+
+        **respect_switches** (boolean, True) - True: open switches are being considered
+                                               False: open switches are being ignored
+
+        **weight** (string, "weight") - Edge attribute of the distance (see calc_distance_matrix)
+
+     OUTPUT:
+        **nearest** (DataFrame) - DataFrame with the in service buses as index and the columns
+            "source" (index of the nearest source bus) and "dist" (distance to this source bus).
+            Buses which are not connected to any source have the source -1 and the distance inf.
+
+     EXAMPLE:
+         import pandapower.topology as top
+
+         nearest = top.calc_nearest_source(net, net.trafo.lv_bus.values)
+
+    """
+    buses, csgraph = create_csgraph(net, respect_switches=respect_switches, weight=weight)
+    sources = _get_sources(net, sources)
+    source_pos = _get_bus_positions(buses, sources)
+    if len(source_pos):
+        dist, _, nearest = dijkstra(csgraph, directed=False, indices=source_pos, min_only=True,
+                                    return_predecessors=True)
+    else:
+        dist, nearest = np.full(len(buses), np.inf), np.full(len(buses), -1)
+    source = np.full(len(buses), -1, dtype=np.int64)
+    connected = nearest >= 0
+    source[connected] = buses[nearest[connected]]
+    return pd.DataFrame({"source": source, "dist": dist}, index=buses)
+
+
+def _get_sources(net, sources):
+    if sources is None:
+        return np.array(sorted(_get_slack_buses(net)), dtype=np.int64)
+    return np.array(sources, dtype=np.int64).flatten()
+
+
+def _get_bus_positions(buses, sources):
+    source_pos = pd.Index(buses).get_indexer(sources)
+    if np.any(source_pos < 0):
+        raise ValueError("source buses %s are not in service or do not exist" %
+                         list(sources[source_pos < 0]))
+    return source_pos
+
+
+def _get_slack_buses(net):
+    return set(net.ext_grid[net.ext_grid.in_service].bus.values) | set(
+        net.gen[net.gen.in_service & net.gen.slack].bus.values)
+
+
+def _dijkstra_batch(csgraph, indices):
+    return dijkstra(csgraph, directed=False, indices=indices)
+
+
 def unsupplied_buses(net, mg=None, slacks=None, respect_switches=True):
     """
      Finds buses, that are not connected to an external grid.
@@ -142,6 +264,9 @@ def unsupplied_buses(net, mg=None, slacks=None, respect_switches=True):
         **respect_switches** (boolean, True) - Fixes how to consider switches - only in case of no
             given mg.
 
+        If no mg is given, the graph is taken from the topology cache of the net (see
+        get_cached_nxgraph), so that repeated calls do not rebuild the graph.
+
      OUTPUT:
         **ub** (set) - unsupplied buses
 
@@ -151,10 +276,9 @@ def unsupplied_buses(net, mg=None, slacks=None, respect_switches=True):
          top.unsupplied_buses(net)
     """
 
-    mg = mg or create_nxgraph(net, respect_switches=respect_switches)
+    mg = mg or get_cached_nxgraph(net, respect_switches=respect_switches)
     if slacks is None:
-        slacks = set(net.ext_grid[net.ext_grid.in_service].bus.values) | set(
-            net.gen[net.gen.in_service & net.gen.slack].bus.values)
+        slacks = _get_slack_buses(net)
     not_supplied = set()
     for cc in nx.connected_components(mg):
         if not set(cc) & slacks:
@@ -171,7 +295,8 @@ def find_basic_graph_characteristics(g, roots, characteristics):
     .. note::
 
         This is the base function for find_graph_characteristics. Please use the latter
-        function instead!
+        function instead! If numba is installed, find_graph_characteristics uses the compiled
+        version of this search in graph_searches_numba.
     """
     connected = 'connected' in characteristics
     stub_buses = 'stub_buses' in characteristics
@@ -233,7 +358,7 @@ def find_basic_graph_characteristics(g, roots, characteristics):
     return char_dict
 
 
-def find_graph_characteristics(g, roots, characteristics):
+def find_graph_characteristics(g, roots, characteristics, numba=True):
     """
     Finds and returns different characteristics of the given graph which can be specified.
 
@@ -244,6 +369,11 @@ def find_graph_characteristics(g, roots, characteristics):
 
         **characteristics** (list) - List of characteristics this function determines and returns
 
+    OPTIONAL:
+        **numba** (bool, True) - if numba is installed, the graph is converted into compressed
+            sparse row arrays and searched with compiled functions, which is much faster for
+            large graphs. The results are the same.
+
         .. note::
 
             Possible characteristics:
@@ -280,6 +410,12 @@ def find_graph_characteristics(g, roots, characteristics):
         g = top.create_nxgraph(net, respect_switches=False)
         char_dict = top.find_graph_characteristics(g, roots=[0, 3], characteristics=['connected', 'stub_buses'])
     """
+    if numba and numba_installed:
+        nodes, indptr, indices = nxgraph_to_csr(g)
+        char_dict = find_graph_characteristics_csr(nodes, indptr, indices, roots,
+                                                   characteristics)
+        return {key: char_dict[key] for key in characteristics}
+
     char_dict = find_basic_graph_characteristics(g, roots, characteristics)
 
     required_bridges = 'required_bridges' in characteristics
@@ -310,9 +446,9 @@ def find_graph_characteristics(g, roots, characteristics):
                     visited_bridges.append((parent, child))
 
                 if notn1_areas:
-                    if child in char_dict['notn1_starts'] and not notn1_area_start:
+                    if child in char_dict['notn1_starts'] and notn1_area_start is None:
                         notn1_area_start = parent
-                    if notn1_area_start:
+                    if notn1_area_start is not None:
                         curr_notn1_area.append(child)
 
         except StopIteration:
@@ -335,7 +471,7 @@ def find_graph_characteristics(g, roots, characteristics):
     return {key: char_dict[key] for key in characteristics}
 
 
-def get_2connected_buses(g, roots):
+def get_2connected_buses(g, roots, numba=True):
     """
     Get all buses which have at least two connections to the roots
 
@@ -343,14 +479,18 @@ def get_2connected_buses(g, roots):
         **g** (NetworkX graph) - NetworkX Graph or MultiGraph that represents a pandapower network
 
         **roots** - Roots of the graphsearch
+
+    OPTIONAL:
+        **numba** (bool, True) - use the compiled graph search if numba is installed
     """
-    char_dict = find_graph_characteristics(g, roots, characteristics=['connected', 'stub_buses'])
+    char_dict = find_graph_characteristics(g, roots, characteristics=['connected', 'stub_buses'],
+                                           numba=numba)
     connected, stub_buses = char_dict['connected'], char_dict['stub_buses']
     two_connected = connected - stub_buses
     return connected, two_connected
 
 
-def determine_stubs(net, roots=None, mg=None, respect_switches=False):
+def determine_stubs(net, roots=None, mg=None, respect_switches=False, numba=True):
     """
      Finds stubs in a network. Open switches are being ignored. Results are being written in a new
      column in the bus table ("on_stub") and line table ("is_stub") as True/False value.
@@ -363,6 +503,10 @@ def determine_stubs(net, roots=None, mg=None, respect_switches=False):
         **roots** (integer/list, None) - indices of buses that should be excluded (by default, the
                                          ext_grid buses will be set as roots)
 
+        **numba** (bool, True) - if numba is installed and no mg is given, the stubs are
+            determined with compiled graph searches on arrays which are directly created from the
+            element tables
+
      EXAMPLE:
          import pandapower.topology as top
 
@@ -370,8 +514,6 @@ def determine_stubs(net, roots=None, mg=None, respect_switches=False):
 
 
     """
-    if mg is None:
-        mg = create_nxgraph(net, respect_switches=respect_switches)
     # remove buses with degree lower 2 until none left
     if roots is None:
         roots = set(net.ext_grid.bus)
@@ -382,7 +524,16 @@ def determine_stubs(net, roots=None, mg=None, respect_switches=False):
     #            break
     #        mg.remove_nodes_from(dgo)
     #    n1_buses = mg.nodes()
-    _, n1_buses = get_2connected_buses(mg, roots)
+    if mg is None and numba and numba_installed:
+        # the graph arrays are created directly from the element tables
+        nodes, indptr, indices = net_to_csr(net, respect_switches=respect_switches)
+        char_dict = find_graph_characteristics_csr(nodes, indptr, indices, roots,
+                                                   ['connected', 'stub_buses'])
+        n1_buses = char_dict['connected'] - char_dict['stub_buses']
+    else:
+        if mg is None:
+            mg = get_cached_nxgraph(net, respect_switches=respect_switches)
+        _, n1_buses = get_2connected_buses(mg, roots, numba=numba)
     net.bus["on_stub"] = True
     net.bus.loc[n1_buses, "on_stub"] = False
     net.line["is_stub"] = ~((net.line.from_bus.isin(n1_buses)) & (net.line.to_bus.isin(n1_buses)))
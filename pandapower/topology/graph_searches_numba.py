@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020 by University of Kassel and Fraunhofer Institute for Energy Economics
+# and Energy System Technology (IEE), Kassel. All rights reserved.
+
+"""
+Array based implementation of the graph searches in find_graph_characteristics. The graph is
+represented by compressed sparse row (CSR) arrays (indptr, indices) of node positions, so that the
+depth first searches can be compiled with numba. The searches are the same as in
+find_basic_graph_characteristics and find_graph_characteristics and the neighbors are visited in
+the same order, so that the results are identical.
+"""
+
+import numpy as np
+import pandas as pd
+
+from pandapower.pf.numba_cache import jit, numba_installed
+from pandapower.topology.create_graph import create_csgraph
+
+
+@jit(nopython=True)
+def _dfs_bridges(indptr, indices, roots, is_root, find_stubs):  # pragma: no cover
+    n = len(indptr) - 1
+    discovery = np.full(n, -1, dtype=np.int64)
+    low = np.zeros(n, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    bridge = np.zeros(n, dtype=np.bool_)  # the tree edge (parent[i], i) is a bridge
+    articulation_point = np.zeros(n, dtype=np.bool_)
+    notn1_start = np.zeros(n, dtype=np.bool_)
+    stub = np.zeros(n, dtype=np.bool_)
+
+    n_roots = len(roots)
+    stack_gp = np.empty(n + n_roots, dtype=np.int64)
+    stack_p = np.empty(n + n_roots, dtype=np.int64)
+    stack_pos = np.empty(n + n_roots, dtype=np.int64)
+    path = np.empty(2 * n + n_roots + 1, dtype=np.int64)
+    n_path = 0
+
+    counter = 0
+    for i in range(n_roots):
+        if discovery[roots[i]] < 0:
+            counter += 1
+        discovery[roots[i]] = 0
+        stack_gp[i] = roots[i]
+        stack_p[i] = roots[i]
+        stack_pos[i] = indptr[roots[i]]
+    top = n_roots - 1
+
+    while top >= 0:
+        grandparent = stack_gp[top]
+        par = stack_p[top]
+        if stack_pos[top] < indptr[par + 1]:
+            child = indices[stack_pos[top]]
+            stack_pos[top] += 1
+            if find_stubs and discovery[child] < 0:
+                path[n_path] = child  # keep track of movement through the graph
+                n_path += 1
+            if grandparent == child:
+                continue
+            if discovery[child] >= 0:
+                if discovery[child] <= discovery[par]:  # back edge
+                    low[par] = min(low[par], discovery[child])
+            else:
+                low[child] = counter
+                discovery[child] = counter
+                counter += 1
+                parent[child] = par
+                top += 1
+                stack_gp[top] = par
+                stack_p[top] = child
+                stack_pos[top] = indptr[child]
+        else:
+            top -= 1
+            if find_stubs:
+                path[n_path] = grandparent
+                n_path += 1
+            if low[par] >= discovery[grandparent]:
+                if not is_root[grandparent]:
+                    articulation_point[grandparent] = True
+                    notn1_start[par] = True
+                if low[par] > discovery[grandparent]:
+                    bridge[par] = True
+                    if find_stubs:
+                        n_path -= 1
+                        if path[n_path] != grandparent:
+                            stub[path[n_path]] = True
+                        while n_path > 0 and path[n_path - 1] != grandparent and \
+                                not is_root[path[n_path - 1]]:
+                            n_path -= 1
+                            stub[path[n_path]] = True
+            low[grandparent] = min(low[par], low[grandparent])
+
+    return discovery >= 0, parent, bridge, articulation_point, notn1_start, stub
+
+
+@jit(nopython=True)
+def _is_bridge(parent, bridge, b1, b2):  # pragma: no cover
+    return (bridge[b2] and parent[b2] == b1) or (bridge[b1] and parent[b1] == b2)
+
+
+@jit(nopython=True)
+def _dfs_required_bridges(indptr, indices, roots, parent, bridge, notn1_start,
+                          find_required_bridges, find_notn1_areas):  # pragma: no cover
+    n = len(indptr) - 1
+    visited = np.zeros(n, dtype=np.bool_)
+    n_roots = len(roots)
+    stack_gp = np.empty(n + n_roots, dtype=np.int64)
+    stack_p = np.empty(n + n_roots, dtype=np.int64)
+    stack_pos = np.empty(n + n_roots, dtype=np.int64)
+    for i in range(n_roots):
+        visited[roots[i]] = True
+        stack_gp[i] = roots[i]
+        stack_p[i] = roots[i]
+        stack_pos[i] = indptr[roots[i]]
+    top = n_roots - 1
+
+    # the bridges on the current path are stored as a linked list: each visited bridge is a
+    # record, which points to the record of the previous bridge on the path
+    record_from = np.empty(n, dtype=np.int64)
+    record_to = np.empty(n, dtype=np.int64)
+    record_previous = np.empty(n, dtype=np.int64)
+    n_records = 0
+    current_record = -1
+    node_record = np.full(n, -1, dtype=np.int64)
+
+    # notn1 areas are returned as pairs of (area start, bus in area)
+    area_start = np.empty(n, dtype=np.int64)
+    area_bus = np.empty(n, dtype=np.int64)
+    n_area_buses = 0
+    area_starts = np.zeros(n, dtype=np.bool_)
+    notn1_area_start = -1
+
+    while top >= 0:
+        grandparent = stack_gp[top]
+        par = stack_p[top]
+        if stack_pos[top] < indptr[par + 1]:
+            child = indices[stack_pos[top]]
+            stack_pos[top] += 1
+            if child == grandparent:
+                continue
+            if not visited[child]:
+                visited[child] = True
+                top += 1
+                stack_gp[top] = par
+                stack_p[top] = child
+                stack_pos[top] = indptr[child]
+                if find_required_bridges and _is_bridge(parent, bridge, par, child):
+                    record_from[n_records] = par
+                    record_to[n_records] = child
+                    record_previous[n_records] = current_record
+                    current_record = n_records
+                    n_records += 1
+                if find_notn1_areas:
+                    if notn1_start[child] and notn1_area_start < 0:
+                        notn1_area_start = par
+                    if notn1_area_start >= 0:
+                        area_start[n_area_buses] = notn1_area_start
+                        area_bus[n_area_buses] = child
+                        n_area_buses += 1
+        else:
+            top -= 1
+            if find_required_bridges:
+                node_record[par] = current_record
+                if _is_bridge(parent, bridge, par, grandparent):
+                    current_record = record_previous[current_record]
+            if find_notn1_areas and grandparent == notn1_area_start:
+                area_starts[grandparent] = True
+                notn1_area_start = -1
+
+    return node_record, record_from[:n_records], record_to[:n_records], \
+        record_previous[:n_records], area_starts, area_start[:n_area_buses], \
+        area_bus[:n_area_buses]
+
+
+def nxgraph_to_csr(g):
+    """
+    Converts a NetworkX graph into compressed sparse row arrays. Parallel edges are merged, the
+    neighbors of each node keep the order of the graph.
+
+    INPUT:
+        **g** (NetworkX graph) - NetworkX Graph or MultiGraph that represents a pandapower network
+
+    OUTPUT:
+        **nodes** (list) - the nodes of the graph; indptr and indices refer to positions in nodes
+
+        **indptr** (array) - indices[indptr[i]:indptr[i + 1]] are the neighbors of node i
+
+        **indices** (array) - positions of the neighbors
+    """
+    nodes = list(g.nodes())
+    lookup = {node: i for i, node in enumerate(nodes)}
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.fromiter((len(g[node]) for node in nodes), dtype=np.int64,
+                                       count=len(nodes)))
+    indices = np.fromiter((lookup[nb] for node in nodes for nb in g[node]), dtype=np.int64,
+                          count=indptr[-1])
+    return nodes, indptr, indices
+
+
+def net_to_csr(net, respect_switches=True):
+    """
+    Creates the compressed sparse row arrays of the graph which create_nxgraph would return for
+    the given parameters directly from the element tables, without building the graph. The
+    neighbors are sorted by bus index.
+
+    OUTPUT:
+        see nxgraph_to_csr, with nodes as array of bus indices
+    """
+    nodes, csgraph = create_csgraph(net, respect_switches=respect_switches, weight=None)
+    return nodes, csgraph.indptr.astype(np.int64), csgraph.indices.astype(np.int64)
+
+
+def find_graph_characteristics_csr(nodes, indptr, indices, roots, characteristics):
+    """
+    Array based version of find_graph_characteristics for graphs given as compressed sparse row
+    arrays (see nxgraph_to_csr and net_to_csr). The return values are the same as of
+    find_graph_characteristics.
+    """
+    lookup = pd.Index(nodes).get_indexer(list(roots))
+    if np.any(lookup < 0):
+        missing = [r for r, pos in zip(roots, lookup) if pos < 0]
+        raise KeyError(missing[0])
+    root_pos = lookup.astype(np.int64)
+    is_root = np.zeros(len(nodes), dtype=bool)
+    is_root[root_pos] = True
+
+    find_stubs = 'stub_buses' in characteristics
+    visited, parent, bridge, articulation_point, notn1_start, stub = _dfs_bridges(
+        indptr, indices, root_pos, is_root, find_stubs)
+
+    char_dict = dict()
+    if 'connected' in characteristics:
+        char_dict['connected'] = {nodes[i] for i in np.flatnonzero(visited)}
+    if 'stub_buses' in characteristics:
+        char_dict['stub_buses'] = {nodes[i] for i in np.flatnonzero(stub)}
+    if 'bridges' in characteristics:
+        char_dict['bridges'] = {(nodes[parent[i]], nodes[i]) for i in np.flatnonzero(bridge)}
+    if 'articulation_points' in characteristics:
+        char_dict['articulation_points'] = {nodes[i] for i in
+                                            np.flatnonzero(articulation_point)}
+
+    find_required_bridges = 'required_bridges' in characteristics
+    find_notn1_areas = 'notn1_areas' in characteristics
+    if not find_required_bridges and not find_notn1_areas:
+        return char_dict
+
+    node_record, record_from, record_to, record_previous, area_starts, area_start, area_bus = \
+        _dfs_required_bridges(indptr, indices, root_pos, parent, bridge, notn1_start,
+                              find_required_bridges, find_notn1_areas)
+
+    if find_required_bridges:
+        record_paths = []
+        for i in range(len(record_from)):
+            previous = record_paths[record_previous[i]] if record_previous[i] >= 0 else []
+            record_paths.append(previous + [(nodes[record_from[i]], nodes[record_to[i]])])
+        char_dict['required_bridges'] = {nodes[i]: record_paths[node_record[i]][:]
+                                         for i in np.flatnonzero(node_record >= 0)}
+    if find_notn1_areas:
+        notn1_areas = {nodes[i]: set() for i in np.flatnonzero(area_starts)}
+        for start, bus in zip(area_start, area_bus):
+            notn1_areas[nodes[start]].add(nodes[bus])
+        char_dict['notn1_areas'] = notn1_areas
+    return char_dict